@@ -0,0 +1,10660 @@
+# =============================== Title Block ===============================
+#
+# file name: SRC230223-002 G-code Generator
+#
+# ---Description---
+# Generate G-code for basic toolpaths.
+# See "ALG20220411004 Main" for reference.
+# Use "TMP20220414001 G-code Parameters" to input parameters
+#
+# ---Requirements---
+# python packages: pandas, numpy, openpyxl (excel files) and tabulate (debug tables). pip install pandas numpy openpyxl tabulate
+# optional: zstandard (output_compression = 'zstd'). toml job files need python 3.11 or later (tomllib). device DNC channels need a posix system (tty).
+# packages are installed in the python environment. they are not kept with the script.
+#
+# ---Change History---
+# rev: 01-01-03-01
+# date: 18/Oct/2026
+# Major change.
+# Added workbook_session and workbook_sheet functions. Excel file is opened once and all sheets are parsed in a single pass.
+# data frame functions read their sheet from the workbook session. parse time is reported on screen and in the debug file.
+# Added sheet cache. parsed sheets are stored on disk, one json file per sheet, keyed by a hash of the sheet and the shared strings and styles it uses.
+# only sheets edited since the last run are parsed. cache size is limited by deleting least recently used sheets. set cache_flag = False to bypass the cache.
+# Added sheet_schema, typed_column, sheet_records and sheet_static functions. each sheet type has a declared schema (float, bool, category).
+# sheets are converted once per column into typed columns and handed out as row records. replaces per cell format_data_frame_variable calls in all data frame functions.
+# Added format_variable function. text formatting moved out of format_data_frame_variable.
+# rapid, shift_data_frame and repeat_data_frame read the typed row record of the main tab.
+# Added schema_records and sheet_stream functions. set stream_flag = True to stream peck drill and spiral drill sheets from the excel file in read-only mode.
+# streamed sheets are not parsed by the workbook session. rows are converted and drilled one chunk at a time and G-code is written per chunk. memory does not grow with number of holes.
+# Added job_format, text_cell, csv_sheet and document_sheets functions. job can be read from a folder of csv files (one csv file per sheet) or from a json or toml file.
+# same sheet and column names as the excel file. excel file remains supported. csv sheets can be streamed with stream_flag.
+# Added validate_job and validation_report functions. whole job is validated with vectorized checks on the typed sheets before any file is written.
+# all errors are reported together in one table. set validate_flag = False to skip validation. repeat_row 0 is reported as out of range (last row detection fails on row -1).
+# Added compile_plan, save_plan and load_plan functions. shift, clear_shift, repeat and last_row_flag of the main tab are resolved into a flat plan before G-code is generated.
+# main program runs the plan step by step. plan is printed to the debug file. set plan_file to save the plan to a json file, replay_file to replay a saved plan.
+# Added translate_gcode function. operations repeated on the same sheet (repeat and shift) are written as translated copies of the first generated toolpath. the sheet and toolpath are not regenerated.
+# set translate_flag = True to use translated copies. copies can differ from a regenerated toolpath by 1 in the last decimal place. translate_flag = False (default) regenerates every toolpath (identical G-code).
+# per row debug tables of the sheet are not written for translated copies. debug file names the step that was copied.
+# Added watch mode. job_modified_time and watch_job functions. set watch_flag = True to keep running and regenerate G-code every time the job is saved.
+# workbook_session keeps unchanged sheets in memory (content key of each sheet). only steps whose sheet, profile or parameters changed are regenerated, all other steps are reused from the last run.
+# regenerated G-code replaces the G-code file of the first run.
+# pandas, numpy and openpyxl are imported by the functions that use them. main program runs under if __name__ == '__main__'. geometry and G-code functions can be imported without pandas.
+# Added import_time_check function. set import_check_flag = True to check the cold start import time of this script against import_budget.
+# Added open_output, close_output and close_outputs functions. G-code and debug files are opened once per job and written through a buffer (output_buffer). write_to_file writes to the open file.
+# files are written as name.txt.tmp, synced to disk and renamed to name.txt in one step at the end of the job and on abort. on any other exit (error, quit) text is kept in name.txt.tmp and name.txt is not replaced. file headers are written after the files are opened. set output_buffer = 0 to open and close the file on every write.
+# G-code of each step is captured in memory for translated copies and watch mode. G-code file is not read back.
+# Added file_sink function. toolpath functions take an optional sink and send G-code blocks to it as they are generated. G-code is written through the output buffer without building the text of a toolpath or sheet.
+# without sink, G-code blocks are collected in a list and joined once. program size no longer grows generation time quadratically.
+# Added move list. move_dtype, move_list, move_op, gcode_moves, move_sink, move_array, render_moves and write_moves functions. G-code is held as a numpy structured array of moves (motion code, x, y, z, r, i, j, feed, operation id).
+# text of each line is kept as a shared template so G-code is rendered exactly. set moves_flag = True to collect the G-code of the job as a move list and render the G-code file in one pass at the end of the job.
+# Added move_lines and emit_lines functions. tro_slot, tro_arc, spiral_surface and spiral_boss send their number columns through emit_lines(); file and move list sinks add them to the move list as they are (no text is formatted and read back). gcode_moves reads the fixed text blocks.
+# Added format_numbers, render_lines and format_benchmark functions. coordinates and feeds are formatted in bulk from number arrays with numpy. text is identical to "%.4f" % value (numbers close to half way are formatted one by one).
+# render_moves renders the moves of each template in bulk. set benchmark_flag = True to print the throughput of bulk formatting against line by line formatting.
+# open_output and close_output. Added output compression. set output_compression = 'gzip' or 'zstd' to compress G-code and debug files as they are written (name.txt.gz, name.txt.zst). zstd needs the zstandard package.
+# Added split_output, split_name, split_open, split_text, split_commit, split_write and close_split functions. set split_bytes and/or split_blocks to split the G-code file into numbered files (name Part001 ...) as it is written.
+# files are split only at safe points (after a move that leaves the tool above the part). each file has the start block and end block and resumes at the position and feed where the last file ended.
+# Added DNC (drip-feed). dnc_channel, dnc_stand_in, dnc_open, dnc_queue, dnc_write, dnc_sender and dnc_close functions. set dnc_address to send G-code blocks to the machine over a socket, serial port or pty while the job is generated.
+# sender thread uses character counting (dnc_flow = 'count', dnc_rx_buffer) or waits for ok after each block (dnc_flow = 'ack'). comments and blank lines are not sent. dnc_address = 'stand-in' runs a stand-in machine for testing.
+# Added debug levels. set debug_level = 'full' (debug tables of every sheet and row), 'summary' (per operation totals of lines, bytes and time) or 'off' (no debug file).
+# debug tables are only rendered at full debug level. Added debug_console and debug_summary functions. profile_generator debug prints and profile debug file at full debug level only.
+# Added write_output, writer_open, writer_put and writer_close functions. debug file is written by a background writer thread through a bounded queue (debug_queue). main program waits only when the queue is full.
+# queued debug text is written before the file is closed at the end of the job, on abort and on exit. set debug_queue = 0 to write the debug file from the main program.
+# Added binary toolpath export. move_positions, npz_open, npz_close and load_toolpath functions. set npz_flag = True to save the toolpath as a numpy archive (name.npz) next to the G-code file.
+# archive holds the moves, tool position and feed of each move, operation names and move index ranges, move templates and job parameters. load_toolpath memory maps the arrays (npz_compress = False).
+# Added array coordinate functions. rotation_matrix, absolute_angle_array, shift_origin_array, cartesian_to_polar_array, polar_to_cartesian_array, rotate_axis_array, relative_coordinate_array, relative_polar_array and
+# absolute_cartesian_to_relative_polar_array transform whole point sets in one call with atan2 and one rotation matrix per angle. geometry_benchmark compares them with the one point at a time functions (benchmark_flag).
+# Added LineSegment and ArcSegment. compact segment types (__slots__) that calculate derived geometry (angle, length, center of arc, start and end angles, arc length) once and keep it.
+# line_data, arc_data, linear_offset_adjustment and arc_offset_adjustment use the segment types. center of arc is shared by arc_data and the offset adjustment.
+# profile_generator shares segments between its passes. tro_slot and tro_arc use LineSegment.
+# Added relative_coordinate_bulk and tro_slot_loops functions. tro_slot calculates the positions of all trochoidal loops in one call and renders the loops in one block. G-code is identical.
+# relative_coordinate_bulk follows relative_coordinate step by step. coordinates close to half way at 4 decimal places are calculated again one by one.
+# Added rounding_check, relative_polar_bulk, tro_arc_schedule and tro_arc_loops functions. tro_arc generates the angle schedule up front and renders the trochoidal loops in one block. G-code is identical.
+# relative_coordinate_bulk uses rounding_check.
+# Added spiral_error, spiral_segments and spiral_path functions. spiral_surface and spiral_boss share one spiral engine that calculates the end points of all segments in one call and renders them in one block.
+# spiral_tolerance sets the largest distance of spiral segment arcs from the spiral. segments of each revolution are picked from it. spiral_tolerance = None keeps 24 segments per revolution and identical G-code.
+# Added requirements to title block.
+# tested on 18/Oct/2026.
+#
+# rev: 01-01-02-02
+# date: 22/Apr/2024
+# minor change.
+# def parameters_data_frame. removed "%.0f" %  from surface_speed and chipload variables. enable variable to accept both string and number variables.
+# adjusted minor spacing.
+# tested on 22/Apr/2024.
+#
+# rev: 01-01-02-01
+# date: 18/Aug/2023
+# Major change.
+# Added profile_generator function. Uses dataframe to process toolpath modification.
+# Major modification to toolpath_data_frame function to work with profile_generator function
+# decreased sensitivity of tro_slot and tro_arc function.
+# Added minor functions for calculations.
+# Added change history to earlier functions.
+#
+# rev: 01-01-01-13
+# date: 21/Jul/2023
+# line and arc function. changed comments in end_z from relative units to absolute units.
+#
+# rev: 01-01-01-12
+# date: 04/Jun/2023
+# description:
+# updated debug text to print tabulated tables and rows for all operations and main program.
+#
+# rev: 01-01-01-11
+# date: 29/May/2023
+# description:
+# Bug fix.toolpath_data_frame. Fixed row# 0 arc_seg able to read and print "None" on Debug txt file.
+#
+# rev: 01-01-01-10
+# date: 29/May/2023
+# description:
+# create supporting document "ALG20220411004 Rev02 Main Algorithm" for repeat_check function.
+# Bug fix.Resolved last_row_flag detection on repeat operation.
+#
+# rev: 01-01-01-09
+# date: 26/May/2023
+# description:
+# simplified last cut to a line to line cut followed by a straight center line cut.
+# added starting point options on 4 different corners.
+# added entry parameter on surface dataframe.
+#
+# rev: 01-01-01-08
+# date: 26/May/2023
+# description:
+# Bug fix.
+# fixed off by one error on first top length.
+# fixed "length_y" mislabelled as "length_x" on left and right length segments.
+# reduced starting point offset from dia*2 to dia.
+#
+# rev: 01-01-01-07
+# date: 13/Mar/2023
+# description:
+# Added repeat operation into dataframe.
+# transferred shift code into dedicated dataframe function.
+#
+# rev: 01-01-01-06
+# date: 12/Mar/2023
+# description:
+# Added shift operation into dataframe.
+#
+# rev: 01-01-01-05
+# date: 11/Mar/2023
+# description:
+# Added error text file statements to spiral boss, spiral drill, spiral surface dataframe function.
+# update error checks using abort function in spiral boss function.
+#
+# rev: 01-01-01-04
+# date: 08/Mar/2023
+# description:
+# Added error text file generator
+# Added text indent function
+#
+# rev: 01-01-01-03
+# date: 23/Feb/2023
+# description:
+# Fixed bug on repeat g-code generation in peck drill data frame
+# Fixed bug on last_row_detect sheet  = 'main' in main data frame
+#
+# rev: 01-01-01-02
+# date: 23/Feb/2023
+# description:
+# Incorporated into GitHub
+# Added last row detect to peck drill data frame
+#
+# rev: 01-01-01-01
+# date: 23/Feb/2023
+# description:
+# Identical to "SRC20210420001 Rev01-01-10-12 G-code Generator"
+#
+# rev: 01-01-10-12
+# date: 16/Nov/2022
+# description:
+# Modified toolpath_data_frame function. Added feed rate to move cutter to start point.
+#
+# rev: 01-01-10-11
+# date: 15/Aug/2022
+# description:
+# last_row_detect - fixed data frame bug.
+# last_row_detect - added active dataframe and active sheet as pass in variables.
+#
+# rev: 01-01-10-10
+# date: 13/Aug/2022
+# description:
+# Modified toolpath_data_frame function to process seperate linear and trochoidal tabs
+# Added rapid function
+# Added last_row_detect function
+# Gives warning when using data validation drop down list.
+#
+# rev: 01-01-10-09
+# date: 12/Apr/2022
+# description:
+# Major revision.
+# Overhauled main program to import all parameters from excel file.
+# changed label and names from "trichoidal" to "trochoidal" and "tri" to "tro"
+# removed "test_cut" function.
+#
+# rev: 01-01-10-08
+# date: 07/Apr/2022
+# description:
+# Changed z ramp in line function and arc function.
+# Shifted trichoidal and line data frame variables to excel file.
+#
+# rev: 01-01-10-07
+# date: 31/Mar/2022
+# description:
+# Added toolpath_data_frame function.
+# Removed offset and tool diameter correction from line, arc, tri_slot, tri_arc functions.
+# fixed bugs in arc_offset_adjustment
+# added decimal round off in linear_offset_adjustment
+#
+# rev: 01-01-10-06
+# date: 24/Oct/2021
+# description:
+# Changed all depth of cut (doc) variables to absolute convention.
+#
+# rev: 01-01-10-05
+# date: 24/Oct/2021
+# description:
+# Corrected input variables in spiral surface function.
+# Corrected description in spiral surface function.
+#
+# rev: 01-01-10-04
+# date: 11/Oct/2021
+# description:
+# Added z overshoot compensation in spiral boss function.
+# Added chipload and surface speed variables in general variables.
+#
+# rev: 01-01-10-03
+# date: 21/Sep/2021
+# description:
+# removed round() function for spiral surface function
+# Added selectable number of finish cuts and finishing feed rate for spiral surface function
+#
+# rev: 01-01-10-02
+# date: 19/Sep/2021
+# description:
+#   Added selectable number of finish cuts and finishing feed rate for spiral boss
+#   Changed origin from corner of test block to center of test block function
+#   Changed variable name of "dia" to "cutter_dia" for diameter of cutter before adjustment.
+#   Updated description for spiral boss.
+#
+# rev: 01-01-10-01
+# date: 04/Sep/2021
+# description:
+#   Fixed spiral End diameter to accommodate cutter dia.
+#   Fixed Tri slot cutter position detection.
+#   Reorganized clean up text in script.
+#   Added spiral boss.
+#   Added rounding to 4 decimal places for G-code coordinates, 3 for label coordinates, 1 for feeds
+#   Added cutter diameter tolerance compensation.
+#   Added initial_x, initial_y, terminal_x, terminal_y, clear_z as universal parameters
+#   Added linear_offset_adjustment function.
+#   Added arc_offset_adjustment function.
+#   Added line function
+#   Added arc function
+#
+# ------------------------------
+# rev: 01-01-09-01
+# date: 13/May/2021
+# description:
+#
+#   Added peck drilling function.
+# ------------------------------
+# rev: 01-01-09
+# date: 12/May/2021
+# description:
+#
+#   Changed name from "Trichoidal Slot and Arc" to "G-code Generator"
+#   Added helix drill function
+#   Added surfacing function
+# ------------------------------
+# rev: 01-01-08
+# date: 29/Apr/2021
+# description:
+#
+#   line 265 to 268
+#       added last position return if block.
+#
+#   line 443 to 446
+#       added last position return if block.
+#
+#   line 551 to 560
+#       added test code
+#
+#   replace file name variable "dt" with "name"
+#
+# ---Bug List---
+# NA
+#
+# ===========================================================================
+
+import atexit
+import collections
+import csv
+import gzip
+import hashlib
+import io
+import json
+import math
+import os
+import queue
+import re
+import socket
+import struct
+import subprocess
+import sys
+from datetime import datetime, time as datetime_time
+from decimal import Decimal
+import textwrap
+import threading
+import time
+import xml.etree.ElementTree as ET
+import zipfile
+
+def toolbox_data_frame():
+    # ---------------------------------------
+    # Data frame tools
+    # ---------------------------------------
+    # creates empty data frame
+    import pandas as pd  # deferred import. see import_time_check().
+    import numpy as np  # deferred import. see import_time_check().
+
+    df = pd.DataFrame(np.nan, index=[0, 1, 2, 3, 4], columns=['A', 'B', 'C', 'D'])  # creates empty data frame with indexed rows and labeled columns.
+    print('create data frame')
+    print(str(df)+'\n')
+
+    # create new row
+    df.loc[2.2,:] = '---'  # create new row, index: 2.2 with cells containing text: '---'.
+    print('create new row with index: 2.2 with all cells containing ---')
+    print(str(df)+'\n')
+
+    # reset index
+    df = df.sort_index().reset_index(drop=True)  # sort rows according to index values and reset to running integers.
+    print('reset index')
+    print(str(df)+'\n')
+
+    df.loc[:,'E'] = '---'  # create new column labeled "E" with cells containing text: '---'.
+    print('create new column labeled "E" with cells containing text: ---')
+    print(str(df)+'\n')
+
+    # write a value to a single cell.
+    df.loc[1, 'B'] = 'Hello'  # modifies cell in column labeled: 'B', row index: '1' to value: '**Hello**'.
+    print('modifies cell in column labeled: B, row index: 1 to value: Hello')
+    print(str(df)+'\n')
+
+    # create new row, index: 4.5 with cells containing unique text. needs identical number of cells.
+    df.loc[4.5] = ['1', '2', '3', '4', '5']  # create new row, index: 4.5 with cells containing unique text. needs identical number of cells.
+    print('create new row, index: 4.5 with cells containing unique text. needs identical number of cells.')
+    print(str(df) + '\n')
+
+    # reset index
+    df = df.sort_index().reset_index(drop=True)  # sort rows according to index values and reset to running integers.
+    print('reset index')
+    print(str(df)+'\n')
+
+    # print number of rows in df
+    print('length: '+ str(len(df)) + '\n')        # print number of rows in df
+
+    # create new row at bottom of df with cells containing text: '---'
+    df.loc[len(df),:] = ['---']     # create new row at bottom of df with cells containing text: '---'.
+    print('create new row at bottom of df with cells containing text: ---')
+    print(str(df)+'\n')
+
+    # modifies cell in bottom row, column labeled: 'A' to value: 'new row'
+    df.loc[(len(df)-1),'A'] = 'NEW ROW'   # modifies cell in bottom row, column labeled: 'A' to value: 'new row'
+    print('modifies cell in bottom row, column labeled: \'A\' to value: \'NEW ROW\'')
+    print(str(df)+'\n')
+
+    # remove all rows except for the first row.
+    df = df.drop(df.index[1:])  # remove all rows except for the first row.
+    print('remove all rows except for the first row.')
+    print(str(df)+'\n')
+
+    # removes all columns up to 'B' columns
+    df = df.loc[:, :'B']  # removes all columns up to 'B' columns
+    print('removes all columns up to \'B\' columns')
+    print(str(df)+'\n')
+
+    # write 'Q','W','E','R','T' to column 'A'
+    df = pd.DataFrame(np.nan, index=[0, 1, 2, 3, 4], columns=['A', 'B', 'C', 'D'])  # creates empty data frame with indexed rows and labeled columns.
+    df.loc[0:4,'A'] = ['Q','W','E','R','T']  # write 'Q','W','E','R','T' to column 'A'.
+    print('write \'Q\',\'W\',\'E\',\'R\',\'T\' to column \'A\'')
+    print(str(df)+'\n')
+
+    # replace index default column with 'A' column
+    df.set_index('A', inplace=True)  # replace index default column with 'A' column
+    print('replace index default column with \'A\' column')
+    print(str(df)+'\n')
+
+    # copies index column to '#' column
+    df.loc[:,'#'] = '---'  # create new column labeled "#" with cells containing text: '---'.
+    df = df.sort_index().reset_index(drop=True)  # sort rows according to index values and reset to running integers.
+    df.loc[:, '#'] = df.index
+    print('copies index column to \'#\' column')
+    print(str(df)+'\n')
+
+    # insert new column at desired position
+    df.insert(0, '#_copy', 'COPY_HERE', True)  # insert new column '#_copy' at index 0 (first column of data frame) containing the values 'COPY_HERE'
+    df = df.sort_index().reset_index(drop=True)  # sort rows according to index values and reset to running integers. done to avoid warning "A value is trying to be set on a copy of a slice from a DataFrame. Try using .loc[row_indexer,col_indexer] = value instead"
+    print('insert new column \'#_copy\' at index position 0 or first column containing the values \'COPY_HERE\'')
+    print(str(df)+'\n')
+
+    # copy values of a column to another column
+    df = df.sort_index().reset_index(drop=True)  # sort rows according to index values and reset to running integers. done to avoid warning "A value is trying to be set on a copy of a slice from a DataFrame. Try using .loc[row_indexer,col_indexer] = value instead"
+    df['#_copy'] = df['#']   # copy values of '#' column to '#_copy' column
+    print('copy values of \'#\' column to \'#_copy\' column')
+    print(str(df)+'\n')
+
+    # write a single value to all cells in a column.
+    df = df.assign(D = '---')    # write '---' into all cells in 'D' column
+    print('write \'---\' into all cells in \'D\' column')
+    print(str(df)+'\n')
+
+def absolute_cartesian_to_relative_polar(origin_x, origin_y, absolute_x, absolute_y):
+    # ---Description---
+    # transforms absolute cartesian coordinates of a single point to its relative polar coordinates about an origin point.
+    # angle will range from 0 deg to < 360 deg. No negative angle.
+    # angle, length, origin_x, origin_y = absolute_cartesian_to_relative_polar(origin_x, origin_y, absolute_x, absolute_y)
+
+    # ---Variable List---
+    # origin_x = x origin of new relative polar coordinate axis
+    # origin_y = y origin of new relative polar coordinate axis
+    # absolute_x = x absolute cartesian coordinate
+    # absolute_y = y absolute cartesian coordinate
+
+    # ---Return Variable List---
+    # angle = angle on relative polar coordinate
+    # length = length on relative polar coordinate
+    # origin_x = x origin of new relative polar coordinate axis
+    # origin_y = y origin of new relative polar coordinate axis
+
+    # ---Change History---
+    # rev: 01-01-02-01
+    # Initial release.
+    # software test run on 18/Aug/2023
+    # --------------------
+
+    angle = absolute_angle(origin_x, origin_y, absolute_x, absolute_y)  # absolute angle of line
+    length = math.sqrt((absolute_x - origin_x) ** 2 + (absolute_y - origin_y) ** 2)     # length of line
+    origin_x = origin_x
+    origin_y = origin_y
+    return angle, length, origin_x, origin_y
+
+def shift_origin(new_origin_x,new_origin_y, x, y):
+    # ---Description---
+    # transforms absolute cartesian coordinates of a single point to its new cartesian coordinates relative to a new origin point.
+    # shifted_x, shifted_y = shift_origin(new_origin_x,new_origin_y, x, y)
+
+    # ---Variable List---
+    # new_origin_x = x origin of new relative cartesian coordinate
+    # new_origin_y = y origin of new relative cartesian coordinate
+    # x = x absolute cartesian coordinate
+    # y = y absolute cartesian coordinate
+
+    # ---Return Variable List---
+    # new_x = x origin of new relative cartesian coordinate
+    # new_y = y origin of new relative cartesian coordinate
+
+    # ---Change History---
+    # rev: 01-01-02-01
+    # Initial release.
+    # software test run on 18/Aug/2023
+    # --------------------
+
+    new_x = x - new_origin_x
+    new_y = y - new_origin_y
+    return new_x, new_y
+
+def cartesian_to_polar(x, y):
+    # ---Description---
+    # transforms cartesian coordinates of a single point to its polar coordinates.
+    # in event an origin point. return angle = 0, length = 0
+    # angle, length = cartesian_to_polar(x, y)
+
+    # ---Variable List---
+    # x = x absolute cartesian coordinate
+    # y = y absolute cartesian coordinate
+
+    # ---Return Variable List---
+    # angle = angle on polar coordinate
+    # hypo = length on polar coordinate
+
+    # ---Change History---
+    # rev: 01-01-02-01
+    # Initial release.
+    # software test run on 18/Aug/2023
+    # --------------------
+
+    if x == 0 and y == 0:
+        hypo = 0
+        angle = 0
+    else:
+        hypo = math.sqrt(x ** 2 + y ** 2)       # length of hypotenuse
+        angle = absolute_angle(0, 0, x, y)      # angle of line
+    return angle, hypo
+
+def polar_to_cartesian(angle, length):
+    # ---Description---
+    # transforms polar coordinates of a single point to its cartesian coordinates.
+    # in event of an origin point, i.e. length = 0. return x = 0 y = 0
+    # input parameters: angle, length
+    # x, y = polar_to_cartesian(angle, length)
+
+    # ---Variable List---
+    # angle = angle on polar coordinate
+    # length = length on polar coordinate
+
+    # ---Return Variable List---
+    # x = x cartesian coordinate
+    # y = y cartesian coordinate
+
+    # ---Change History---
+    # rev: 01-01-02-01
+    # Initial release.
+    # software test run on 18/Aug/2023
+    # --------------------
+
+    angle = format_angle(angle) # format angle
+    if length == 0:
+        x = 0   # origin point
+        y = 0   # origin point
+    else:
+        x = length * math.cos((angle)/180*math.pi)  # calculate x in degrees
+        y = length * math.sin((angle)/180*math.pi)  # calculate y in degrees
+#        x = length * math.cos(angle)  # calculate x   # in radians
+#        y = length * math.sin(angle)  # calculate y   # in radians
+    return x, y
+
+def format_angle(angle):
+    # ---Description---
+    # formats angle to non negative angle in the range of: 0 >= angle < 360 degrees.
+    # angle = format_angle(angle)
+
+    # ---Variable List---
+    # angle = angle to be formatted
+
+    # ---Return Variable List---
+    # angle = formatted angle
+
+    # ---Change History---
+    # rev: 01-01-02-01
+    # Initial release.
+    # software test run on 18/Aug/2023
+    # --------------------
+
+    angle = angle % 360     # format angle to remove excess revolutions. remainder of angle divided by 360deg. in degrees.
+#    angle = angle % (2*math.pi)     # format angle to remove excess revolutions. remainder of angle divided by 360deg. in radians.
+    if angle < 0 :
+        angle = angle + 360     # format negative angles to positive absolute angle. in degrees.
+#        angle = angle + 2*math.pi    # format negative angles to positive absolute angle. in radians.
+    return angle
+
+def rotate_axis(angle, x, y):
+    # ---Description---
+    # transforms cartesian coordinates of a single point to its new cartesian coordinates relative to a new rotated axis.
+    # axis is rotated about the absolute origin.
+    # input parameters: angle, x, y
+    # new_x, new_y = rotate_axis(angle, x, y)
+
+    # ---Variable List---
+    # x = x absolute cartesian coordinate
+    # y = y absolute cartesian coordinate
+
+    # ---Return Variable List---
+    # new_x = x origin of new relative cartesian coordinate
+    # new_y = y origin of new relative cartesian coordinate
+
+    # ---Change History---
+    # rev: 01-01-02-01
+    # Initial release.
+    # software test run on 18/Aug/2023
+    # --------------------
+
+    if x == 0 and y == 0:
+        new_x = 0   # origin point
+        new_y = 0   # origin point
+    else:
+        temp_angle, length = cartesian_to_polar(x, y)
+        temp_angle = temp_angle - angle
+        temp_angle = format_angle(temp_angle)   # format angle
+        new_x, new_y = polar_to_cartesian(temp_angle,length)
+    return new_x, new_y
+
+def arc_data(start_x, start_y, end_x, end_y, rad, cw, less_180):
+    # ---Description---
+    # calculate various arc parameters based on inputs.
+    # center_x, center_y, start_angle, end_angle, arc_length, arc_angle = arc_data(start_x, start_y, end_x, end_y, rad, cw, less_180)
+
+    # ---Variable List---
+    # start_x = x start of arc
+    # start_y = y start of arc
+    # end_x = x end of arc
+    # end_y = y end of arc
+    # rad = radius of arc
+    # cw = Boolean. True = clockwise False = counter clockwise.
+    # less_180 = Boolean. True: < 180deg i.e. acute arc. False: > 180deg i.e. obtuse arc.
+
+    # ---Return Variable List---
+    # center_x = x coordinates of center of arc
+    # center_y = y coordinates of center of arc
+    # start_angle = absolute start angle of arc
+    # end_angle = absolute end angle of arc
+    # arc_length = length of arc
+    # arc_angle = angle of arc
+
+    # ---Change History---
+    # rev: 01-01-03-01
+    # date: 18/Oct/2026
+    # geometry is calculated by ArcSegment. see ArcSegment.data()
+    # software test run on 18/Oct/2026
+    #
+    # rev: 01-01-02-01
+    # Initial release.
+    # software test run on 18/Aug/2023
+    # --------------------
+
+    return (ArcSegment(start_x, start_y, end_x, end_y, rad, cw, less_180).data())
+
+def line_data(start_x, start_y, end_x, end_y):
+    # ---Description---
+    # calculate various line parameters based on inputs.
+    # angle, length, vector_x, vector_y = line_data(start_x, start_y, end_x, end_y)
+
+    # ---Variable List---
+    # start_x = x start of line
+    # start_y = y start of line
+    # end_x = x end of line
+    # end_y = y end of line
+
+    # ---Return Variable List---
+    # angle = absolute angle of line
+    # length = length of line
+    # vector_x = x vector of line
+    # vector_y = y vector of line
+
+    # ---Change History---
+    # rev: 01-01-03-01
+    # date: 18/Oct/2026
+    # geometry is calculated by LineSegment. see LineSegment.data()
+    # software test run on 18/Oct/2026
+    #
+    # rev: 01-01-02-01
+    # Initial release.
+    # software test run on 18/Aug/2023
+    # --------------------
+
+    return (LineSegment(start_x, start_y, end_x, end_y).data())
+
+class LineSegment:
+    # ---Description---
+    # Straight line segment. derived geometry (angle, length, vector) is calculated once when it is first used and kept with the segment.
+    # Used by line_data(), linear_offset_adjustment(), profile_generator() and tro_slot().
+    # segment = LineSegment(start_x, start_y, end_x, end_y)
+    # e.g. segment.angle, segment.length, adjusted = segment.offset(dia, offset, mode)
+
+    # ---Variable List---
+    # start_x = x start of line
+    # start_y = y start of line
+    # end_x = x end of line
+    # end_y = y end of line
+
+    # ---Return Variable List---
+    # segment = line segment
+
+    # ---Change History---
+    # rev: 01-01-03-01
+    # date: 18/Oct/2026
+    # initial release
+    # software test run on 18/Oct/2026
+
+    __slots__ = ('start_x', 'start_y', 'end_x', 'end_y', '_data')
+
+    def __init__(self, start_x, start_y, end_x, end_y):
+        self.start_x = start_x
+        self.start_y = start_y
+        self.end_x = end_x
+        self.end_y = end_y
+        self._data = None   # angle, length, vector_x, vector_y. see data()
+
+    def key(self):
+        # segments with the same key have the same geometry.
+        return (('linear', self.start_x, self.start_y, self.end_x, self.end_y))
+
+    def data(self):
+        # angle, length, vector_x, vector_y = segment.data(). see line_data()
+        if self._data == None:
+            vector_x = self.end_x - self.start_x     # x vector length of slot
+            vector_y = self.end_y - self.start_y     # y vector length of slot
+            length = math.sqrt(vector_x ** 2 + vector_y ** 2)     # direct length of start to end point.
+            angle = absolute_angle(self.start_x, self.start_y, self.end_x, self.end_y, debug=False)     # absolute angle of the vector from the start point to end point.
+            self._data = (angle, length, vector_x, vector_y)
+        return (self._data)
+
+    @property
+    def angle(self):
+        return (self.data()[0])     # absolute angle of line
+
+    @property
+    def direction(self):
+        return (self.data()[0])     # absolute angle of start to end point
+
+    @property
+    def length(self):
+        return (self.data()[1])     # length of line
+
+    def offset(self, dia, offset, mode = None):
+        # line adjusted for cutter diameter/slot width and additional offset. see linear_offset_adjustment()
+        # adjusted = segment.offset(dia, offset, mode)
+
+        # check if mode is defined.
+        if mode != 1 and mode != 2 and mode != 3:
+            print(f"!!script aborted!!\nlinear_offset_adjustment\nlinear_offset_adjustment mode undefined\nlinear_offset_adjustment mode = {mode}")
+            text = '''\n(!!script aborted!!)\n(mode undefined)\n'''  # write header for section.
+            quit()
+
+        if mode == 3:
+            return (self)   # on line. no adjustment
+
+        angle_temp, length, vec_x, vec_y = self.data()     # angle and length of slot
+
+        if mode == 1:
+            y_temp = -(dia/2 + offset)  # adjust for right side of travel
+
+        elif mode == 2:
+            y_temp = dia/2 + offset  # adjust for left side of travel
+
+        # update adjustment offset position of slot center.
+        start_x_adjusted, start_y_adjusted = relative_coordinate(self.start_x, self.start_y, angle_temp, 0, y_temp, debug=False)
+        start_x_adjusted = round(start_x_adjusted, 5)    # round to 5 decimal places.
+        start_y_adjusted = round(start_y_adjusted, 5)     # round to 5 decimal places.
+        end_x_adjusted, end_y_adjusted = relative_coordinate(self.start_x, self.start_y, angle_temp, length, y_temp, debug=False)
+        end_x_adjusted = round(end_x_adjusted, 5)     # round to 5 decimal places.
+        end_y_adjusted = round(end_y_adjusted, 5)     # round to 5 decimal places.
+
+        return (LineSegment(start_x_adjusted, start_y_adjusted, end_x_adjusted, end_y_adjusted))
+
+class ArcSegment:
+    # ---Description---
+    # Arc segment. derived geometry (center, angles, arc length) is calculated once when it is first used and kept with the segment.
+    # center of arc is shared by arc_data() and the offset adjustment of the arc.
+    # Used by arc_data(), arc_offset_adjustment() and profile_generator().
+    # segment = ArcSegment(start_x, start_y, end_x, end_y, rad, cw, less_180)
+    # e.g. segment.center_x, segment.length, adjusted = segment.offset(dia, offset, mode)
+
+    # ---Variable List---
+    # start_x = x start of arc
+    # start_y = y start of arc
+    # end_x = x end of arc
+    # end_y = y end of arc
+    # rad = radius of arc
+    # cw = Boolean. True = clockwise False = counter clockwise.
+    # less_180 = Boolean. True: < 180deg i.e. acute arc. False: > 180deg i.e. obtuse arc.
+
+    # ---Return Variable List---
+    # segment = arc segment
+
+    # ---Change History---
+    # rev: 01-01-03-01
+    # date: 18/Oct/2026
+    # initial release
+    # software test run on 18/Oct/2026
+
+    __slots__ = ('start_x', 'start_y', 'end_x', 'end_y', 'rad', 'cw', 'less_180', '_center', '_data')
+
+    def __init__(self, start_x, start_y, end_x, end_y, rad, cw, less_180):
+        self.start_x = start_x
+        self.start_y = start_y
+        self.end_x = end_x
+        self.end_y = end_y
+        self.rad = rad
+        self.cw = cw
+        self.less_180 = less_180
+        self._center = None     # center_x, center_y, direction, angle_arc, start_vector_angle. see center()
+        self._data = None       # arc_data() values. see data()
+
+    def key(self):
+        # segments with the same key have the same geometry.
+        return (('arc', self.start_x, self.start_y, self.end_x, self.end_y, self.rad, self.cw, self.less_180))
+
+    def center(self):
+        # center_x, center_y, direction, angle_arc, start_vector_angle = segment.center()
+        # direction = absolute angle of start to end point. angle_arc = signed angle of arc. start_vector_angle = absolute angle of center to start point.
+        if self._center == None:
+            vec_x = self.end_x - self.start_x                         # x vector length of slot
+            vec_y = self.end_y - self.start_y                         # y vector length of slot
+            length = math.sqrt(vec_x ** 2 + vec_y ** 2)     # direct length of start to end point.
+            x_temp = length/2                               # determine the projected (x) distance of the center of arc along the vector from the start to end point. Used later to determine center of arc.
+            y_temp = math.sqrt(self.rad ** 2 - x_temp ** 2)      # Determine the perpendicular (y) distance of the center of arc to the vector from the start to end point. Used later to determine center of arc.
+            angle_temp = absolute_angle(self.start_x, self.start_y, self.end_x, self.end_y, debug=False)        # calculate absolute angle of the vector from the start point to end point. Used to determine center of arc
+            angle_arc = 2 * math.degrees(math.asin((length/2)/self.rad))                         # determine angle of arc in degrees.
+
+            if self.cw == True:
+                if self.less_180 == True:
+                    y_temp = -y_temp        # center is on right side of arc vector for acute clockwise arcs.
+                    angle_arc = -angle_arc  # arc angle is moving in the negative direction from the start to end point.
+            if self.cw == False:
+                if self.less_180 == False:
+                    y_temp = -y_temp        # center is on right side of arc vector for acute clockwise arcs.
+                    angle_arc = -angle_arc  # arc angle is moving in the negative direction from the start to end point.
+
+            center_x, center_y = relative_coordinate(self.start_x, self.start_y, angle_temp, x_temp, y_temp, debug = False) # calculate center of arc
+            start_vector_angle = absolute_angle(center_x, center_y, self.start_x, self.start_y, debug = False)   # calculate absolute angle of datum vector. i.e. vector of arc center to start point
+            self._center = (center_x, center_y, angle_temp, angle_arc, start_vector_angle)
+        return (self._center)
+
+    def data(self):
+        # center_x, center_y, start_angle, end_angle, arc_length, arc_angle = segment.data(). see arc_data()
+        if self._data == None:
+            center_x, center_y, direction, angle_arc, start_angle_temp = self.center()
+            end_angle_temp = absolute_angle(center_x, center_y, self.end_x, self.end_y)     # absolute angle of center to end point
+
+            if self.cw == True:
+                start_angle = start_angle_temp - 90     # calculate angle of starting vector
+                if start_angle < 0:
+                    start_angle = start_angle + 360     # if angle is negative. add 360deg
+                end_angle = end_angle_temp - 90         # calculate angle of ending vector
+                if end_angle < 0:
+                    end_angle = end_angle + 360     # if angle is negative. add 360deg
+            elif self.cw == False:
+                start_angle = start_angle_temp + 90   # calculate angle of starting vector
+                if start_angle >= 360:
+                    start_angle = start_angle - 360     # if angle is over 360. subtract 360deg
+                end_angle = end_angle_temp + 90         # calculate angle of ending vector
+                if end_angle >= 360:
+                    end_angle = end_angle - 360     # if angle is over 360. subtract 360deg
+
+            if round(start_angle, 2) == 360:  # if angle is 360. conventionalize to 0
+                start_angle = 0
+            if round(end_angle, 2) == 360:    # if angle is 360. conventionalize to 0
+                end_angle = 0
+
+            arc_angle = abs(end_angle_temp - start_angle_temp)      # absolute arc angle
+            arc_length = arc_angle/360 * 2*math.pi * self.rad    # calculate arc_length in degrees.
+            self._data = (center_x, center_y, start_angle, end_angle, arc_length, arc_angle)
+        return (self._data)
+
+    @property
+    def center_x(self):
+        return (self.center()[0])   # x coordinates of center of arc
+
+    @property
+    def center_y(self):
+        return (self.center()[1])   # y coordinates of center of arc
+
+    @property
+    def direction(self):
+        return (self.center()[2])   # absolute angle of start to end point
+
+    @property
+    def length(self):
+        return (self.data()[4])     # length of arc
+
+    def offset(self, dia, offset, mode = None):
+        # arc adjusted for cutter diameter/slot width and additional offset. see arc_offset_adjustment()
+        # adjusted = segment.offset(dia, offset, mode)
+        rad = self.rad
+        cw = self.cw
+
+        # check if mode is defined.
+        if mode != 1 and mode != 2 and mode != 3:
+            print(f"!!script aborted!!\narc_offset_adjustment mode undefined\narc_offset_adjustment mode = {mode}")
+            text = '''\n(!!script aborted!!)\n(mode undefined)\n'''  # write header for section.
+            quit()
+
+        if mode == 3:   # on line cut. no adjustment
+            return (ArcSegment(round(self.start_x, 5), round(self.start_y, 5), round(self.end_x, 5), round(self.end_y, 5), round(rad, 5), cw, self.less_180))  # round to 5 decimal places.
+
+        # check if cutter radius + offset is larger than arc radius for internal/pocket cut.
+        if ((mode == 1 and cw == True) or (mode == 1 and cw == True))and dia/2+offset >= rad:
+            print(f"!!script aborted!!\narc_offset_adjustment\ncutter radius + offset is larger than of equal to arc radius for internal/pocket cut\nrad = {rad}\ndia = {dia}\noffset = {offset}")
+            text = '''\n(!!script aborted!!)\n(cutter offset larger than of equal to arc)\n'''  # write header for section.
+            quit()
+
+        # check if arc radius is <= to 0
+        if rad <= 0:
+            print(f"!!script aborted!!\narc_offset_adjustment\narc radius <= 0\nrad = {rad}")
+            text = '''\n(!!script aborted!!)\n(arc radius <= 0)\n'''  # write header for section.
+            quit()
+
+        x_center, y_center, direction, angle_arc, start_angle = self.center()     # center of arc is shared with data()
+
+        if cw == True:
+            if mode == 1:
+                rad_adjusted = rad - (dia/2 + offset)   # calculate adjusted radius for internal/pocket cut
+            elif mode == 2:
+                rad_adjusted = rad + (dia/2 + offset)    # calculate adjusted radius for external/boss cut
+        if cw == False:
+            if mode == 1:
+                rad_adjusted = rad + (dia/2 + offset)   # calculate adjusted radius for external/boss cut
+            elif mode == 2:
+                rad_adjusted = rad - (dia/2 + offset)    # calculate adjusted radius for internal/pocket cut
+        rad_adjusted = round(rad_adjusted, 5)  # round to 5 decimal places.
+
+        start_x_adjusted, start_y_adjusted = relative_polar(x_center, y_center, start_angle, rad_adjusted, 0, debug=False)        # calculate adjusted start point
+        start_x_adjusted = round(start_x_adjusted, 5)    # round to 5 decimal places.
+        start_y_adjusted = round(start_y_adjusted, 5)     # round to 5 decimal places.
+
+        end_x_adjusted, end_y_adjusted = relative_polar(x_center, y_center, start_angle, rad_adjusted, angle_arc, debug=False)    # calculate adjusted end point
+        end_x_adjusted = round(end_x_adjusted, 5)     # round to 5 decimal places.
+        end_y_adjusted = round(end_y_adjusted, 5)     # round to 5 decimal places.
+
+        return (ArcSegment(start_x_adjusted, start_y_adjusted, end_x_adjusted, end_y_adjusted, rad_adjusted, cw, self.less_180))
+
+def absolute_angle(start_x, start_y, end_x, end_y, debug = False):
+    # ---Description---
+    # calculate absolute angle of a vector with reference to the x axis.
+    # input parameters: start_x, start_y, end_x, end_y, debug (optional)
+    # returns the absolute angle.
+    # angle = absolute_angle(start_x, start_y, end_x, end_y)
+
+    # ---Variable List---
+    # start_x = start point x coordinate
+    # start_y = start point y coordinate
+    # end_x = end point x coordinate
+    # end_y = end point y coordinate
+
+    # ---Return Variable List---
+    # angle = absolute angle of vector
+
+    # ---Change History---
+    # rev: 01-01-02-01
+    # Initial record.
+    # added change history
+    # software test run < 18/Aug/2023
+    # --------------------
+
+    vec_x = end_x - start_x
+    vec_y = end_y - start_y
+    length = math.sqrt(vec_x ** 2 + vec_y ** 2)
+    angle = math.degrees(math.asin(abs(vec_y)/length))
+    if vec_x >= 0 and vec_y >= 0:   # angle in the 1st quadrant. from 0deg to 90deg.
+        angle = angle
+        q=1
+    elif vec_x < 0 and vec_y >= 0:   # angle in the 2nd quadrant. from 90deg to 180deg.
+        angle = 180 - angle
+        q=2
+    elif vec_x <= 0 and vec_y < 0:  # angle in the 3rd quadrant. from 180deg to 270deg.
+        angle = 180 + angle
+        q=3
+    elif vec_x > 0 and vec_y < 0:  # angle in the 4th quadrant. from 270deg to 360deg.
+        angle = 360 - angle
+        q=4
+    if debug == True:
+        print(f"Q {q}")
+        print(f"angle {angle}")
+    return angle
+
+def relative_coordinate(datum_x, datum_y, datum_angle, x, y, debug = False):
+    # ---Description---
+    # transforms cartesian coordinates relative to a datum point to its absolute coordinates.
+    # input parameters: datum_x, datum_y, datum_angle, x, y, debug(optional)
+    # absolute_x, absolute_y = relative_coordinate(datum_x, datum_y, datum_angle, x, y, debug)
+    # refer to "PRT20210423001 Relative Coordinates Calculator"
+
+    # ---Variable List---
+    # datum_x = datum x coordinate
+    # datum_y = datum y coordinate
+    # datum_angle = angle of relative axis relative to the absolute axis.
+    # x = relative x coordinate
+    # y = relative y coordinate
+
+    # ---Return Variable List---
+    # absolute_x = absolute x coordinate
+    # absolute_y = absolute y coordinate
+
+    # ---Change History---
+    # rev: 01-01-02-01
+    # Initial record.
+    # added change history
+    # software test run < 18/Aug/2023
+    # --------------------
+
+    length = math.sqrt(x ** 2 + y ** 2)     # length of position relative to datum.
+    angle = absolute_angle(0, 0, x, y, debug)    # angle of position vector relative to datum x axis.
+    absolute_x = length * math.cos((datum_angle + angle)/180*math.pi) + datum_x
+    absolute_y = length * math.sin((datum_angle + angle)/180*math.pi) + datum_y
+
+    if debug == True:
+        print("")
+        print(f"datum_x = {datum_x}")
+        print(f"datum_y = {datum_y}")
+        print(f"datum_angle = {datum_angle}")
+        print(f"x = {x}")
+        print(f"y = {y}")
+        print(f"length = {length}")
+        print(f"angle = {angle}")
+        print(f"absolute_x = {absolute_x}")
+        print(f"absolute_y = {absolute_y}")
+        print("")
+
+    return absolute_x, absolute_y
+
+def relative_polar(datum_x, datum_y, datum_angle, length, angle, debug = False):
+    # ---Description---
+    # transforms polar coordinates relative to a datum point to its absolute cartesian coordinates.
+    # input parameters: datum_x, datum_y, datum_angle, length, angle, debug(optional))
+    # absolute_x, absolute_y = relative_polar(datum_x, datum_y, datum_angle, length, angle, debug)
+    # refer to "PRT20210423002 Polar Coordinates Calculator"
+
+    # ---Variable List---
+    # datum_x = datum/absolute origin x coordinate
+    # datum_y = datum/absolute origin y coordinate
+    # datum_angle = angle of relative axis relative to the absolute axis.
+    # length = length of the polar coordinate
+    # angle =  angle of the polar coordinate
+
+    # ---Return Variable List---
+    # absolute_x = absolute x coordinate
+    # absolute_y = absolute y coordinate
+
+    # ---Change History---
+    # rev: 01-01-02-01
+    # Initial record.
+    # added change history
+    # software test run < 18/Aug/2023
+    # --------------------
+
+    absolute_x = length * math.cos((datum_angle + angle)/180*math.pi) + datum_x
+    absolute_y = length * math.sin((datum_angle + angle)/180*math.pi) + datum_y
+
+    if debug == True:
+        print(f"datum_x = {datum_x}")
+        print(f"datum_y = {datum_y}")
+        print(f"datum_angle = {datum_angle}")
+        print(f"length = {length}")
+        print(f"angle = {angle}")
+        print(f"absolute_x = {absolute_x}")
+        print(f"absolute_y = {absolute_y}")
+
+    return absolute_x, absolute_y
+
+def rotation_matrix(angle):
+    # ---Description---
+    # Rotation matrix of an angle in degrees. cos and sin are calculated once for all points rotated by the angle.
+    # angle can be an array. matrix elements are then arrays of the same shape.
+    # matrix = rotation_matrix(angle)
+
+    # ---Variable List---
+    # angle = angle of rotation in degrees. counter clockwise is positive.
+
+    # ---Return Variable List---
+    # matrix = 2 x 2 numpy array. [[cos, -sin], [sin, cos]]
+
+    # ---Change History---
+    # rev: 01-01-03-01
+    # date: 18/Oct/2026
+    # initial release
+    # software test run on 18/Oct/2026
+
+    import numpy as np  # deferred import. see import_time_check().
+
+    radians = np.radians(angle)
+    cos = np.cos(radians)
+    sin = np.sin(radians)
+    return (np.array([[cos, -sin], [sin, cos]]))
+
+def absolute_angle_array(start_x, start_y, end_x, end_y):
+    # ---Description---
+    # Array version of absolute_angle(). absolute angles of many vectors in one call. angle ranges from 0 deg to < 360 deg.
+    # zero length vector -> angle = 0. angle is calculated with atan2. vectors close to 90 deg and 270 deg are more precise than absolute_angle() (asin of a number close to 1).
+    # angle = absolute_angle_array(start_x, start_y, end_x, end_y)
+
+    # ---Variable List---
+    # start_x = array of start point x coordinates
+    # start_y = array of start point y coordinates
+    # end_x = array of end point x coordinates
+    # end_y = array of end point y coordinates
+
+    # ---Return Variable List---
+    # angle = array of absolute angles of vectors
+
+    # ---Change History---
+    # rev: 01-01-03-01
+    # date: 18/Oct/2026
+    # initial release
+    # software test run on 18/Oct/2026
+
+    import numpy as np  # deferred import. see import_time_check().
+
+    angle = np.degrees(np.arctan2(np.subtract(end_y, start_y), np.subtract(end_x, start_x)))  # -180 deg to 180 deg
+    return (np.where(angle < 0, angle + 360, angle))
+
+def shift_origin_array(new_origin_x, new_origin_y, x, y):
+    # ---Description---
+    # Array version of shift_origin(). coordinates of many points relative to a new origin point.
+    # new_x, new_y = shift_origin_array(new_origin_x, new_origin_y, x, y)
+
+    # ---Variable List---
+    # new_origin_x = x origin of new relative cartesian coordinate
+    # new_origin_y = y origin of new relative cartesian coordinate
+    # x = array of x absolute cartesian coordinates
+    # y = array of y absolute cartesian coordinates
+
+    # ---Return Variable List---
+    # new_x = array of x relative cartesian coordinates
+    # new_y = array of y relative cartesian coordinates
+
+    # ---Change History---
+    # rev: 01-01-03-01
+    # date: 18/Oct/2026
+    # initial release
+    # software test run on 18/Oct/2026
+
+    import numpy as np  # deferred import. see import_time_check().
+
+    return (np.subtract(x, new_origin_x), np.subtract(y, new_origin_y))
+
+def cartesian_to_polar_array(x, y):
+    # ---Description---
+    # Array version of cartesian_to_polar(). polar coordinates of many points. origin point -> angle = 0, length = 0.
+    # angle, length = cartesian_to_polar_array(x, y)
+
+    # ---Variable List---
+    # x = array of x absolute cartesian coordinates
+    # y = array of y absolute cartesian coordinates
+
+    # ---Return Variable List---
+    # angle = array of angles on polar coordinate
+    # length = array of lengths on polar coordinate
+
+    # ---Change History---
+    # rev: 01-01-03-01
+    # date: 18/Oct/2026
+    # initial release
+    # software test run on 18/Oct/2026
+
+    import numpy as np  # deferred import. see import_time_check().
+
+    return (absolute_angle_array(0, 0, x, y), np.hypot(x, y))
+
+def polar_to_cartesian_array(angle, length):
+    # ---Description---
+    # Array version of polar_to_cartesian(). cartesian coordinates of many points.
+    # x, y = polar_to_cartesian_array(angle, length)
+
+    # ---Variable List---
+    # angle = array of angles on polar coordinate
+    # length = array of lengths on polar coordinate
+
+    # ---Return Variable List---
+    # x = array of x cartesian coordinates
+    # y = array of y cartesian coordinates
+
+    # ---Change History---
+    # rev: 01-01-03-01
+    # date: 18/Oct/2026
+    # initial release
+    # software test run on 18/Oct/2026
+
+    import numpy as np  # deferred import. see import_time_check().
+
+    radians = np.radians(np.mod(angle, 360))    # format angle. see format_angle()
+    return (length * np.cos(radians), length * np.sin(radians))
+
+def rotate_axis_array(angle, x, y):
+    # ---Description---
+    # Array version of rotate_axis(). coordinates of many points relative to an axis rotated about the absolute origin.
+    # points are rotated by -angle with one rotation matrix.
+    # new_x, new_y = rotate_axis_array(angle, x, y)
+
+    # ---Variable List---
+    # angle = angle of rotated axis in degrees
+    # x = array of x absolute cartesian coordinates
+    # y = array of y absolute cartesian coordinates
+
+    # ---Return Variable List---
+    # new_x = array of x coordinates relative to rotated axis
+    # new_y = array of y coordinates relative to rotated axis
+
+    # ---Change History---
+    # rev: 01-01-03-01
+    # date: 18/Oct/2026
+    # initial release
+    # software test run on 18/Oct/2026
+
+    matrix = rotation_matrix(-angle)
+    return (matrix[0][0] * x + matrix[0][1] * y, matrix[1][0] * x + matrix[1][1] * y)
+
+def relative_coordinate_array(datum_x, datum_y, datum_angle, x, y):
+    # ---Description---
+    # Array version of relative_coordinate(). absolute coordinates of many points given relative to a datum point.
+    # points are rotated by datum_angle with one rotation matrix and shifted to the datum point.
+    # absolute_x, absolute_y = relative_coordinate_array(datum_x, datum_y, datum_angle, x, y)
+
+    # ---Variable List---
+    # datum_x = datum x coordinate
+    # datum_y = datum y coordinate
+    # datum_angle = angle of relative axis relative to the absolute axis.
+    # x = array of relative x coordinates
+    # y = array of relative y coordinates
+
+    # ---Return Variable List---
+    # absolute_x = array of absolute x coordinates
+    # absolute_y = array of absolute y coordinates
+
+    # ---Change History---
+    # rev: 01-01-03-01
+    # date: 18/Oct/2026
+    # initial release
+    # software test run on 18/Oct/2026
+
+    matrix = rotation_matrix(datum_angle)
+    return (matrix[0][0] * x + matrix[0][1] * y + datum_x, matrix[1][0] * x + matrix[1][1] * y + datum_y)
+
+def relative_polar_array(datum_x, datum_y, datum_angle, length, angle):
+    # ---Description---
+    # Array version of relative_polar(). absolute cartesian coordinates of many points given in polar coordinates relative to a datum point.
+    # absolute_x, absolute_y = relative_polar_array(datum_x, datum_y, datum_angle, length, angle)
+
+    # ---Variable List---
+    # datum_x = datum/absolute origin x coordinate
+    # datum_y = datum/absolute origin y coordinate
+    # datum_angle = angle of relative axis relative to the absolute axis.
+    # length = array of lengths of the polar coordinates
+    # angle = array of angles of the polar coordinates
+
+    # ---Return Variable List---
+    # absolute_x = array of absolute x coordinates
+    # absolute_y = array of absolute y coordinates
+
+    # ---Change History---
+    # rev: 01-01-03-01
+    # date: 18/Oct/2026
+    # initial release
+    # software test run on 18/Oct/2026
+
+    import numpy as np  # deferred import. see import_time_check().
+
+    radians = np.radians(np.add(datum_angle, angle))
+    return (length * np.cos(radians) + datum_x, length * np.sin(radians) + datum_y)
+
+def absolute_cartesian_to_relative_polar_array(origin_x, origin_y, absolute_x, absolute_y):
+    # ---Description---
+    # Array version of absolute_cartesian_to_relative_polar(). relative polar coordinates of many points about an origin point.
+    # angle will range from 0 deg to < 360 deg. No negative angle.
+    # angle, length, origin_x, origin_y = absolute_cartesian_to_relative_polar_array(origin_x, origin_y, absolute_x, absolute_y)
+
+    # ---Variable List---
+    # origin_x = x origin of new relative polar coordinate axis
+    # origin_y = y origin of new relative polar coordinate axis
+    # absolute_x = array of x absolute cartesian coordinates
+    # absolute_y = array of y absolute cartesian coordinates
+
+    # ---Return Variable List---
+    # angle = array of angles on relative polar coordinate
+    # length = array of lengths on relative polar coordinate
+    # origin_x = x origin of new relative polar coordinate axis
+    # origin_y = y origin of new relative polar coordinate axis
+
+    # ---Change History---
+    # rev: 01-01-03-01
+    # date: 18/Oct/2026
+    # initial release
+    # software test run on 18/Oct/2026
+
+    angle, length = cartesian_to_polar_array(*shift_origin_array(origin_x, origin_y, absolute_x, absolute_y))
+    return (angle, length, origin_x, origin_y)
+
+def rounding_check(absolute_x, absolute_y, decimals = 4):
+    # ---Description---
+    # Finds coordinates whose "%.4f" text can change with a difference in the last bit, e.g. numpy and math trig functions.
+    # coordinates that are close to half way at decimals places, round to zero (sign can differ) or are not finite.
+    # index = rounding_check(absolute_x, absolute_y, decimals)
+
+    # ---Variable List---
+    # absolute_x = array of x coordinates
+    # absolute_y = array of y coordinates
+    # decimals = decimal places of G-code coordinates.
+
+    # ---Return Variable List---
+    # index = list of positions to be calculated again one by one.
+
+    # ---Change History---
+    # rev: 01-01-03-01
+    # date: 18/Oct/2026
+    # initial release
+    # software test run on 18/Oct/2026
+
+    import numpy as np  # deferred import. see import_time_check().
+
+    scale = 10 ** decimals
+    check = []
+    for value in (absolute_x, absolute_y):
+        scaled = value * scale
+        fraction = np.abs(scaled - np.trunc(scaled))
+        check.append((np.abs(fraction - 0.5) <= np.abs(scaled) * 1e-12 + 1e-9) | (np.abs(scaled) < 1) | (np.isfinite(scaled) == False))  # last digit or sign can differ
+    return (np.flatnonzero(check[0] | check[1]).tolist())
+
+def relative_coordinate_bulk(datum_x, datum_y, datum_angle, x, y, decimals = 4):
+    # ---Description---
+    # Bulk version of relative_coordinate() for G-code. absolute coordinates of many points relative to a datum point in one call.
+    # Calculation follows relative_coordinate() step by step (length, absolute_angle quadrants, cos and sin), unlike relative_coordinate_array().
+    # coordinates that are close to half way at decimals places (or round to zero) are calculated again with relative_coordinate(),
+    # so "%.4f" text of every coordinate is identical to the one point at a time function.
+    # absolute_x, absolute_y = relative_coordinate_bulk(datum_x, datum_y, datum_angle, x, y, decimals)
+
+    # ---Variable List---
+    # datum_x = datum x coordinate
+    # datum_y = datum y coordinate
+    # datum_angle = angle of relative axis relative to the absolute axis.
+    # x = array of relative x coordinates
+    # y = array of relative y coordinates
+    # decimals = decimal places of G-code coordinates.
+
+    # ---Return Variable List---
+    # absolute_x = array of absolute x coordinates
+    # absolute_y = array of absolute y coordinates
+
+    # ---Change History---
+    # rev: 01-01-03-01
+    # date: 18/Oct/2026
+    # initial release
+    # software test run on 18/Oct/2026
+
+    import numpy as np  # deferred import. see import_time_check().
+
+    x, y = np.broadcast_arrays(np.asarray(x, dtype='f8'), np.asarray(y, dtype='f8'))
+    length = np.sqrt(x ** 2 + y ** 2)     # length of position relative to datum.
+    with np.errstate(divide='ignore', invalid='ignore'):
+        angle = np.degrees(np.arcsin(np.abs(y) / length))    # see absolute_angle()
+    angle = np.select([(x >= 0) & (y >= 0), (x < 0) & (y >= 0), (x <= 0) & (y < 0)], [angle, 180 - angle, 180 + angle], 360 - angle)    # 1st to 4th quadrant
+    absolute_x = length * np.cos((datum_angle + angle)/180*np.pi) + datum_x
+    absolute_y = length * np.sin((datum_angle + angle)/180*np.pi) + datum_y
+
+    for k in rounding_check(absolute_x, absolute_y, decimals):
+        absolute_x[k], absolute_y[k] = relative_coordinate(datum_x, datum_y, datum_angle, float(x[k]), float(y[k]))   # one by one
+    return (absolute_x, absolute_y)
+
+def tro_slot_loops(start_x, start_y, angle, step, noc, noc_re, rad_arc):
+    # ---Description---
+    # Positions of all trochoidal loops of a straight slot in one call. refer to sketch of tro_slot().
+    # loop i (1 to noc) starts at (i - 1) * step along the slot. last loop is cut to the depth of the remainder (noc_re).
+    # x1, y1, x2, y2, x3, y3, x4, y4 = tro_slot_loops(start_x, start_y, angle, step, noc, noc_re, rad_arc)
+
+    # ---Variable List---
+    # start_x = x start of slot along neutral axis
+    # start_y = y start of slot along neutral axis
+    # angle = absolute angle of slot
+    # step = step over of loops
+    # noc = number of loops (cuts)
+    # noc_re = length of last partial loop. 0 -> last loop is a full step.
+    # rad_arc = radius of cut arc
+
+    # ---Return Variable List---
+    # x1, y1 ... x4, y4 = arrays of 1st to 4th position of each loop
+
+    # ---Change History---
+    # rev: 01-01-03-01
+    # date: 18/Oct/2026
+    # initial release
+    # software test run on 18/Oct/2026
+
+    import numpy as np  # deferred import. see import_time_check().
+
+    i = np.arange(1, noc + 1)
+    back = ((i - 1) * step).astype('f8')   # 1st and 4th position
+    front = (i * step).astype('f8')        # 2nd and 3rd position
+    if noc > 0 and noc_re != 0:
+        front[-1] = (noc - 1) * step + noc_re    # cut last loop to the depth of the remainder.
+    x1, y1 = relative_coordinate_bulk(start_x, start_y, angle, back, -rad_arc)
+    x2, y2 = relative_coordinate_bulk(start_x, start_y, angle, front, -rad_arc)
+    x3, y3 = relative_coordinate_bulk(start_x, start_y, angle, front, rad_arc)
+    x4, y4 = relative_coordinate_bulk(start_x, start_y, angle, back, rad_arc)
+    return (x1, y1, x2, y2, x3, y3, x4, y4)
+
+def relative_polar_bulk(datum_x, datum_y, datum_angle, length, angle, decimals = 4):
+    # ---Description---
+    # Bulk version of relative_polar() for G-code. absolute coordinates of many polar coordinates relative to a datum point in one call.
+    # Calculation follows relative_polar() in the same order. coordinates found by rounding_check() are calculated again with relative_polar(),
+    # so "%.4f" text of every coordinate is identical to the one point at a time function.
+    # absolute_x, absolute_y = relative_polar_bulk(datum_x, datum_y, datum_angle, length, angle, decimals)
+
+    # ---Variable List---
+    # datum_x = datum/absolute origin x coordinate
+    # datum_y = datum/absolute origin y coordinate
+    # datum_angle = angle of relative axis relative to the absolute axis.
+    # length = array of lengths of the polar coordinates
+    # angle = array of angles of the polar coordinates
+    # decimals = decimal places of G-code coordinates.
+
+    # ---Return Variable List---
+    # absolute_x = array of absolute x coordinates
+    # absolute_y = array of absolute y coordinates
+
+    # ---Change History---
+    # rev: 01-01-03-01
+    # date: 18/Oct/2026
+    # initial release
+    # software test run on 18/Oct/2026
+
+    import numpy as np  # deferred import. see import_time_check().
+
+    length, angle = np.broadcast_arrays(np.asarray(length, dtype='f8'), np.asarray(angle, dtype='f8'))
+    absolute_x = length * np.cos((datum_angle + angle)/180*np.pi) + datum_x
+    absolute_y = length * np.sin((datum_angle + angle)/180*np.pi) + datum_y
+    for k in rounding_check(absolute_x, absolute_y, decimals):
+        absolute_x[k], absolute_y[k] = relative_polar(datum_x, datum_y, datum_angle, float(length[k]), float(angle[k]))   # one by one
+    return (absolute_x, absolute_y)
+
+def tro_arc_schedule(step_angle, end_angle, cw):
+    # ---Description---
+    # Angle schedule of all trochoidal loops of an arc slot. refer to tro_arc().
+    # 1st loop starts at 0 deg. angle advances by step_angle (cw: negative direction. ccw: positive direction) until the last step_angle before end_angle.
+    # a last partial loop covers the remainder to end_angle if present.
+    # angles are added one step at a time (cumulative sum) so they are identical to incrementing angle in a loop.
+    # angle, inc_angle, partial = tro_arc_schedule(step_angle, end_angle, cw)
+
+    # ---Variable List---
+    # step_angle = angle of one step over along slot arc
+    # end_angle = angle of end of slot arc. negative for cw arc.
+    # cw = Boolean. True = clockwise False = counter clockwise.
+
+    # ---Return Variable List---
+    # angle = array of start angles of loops
+    # inc_angle = array of angles covered by each loop
+    # partial = Boolean. True: last loop is the partial loop to end_angle.
+
+    # ---Change History---
+    # rev: 01-01-03-01
+    # date: 18/Oct/2026
+    # initial release
+    # software test run on 18/Oct/2026
+
+    import numpy as np  # deferred import. see import_time_check().
+
+    if cw == True:
+        step_signed = - step_angle     # angle decrements in cw arc
+    elif cw == False:
+        step_signed = step_angle       # angle increments in ccw arc
+    limit = abs(end_angle) - abs(step_angle)
+    count = int(abs(end_angle) / abs(step_angle)) + 2     # number of steps. doubled until the schedule ends.
+    while True:
+        angle = np.concatenate(([0.0], np.cumsum(np.full(count, step_signed, dtype='f8'))))
+        if abs(angle[-1]) >= limit:
+            break
+        count = count * 2
+    stop = int(np.argmin(np.abs(angle[1:]) < limit)) + 1     # first angle after loops with full step.
+    partial = bool(abs(angle[stop]) < abs(end_angle))
+    if partial == True:
+        angle = angle[:stop + 1]
+        inc_angle = np.full(stop + 1, step_angle, dtype='f8')
+        inc_angle[-1] = abs(end_angle) - abs(angle[-1])     # remainder to end angle
+    else:
+        angle = angle[:stop]
+        inc_angle = np.full(stop, step_angle, dtype='f8')
+    return (angle, inc_angle, partial)
+
+def tro_arc_loops(datum_x, datum_y, datum_angle, rad_slot, rad_arc, angle, inc_angle, cw):
+    # ---Description---
+    # Positions of trochoidal loops of an arc slot in one call. refer to sketch of tro_arc().
+    # loop starts at angle and covers inc_angle. cw: 1st and 2nd position on minor radius. ccw: 1st and 2nd position on major radius.
+    # x1, y1, x2, y2, x3, y3, x4, y4 = tro_arc_loops(datum_x, datum_y, datum_angle, rad_slot, rad_arc, angle, inc_angle, cw)
+
+    # ---Variable List---
+    # datum_x = x center of slot arc
+    # datum_y = y center of slot arc
+    # datum_angle = absolute angle of start point with respect to center of slot arc.
+    # rad_slot = radius of slot arc.
+    # rad_arc = radius of cut arc
+    # angle = array of start angles of loops. see tro_arc_schedule()
+    # inc_angle = array of angles covered by each loop
+    # cw = Boolean. True = clockwise False = counter clockwise.
+
+    # ---Return Variable List---
+    # x1, y1 ... x4, y4 = arrays of 1st to 4th position of each loop
+
+    # ---Change History---
+    # rev: 01-01-03-01
+    # date: 18/Oct/2026
+    # initial release
+    # software test run on 18/Oct/2026
+
+    major_rad = rad_slot + rad_arc
+    minor_rad = rad_slot - rad_arc
+    if cw == True:
+        rad_1 = minor_rad
+        rad_3 = major_rad
+        angle_2 = angle - inc_angle
+    elif cw == False:
+        rad_1 = major_rad
+        rad_3 = minor_rad
+        angle_2 = angle + inc_angle
+    x1, y1 = relative_polar_bulk(datum_x, datum_y, datum_angle, rad_1, angle)
+    x2, y2 = relative_polar_bulk(datum_x, datum_y, datum_angle, rad_1, angle_2)
+    x3, y3 = relative_polar_bulk(datum_x, datum_y, datum_angle, rad_3, angle_2)
+    x4, y4 = relative_polar_bulk(datum_x, datum_y, datum_angle, rad_3, angle)
+    return (x1, y1, x2, y2, x3, y3, x4, y4)
+
+def spiral_error(length, step_length, segments, samples = 32):
+    # ---Description---
+    # Largest distance between one spiral segment as cut (arc of radius length, G2/G3 R word) and the spiral it replaces.
+    # segment ends at length and starts at length - step_length, 360 / segments deg before. spiral radius changes evenly with angle along the segment.
+    # distance is measured along the radius of the spiral at samples points of the arc. cw segments are mirror images of ccw segments (same error).
+    # error = spiral_error(length, step_length, segments, samples)
+
+    # ---Variable List---
+    # length = radius of end of segment. radius of arc.
+    # step_length = radius change of segment (step / segments). negative for inward spiral.
+    # segments = number of segments per revolution.
+    # samples = number of parts the arc is divided into.
+
+    # ---Return Variable List---
+    # error = largest distance of arc from spiral.
+
+    # ---Change History---
+    # rev: 01-01-03-01
+    # date: 18/Oct/2026
+    # initial release
+    # software test run on 18/Oct/2026
+
+    segment_angle = 2 * math.pi / segments
+    start_x, start_y = length - step_length, 0     # start of segment at 0 deg
+    end_x, end_y = polar_to_cartesian(segment_angle * 180 / math.pi, length)   # end of segment
+    chord = math.sqrt((end_x - start_x) ** 2 + (end_y - start_y) ** 2)
+    height = math.sqrt(max(length ** 2 - chord ** 2 / 4, 0))  # center of arc from middle of chord. shorter arc (R positive).
+    center_x = (start_x + end_x) / 2 - (end_y - start_y) / chord * height     # center on the left of the chord (ccw)
+    center_y = (start_y + end_y) / 2 + (end_x - start_x) / chord * height
+    start_angle = math.atan2(start_y - center_y, start_x - center_x)
+    end_angle = math.atan2(end_y - center_y, end_x - center_x)
+    if end_angle < start_angle:
+        end_angle = end_angle + 2 * math.pi
+    error = 0
+    for k in range(1, samples):
+        angle = start_angle + (end_angle - start_angle) * k / samples
+        x = center_x + length * math.cos(angle)     # point on arc
+        y = center_y + length * math.sin(angle)
+        spiral = length - step_length + step_length * math.atan2(y, x) / segment_angle     # spiral radius at angle of point
+        error = max(error, abs(math.sqrt(x ** 2 + y ** 2) - spiral))
+    return (error)
+
+def spiral_segments(length, step_length, tolerance = None):
+    # ---Description---
+    # Number of segments per revolution of a spiral.
+    # tolerance = None -> 24 segments per revolution (fixed number of segments before 01-01-03-01).
+    # otherwise the fewest segments (at least 4, 90 deg) whose arcs stay within tolerance of the spiral. see spiral_error()
+    # error comes from the radius change per segment: about step / segments * (2 pi / segments) ** 2 / (9 sqrt(3)). nearly the same at any radius.
+    # small pockets and fine steps get fewer segments than 24 at usual tolerances.
+    # error grows close to the center (more segments in the 1st revolutions of a pocket). radius is taken as at least one segment step.
+    # segments = spiral_segments(length, step_length, tolerance)
+
+    # ---Variable List---
+    # length = smallest radius of spiral revolution.
+    # step_length = radius change per revolution (step). negative for inward spiral.
+    # tolerance = largest distance of segment arcs from spiral. None -> 24 segments.
+
+    # ---Return Variable List---
+    # segments = number of segments per revolution.
+
+    # ---Change History---
+    # rev: 01-01-03-01
+    # date: 18/Oct/2026
+    # initial release
+    # software test run on 18/Oct/2026
+
+    if tolerance == None:
+        return (24)
+    if tolerance <= 0:
+        abort('spiral_tolerance', tolerance, 'spiral tolerance must be larger than 0 or None')
+    length = abs(length)
+    segments = max(4, math.floor((abs(step_length) * (2 * math.pi) ** 2 / (9 * math.sqrt(3)) / tolerance) ** (1 / 3)))     # estimate
+    while segments > 4 and spiral_error(max(length, abs(step_length) / (segments - 1)), step_length / (segments - 1), segments - 1) <= tolerance:
+        segments = segments - 1
+    while spiral_error(max(length, abs(step_length) / segments), step_length / segments, segments) > tolerance:
+        segments = segments + 1
+    return (segments)
+
+def spiral_path(origin_x, origin_y, start_length, end_length, step, outward, cw, tolerance = None):
+    # ---Description---
+    # End points of all segments of a spiral in one call. shared by spiral_surface (outward) and spiral_boss (inward).
+    # radius changes by step per revolution. number of segments of each revolution from spiral_segments() at the smallest radius of the revolution.
+    # radius and angle are added one segment at a time (cumulative sum) so they are identical to incrementing them in a loop.
+    # path ends at end_length. 1st segment is not shortened. last point is calculated with relative_polar().
+    # x, y, length, last = spiral_path(origin_x, origin_y, start_length, end_length, step, outward, cw, tolerance)
+
+    # ---Variable List---
+    # origin_x = x center of spiral
+    # origin_y = y center of spiral
+    # start_length = radius of start point at 0 deg.
+    # end_length = radius of end point
+    # step = step of slice per spiral.
+    # outward = Boolean. True: radius increases. False: radius decreases.
+    # cw = Boolean. True = clockwise False = counter clockwise.
+    # tolerance = largest distance of segment arcs from spiral. None -> 24 segments per revolution. see spiral_segments()
+
+    # ---Return Variable List---
+    # x = array of x end point of each segment
+    # y = array of y end point of each segment
+    # length = array of radius of each segment
+    # last = Boolean. True: path reached end_length.
+
+    # ---Change History---
+    # rev: 01-01-03-01
+    # date: 18/Oct/2026
+    # initial release
+    # software test run on 18/Oct/2026
+
+    import numpy as np  # deferred import. see import_time_check().
+
+    if step <= 0:
+        abort('step', step, 'step must be larger than 0')
+    sign = 1 if outward == True else -1
+    direction = 1 if cw == False else -1
+
+    segments = []   # number of segments of each revolution
+    length = start_length
+    while len(segments) < 2 or sign * (length - end_length) < step:     # revolutions past end of spiral. 1 extra for rounding of the cumulative sum.
+        segments.append(spiral_segments(min(abs(length), abs(length + sign * step)), sign * step, tolerance))
+        length = length + sign * step
+    segments = np.array(segments)
+    step_length = np.repeat(sign * (step / segments), segments)    # radius increment of each segment. -(a / b) is identical to subtracting a / b.
+    step_angle = np.repeat(direction * (360 / segments), segments)     # angle increment of each segment.
+
+    length = np.cumsum(np.concatenate(([start_length], step_length)))[1:]
+    if sign * (length[0] - end_length) > 0:    # 1st segment is past end of spiral.
+        empty = np.zeros(0, dtype='f8')
+        return (empty, empty, empty, False)
+
+    stop = int(np.argmax(sign * (length[1:] - end_length) >= 0)) + 1     # first segment at or past end of spiral.
+    length = length[:stop + 1]
+    length[-1] = end_length     # last segment ends at end_length.
+    angle = np.cumsum(step_angle[:stop + 1])
+    x, y = relative_polar_bulk(origin_x, origin_y, 0, length, angle)
+    x[-1], y[-1] = relative_polar(origin_x, origin_y, 0, float(length[-1]), float(angle[-1]))     # end point of finish cuts.
+    return (x, y, length, True)
+
+def write_to_file(name, text, lines = None):
+    # ---Description---
+    # open and write text to a text file.
+
+    # ---Variable List---
+    # name = name of txt file
+    # lines = optional (parts, columns, decimals) of G-code lines. see render_lines(). numbers are added to move lists as they are. text = None -> rendered when needed.
+
+    # ---Return Variable List---
+    # text = text to write to file
+
+    # ---Change History---
+    # rev: 01-01-03-01
+    # date: 18/Oct/2026
+    # text is written to the open output file if name was opened with open_output(). file is not opened and closed for every write.
+    # text is added to output_capture if capture of name is started.
+    # text of a split G-code file is passed to split_write().
+    # text of a G-code file sent to a machine is passed to dnc_write().
+    # text of a file with a writer thread is put into its queue. see writer_open(). file is written by write_output().
+    # text of a file with binary toolpath export is added to its move list. see npz_open()
+    # Added lines. number columns of G-code lines are added to move lists without reading text. see move_lines()
+    # software test run on 18/Oct/2026
+    #
+    # rev: 01-01-02-01
+    # Initial record.
+    # added change history
+    # software test run < 18/Aug/2023
+    # --------------------
+
+    if text == None:
+        data, lengths = render_lines(*lines)
+        text = data.tobytes().decode()
+    if name in output_capture:
+        output_capture[name].append(text)   # capture G-code of current step
+    if name in output_npz and output_npz[name]['shared'] == False:
+        if lines == None:
+            gcode_moves(output_npz[name]['moves'], text)    # add to move list of binary toolpath export. see npz_open()
+        else:
+            move_lines(output_npz[name]['moves'], *lines)
+    if name in output_moves:
+        if lines == None:
+            gcode_moves(output_moves[name], text)   # add to move list. file is written by write_moves().
+        else:
+            move_lines(output_moves[name], *lines)
+        return
+    if name in output_dnc:
+        dnc_write(name, text)   # drip-feed to machine. see dnc_open()
+    if name in output_split:
+        split_write(name, text)     # written to chunk files. see split_output()
+        return
+    if name in output_writers:
+        writer_put(name, text)  # written by background writer thread. see writer_open()
+        return
+    write_output(name, text)
+
+output_files = {}       # open output files. key is file name without extension. see open_output()
+output_capture = {}     # text written to each captured file name. see write_to_file()
+output_moves = {}       # move list of each file name rendered at the end of the job. see gcode_moves()
+output_npz = {}         # binary toolpath export of each file name. saved when the file is closed. see npz_open()
+
+output_suffix = {None: '.txt', 'gzip': '.txt.gz', 'zstd': '.txt.zst'}     # file extension of each output compression.
+
+output_writers = {}     # background writer threads. key is file name without extension. see writer_open()
+
+def write_output(name, text):
+    # ---Description---
+    # Writes text to the open output file of name or appends it to name.txt. write_to_file() and writer threads write through this function.
+    # write_output(name, text)
+
+    # ---Variable List---
+    # name = name of txt file without extension.
+    # text = text to write to file
+
+    # ---Return Variable List---
+    # N/A
+
+    # ---Change History---
+    # rev: 01-01-03-01
+    # date: 18/Oct/2026
+    # initial release
+    # software test run on 18/Oct/2026
+
+    if name in output_files:
+        output_files[name]['file'].write(text)  # buffered write to open output file
+        return
+    with open(f'{name}.txt', 'a') as file:  # create new date time stamped file and open for writing
+        file.write(text)
+    file.close()
+
+def writer_open(name, queue_size=1000):
+    # ---Description---
+    # Starts a background writer thread for name. write_to_file() puts text of name into a queue and returns. the writer thread writes it to the file.
+    # File writes, compression and syncing to disk do not hold up the main program.
+    # Queue holds queue_size writes. write_to_file() waits when the queue is full (back-pressure). memory does not grow when the file is written slower than the text is made.
+    # writer_close() writes the queue to the file and stops the thread. called by close_outputs() at the end of the job, on abort and on exit.
+    # writer_open(name, queue_size)
+
+    # ---Variable List---
+    # name = name of txt file without extension.
+    # queue_size = maximum number of writes waiting in the queue.
+
+    # ---Return Variable List---
+    # N/A
+
+    # ---Change History---
+    # rev: 01-01-03-01
+    # date: 18/Oct/2026
+    # initial release
+    # software test run on 18/Oct/2026
+
+    writer = {'queue': queue.Queue(queue_size), 'error': None}
+
+    def write():
+        try:
+            while True:
+                text = writer['queue'].get()
+                if text == None:
+                    break   # writer closed
+                texts = [text]
+                while len(texts) < queue_size:
+                    try:
+                        texts.append(writer['queue'].get_nowait())  # join waiting writes into one write
+                    except queue.Empty:
+                        break
+                stop = texts[-1] == None
+                if stop == True:
+                    texts.pop()
+                write_output(name, ''.join(texts))
+                if stop == True:
+                    break
+        except Exception as error:
+            writer['error'] = error
+
+    writer['thread'] = threading.Thread(target=write, name=f'writer {name}', daemon=True)
+    writer['thread'].start()
+    output_writers[name] = writer
+
+def writer_put(name, text):
+    # ---Description---
+    # Puts text into the queue of the writer thread of name. waits while the queue is full.
+    # Raises the error of the writer thread if the file can not be written.
+    # writer_put(name, text)
+
+    # ---Variable List---
+    # name = name of txt file without extension.
+    # text = text to write. None -> close writer.
+
+    # ---Return Variable List---
+    # N/A
+
+    # ---Change History---
+    # rev: 01-01-03-01
+    # date: 18/Oct/2026
+    # initial release
+    # software test run on 18/Oct/2026
+
+    writer = output_writers[name]
+    while writer['thread'].is_alive():
+        try:
+            writer['queue'].put(text, timeout=0.5)
+            return
+        except queue.Full:
+            pass    # file is written slower than text is made
+    if writer['error'] != None:
+        raise OSError(f'writer of {name} stopped. {writer["error"]}')
+
+def writer_close(name):
+    # ---Description---
+    # Writes the text waiting in the queue of the writer thread of name to the file and stops the thread. file stays open. see close_output()
+    # writer_close(name)
+
+    # ---Variable List---
+    # name = name of txt file without extension.
+
+    # ---Return Variable List---
+    # N/A
+
+    # ---Change History---
+    # rev: 01-01-03-01
+    # date: 18/Oct/2026
+    # initial release
+    # software test run on 18/Oct/2026
+
+    writer = output_writers[name]
+    if writer['thread'].is_alive():
+        writer_put(name, None)  # close writer after last text
+    del output_writers[name]
+    writer['thread'].join()
+    if writer['error'] != None:
+        print(f'writer of {name} stopped. {writer["error"]}')
+
+def open_output(name, buffer_size=1024 * 1024, compression=None):
+    # ---Description---
+    # Opens an output text file once per job. write_to_file() writes to the open file through a buffer.
+    # Text is written to a temporary file (name.txt.tmp). close_output() flushes and renames it to name.txt in one step.
+    # file is opened before any text of the job is written. name.txt of an earlier run is replaced, never appended.
+    # Optional compression. text is compressed as it is written (name.txt.gz or name.txt.zst). whole text is never held in memory.
+    # zstd needs the zstandard package.
+    # open_output(name, buffer_size, compression)
+
+    # ---Variable List---
+    # name = name of txt file without extension.
+    # buffer_size = write buffer size in bytes. text is written to disk when the buffer is full.
+    # compression = None -> text file. 'gzip' -> gzip file. 'zstd' -> zstandard file.
+
+    # ---Return Variable List---
+    # N/A
+
+    # ---Change History---
+    # rev: 01-01-03-01
+    # date: 18/Oct/2026
+    # initial release
+    # Added compression.
+    # text is not copied from name.txt. file headers are written after the file is opened.
+    # software test run on 18/Oct/2026
+
+    if compression not in output_suffix:
+        raise ValueError(f"invalid output compression: {compression}. use None, 'gzip' or 'zstd'")
+    path = name + output_suffix[compression]
+    temp_path = path + '.tmp'
+    output = {'path': path, 'temp_path': temp_path, 'compression': compression}
+    if compression == None:
+        output['file'] = open(temp_path, 'w', buffering=buffer_size)
+        output_files[name] = output
+        return
+    if compression == 'zstd':
+        try:
+            import zstandard    # optional package. imported only for zstd output.
+        except ImportError:
+            raise ImportError("output_compression = 'zstd' needs the zstandard package. pip install zstandard") from None
+    output['raw'] = open(temp_path, 'wb', buffering=buffer_size)   # compressed file
+    if compression == 'gzip':
+        output['stream'] = gzip.GzipFile(os.path.basename(f'{name}.txt'), 'wb', 6, output['raw'])  # compress as written
+    else:
+        output['stream'] = zstandard.ZstdCompressor(level=3).stream_writer(output['raw'])  # compress as written
+    output['file'] = io.TextIOWrapper(output['stream'])
+    output_files[name] = output
+
+def close_output(name, finish=True):
+    # ---Description---
+    # Flushes and closes an output file opened with open_output().
+    # File is synced to disk and renamed from name.txt.tmp to name.txt. name.txt is only replaced by a finished file (end of job or abort).
+    # Compressed files are finished (gzip trailer, zstandard frame end) before they are renamed.
+    # finish = False (exit on error) -> text is kept in name.txt.tmp and name.txt is left as it was.
+    # close_output(name, finish)
+
+    # ---Variable List---
+    # name = name of txt file without extension.
+    # finish = True -> rename into place. False -> keep temporary file.
+
+    # ---Return Variable List---
+    # N/A
+
+    # ---Change History---
+    # rev: 01-01-03-01
+    # date: 18/Oct/2026
+    # initial release
+    # compressed files are finished before they are renamed.
+    # Added finish. file is not renamed into place on exit without abort.
+    # software test run on 18/Oct/2026
+
+    output = output_files.pop(name)
+    output['file'].flush()     # write buffer to file
+    if output['compression'] == None:
+        os.fsync(output['file'].fileno())   # write file to disk
+        output['file'].close()
+    else:
+        if output['compression'] == 'gzip':
+            output['stream'].close()    # write gzip trailer. compressed file stays open.
+        else:
+            import zstandard
+            output['stream'].flush(zstandard.FLUSH_FRAME)  # end zstandard frame
+        output['raw'].flush()
+        os.fsync(output['raw'].fileno())    # write file to disk
+        output['raw'].close()
+    if finish == False:
+        return      # unfinished file stays in name.txt.tmp
+    os.replace(output['temp_path'], output['path'])  # rename into place in one step
+
+def close_outputs(dnc_stop=False, finish=True):
+    # ---Description---
+    # Closes all open output files. Called at the end of the job, by abort() and on exit so text written before the program stops is kept.
+    # Ends drip-feeding (DNC) after the files are closed. waits for the machine to answer all blocks unless dnc_stop is set.
+    # on exit without abort (error, quit) files are not finished: text stays in the temporary files and no binary toolpath is saved.
+    # close_outputs(dnc_stop, finish)
+
+    # ---Variable List---
+    # dnc_stop = True -> stop DNC sending. blocks not yet sent are dropped. abort and exit on error. see dnc_close()
+    # finish = True -> files are renamed into place. False -> exit on error. see close_output()
+
+    # ---Return Variable List---
+    # N/A
+
+    # ---Change History---
+    # rev: 01-01-03-01
+    # date: 18/Oct/2026
+    # initial release
+    # split G-code files are closed. see close_split()
+    # DNC senders are closed. see dnc_close()
+    # writer threads are closed before their files. see writer_close()
+    # binary toolpath exports are saved. see npz_close()
+    # files are renamed into place only at the end of the job and on abort (finish).
+    # software test run on 18/Oct/2026
+
+    for name in list(output_moves):
+        write_moves(name)   # render move list
+    for name in list(output_npz):
+        if finish == True:
+            npz_close(name)     # save binary toolpath
+        else:
+            del output_npz[name]    # unfinished toolpath is not saved
+    for name in list(output_split):
+        close_split(name, finish)   # last chunk of split file
+    for name in list(output_writers):
+        writer_close(name)  # write queued text
+    for name in list(output_files):
+        close_output(name, finish)
+    for name in list(output_dnc):
+        dnc_close(name, dnc_stop)   # end DNC
+
+atexit.register(close_outputs, True, False)  # close output files when program quits. DNC is stopped and files are not renamed into place if the job did not finish.
+
+def file_sink(name):
+    # ---Description---
+    # Returns a sink for the toolpath functions. Each G-code block is written to the output file as it is generated.
+    # G-code of a toolpath is not held in memory. see open_output() for the write buffer.
+    # sink = file_sink(name)
+
+    # ---Variable List---
+    # name = name of txt file without extension.
+
+    # ---Return Variable List---
+    # sink = function. sink(text) writes text to the file. sink.lines(parts, columns, decimals) writes G-code lines. see emit_lines()
+
+    # ---Change History---
+    # rev: 01-01-03-01
+    # date: 18/Oct/2026
+    # initial release
+    # Added sink.lines.
+    # software test run on 18/Oct/2026
+
+    def sink(text):
+        write_to_file(name, text)
+    def lines(parts, columns, decimals):
+        write_to_file(name, None, (parts, columns, decimals))
+    sink.lines = lines
+    return (sink)
+
+output_split = {}       # G-code files split into chunks. key is file name without extension. see split_output()
+output_chunks = {}      # chunk file names of each split file after it is closed. see close_split()
+
+def split_name(name, index):
+    # ---Description---
+    # Returns the file name of a chunk of a split G-code file.
+    # chunk_name = split_name(name, index)
+
+    # ---Variable List---
+    # name = name of txt file without extension.
+    # index = chunk number. first chunk is 1.
+
+    # ---Return Variable List---
+    # chunk_name = name of chunk txt file without extension. e.g. name Part001
+
+    # ---Change History---
+    # rev: 01-01-03-01
+    # date: 18/Oct/2026
+    # initial release
+    # software test run on 18/Oct/2026
+
+    return (f'{name} Part{index:03d}')
+
+def split_output(name, start_block, end_block, start_z, split_bytes=None, split_blocks=None, buffer_size=1024 * 1024, compression=None):
+    # ---Description---
+    # Splits a G-code file into numbered chunk files (name Part001, name Part002 ...) while it is written. for controllers with a limit on program size or block count.
+    # write_to_file() passes the text of name to split_write(). a chunk is ended only at a safe point, after a move that leaves the tool above the part (z > start_z) in absolute positioning.
+    # e.g. retract to safe z or clear z between rows of the main tab. text between safe points is held until the next safe point, never the whole program.
+    # every chunk runs on its own. a chunk is closed with end_block. the next chunk starts with start_block (spindle, G90, G21G64G17, clear z)
+    # and a resume block that rapids to the x, y of the safe point at clear z, goes down to the z of the safe point and sets the feed.
+    # file header is written to the first chunk. blocks are non blank lines.
+    # split_output(name, start_block, end_block, start_z, split_bytes, split_blocks, buffer_size, compression)
+
+    # ---Variable List---
+    # name = name of txt file without extension.
+    # start_block = G-code start block
+    # end_block = G-code end block
+    # start_z = z height at top of part.
+    # split_bytes = maximum size of a chunk file in bytes. None -> no size limit.
+    # split_blocks = maximum number of blocks of a chunk file. None -> no block limit.
+    # buffer_size = write buffer size in bytes. 0 -> chunk files are opened and closed on every write. see open_output()
+    # compression = output compression of chunk files. see open_output()
+
+    # ---Return Variable List---
+    # N/A
+
+    # ---Change History---
+    # rev: 01-01-03-01
+    # date: 18/Oct/2026
+    # initial release
+    # software test run on 18/Oct/2026
+
+    newline_bytes = len(os.linesep) - 1     # extra bytes of a line end written in text mode.
+    split = {'start_block': start_block,
+             'end_block': end_block,
+             'end_bytes': len(end_block.encode()) + end_block.count('\n') * newline_bytes,
+             'end_blocks': sum(1 for line in end_block.split('\n') if line.strip() != ''),
+             'start_z': start_z,
+             'split_bytes': split_bytes,
+             'split_blocks': split_blocks,
+             'buffer_size': buffer_size,
+             'compression': compression,
+             'newline_bytes': newline_bytes,
+             'chunks': [],      # chunk file names
+             'bytes': 0,        # bytes of current chunk
+             'blocks': 0,       # blocks of current chunk
+             'segments': 0,     # text between safe points written to current chunk
+             'pending': [],     # lines since last safe point
+             'pending_bytes': 0,
+             'pending_blocks': 0,
+             'tail': '',        # text after last line end
+             'absolute': True,  # G90 / G91
+             'x': None, 'y': None, 'z': None, 'feed': None,   # tool position and feed after last line
+             'resume': None}    # tool position and feed at last safe point
+    output_split[name] = split
+    split_open(name, split)
+
+def split_open(name, split):
+    # ---Description---
+    # Opens the next chunk file of a split G-code file. see split_output()
+    # chunk_name = split_open(name, split)
+
+    # ---Variable List---
+    # name = name of txt file without extension.
+    # split = split state of name. see split_output()
+
+    # ---Return Variable List---
+    # chunk_name = name of chunk txt file without extension.
+
+    # ---Change History---
+    # rev: 01-01-03-01
+    # date: 18/Oct/2026
+    # initial release
+    # software test run on 18/Oct/2026
+
+    chunk_name = split_name(name, len(split['chunks']) + 1)
+    if os.path.exists(f'{chunk_name}.txt'):
+        os.remove(f'{chunk_name}.txt')      # chunk file of an earlier run with the same name
+    if split['buffer_size'] > 0 or split['compression'] != None:
+        open_output(chunk_name, split['buffer_size'], split['compression'])
+    split['chunks'].append(chunk_name)
+    split['bytes'] = 0
+    split['blocks'] = 0
+    split['segments'] = 0
+    return (chunk_name)
+
+def split_text(split, text):
+    # ---Description---
+    # Writes text to the current chunk file of a split G-code file and counts its bytes and blocks.
+    # split_text(split, text)
+
+    # ---Variable List---
+    # split = split state. see split_output()
+    # text = text to write
+
+    # ---Return Variable List---
+    # N/A
+
+    # ---Change History---
+    # rev: 01-01-03-01
+    # date: 18/Oct/2026
+    # initial release
+    # software test run on 18/Oct/2026
+
+    write_to_file(split['chunks'][-1], text)
+    split['bytes'] = split['bytes'] + len(text.encode()) + text.count('\n') * split['newline_bytes']
+    split['blocks'] = split['blocks'] + sum(1 for line in text.split('\n') if line.strip() != '')
+
+def split_commit(name, split):
+    # ---Description---
+    # Writes the lines since the last safe point to the current chunk file.
+    # Current chunk is closed with end_block and the next chunk is opened first if the lines do not fit into the current chunk.
+    # lines that do not fit into an empty chunk are written anyway. a message is printed.
+    # split_commit(name, split)
+
+    # ---Variable List---
+    # name = name of txt file without extension.
+    # split = split state of name. see split_output()
+
+    # ---Return Variable List---
+    # N/A
+
+    # ---Change History---
+    # rev: 01-01-03-01
+    # date: 18/Oct/2026
+    # initial release
+    # software test run on 18/Oct/2026
+
+    if split['pending'] == []:
+        return
+    over_bytes = split['split_bytes'] != None and split['bytes'] + split['pending_bytes'] + split['end_bytes'] > split['split_bytes']
+    over_blocks = split['split_blocks'] != None and split['blocks'] + split['pending_blocks'] + split['end_blocks'] > split['split_blocks']
+    if (over_bytes == True or over_blocks == True) and split['segments'] > 0 and split['resume'] != None:
+        split_text(split, split['end_block'])    # end current chunk
+        chunk_name = split['chunks'][-1]
+        if chunk_name in output_files:
+            close_output(chunk_name)
+        x, y, z, feed = split['resume']
+        text = split['start_block'] + \
+            f'''
+    (===Resume from {os.path.basename(chunk_name)}===)
+    G0 X{"%.4f" % x} Y{"%.4f" % y}   (Rapid to resume point)
+    G0 Z{"%.4f" % z}   (Go to resume height)
+    '''
+        if feed != None:
+            text = text + f'''F{feed}  (set feed)
+    '''
+        split_open(name, split)
+        split_text(split, text)     # start next chunk
+        over_bytes = split['split_bytes'] != None and split['bytes'] + split['pending_bytes'] + split['end_bytes'] > split['split_bytes']
+        over_blocks = split['split_blocks'] != None and split['blocks'] + split['pending_blocks'] + split['end_blocks'] > split['split_blocks']
+    if (over_bytes == True or over_blocks == True) and split['segments'] == 0:
+        print(f'{split["chunks"][-1]}: {split["pending_blocks"]} blocks without a safe point to split at. chunk exceeds split limit.')
+    write_to_file(split['chunks'][-1], ''.join(split['pending']))
+    split['bytes'] = split['bytes'] + split['pending_bytes']
+    split['blocks'] = split['blocks'] + split['pending_blocks']
+    split['segments'] = split['segments'] + 1
+    split['pending'] = []
+    split['pending_bytes'] = 0
+    split['pending_blocks'] = 0
+
+def split_write(name, text):
+    # ---Description---
+    # Writes text of a split G-code file. called by write_to_file().
+    # Tool position (absolute and incremental moves), positioning mode and feed are followed line by line.
+    # Lines are committed to the current chunk after every move that leaves the tool above the part in absolute positioning. see split_commit()
+    # split_write(name, text)
+
+    # ---Variable List---
+    # name = name of txt file without extension.
+    # text = G-code text
+
+    # ---Return Variable List---
+    # N/A
+
+    # ---Change History---
+    # rev: 01-01-03-01
+    # date: 18/Oct/2026
+    # initial release
+    # software test run on 18/Oct/2026
+
+    split = output_split[name]
+    lines = (split['tail'] + text).split('\n')
+    split['tail'] = lines.pop()     # text after last line end is kept for the next write.
+    for line in lines:
+        code = line.split('(')[0]   # line without comment
+        move = False    # initialize flag. line moves the tool.
+        for letter, number in move_word.findall(code):
+            letter = letter.upper()
+            if letter == 'G':
+                if number == '90':
+                    split['absolute'] = True
+                elif number == '91':
+                    split['absolute'] = False
+            elif letter in ('X', 'Y', 'Z'):
+                axis = letter.lower()
+                move = True
+                if split['absolute'] == True:
+                    split[axis] = float(number)
+                elif split[axis] != None:
+                    split[axis] = split[axis] + float(number)   # incremental move
+            elif letter == 'F':
+                split['feed'] = number
+        line = line + '\n'
+        split['pending'].append(line)
+        split['pending_bytes'] = split['pending_bytes'] + len(line.encode()) + split['newline_bytes']
+        if line.strip() != '':
+            split['pending_blocks'] = split['pending_blocks'] + 1
+        if move == True and split['absolute'] == True and split['x'] != None and split['y'] != None and split['z'] != None and split['z'] > split['start_z']:
+            split_commit(name, split)   # safe point. tool is above the part. comments after the move go with the next move.
+            split['resume'] = (split['x'], split['y'], split['z'], split['feed'])
+
+def close_split(name, finish=True):
+    # ---Description---
+    # Writes the remaining text of a split G-code file and closes the last chunk file. end_block of the program is written by the main program.
+    # Chunk file names are kept in output_chunks.
+    # chunks = close_split(name, finish)
+
+    # ---Variable List---
+    # name = name of txt file without extension.
+    # finish = True -> last chunk file is renamed into place. False -> kept in temporary file. see close_output()
+
+    # ---Return Variable List---
+    # chunks = chunk file names without extension.
+
+    # ---Change History---
+    # rev: 01-01-03-01
+    # date: 18/Oct/2026
+    # initial release
+    # software test run on 18/Oct/2026
+
+    split = output_split[name]
+    if split['tail'] != '':
+        split['pending'].append(split['tail'])     # last line without line end
+        split['pending_bytes'] = split['pending_bytes'] + len(split['tail'].encode())
+        if split['tail'].strip() != '':
+            split['pending_blocks'] = split['pending_blocks'] + 1
+        split['tail'] = ''
+    split_commit(name, split)
+    del output_split[name]
+    if split['chunks'][-1] in output_files:
+        close_output(split['chunks'][-1], finish)
+    output_chunks[name] = split['chunks']
+    return (split['chunks'])
+
+output_dnc = {}         # DNC senders. key is file name without extension. see dnc_open()
+
+def dnc_channel(address):
+    # ---Description---
+    # Opens a byte channel to a machine for DNC. 'host:port' opens a socket. any other address is opened as a device (serial port or pty) in raw mode.
+    # channel = dnc_channel(address)
+
+    # ---Variable List---
+    # address = 'host:port' or device path. e.g. '192.168.0.20:23', '/dev/ttyUSB0', '/dev/pts/3'
+
+    # ---Return Variable List---
+    # channel = dictionary of write(bytes), readline() and close() functions.
+
+    # ---Change History---
+    # rev: 01-01-03-01
+    # date: 18/Oct/2026
+    # initial release
+    # software test run on 18/Oct/2026
+
+    if ':' in address and os.path.exists(address) == False:
+        host, port = address.rsplit(':', 1)
+        connection = socket.create_connection((host, int(port)))
+        connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)  # send each block without delay
+        reader = connection.makefile('rb')
+
+        def close():
+            reader.close()
+            connection.close()
+        return ({'write': connection.sendall, 'readline': reader.readline, 'close': close})
+
+    descriptor = os.open(address, os.O_RDWR | getattr(os, 'O_NOCTTY', 0))
+    if os.isatty(descriptor):
+        import tty  # posix only. imported only for device channels.
+        tty.setraw(descriptor)  # no echo or line editing. baud rate is set by the system.
+    device = os.fdopen(descriptor, 'r+b', buffering=0)
+
+    def write(data):
+        while data:
+            data = data[device.write(data):]    # device can take part of the data
+    return ({'write': write, 'readline': device.readline, 'close': device.close})
+
+def dnc_stand_in(file_name, rx_buffer=128, line_time=0):
+    # ---Description---
+    # Starts a stand-in machine on a local socket for testing DNC without a machine.
+    # Stand-in receives blocks into a receive buffer of rx_buffer bytes, runs each block for line_time seconds, answers ok and writes the block to file_name.txt.
+    # a receive buffer overflow is answered with error:overflow.
+    # address = dnc_stand_in(file_name, rx_buffer, line_time)
+
+    # ---Variable List---
+    # file_name = name of txt file for received blocks without extension.
+    # rx_buffer = receive buffer of stand-in in bytes.
+    # line_time = time to run each block in seconds.
+
+    # ---Return Variable List---
+    # address = 'host:port' of stand-in.
+
+    # ---Change History---
+    # rev: 01-01-03-01
+    # date: 18/Oct/2026
+    # initial release
+    # software test run on 18/Oct/2026
+
+    server = socket.create_server(('127.0.0.1', 0))
+
+    def machine():
+        connection, address = server.accept()
+        server.close()
+        received = b''  # receive buffer
+        with connection, open(f'{file_name}.txt', 'wb') as file:
+            while True:
+                data = connection.recv(4096)
+                if data == b'':
+                    break   # sender closed channel
+                received = received + data
+                if len(received) > rx_buffer:
+                    connection.sendall(b'error:overflow\n')
+                    break
+                while b'\n' in received:
+                    block, received = received.split(b'\n', 1)
+                    time.sleep(line_time)   # run block
+                    file.write(block + b'\n')
+                    connection.sendall(b'ok\n')
+
+    threading.Thread(target=machine, name='dnc stand-in', daemon=True).start()
+    return ('%s:%d' % server.getsockname())
+
+def dnc_open(name, address, flow='count', rx_buffer=128, queue_size=100000):
+    # ---Description---
+    # Starts drip-feeding (DNC) the G-code of name to a machine while it is generated. write_to_file() passes the text of name to dnc_write().
+    # Blocks are sent by a sender thread. machining starts with the first blocks, not when the G-code file is finished.
+    # Comments and blank lines are not sent. flow control:
+    # 'count' -> character counting. blocks are sent while the blocks not yet answered with ok fit into the receive buffer of the machine (rx_buffer).
+    # 'ack' -> each block is sent after the last block is answered with ok.
+    # An error or alarm answer of the machine stops sending. G-code files are written as before.
+    # Generation waits if queue_size blocks are waiting to be sent. memory does not grow with the size of the program.
+    # address 'stand-in' starts a stand-in machine for testing. see dnc_stand_in(). received blocks are written to name DNC.txt.
+    # dnc_open(name, address, flow, rx_buffer, queue_size)
+
+    # ---Variable List---
+    # name = name of txt file without extension.
+    # address = 'host:port', device path or 'stand-in'. see dnc_channel()
+    # flow = flow control. 'count' or 'ack'.
+    # rx_buffer = receive buffer of machine in bytes.
+    # queue_size = maximum number of blocks waiting to be sent.
+
+    # ---Return Variable List---
+    # N/A
+
+    # ---Change History---
+    # rev: 01-01-03-01
+    # date: 18/Oct/2026
+    # initial release
+    # software test run on 18/Oct/2026
+
+    if flow not in ('count', 'ack'):
+        raise ValueError(f"invalid DNC flow control: {flow}. use 'count' or 'ack'")
+    if address == 'stand-in':
+        address = dnc_stand_in(f'{name} DNC', rx_buffer)
+    dnc = {'address': address,
+           'flow': flow,
+           'rx_buffer': rx_buffer,
+           'queue': queue.Queue(queue_size),    # blocks waiting to be sent
+           'tail': '',      # text after last line end
+           'sent': 0,       # blocks sent
+           'acked': 0,      # blocks answered with ok
+           'error': None,   # error that stopped sending
+           'stop': False,   # stop sending. abort.
+           'start_time': time.perf_counter()}
+    dnc['channel'] = dnc_channel(address)
+    dnc['thread'] = threading.Thread(target=dnc_sender, args=(dnc,), name=f'dnc {address}', daemon=True)
+    dnc['thread'].start()
+    output_dnc[name] = dnc
+
+def dnc_queue(dnc, block):
+    # ---Description---
+    # Puts a block into the queue of a DNC sender. waits while the queue is full. block is dropped if sending has stopped.
+    # dnc_queue(dnc, block)
+
+    # ---Variable List---
+    # dnc = DNC sender. see dnc_open()
+    # block = G-code block without line end. None -> end of program.
+
+    # ---Return Variable List---
+    # N/A
+
+    # ---Change History---
+    # rev: 01-01-03-01
+    # date: 18/Oct/2026
+    # initial release
+    # software test run on 18/Oct/2026
+
+    while dnc['error'] == None and dnc['thread'].is_alive():
+        try:
+            dnc['queue'].put(block, timeout=0.5)
+            return
+        except queue.Full:
+            pass    # machine is behind generation
+
+def dnc_write(name, text):
+    # ---Description---
+    # Queues the blocks of text to be sent to the machine. called by write_to_file(). comments and blank lines are removed.
+    # dnc_write(name, text)
+
+    # ---Variable List---
+    # name = name of txt file without extension.
+    # text = G-code text
+
+    # ---Return Variable List---
+    # N/A
+
+    # ---Change History---
+    # rev: 01-01-03-01
+    # date: 18/Oct/2026
+    # initial release
+    # software test run on 18/Oct/2026
+
+    dnc = output_dnc[name]
+    lines = (dnc['tail'] + text).split('\n')
+    dnc['tail'] = lines.pop()   # text after last line end is kept for the next write.
+    for line in lines:
+        block = line.split('(')[0].strip()     # block without comment. comments run to the end of the line and can hold brackets.
+        if block != '':
+            dnc_queue(dnc, block)
+
+def dnc_sender(dnc):
+    # ---Description---
+    # Sender thread of dnc_open(). sends queued blocks with flow control until the end of program (None) and waits for the last ok.
+    # dnc_sender(dnc)
+
+    # ---Variable List---
+    # dnc = DNC sender. see dnc_open()
+
+    # ---Return Variable List---
+    # N/A
+
+    # ---Change History---
+    # rev: 01-01-03-01
+    # date: 18/Oct/2026
+    # initial release
+    # software test run on 18/Oct/2026
+
+    channel = dnc['channel']
+    pending = collections.deque()   # bytes of each block not yet answered with ok
+    buffered = 0    # bytes in receive buffer of machine
+
+    def answer():
+        nonlocal buffered
+        reply = channel['readline']().strip().lower()
+        if reply == b'':
+            raise ConnectionError('channel closed by machine')
+        if reply.startswith(b'ok'):
+            buffered = buffered - pending.popleft()
+            dnc['acked'] = dnc['acked'] + 1
+        elif reply.startswith(b'error') or reply.startswith(b'alarm'):
+            raise RuntimeError(f'machine answered {reply.decode(errors="replace")} to block {dnc["acked"] + 1}')
+        # other messages (welcome, status) are ignored.
+
+    try:
+        while dnc['stop'] == False:
+            block = dnc['queue'].get()
+            if block == None or dnc['stop'] == True:
+                break   # end of program
+            data = (block + '\n').encode()
+            if dnc['flow'] == 'count':
+                while pending and buffered + len(data) > dnc['rx_buffer']:
+                    answer()    # wait for room in receive buffer
+            else:
+                while pending:
+                    answer()    # wait for ok of last block
+            channel['write'](data)
+            pending.append(len(data))
+            buffered = buffered + len(data)
+            dnc['sent'] = dnc['sent'] + 1
+        while pending and dnc['stop'] == False:
+            answer()    # wait for last blocks to be answered
+    except Exception as error:
+        dnc['error'] = str(error)
+    finally:
+        channel['close']()
+
+def dnc_close(name, stop=False):
+    # ---Description---
+    # Ends drip-feeding of name. waits until all blocks are sent and answered by the machine and closes the channel.
+    # stop = True stops sending after the block being sent (abort). blocks in the queue are not sent.
+    # Prints number of blocks sent and time, or the error that stopped sending.
+    # dnc = dnc_close(name, stop)
+
+    # ---Variable List---
+    # name = name of txt file without extension.
+    # stop = True -> stop sending. False -> send all blocks.
+
+    # ---Return Variable List---
+    # dnc = DNC sender. see dnc_open()
+
+    # ---Change History---
+    # rev: 01-01-03-01
+    # date: 18/Oct/2026
+    # initial release
+    # software test run on 18/Oct/2026
+
+    dnc = output_dnc.pop(name)
+    if stop == True:
+        dnc['stop'] = True
+    elif dnc['tail'].strip() != '':
+        dnc_queue(dnc, dnc['tail'].split('(')[0].strip())    # last line without line end
+    dnc_queue(dnc, None)    # end of program
+    dnc['thread'].join()
+    run_time = time.perf_counter() - dnc['start_time']
+    if dnc['error'] != None:
+        print(f'DNC {dnc["address"]}: stopped after {dnc["acked"]} blocks. {dnc["error"]}')
+    elif dnc['stop'] == True:
+        print(f'DNC {dnc["address"]}: stopped after {dnc["sent"]} blocks sent.')
+    else:
+        print(f'DNC {dnc["address"]}: {dnc["acked"]} blocks sent in {"%.1f" % run_time} s')
+    return (dnc)
+
+move_columns = ('x', 'y', 'z', 'r', 'i', 'j', 'feed')     # number columns of move list. G-code words X, Y, Z, R, I, J, F.
+move_word = re.compile(r'(?<![A-Za-z0-9_.])([GXYZRIJFgxyzrijf])(-?\d+(?:\.\d+)?)(?![\d.])')     # G-code word with a number.
+
+def move_dtype():
+    # ---Description---
+    # Data type of a move list array. One element per G-code line.
+    # code = motion code. 0 = G0 rapid, 1 = G1 line, 2 = G2 clockwise arc, 3 = G3 counter clockwise arc, -1 = no motion (comment, feed, G90, G91, dwell etc.)
+    # x, y, z, r, i, j, feed = numbers of X, Y, Z, R, I, J and F words. nan -> word not in line.
+    # op = operation id. index of moves['ops']. template = index of moves['templates']. incremental = True -> G91 incremental positioning.
+    # dtype = move_dtype()
+
+    # ---Variable List---
+    # N/A
+
+    # ---Return Variable List---
+    # dtype = numpy structured data type.
+
+    # ---Change History---
+    # rev: 01-01-03-01
+    # date: 18/Oct/2026
+    # initial release
+    # software test run on 18/Oct/2026
+
+    import numpy as np  # deferred import. see import_time_check().
+
+    return (np.dtype([('code', 'i1')] + [(column, 'f8') for column in move_columns] + [('op', 'i4'), ('template', 'i4'), ('incremental', '?')]))
+
+def move_list():
+    # ---Description---
+    # Creates an empty move list. Moves are added with gcode_moves() and converted to a structured array with move_array().
+    # Text of each G-code line is kept as a template. numbers of the line are replaced by the move columns, so the text can be rendered exactly.
+    # Same templates are stored once.
+    # moves = move_list()
+
+    # ---Variable List---
+    # N/A
+
+    # ---Return Variable List---
+    # moves = dictionary. rows = list of moves. chunks = arrays of moves added before rows (see move_lines()). templates = list of (text parts, columns, decimal places).
+    #         ops = list of operation names. op = current operation id. incremental = G91 positioning active.
+
+    # ---Change History---
+    # rev: 01-01-03-01
+    # date: 18/Oct/2026
+    # initial release
+    # software test run on 18/Oct/2026
+
+    return ({'rows': [], 'chunks': [], 'templates': [], 'template_ids': {}, 'ops': ['job'], 'op': 0, 'incremental': False})
+
+def move_op(moves, op_name):
+    # ---Description---
+    # Starts a new operation. Moves added after this call carry the new operation id.
+    # op = move_op(moves, op_name)
+
+    # ---Variable List---
+    # moves = move list. see move_list()
+    # op_name = name of operation. e.g. step number, operation and sheet.
+
+    # ---Return Variable List---
+    # op = operation id
+
+    # ---Change History---
+    # rev: 01-01-03-01
+    # date: 18/Oct/2026
+    # initial release
+    # software test run on 18/Oct/2026
+
+    moves['ops'].append(op_name)
+    moves['op'] = len(moves['ops']) - 1
+    return (moves['op'])
+
+def gcode_moves(moves, text):
+    # ---Description---
+    # Adds G-code text to a move list. One move per line.
+    # X, Y, Z, R, I, J and F words are stored as numbers. rest of the line (G word, spacing, comments) is stored as the template of the move.
+    # A number is stored only if it renders back to the same text. Otherwise it stays part of the template.
+    # Words inside comments (brackets) are not read.
+    # gcode_moves(moves, text)
+
+    # ---Variable List---
+    # moves = move list. see move_list()
+    # text = G-code text
+
+    # ---Return Variable List---
+    # N/A
+
+    # ---Change History---
+    # rev: 01-01-03-01
+    # date: 18/Oct/2026
+    # initial release
+    # software test run on 18/Oct/2026
+
+    rows = moves['rows']
+    template_ids = moves['template_ids']
+    op = moves['op']
+    for line in text.splitlines(True):
+        code = -1           # initialize no motion
+        values = [math.nan] * 7     # initialize x, y, z, r, i, j, feed
+        parts = []          # text between numbers
+        columns = []        # column of each number
+        decimals = []       # decimal places of each number
+        start = 0
+        end = line.find('(')    # words in comments are not read
+        if end == -1:
+            end = len(line)
+        for match in move_word.finditer(line, 0, end):
+            letter = match.group(1).upper()
+            number = match.group(2)
+            if letter == 'G':
+                if code == -1 and number in ('0', '00', '1', '01', '2', '02', '3', '03'):
+                    code = int(number)   # motion code
+                elif number == '90':
+                    moves['incremental'] = False   # absolute positioning
+                elif number == '91':
+                    moves['incremental'] = True    # incremental positioning
+                continue
+            column = move_columns['XYZRIJF'.index(letter)]
+            if column in columns:
+                continue    # word repeated in line. kept in template.
+            places = len(number) - number.find('.') - 1 if '.' in number else 0
+            value = float(number)
+            if '%.*f' % (places, value) != number:
+                continue    # number does not render back to the same text. kept in template.
+            parts.append(line[start:match.start(2)])
+            columns.append(column)
+            decimals.append(places)
+            values['xyzrij'.find(column) if column != 'feed' else 6] = value
+            start = match.end(2)
+        parts.append(line[start:])
+        template = (tuple(parts), tuple(columns), tuple(decimals))
+        template_id = template_ids.get(template)
+        if template_id == None:
+            template_id = len(moves['templates'])
+            template_ids[template] = template_id
+            moves['templates'].append(template)
+        rows.append((code, *values, op, template_id, moves['incremental']))
+
+def move_lines(moves, parts, columns, decimals):
+    # ---Description---
+    # Adds G-code lines given as number columns to a move list. same parts, columns and decimals as render_lines().
+    # numbers are stored as they are (not rounded or read back from text). only the text between numbers is read, once per call.
+    # every row of columns is split into one move per line. word letter of each column is the last letter of the text before it (e.g. ' Y').
+    # text that can not be split this way (comments before numbers, repeated words, G90/G91) is rendered and added with gcode_moves().
+    # move_lines(moves, parts, columns, decimals)
+
+    # ---Variable List---
+    # moves = move list. see move_list()
+    # parts = text between numbers. one more than columns.
+    # columns = list of number arrays. e.g. x, y.
+    # decimals = decimal places of each column.
+
+    # ---Return Variable List---
+    # N/A
+
+    # ---Change History---
+    # rev: 01-01-03-01
+    # date: 18/Oct/2026
+    # initial release
+    # software test run on 18/Oct/2026
+
+    import numpy as np  # deferred import. see import_time_check().
+
+    lines = []      # text parts and column index of each line of a row
+    line_parts = ['']
+    line_columns = []
+    for k in range(len(parts)):
+        pieces = parts[k].split('\n')
+        for p in range(len(pieces)):
+            if p > 0:
+                line_parts[-1] = line_parts[-1] + '\n'
+                lines.append((line_parts, line_columns))    # line end
+                line_parts = ['']
+                line_columns = []
+            line_parts[-1] = line_parts[-1] + pieces[p]
+        if k < len(columns):
+            line_columns.append(k)
+            line_parts.append('')
+    if line_parts != [''] or line_columns != []:
+        lines.append((line_parts, line_columns))    # last line without line end
+
+    structured = True
+    templates = []      # template id, motion code and number columns of each line
+    for line_parts, line_columns in lines:
+        code = -1           # initialize no motion
+        names = []
+        for n in range(len(line_columns)):
+            letter = line_parts[n][-1:].upper()
+            if letter == '' or letter not in 'XYZRIJF' or '(' in ''.join(line_parts[:n + 1]):
+                structured = False      # number is not a G-code word
+                break
+            names.append(move_columns['XYZRIJF'.index(letter)])
+        for match in move_word.finditer(''.join(line_parts).split('(')[0]):
+            if match.group(1).upper() == 'G':
+                if code == -1 and match.group(2) in ('0', '00', '1', '01', '2', '02', '3', '03'):
+                    code = int(match.group(2))   # motion code
+                elif match.group(2) in ('90', '91'):
+                    structured = False      # positioning mode changes. read line by line.
+        if structured == False or len(set(names)) != len(names):
+            structured = False
+            break
+        template = (tuple(line_parts), tuple(names), tuple(int(decimals[c]) for c in line_columns))
+        template_id = moves['template_ids'].get(template)
+        if template_id == None:
+            template_id = len(moves['templates'])
+            moves['template_ids'][template] = template_id
+            moves['templates'].append(template)
+        templates.append((template_id, code, names, line_columns))
+
+    if structured == False:
+        data, lengths = render_lines(parts, columns, decimals)
+        gcode_moves(moves, data.tobytes().decode())     # read text line by line
+        return
+
+    rows = len(columns[0])
+    array = np.zeros(rows * len(templates), dtype=move_dtype())
+    for column in move_columns:
+        array[column] = math.nan    # word not in line
+    array['op'] = moves['op']
+    array['incremental'] = moves['incremental']
+    for n in range(len(templates)):
+        template_id, code, names, line_columns = templates[n]
+        line = array[n::len(templates)]     # n-th line of every row
+        line['code'] = code
+        line['template'] = template_id
+        for column, c in zip(names, line_columns):
+            line[column] = columns[c]
+    if moves['rows'] != []:
+        moves['chunks'].append(np.array(moves['rows'], dtype=move_dtype()))   # rows added before
+        moves['rows'] = []
+    moves['chunks'].append(array)
+
+def move_sink(moves):
+    # ---Description---
+    # Returns a sink for the toolpath functions. G-code blocks are added to the move list instead of written to a file.
+    # sink = move_sink(moves)
+
+    # ---Variable List---
+    # moves = move list. see move_list()
+
+    # ---Return Variable List---
+    # sink = function. sink(text) adds text to the move list. sink.lines(parts, columns, decimals) adds G-code lines. see emit_lines()
+
+    # ---Change History---
+    # rev: 01-01-03-01
+    # date: 18/Oct/2026
+    # initial release
+    # Added sink.lines.
+    # software test run on 18/Oct/2026
+
+    def sink(text):
+        gcode_moves(moves, text)
+    def lines(parts, columns, decimals):
+        move_lines(moves, parts, columns, decimals)
+    sink.lines = lines
+    return (sink)
+
+def move_array(moves):
+    # ---Description---
+    # Converts a move list to a numpy structured array. see move_dtype()
+    # Optimizers and simulators can read the columns of the array. G-code text is rendered with render_moves().
+    # arrays added by move_lines() and rows added by gcode_moves() are joined in the order they were added.
+    # array = move_array(moves)
+
+    # ---Variable List---
+    # moves = move list. see move_list()
+
+    # ---Return Variable List---
+    # array = structured array of moves.
+
+    # ---Change History---
+    # rev: 01-01-03-01
+    # date: 18/Oct/2026
+    # initial release
+    # software test run on 18/Oct/2026
+
+    import numpy as np  # deferred import. see import_time_check().
+
+    return (np.concatenate(moves['chunks'] + [np.array(moves['rows'], dtype=move_dtype())]))
+
+def format_numbers(values, decimals):
+    # ---Description---
+    # Formats a whole array of numbers with a fixed number of decimal places. Same text as "%.4f" % value for every number.
+    # Numbers are scaled and rounded as integers and their digits are written into a character array in numpy.
+    # numbers close to half way between two results, nan, inf and very large numbers are formatted one by one with "%",
+    # so the text is always identical to "%.4f" % value (round half to even of the exact binary value, -0.0000 kept).
+    # chars = format_numbers(values, decimals)
+
+    # ---Variable List---
+    # values = array of numbers
+    # decimals = number of decimal places. e.g. 4 for coordinates, 0 or 1 for feeds.
+
+    # ---Return Variable List---
+    # chars = 2D uint8 array of character codes. one row per number, right aligned. 0 = padding.
+
+    # ---Change History---
+    # rev: 01-01-03-01
+    # date: 18/Oct/2026
+    # initial release
+    # software test run on 18/Oct/2026
+
+    import numpy as np  # deferred import. see import_time_check().
+
+    values = np.asarray(values, dtype='f8')
+    rows = len(values)
+    scale = 10 ** decimals
+    scaled = values * scale
+    rounded = np.rint(scaled)   # round half to even
+    with np.errstate(invalid='ignore'):
+        fraction = np.abs(scaled - np.trunc(scaled))    # nan for inf. formatted one by one.
+    slow = (np.isfinite(scaled) == False) | (np.abs(scaled) >= 2.0 ** 52)
+    slow = slow | (np.abs(fraction - 0.5) <= np.abs(scaled) * 1e-15 + 1e-9)    # too close to half way to round the scaled number.
+    number = np.abs(np.where(slow, 0, rounded)).astype('i8')
+    whole = number // scale     # whole number part
+    part = number % scale       # decimal part
+    whole_digits = np.searchsorted(10 ** np.arange(1, 19, dtype='i8'), whole, side='right') + 1    # number of digits of whole number part
+    max_digits = int(whole_digits.max()) if rows > 0 else 1
+    point = decimals + 1 if decimals > 0 else 0     # decimal point and decimal places
+    width = 1 + max_digits + point      # sign, whole number, decimal point and decimal places
+    chars = np.zeros((width, rows), dtype='u1')    # one row per character position. transposed when returned.
+    for k in range(decimals):
+        chars[width - 1 - k] = 48 + part % 10     # decimal places
+        part = part // 10
+    if decimals > 0:
+        chars[width - 1 - decimals] = 46     # decimal point
+    units = width - 1 - point   # position of units digit
+    for k in range(max_digits):
+        chars[units - k] = np.where(k < whole_digits, 48 + whole % 10, 0)     # whole number digits
+        whole = whole // 10
+    negative = np.flatnonzero(np.signbit(values) & (slow == False))
+    chars[units - whole_digits[negative], negative] = 45   # sign
+    chars = chars.T
+    if slow.any():
+        text_slow = {k: ('%.*f' % (decimals, values[k])).encode() for k in np.flatnonzero(slow).tolist()}    # format one by one
+        longest = max(len(text) for text in text_slow.values())
+        chars = np.ascontiguousarray(chars)
+        if longest > width:
+            chars = np.hstack([np.zeros((rows, longest - width), dtype='u1'), chars])     # widen for long numbers
+            width = longest
+        for k, text in text_slow.items():
+            chars[k, :] = 0
+            chars[k, width - len(text):] = np.frombuffer(text, dtype='u1')
+    return (chars)
+
+def render_lines(parts, columns, decimals):
+    # ---Description---
+    # Renders G-code lines in bulk. parts[0] + column 0 + parts[1] + column 1 ... + parts[-1] for every row.
+    # characters of all lines are built in one array. text = data.tobytes().decode()
+    # data, lengths = render_lines(parts, columns, decimals)
+
+    # ---Variable List---
+    # parts = text between numbers. one more than columns. must not contain character code 0.
+    # columns = list of number arrays. e.g. x, y, z, feed.
+    # decimals = decimal places of each column. e.g. (4, 4, 4, 0)
+
+    # ---Return Variable List---
+    # data = uint8 array of utf-8 text of all lines.
+    # lengths = length of each line in bytes.
+
+    # ---Change History---
+    # rev: 01-01-03-01
+    # date: 18/Oct/2026
+    # initial release
+    # software test run on 18/Oct/2026
+
+    import numpy as np  # deferred import. see import_time_check().
+
+    rows = len(columns[0])
+    blocks = []
+    for k in range(len(parts)):
+        if parts[k] != '':
+            text = np.frombuffer(parts[k].encode(), dtype='u1')
+            blocks.append(np.broadcast_to(text, (rows, len(text))))     # same text in every row
+        if k < len(columns):
+            blocks.append(format_numbers(columns[k], decimals[k]))
+    chars = np.hstack(blocks)
+    used = chars != 0   # padding of numbers removed
+    return (chars[used], used.sum(axis=1))
+
+def emit_lines(emit, parts, columns, decimals):
+    # ---Description---
+    # Sends G-code lines given as number columns to the sink of a toolpath function.
+    # file and move list sinks (file_sink(), move_sink()) receive the columns. numbers go into move lists without being formatted and read back.
+    # any other sink (e.g. list of G-code blocks) receives the text rendered with render_lines().
+    # emit_lines(emit, parts, columns, decimals)
+
+    # ---Variable List---
+    # emit = sink of toolpath function. sink(text)
+    # parts = text between numbers. one more than columns.
+    # columns = list of number arrays. e.g. x, y.
+    # decimals = decimal places of each column.
+
+    # ---Return Variable List---
+    # N/A
+
+    # ---Change History---
+    # rev: 01-01-03-01
+    # date: 18/Oct/2026
+    # initial release
+    # software test run on 18/Oct/2026
+
+    lines = getattr(emit, 'lines', None)
+    if lines != None:
+        lines(parts, columns, decimals)     # numbers are passed on as they are
+        return
+    data, lengths = render_lines(parts, columns, decimals)
+    emit(data.tobytes().decode())
+
+def render_moves(array, templates):
+    # ---Description---
+    # Renders G-code text from a move array in one pass.
+    # Numbers are formatted with the decimal places of their template. text is identical to the G-code text added with gcode_moves().
+    # moves of each template are rendered together with render_lines() and copied into place.
+    # text = render_moves(array, templates)
+
+    # ---Variable List---
+    # array = structured array of moves. see move_array()
+    # templates = moves['templates'] of move list.
+
+    # ---Return Variable List---
+    # text = G-code text
+
+    # ---Change History---
+    # rev: 01-01-03-01
+    # date: 18/Oct/2026
+    # initial release
+    # moves are rendered in bulk per template with render_lines() instead of line by line.
+    # software test run on 18/Oct/2026
+
+    import numpy as np  # deferred import. see import_time_check().
+
+    template_ids = array['template']
+    order = np.argsort(template_ids, kind='stable')    # rows sorted by template
+    used, first = np.unique(template_ids[order], return_index=True)
+    last = np.append(first[1:], len(order))
+    lengths = np.zeros(len(array), dtype='i8')  # length of each line
+    groups = []
+    for template_id, start, end in zip(used.tolist(), first.tolist(), last.tolist()):
+        rows = order[start:end]
+        parts, columns, decimals = templates[template_id]
+        if columns == ():
+            text = np.frombuffer(parts[0].encode(), dtype='u1')
+            data = np.tile(text, len(rows))   # line without numbers
+            group_lengths = np.full(len(rows), len(text), dtype='i8')
+        else:
+            data, group_lengths = render_lines(parts, [array[column][rows] for column in columns], decimals)
+        lengths[rows] = group_lengths
+        groups.append((rows, data, group_lengths))
+    starts = np.cumsum(lengths) - lengths   # start of each line in text
+    text = np.empty(int(lengths.sum()), dtype='u1')
+    for rows, data, group_lengths in groups:
+        group_starts = np.cumsum(group_lengths) - group_lengths
+        text[np.repeat(starts[rows] - group_starts, group_lengths) + np.arange(len(data))] = data    # copy lines into place
+    return (text.tobytes().decode())
+
+def write_moves(name):
+    # ---Description---
+    # Renders the move list of an output file and writes the G-code text to the file.
+    # array, templates, ops = write_moves(name)
+
+    # ---Variable List---
+    # name = name of txt file without extension.
+
+    # ---Return Variable List---
+    # array = structured array of moves
+    # templates = templates of moves
+    # ops = operation names
+
+    # ---Change History---
+    # rev: 01-01-03-01
+    # date: 18/Oct/2026
+    # initial release
+    # software test run on 18/Oct/2026
+
+    moves = output_moves.pop(name)
+    array = move_array(moves)
+    write_to_file(name, render_moves(array, moves['templates']))   # one pass
+    return (array, moves['templates'], moves['ops'])
+
+def format_benchmark(rows=200000):
+    # ---Description---
+    # Throughput benchmark of G-code formatting. Formats rows of "G1 X Y Z F" lines one by one ("%.4f" % value) and in bulk (render_lines).
+    # Prints lines per second of both and checks that the text is identical.
+    # line_rate, bulk_rate, identical = format_benchmark(rows)
+
+    # ---Variable List---
+    # rows = number of G-code lines.
+
+    # ---Return Variable List---
+    # line_rate = lines per second formatted one by one.
+    # bulk_rate = lines per second formatted in bulk.
+    # identical = True -> text of both is identical.
+
+    # ---Change History---
+    # rev: 01-01-03-01
+    # date: 18/Oct/2026
+    # initial release
+    # software test run on 18/Oct/2026
+
+    import numpy as np  # deferred import. see import_time_check().
+
+    generator = np.random.default_rng(20261018)
+    x = generator.uniform(-500, 500, rows).round(6)     # coordinates with more decimals than G-code. includes half way values.
+    y = generator.uniform(-500, 500, rows)
+    z = -generator.uniform(0, 20, rows).round(5)
+    feed = generator.uniform(10, 3000, rows).round(1)
+
+    start_time = time.perf_counter()
+    text_line = ''.join([f'G1 X{"%.4f" % x[k]} Y{"%.4f" % y[k]} Z{"%.4f" % z[k]} F{"%.0f" % feed[k]}\n' for k in range(rows)])
+    line_time = time.perf_counter() - start_time
+
+    start_time = time.perf_counter()
+    data, lengths = render_lines(('G1 X', ' Y', ' Z', ' F', '\n'), [x, y, z, feed], (4, 4, 4, 0))
+    text_bulk = data.tobytes().decode()
+    bulk_time = time.perf_counter() - start_time
+
+    identical = text_line == text_bulk
+    line_rate = rows / line_time
+    bulk_rate = rows / bulk_time
+    print(f'format benchmark: {rows} lines\n'
+          f'one by one: {"%.0f" % line_rate} lines/s\n'
+          f'bulk: {"%.0f" % bulk_rate} lines/s ({"%.1f" % (bulk_rate / line_rate)} x)\n'
+          f'identical: {identical}')
+    return (line_rate, bulk_rate, identical)
+
+def move_positions(array):
+    # ---Description---
+    # Position of the tool after each move and modal feed of each move. numbers that are not in a line carry over from the lines before.
+    # Incremental (G91) moves are added to the last position. position is nan until the axis is first set in absolute (G90) positioning.
+    # position, feed = move_positions(array)
+
+    # ---Variable List---
+    # array = structured array of moves. see move_array()
+
+    # ---Return Variable List---
+    # position = array of x, y, z of tool after each move. one row per move.
+    # feed = array of active feed of each move. nan before the first F word.
+
+    # ---Change History---
+    # rev: 01-01-03-01
+    # date: 18/Oct/2026
+    # initial release
+    # software test run on 18/Oct/2026
+
+    import numpy as np  # deferred import. see import_time_check().
+
+    index = np.arange(len(array))
+    position = np.full((len(array), 3), np.nan)
+    for axis, column in enumerate(('x', 'y', 'z')):
+        value = array[column]
+        given = ~np.isnan(value)
+        total = np.cumsum(np.where(given & array['incremental'], value, 0.0))   # sum of incremental moves
+        base = np.maximum.accumulate(np.where(given & ~array['incremental'], index, -1))     # last absolute move
+        known = base >= 0
+        position[known, axis] = value[base[known]] + total[known] - total[base[known]]
+    last = np.maximum.accumulate(np.where(~np.isnan(array['feed']), index, -1))    # last F word
+    feed = np.full(len(array), np.nan)
+    feed[last >= 0] = array['feed'][last[last >= 0]]
+    return (position, feed)
+
+def npz_open(name, metadata, moves=None, compress=False):
+    # ---Description---
+    # Starts the binary toolpath export of an output file. G-code written to the file is also collected as a move list.
+    # The move list is saved as a numpy archive (name.npz) next to the G-code file when the file is closed. see npz_close()
+    # npz_open(name, metadata, moves, compress)
+
+    # ---Variable List---
+    # name = name of txt file without extension.
+    # metadata = dictionary of job data saved with the moves. e.g. parameters of parameters_data_frame().
+    # moves = move list of the file if it is already collected (moves_flag). None -> new move list.
+    # compress = True -> compressed archive. smaller file, loaded into memory by load_toolpath(). False -> arrays are memory mapped.
+
+    # ---Return Variable List---
+    # N/A
+
+    # ---Change History---
+    # rev: 01-01-03-01
+    # date: 18/Oct/2026
+    # initial release
+    # software test run on 18/Oct/2026
+
+    output_npz[name] = {'moves': move_list() if moves == None else moves,
+                        'shared': moves != None,    # True -> moves are added by write_to_file() for output_moves.
+                        'metadata': metadata,
+                        'compress': compress}
+
+def npz_close(name):
+    # ---Description---
+    # Saves the move list of an output file as a numpy archive (name.npz). see npz_open()
+    # Archive arrays:
+    # moves = structured array of moves. see move_dtype(). position = x, y, z after each move. feed = active feed. see move_positions()
+    # ops = operation names. op_ranges = first and last + 1 move index of each operation.
+    # templates = json text of move templates. G-code text is rendered with render_moves(). metadata = json text of job data.
+    # moves start at the start block. file header comments of parameters_data_frame() are not in the archive.
+    # Archive is written as name.npz.tmp, synced to disk and renamed to name.npz in one step.
+    # file_name = npz_close(name)
+
+    # ---Variable List---
+    # name = name of txt file without extension.
+
+    # ---Return Variable List---
+    # file_name = name of numpy archive.
+
+    # ---Change History---
+    # rev: 01-01-03-01
+    # date: 18/Oct/2026
+    # initial release
+    # software test run on 18/Oct/2026
+
+    import numpy as np  # deferred import. see import_time_check().
+
+    export = output_npz.pop(name)
+    moves = export['moves']
+    array = move_array(moves)
+    position, feed = move_positions(array)
+    op_ids = np.arange(len(moves['ops']))
+    op_ranges = np.stack((np.searchsorted(array['op'], op_ids, 'left'), np.searchsorted(array['op'], op_ids, 'right')), axis=1)    # moves are in operation order
+    json_value = lambda value: value.item() if hasattr(value, 'item') else str(value)     # numpy numbers and dates
+    arrays = {'moves': array,
+              'position': position,
+              'feed': feed,
+              'ops': np.array(moves['ops'], dtype=str),
+              'op_ranges': op_ranges,
+              'templates': np.array(json.dumps(moves['templates'])),
+              'metadata': np.array(json.dumps(export['metadata'], default=json_value))}
+    file_name = f'{name}.npz'
+    with open(f'{file_name}.tmp', 'wb') as file:
+        if export['compress'] == True:
+            np.savez_compressed(file, **arrays)
+        else:
+            np.savez(file, **arrays)    # stored members. memory mapped by load_toolpath().
+        file.flush()
+        os.fsync(file.fileno())     # write file to disk
+    os.replace(f'{file_name}.tmp', file_name)   # rename into place in one step
+    return (file_name)
+
+def load_toolpath(file_name, mmap=True):
+    # ---Description---
+    # Loads a numpy archive saved by npz_close(). Arrays of stored (not compressed) archives are memory mapped from the archive file.
+    # nothing is read until an array is used. arrays of compressed archives are read into memory.
+    # templates, ops and metadata are decoded from json.
+    # toolpath = load_toolpath(file_name, mmap)
+    # e.g. text = render_moves(toolpath['moves'], toolpath['templates'])
+
+    # ---Variable List---
+    # file_name = name of numpy archive.
+    # mmap = True -> memory map arrays of stored members. False -> read arrays into memory.
+
+    # ---Return Variable List---
+    # toolpath = dictionary of archive arrays. see npz_close()
+
+    # ---Change History---
+    # rev: 01-01-03-01
+    # date: 18/Oct/2026
+    # initial release
+    # software test run on 18/Oct/2026
+
+    import numpy as np  # deferred import. see import_time_check().
+
+    toolpath = {}
+    with zipfile.ZipFile(file_name) as archive, open(file_name, 'rb') as file:
+        for info in archive.infolist():
+            key = info.filename[:-len('.npy')]
+            with archive.open(info) as member:
+                version = np.lib.format.read_magic(member)
+                if version == (1, 0):
+                    shape, fortran, dtype = np.lib.format.read_array_header_1_0(member)
+                else:
+                    shape, fortran, dtype = np.lib.format.read_array_header_2_0(member)
+                header_size = member.tell()     # size of npy header
+            if mmap == True and info.compress_type == zipfile.ZIP_STORED and dtype.hasobject == False and shape != () and math.prod(shape) > 0:
+                file.seek(info.header_offset)
+                local_header = struct.unpack('<4s5H3L2H', file.read(30))   # zip local file header
+                offset = info.header_offset + 30 + local_header[9] + local_header[10] + header_size     # start of array data
+                toolpath[key] = np.memmap(file_name, dtype=dtype, mode='r', offset=offset, shape=shape, order='F' if fortran == True else 'C')
+            else:
+                with archive.open(info) as member:
+                    toolpath[key] = np.lib.format.read_array(member, allow_pickle=False)
+    toolpath['templates'] = [(tuple(parts), tuple(columns), tuple(decimals)) for parts, columns, decimals in json.loads(str(toolpath['templates']))]
+    toolpath['ops'] = [str(op) for op in toolpath['ops']]
+    toolpath['metadata'] = json.loads(str(toolpath['metadata']))
+    return (toolpath)
+
+def geometry_benchmark(points=200000):
+    # ---Description---
+    # Compares the array coordinate functions (absolute_angle_array etc.) with the one point at a time functions on random points.
+    # Prints points per second of both and largest difference of results.
+    # rates = geometry_benchmark(points)
+
+    # ---Variable List---
+    # points = number of random points.
+
+    # ---Return Variable List---
+    # rates = dictionary. key is function name. value is (points/s one by one, points/s array, largest difference).
+
+    # ---Change History---
+    # rev: 01-01-03-01
+    # date: 18/Oct/2026
+    # initial release
+    # software test run on 18/Oct/2026
+
+    import numpy as np  # deferred import. see import_time_check().
+
+    generator = np.random.default_rng(20261018)
+    x = generator.uniform(-500, 500, points)
+    y = generator.uniform(-500, 500, points)
+    angle = generator.uniform(-720, 720, points)
+    datum_x, datum_y, datum_angle = 12.5, -7.25, 33.7
+    functions = {'absolute_angle': (lambda k: absolute_angle(datum_x, datum_y, x[k], y[k]),
+                                    lambda: absolute_angle_array(datum_x, datum_y, x, y)),
+                 'rotate_axis': (lambda k: rotate_axis(datum_angle, x[k], y[k]),
+                                 lambda: rotate_axis_array(datum_angle, x, y)),
+                 'relative_coordinate': (lambda k: relative_coordinate(datum_x, datum_y, datum_angle, x[k], y[k]),
+                                         lambda: relative_coordinate_array(datum_x, datum_y, datum_angle, x, y)),
+                 'relative_polar': (lambda k: relative_polar(datum_x, datum_y, datum_angle, x[k], angle[k]),
+                                    lambda: relative_polar_array(datum_x, datum_y, datum_angle, x, angle)),
+                 'absolute_cartesian_to_relative_polar': (lambda k: absolute_cartesian_to_relative_polar(datum_x, datum_y, x[k], y[k])[:2],
+                                                          lambda: absolute_cartesian_to_relative_polar_array(datum_x, datum_y, x, y)[:2])}
+    rates = {}
+    print(f'geometry benchmark: {points} points')
+    for function_name, (one, bulk) in functions.items():
+        start_time = time.perf_counter()
+        result_one = np.array([one(k) for k in range(points)])
+        one_time = time.perf_counter() - start_time
+        start_time = time.perf_counter()
+        result_bulk = np.array(bulk())
+        bulk_time = time.perf_counter() - start_time
+        difference = np.abs(result_one.reshape(points, -1) - result_bulk.reshape(-1, points).T).max()
+        rates[function_name] = (points / one_time, points / bulk_time, difference)
+        print(f'{function_name}: one by one: {"%.0f" % (points / one_time)} points/s, '
+              f'array: {"%.0f" % (points / bulk_time)} points/s ({"%.1f" % (one_time / bulk_time)} x), '
+              f'largest difference: {"%.1e" % difference}')
+    return (rates)
+
+def linear_offset_adjustment(dia, offset, start_x, start_y, end_x, end_y, mode = None):
+
+    # ---Description---
+    # Calculates a straight line adjusted for cutter diameter/slot width and additional offset.
+    # returns adjusted position of start and end position.
+    # start_x_adjusted, start_y_adjusted, end_x_adjusted, end_y_adjusted = linear_offset_adjustment(dia, offset, start_x, start_y, end_x, end_y, mode)
+
+    # ---Variable List---
+    # dia = diameter of cutter/slot
+    # offset = additional offset
+    # start_x = x start of slot along neutral axis
+    # start_y = y start of slot along neutral axis
+    # end_x = x end of slot along neutral axis
+    # end_y = y end of slot along neutral axis
+    # mode = offset mode. 1 = right side of travel, 2 = left side of travel, 3 = on line of travel.
+
+    # ---Return Variable List---
+    # start_x_adjusted = adjusted start x position
+    # start_y_adjusted = adjusted start y position
+    # end_x_adjusted = adjusted end x position
+    # end_y_adjusted = adjusted end y position
+
+    # ---Change History---
+    # rev: 01-01-03-01
+    # date: 18/Oct/2026
+    # adjusted line is calculated by LineSegment. see LineSegment.offset()
+    # software test run on 18/Oct/2026
+    #
+    # rev: 01-01-10-07
+    # round of return values to 4 deicimal places.
+    # software test run on 31/Mar/2022
+    #
+    # rev: 01-01-10-01
+    # Initial release.
+    # software test run on 13/Sep/2021
+    # --------------------
+
+    segment = LineSegment(start_x, start_y, end_x, end_y).offset(dia, offset, mode)    # adjusted line
+    return (segment.start_x, segment.start_y, segment.end_x, segment.end_y)
+
+def arc_offset_adjustment(dia, offset, start_x, start_y, end_x, end_y, rad, cw, less_180, mode = None):
+
+    # ---Description---
+    # Calculates an arc adjusted for cutter diameter/slot width and additional offset.
+    # returns adjusted position of start and end position.
+    # Refer to 'PRT20210912001 Arc Offset Adjustment' and 'ALG20220401001 Arc Offset Adjustment Algorithm'
+    # start_x_adjusted, start_y_adjusted, end_x_adjusted, end_y_adjusted, rad_adjusted = arc_offset_adjustment(dia, offset, start_x, start_y, end_x, end_y, rad, cw, less_180, mode)
+
+    # ---Variable List---
+    # dia = diameter of cutter/slot
+    # offset = additional offset
+    # start_x = x start of arc along neutral axis
+    # start_y = y start of arc along neutral axis
+    # end_x = x end of arc along neutral axis
+    # end_y = y end of arc along neutral axis
+    # rad = radius of arc
+    # cw = Boolean. True = clockwise False = counter clockwise.
+    # less_180 = Boolean. True: < 180deg False: > 180deg.
+    # mode = offset mode. 1 = right side of travel, 2 = left side of travel, 3 = on line of travel.
+
+    # ---Return Variable List---
+    # start_x_adjusted = adjusted start x position
+    # start_y_adjusted = adjusted start y position
+    # end_x_adjusted = adjusted end x position
+    # end_y_adjusted = adjusted end y position
+    # rad_adjusted = adjusted arc radius
+
+    # ---Change History---
+    # rev: 01-01-03-01
+    # date: 18/Oct/2026
+    # adjusted arc is calculated by ArcSegment. center of arc is shared with arc_data(). see ArcSegment.offset()
+    # software test run on 18/Oct/2026
+    #
+    # rev: 01-01-10-07
+    # fixed bug on angle and vector selection for cw and ccw arcs.
+    # elaborated comments.
+    # fixed bug on pre code check.
+    # round of return values to 4 decimal places.
+    # software test run on 31/Mar/2022
+    #
+    # rev: 01-01-10-01
+    # Initial release.
+    # software test run on 13/Sep/2021
+    # --------------------
+
+    segment = ArcSegment(start_x, start_y, end_x, end_y, rad, cw, less_180).offset(dia, offset, mode)    # adjusted arc
+    return (segment.start_x, segment.start_y, segment.end_x, segment.end_y, segment.rad)
+
+def line(end_x, end_y, name, feed = None, end_z = None):
+
+    # ---Description---
+    # Calculates and prints G-code of a straight line.
+    # Optional end_z !! Note: end_z is in absolute units. !!
+    # Optional feed rate.
+    # returns cutter position
+    # cutter_x, cutter_y, cutter_z, text = line(end_x, end_y, name, feed, end_z)
+
+    # ---Variable List---
+    # end_x = x end of line
+    # end_y = y end of line
+    # name = name of file
+    # feed = cutting feed. (Optional)
+
+    # ---Return Variable List---
+    # cutter_x = current cutter x position
+    # cutter_y = current cutter y position
+    # cutter_z = current cutter z position
+    # text = G-code text
+
+    # ---Change History---
+    # rev: 01-01-01-13
+    #  changed comments in end_z from relative units to absolute units.
+    #
+    # rev: 01-01-10-09
+    # removed z ramp from pass in variables.
+    #
+    # rev: 01-01-10-08
+    # date: 07/Apr/2022
+    # description:
+    # Changed z ramp to end ramp
+    #
+    # rev: 01-01-10-07
+    # changed from writing G-code directly to txt file to a separate text variable.
+    # removed dia and offset compensation.
+    # added z return parameters.
+    # software test run on 12/Mar/2022
+    #
+    # rev: 01-01-10-01
+    # Initial release.
+    # software test run on 14/Sep/2021
+    # --------------------
+
+    text = f'''G1 X{"%.4f" % end_x} Y{"%.4f" % end_y}'''
+
+    if end_z != None:
+        text_temp = f''' Z{"%.4f" % end_z}'''  # optional end_z
+        text = text + text_temp
+
+    if feed != None:
+        text_temp = f''' F{"%.0f" % feed}'''    # optional feed
+        text = text + text_temp
+
+    text = text + "\n"      # new line
+
+    cutter_x = end_x
+    cutter_y = end_y
+    cutter_z = end_z
+
+    return(cutter_x, cutter_y, cutter_z, text)        # returns cutter position
+
+def arc(end_x, end_y, name, rad, cw, less_180, feed = None, end_z = None):
+
+    # ---Description---
+    # Calculates and prints G-code of an arc.
+    # Optional end_z !! Note: end_z is in absolute units. !!
+    # Optional feed rate.
+    # returns cutter position
+    # cutter_x, cutter_y, cutter_z, text = arc(end_x, end_y, name, rad, cw, less_180, feed, end_z)
+
+    # ---Variable List---
+    # end_x = x end of line
+    # end_y = y end of line
+    # name = name of file
+    # rad = radius of arc
+    # cw = Boolean. True = clockwise False = counter clockwise.
+    # less_180 = Boolean. True: < 180deg False: > 180deg.
+    # feed = cutting feed. (Optional)
+
+    # ---Return Variable List---
+    # cutter_x = adjusted start x position/ cutter x position
+    # cutter_y = adjusted start y position/ cutter y position
+    # cutter_z = adjusted start z position/ cutter z position
+    # text = G-code text
+
+    # ---Change History---
+    # rev: 01-01-01-13
+    #  changed comments in end_z from relative units to absolute units.
+    #
+    # rev: 01-01-10-09
+    # removed z ramp from pass in variables.
+    # included rad = 0 condition.
+    #
+    # rev: 01-01-10-08
+    # date: 07/Apr/2022
+    # description:
+    # Changed z ramp to end ramp
+    #
+    # rev: 01-01-10-07
+    # changed from writing G-code directly to txt file to a separate text variable.
+    # removed dia and offset compensation.
+    # added z return parameters.
+    # software test run on 12/Mar/2022
+    #
+    # rev: 01-01-10-01
+    # Initial release.
+    # software test run on 14/Sep/2021
+    # --------------------
+
+    # check for start_z definition.
+
+    if round(rad, 5)==0:    # round to 5 decimal places. detect rad = zero. returns x, y as point destination.
+        text = f'''G1 X{"%.4f" % end_x} Y{"%.4f" % end_y}'''
+        cutter_x = end_x
+        cutter_y = end_y
+        cutter_z = end_z
+        return (cutter_x, cutter_y, cutter_z, text)  # returns cutter position
+
+    if less_180 == True:
+        rad_adjusted = rad     # acute arc. G-code convention: positive radius = minor arc.
+    if less_180 == False:
+        rad_adjusted = -rad    # obtuse arc. G-code convention: negative radius = major arc.
+
+    if cw == True:
+        dir = '02'
+    elif cw == False:
+        dir = '03'
+
+    text = f'''G{dir} X{"%.4f" % end_x} Y{"%.4f" % end_y} R{"%.4f" % rad_adjusted}'''
+
+    if end_z != None:
+        text_temp = f''' Z{"%.4f" % end_z}'''  # optional end_z
+        text = text + text_temp
+
+    if feed != None:
+        text_temp = f''' F{"%.0f" % feed}'''    # optional feed
+        text = text + text_temp
+
+    text = text + "\n"      # new line
+
+    cutter_x = end_x
+    cutter_y = end_y
+    cutter_z = end_z
+
+    return(cutter_x, cutter_y, cutter_z, text)        # returns cutter position
+
+def tro_slot(start_x, start_y, end_x, end_y, step, wos, dia, name, cutter_x, cutter_y, first_slot = True, last_slot = True, debug = False, sink = None):
+    
+   # ---Description---
+   # Calculates and prints to a txt file the trochoidal tool path in G code of a straight slot.
+   # returns last position of cutter and end position of slot.
+   # start and end points are located along slot arc center/neutral axis.
+   # assumes that cutter is at cutting depth.
+   # does NOT return to safe z.
+   # end_x_original, end_y_original, cutter_x_final, cutter_y_final, text = tro_slot(start_x, start_y, end_x, end_y, step, wos, dia, name, cutter_x, cutter_y, first_slot, last_slot, debug)
+
+   # ---Variable List---
+   # start_x = x start of slot along neutral axis
+   # start_y = y start of slot along neutral axis
+   # end_x = x end of slot along neutral axis
+   # end_y = y end of slot along neutral axis
+   # step = depth of step per trochoidal slice.
+   # wos = width of slot
+   # dia = diameter of cutter
+   # name = name of file
+   # cutter_x = x position of cutter
+   # cutter_y = y position of cutter
+   # first_slot = boolean. Is this the first slot?
+   # last_slot = boolean. Is this the last slot?
+   # debug = False (default)
+   # sink = optional function. sink(text) receives each G-code block. None -> G-code text is returned.
+
+   # ---Return Variable List---
+   # end_x_original = x coordinate of end of slot unadjusted
+   # end_y_original = y coordinate of end of slot unadjusted
+   # cutter_x_final = x coordinate of cutter position
+   # cutter_y_final = y coordinate of cutter position
+   # text = G-code text
+   
+   # ---Change History---
+   # rev: 01-01-03-01
+   # date: 18/Oct/2026
+   # Added optional sink. G-code blocks are sent to sink(text) as they are generated and text returns empty.
+   # without sink, blocks are collected in a list and joined once (text = text + ... removed).
+   # length and angle of slot from LineSegment.
+   # positions of all loops are calculated in one call by tro_slot_loops(). loops except the last loop are sent in one block by emit_lines() (number columns go straight into move lists). G-code is identical.
+   # software test run on 18/Oct/2026
+    #
+   # rev: 01-01-02-01
+   # decreased the snesitivity of acutal cutter starting point and desired starting point for non-first trochoidal transitions.
+   # changed from:
+   #         if (delta_x > 0.0001) or (delta_y > 0.0001):       # if cutter not at start point reorient else skip.
+   # to:
+   #         if (delta_x > 0.0005) or (delta_y > 0.0005):       # if cutter not at start point reorient else skip.
+   #
+   # rev: 01-01-10-09
+   # changed label and names from "trichoidal" to "trochoidal" and "tri" to "tro"
+   #
+   # rev: 01-01-10-07
+   # changed from writing G-code directly to txt file to a separate text variable.
+   # removed offset compensation.
+   # software test run on 12/Mar/2022
+   #
+   # rev: 01-01-10-01
+   # Fixed cutter reorientation detection by changing "and" to "or"
+   # Added rounding to 4 decimal places for G-code coordinates, 3 for label coordinates, 1 for feeds
+   # software test run on 07/Sep/2021
+   # physical test run on 09/Sep/2021
+   # Added slot offset for internal, external or slot cut
+   # --------------------
+
+    title_block = \
+    f'''
+    (---trochoidal linear slot start---)                                                                                                                                                                                                                     
+    (---description---)
+    (Calculates and prints to a txt file the trochoidal tool path in G code of a straight slot.)                                                                                                         
+    (returns last position of cutter and end position of slot)
+    (start and end points are located along slot arc center/neutral axis)
+    (assumes that cutter is at cutting depth)
+    (does NOT return to safe z)
+    (---parameters---)                                                                                                          
+    (start: X{"%.3f" % start_x} Y{"%.3f" % start_y})
+    (end: X{"%.3f" % end_x} Y{"%.3f" % end_y})
+    (step over: {"%.3f" % step})
+    (width of slot: {"%.3f" % wos})                                                                                            
+    (cutter diameter: {"%.3f" % dia})
+    (position of cutter: X{"%.4f" % cutter_x} Y{"%.4f" % cutter_y})
+    (first slot: {first_slot})
+    (last slot: {last_slot})                                                                                                  
+    '''
+    blocks = []     # G-code blocks. joined once at the end.
+    emit = blocks.append if sink == None else sink     # send G-code blocks to sink or collect them.
+    emit(title_block)          # emit header block
+
+    start_x_original = start_x
+    start_y_original = start_y
+    end_x_original = end_x
+    end_y_original = end_y
+
+    segment = LineSegment(start_x, start_y, end_x, end_y)     # geometry of slot
+    length = segment.length     # length of slot
+    noc_raw = length / step    # number of cuts-raw
+    noc = math.floor(noc_raw)  # number of cuts rounded down
+    noc_re = length % step  # calculate remainder
+    dia_arc = wos - dia  # diameter of Cut Arc
+    rad_arc = dia_arc / 2  # radius of Cut Arc
+    angle = segment.angle    # absolute angle of slot.
+
+
+    if noc_re != 0:  # if there is a remainder, increment number of cuts by 1 to include last partial cut.
+        noc = noc + 1
+
+    if debug == True:
+        print("")
+        print("--------------------")
+        print("Function: trochoidal")
+        print("--------------------")
+        print(f"start_x {start_x}")
+        print(f"start_y {start_y}")
+        print(f"end_x {end_x}")
+        print(f"end_y {end_y}")
+        print(f"length {length}")
+        print(f"noc_raw {noc_raw}")
+        print(f"noc {noc}")
+        print(f"noc_re {noc_re}")
+        print(f"dia_arc {dia_arc}")
+        print(f"rad_arc {rad_arc}")
+        print(f"angle {angle}")
+        print(f"noc {noc}\n")
+
+    x1, y1, x2, y2, x3, y3, x4, y4 = tro_slot_loops(start_x, start_y, angle, step, noc, noc_re, rad_arc)    # positions of all loops. refer to sketch.
+    if debug == True:
+        print(f"x1 {x1}\ny1 {y1}\nx2 {x2}\ny2 {y2}\nx3 {x3}\ny3 {y3}\nx4 {x4}\ny4 {y4}")
+
+    if noc > 0:                                              # for 1st loop only. move tool from arc start position to 1st position.
+        if first_slot == True:
+            temp = rad_arc / 2
+            line_1 = \
+    f'''
+    G03 X{"%.4f" % x1[0]} Y{"%.4f" % y1[0]} R{"%.4f" % temp}
+    '''
+            emit(line_1)                # emit G-code block
+        else:                                           # reorient cutter to starting point of slot.
+            x_start, y_start = relative_coordinate(start_x, start_y, angle, 0 * step, -rad_arc, debug)     # 1st position of 1st loop
+            delta_x = abs(x_start - cutter_x)
+            delta_y = abs(y_start - cutter_y)
+            if (delta_x > 0.0005) or (delta_y > 0.0005):       # if cutter is at start point skip else reorient.
+                line_1 = \
+    f'''
+    G03 X{"%.4f" % x1[0]} Y{"%.4f" % y1[0]} I{"%.4f" % (start_x-cutter_x)} J{"%.4f" % (start_y-cutter_y)}
+    '''
+                emit(line_1)            # emit G-code block
+
+    if noc > 1:     # write G code of all loops except the last loop in one block.
+        rad = [rad_arc] * (noc - 1)
+        emit_lines(emit, ('\n    G1 X', ' Y', '\n    G03 X', ' Y', ' R', '\n    G1 X', ' Y', '\n    G03 X', ' y', ' R', '\n    '),
+                   [x2[:-1], y2[:-1], x3[:-1], y3[:-1], rad, x4[:-1], y4[:-1], x1[:-1], y1[:-1], rad], (4, 4, 4, 4, 4, 4, 4, 4, 4, 4))    # emit G-code block
+
+    if noc > 0:     # last loop. move tool to be along slot arc.
+        i = noc
+        line_2 = \
+    f'''
+    G1 X{"%.4f" % x2[-1]} Y{"%.4f" % y2[-1]}
+    G03 X{"%.4f" % x3[-1]} Y{"%.4f" % y3[-1]} R{"%.4f" % rad_arc}
+    G1 X{"%.4f" % x4[-1]} Y{"%.4f" % y4[-1]}
+    '''
+        emit(line_2)                 # emit G-code block
+        if last_slot == True:
+            temp = rad_arc / 2
+            x_temp = (i - 1) * step
+            y_temp = 0
+            x5, y5 = relative_coordinate(start_x, start_y, angle, x_temp, y_temp, debug)
+            line_3 = \
+    f'''G03 X{"%.4f" % x5} y{"%.4f" % y5} R{"%.4f" % temp}
+    G1 X{"%.4f" % end_x} Y{"%.4f" % end_y}
+    '''
+            cutter_x_final = end_x
+            cutter_y_final = end_y
+        elif last_slot == False:
+            x_temp = length
+            y_temp = -rad_arc
+            x5, y5 = relative_coordinate(start_x, start_y, angle, x_temp, y_temp, debug)
+            line_3 = \
+    f'''G03 X{"%.4f" % x1[-1]} y{"%.4f" % y1[-1]} R{"%.4f" % rad_arc}
+    G1 X{"%.4f" % x5} Y{"%.4f" % y5}
+    '''
+            cutter_x_final = x5
+            cutter_y_final = y5
+        emit(line_3)             # emit G-code block
+
+    text_temp = \
+    f'''(---trochoidal linear slot end---)
+    '''
+    emit(text_temp)         # emit G-code block
+
+    text = ''.join(blocks)    # G-code text. '' if blocks are sent to sink.
+    return (end_x_original, end_y_original, cutter_x_final, cutter_y_final, text)
+
+def tro_arc(start_x, start_y, end_x, end_y, step, wos, dia, rad_slot, cw, less_180, name, cutter_x, cutter_y, first_slot = True, last_slot = True, debug = False, sink = None):
+
+   # ---Description---
+   # Calculates and prints to a txt file the trochoidal tool path in G code of a circular arc.
+   # returns last position of cutter and end position of arc.
+   # refer to "PRT20210421001 Trichoidal Arc Calculator", "MEM20210522001 Trichoidal Arc", "MEM20210429002 Trichoidal Notes", "ALG20210520001 Trichoidal Arc Algorithm"
+   # start and end points are located at slot arc center points.
+   # assumes that cutter is at cutting depth.
+   # does not return to safe z.
+   # does not set cutting feed.
+   # end_x_original, end_y_original, cutter_x_final, cutter_y_final, text = tro_arc(start_x, start_y, end_x, end_y, step, wos, dia, rad_slot, cw, less_180, name, cutter_x, cutter_y, first_slot, last_slot, debug)
+
+   # ---Variable List---
+   # start_x = x start of arc along neutral axis
+   # start_y = y start of arc along neutral axis
+   # end_x = x end of arc along neutral axis
+   # end_y = y end of arc along neutral axis
+   # step = depth of step per trochoidal slice.
+   # wos = width of slot
+   # dia = diameter of cutter
+   # rad_slot = radius of slot arc.
+   # cw = Boolean. True = clockwise False = counter clockwise.
+   # less_180 = Boolean. True: < 180deg False: > 180deg.
+   # name = name of file
+   # cutter_x = x position of cutter
+   # cutter_y = y position of cutter
+   # first_slot = boolean. Is this the first slot?
+   # last_slot = boolean. Is this the last slot?
+   # debug = False (default)
+   # sink = optional function. sink(text) receives each G-code block. None -> G-code text is returned.
+
+   # ---Return Variable List---
+   # end_x_original = x coordinate of end of slot unadjusted
+   # end_y_original = y coordinate of end of slot unadjusted
+   # cutter_x_final = x coordinate of cutter position
+   # cutter_y_final = y coordinate of cutter position
+   # text = G-code text
+
+    # ---Change History---
+    # rev: 01-01-03-01
+    # date: 18/Oct/2026
+    # Added optional sink. G-code blocks are sent to sink(text) as they are generated and text returns empty.
+    # without sink, blocks are collected in a list and joined once (text = text + ... removed).
+    # linear length and angle of slot arc chord from LineSegment.
+    # angles of all loops are generated up front by tro_arc_schedule(). positions of loops except the first and last loop are calculated in one call by tro_arc_loops() and sent in one block by emit_lines() (number columns go straight into move lists). angle_increment() removed. G-code is identical.
+    # software test run on 18/Oct/2026
+    #
+    # rev: 01-01-02-01
+    # decreased the snesitivity of acutal cutter starting point and desired starting point for non-first trochoidal transitions.
+    # changed from:
+    #         if (delta_x > 0.0001) or (delta_y > 0.0001):       # if cutter not at start point reorient else skip.
+    # to:
+    #         if (delta_x > 0.0005) or (delta_y > 0.0005):       # if cutter not at start point reorient else skip.
+    #
+    # rev: 01-01-10-09
+    # changed label and names from "trichoidal" to "trochoidal" and "tri" to "tro"
+    #
+    # rev: 01-01-10-07
+    # changed from writing G-code directly to txt file to a separate text variable.
+    # changed "else:" to "elif cw == False:" where available.
+    # found and fixed bug for cw and ccw arcs regarding adjusted radius for the last arc segments for non last slots.
+    # software test run on 04/Apr/2022
+    # removed offset compensation.
+    # software test run on 12/Mar/2022
+    #
+    # rev: 01-01-10-01
+    # Added variable list
+    # Added rounding to 4 decimal places for G-code coordinates, 3 for label coordinates, 1 for feeds
+    # software test run on 07/Sep/2021
+    # physical test run on 09/Sep/2021
+    #
+    # rev: 01-01-09-08
+    # initial release
+
+    start_block = \
+    f'''(---trochoidal arc slot start---)
+    (---description---)
+    (Calculates and prints to a txt file the trochoidal tool path in G code of a counter clockwise arc.)
+    (returns last position of cutter and end position of arc.)
+    (refer to "PRT20210421001 Trichoidal Arc Calculator", "MEM20210522001 Trichoidal Arc", "MEM20210429002 Trichoidal Notes")
+    (start and end points are located at slot arc center points.)
+    (assumes that cutter is at cutting depth.)
+    (does not return to safe z.)
+    (does not set cutting feed.)
+    (---parameter---)
+    (start: X{"%.3f" % start_x} Y{"%.3f" % start_y})
+    (end: X{"%.3f" % end_x} Y{"%.3f" % end_y})
+    (step over: {"%.3f" % step})                     
+    (width of slot: {"%.3f" % wos}) 
+    (slot radius : {"%.3f" % rad_slot})                  
+    (cutter diameter: {"%.3f" % dia})        
+    (position of cutter: X{"%.4f" % cutter_x} Y{"%.4f" % cutter_y}) 
+    (first slot: {first_slot})              
+    (last slot: {last_slot})                
+    (clockwise : {cw})
+    (acute angle: {less_180})
+    '''
+    blocks = []     # G-code blocks. joined once at the end.
+    emit = blocks.append if sink == None else sink     # send G-code blocks to sink or collect them.
+    emit(start_block)          # emit header block
+
+    start_x_original = start_x
+    start_y_original = start_y
+    end_x_original = end_x
+    end_y_original = end_y
+
+    # check if width of slot is smaller tool dia
+    if wos <= dia:
+        print(f'''!!script aborted!!\ntro_arc\nwidth of slot is smaller tool dia.\nwidth of slot= {"%.3f" % wos}\ntool dia = {"%.3f" % dia}''')
+        text = '''\n(!!script aborted!!)\n(width of slot is smaller tool dia)\n'''  # write header for section.
+        quit()
+
+    skip_1 = False   # initialize skip_1 flag
+
+    segment = LineSegment(start_x, start_y, end_x, end_y)     # chord of slot arc
+    linear_length = segment.length      # calculate linear length from start point to end point
+
+    # check if diameter of arc is larger than linear length
+    #print( '0001 dia arc: ' + str(rad_slot*2) + '\n' + 'linear_length: ' + str(linear_length) + '\n')  # debug !!!TEMP!!!
+#    if rad_slot*2 < linear_length:      # !!!BUG!!!  check does not work as intended.
+#        print(f'''!!script aborted!!\ntro_arc\ndiameter of arc is smaller than linear length.\ndiameter of arc = {"%.3f" % (rad_slot*2)}\nlinear length = {"%.3f" % linear_length}''')
+#        text = '''\n(!!script aborted!!)\n(diameter of arc is smaller than linear length)\n'''  # write header for section.
+#        quit()
+
+    if rad_slot*2 < (wos-dia):      # !!!BUG!!!  check does not work as intended.
+        print(f'''!!script aborted!!\ntro_arc\ndiameter of arc is smaller than (wos-dia).\ndiameter of arc = {"%.3f" % (rad_slot*2)}\nwos = {"%.3f" % (wos-dia)}''')
+        print('minor arc of trochoidal arc is too small.\nCausing unpredictability of trochoidal pattern')
+        text = '''\n(!!script aborted!!)\n(diameter of arc is smaller than (wos-dia))\n(minor arc of trochoidal arc is too small.)\n(Causing unpredictability of trochoidal pattern)'''  # write header for section.
+        quit()
+
+    slot_angle = 2 * math.degrees(math.asin(( linear_length / 2) / rad_slot))  # acute arc angle
+    if less_180 == False:
+        slot_angle = 360 - slot_angle     # obtuse arc angle
+
+    dia_arc = wos - dia  # diameter of Cut Arc
+    rad_arc = dia_arc / 2  # radius of Cut Arc
+
+    # -----calculate datum-----
+    # the center of slot arc is to be used as the datum point for indexing the trochoidal loops.
+    # the centroid of the geometric model is to be used as the temporary reference point. refer to sketch "MEM20210429002 Notes".
+    # vectors are initially resolved relative to the centroid after which absolute positions are determined.
+    # there are 2 possible center points (datums) depending on if the arc is acute or obtuse.
+    # acute arc (<= 180deg) will have its datum on the left side of the arc vector.
+    # obtuse arc (> 180deg) will have its datum on the right side of the arc vector.
+
+    cen_length = math.sqrt(rad_slot**2 - (linear_length/2)**2)    # calculate distance between centroid and arc center.
+    vec_angle = segment.angle    # calculate the absolute angle of start point to end point.
+    cen_x, cen_y = relative_polar(start_x, start_y, 0, linear_length/2, vec_angle)  # calculate position of centroid.
+
+    if less_180:
+        if cw == True:
+            vec_angle = vec_angle + 270     # acute angle, cw
+        elif cw == False:
+            vec_angle = vec_angle + 90     # acute angle, ccw
+    else:
+        if cw == True:
+            vec_angle = vec_angle + 90     # obtuse angle, cw
+        elif cw == False:
+            vec_angle = vec_angle + 270     # obtuse angle, ccw
+
+    datum_x, datum_y = relative_polar(cen_x, cen_y, 0, cen_length, vec_angle)  # calculate position of datum.
+    step_angle = step / (rad_slot*math.pi/180)
+    inc_angle = step_angle  # initialize increment angle
+    datum_angle = absolute_angle(datum_x, datum_y, start_x, start_y)  # calculate absolute angle of start point with respect to datum (center of slot arc).
+    end_angle = slot_angle  # end angle
+    if cw == True:
+        end_angle = - abs(end_angle)    # angle decrements in cw arc
+    elif cw == False:
+        end_angle = abs(end_angle)      # angle increments in ccw arc
+    angles, inc_angles, partial = tro_arc_schedule(step_angle, end_angle, cw)     # start angle and angle of all loops.
+    angle = float(angles[0])   # initialize angle
+
+    def segment_position (datum_x, datum_y, datum_angle, rad_slot, rad_arc, angle, inc_angle, cw):
+        # calculate positions. refer to sketch.
+        major_rad = rad_slot + rad_arc
+        minor_rad = rad_slot - rad_arc
+        if cw == True:
+            x1, y1 = relative_polar(datum_x, datum_y, datum_angle, minor_rad, angle)
+            x2, y2 = relative_polar(datum_x, datum_y, datum_angle, minor_rad, angle - inc_angle)
+            x3, y3 = relative_polar(datum_x, datum_y, datum_angle, major_rad, angle - inc_angle)
+            x4, y4 = relative_polar(datum_x, datum_y, datum_angle, major_rad, angle)
+        elif cw == False:
+            x1, y1 = relative_polar(datum_x, datum_y, datum_angle, major_rad, angle)
+            x2, y2 = relative_polar(datum_x, datum_y, datum_angle, major_rad, angle + inc_angle)
+            x3, y3 = relative_polar(datum_x, datum_y, datum_angle, minor_rad, angle + inc_angle)
+            x4, y4 = relative_polar(datum_x, datum_y, datum_angle, minor_rad, angle)
+        x5 = x1
+        y5 = y1
+        return (x1, y1, x2, y2, x3, y3, x4, y4, x5, y5)
+
+    def segment_radius(rad_slot, rad_arc, cw):
+        # calculate radii. refer to sketch.
+        major_rad = rad_slot + rad_arc
+        minor_rad = rad_slot - rad_arc
+        if cw == True:
+            r1 = minor_rad
+            r2 = minor_rad
+            r4 = major_rad
+        elif cw == False:
+            r1 = major_rad
+            r2 = major_rad
+            r4 = minor_rad
+        r3 = rad_arc
+        r5 = rad_arc
+        return (r1, r2, r3, r4, r5)
+
+    def text_tro_arc(x1, y1, x2, y2, x3, y3, x4, y4, x5, y5, r1, r2, r3, r4, r5, dir_1, skip_1, cw):
+        # generate g code. refer to sketch.
+
+        text = ''   # intialize
+
+        if cw == True:
+            dir = 'G02'
+            inv_dir = 'G03'
+        elif cw == False:
+            dir = 'G03'
+            inv_dir = 'G02'
+
+        if skip_1 == False:     # if cutter is at x1y1, skip
+            text_01 = \
+            f'''
+            {dir_1} X{"%.4f" % x1} Y{"%.4f" % y1} R{"%.4f" % r1}
+            '''
+            text = text_01
+
+        text_02 = \
+            f'''
+            {dir} X{"%.4f" % x2} Y{"%.4f" % y2} R{"%.4f" % r2}
+            G03 X{"%.4f" % x3} Y{"%.4f" % y3} R{"%.4f" % r3}
+            {inv_dir} X{"%.4f" % x4} Y{"%.4f" % y4} R{"%.4f" % r4}
+            G03 X{"%.4f" % x5} Y{"%.4f" % y5} R{"%.4f" % r5}
+            '''
+        text = text + text_02
+        return (text)
+
+    x1, y1, x2, y2, x3, y3, x4, y4, x5, y5 = segment_position(datum_x, datum_y, datum_angle, rad_slot, rad_arc, angle, inc_angle, cw)
+    r1, r2, r3, r4, r5 = segment_radius(rad_slot, rad_arc, cw)
+
+    # for 1st loop only. move tool from arc start position to 1st position.
+    if first_slot == True:      # first slot. assumes cutter at start x y.
+        r1 = rad_arc / 2
+        dir_1 = 'G03'
+    elif first_slot == False:   # reorient cutter to starting point of slot if this is not first slot. assumes cutter is along circumference of slot.
+        delta_x = abs(x1 - cutter_x)
+        delta_y = abs(y1 - cutter_y)
+        if (delta_x > 0.0005) or (delta_y > 0.0005):       # if cutter not at start point reorient else skip.
+
+            #determine if angle between current/now cutter position and first position (x1, y1) is acute or obtuse
+            temp_angle_now = absolute_angle(start_x, start_y, cutter_x, cutter_y)
+            temp_angle_1 = absolute_angle(start_x, start_y, x1, y1)
+            temp_angle_diff = temp_angle_1 - temp_angle_now
+
+            if temp_angle_diff <0 :         # if angle overflow add 360
+                temp_angle_diff = 360+temp_angle_diff
+
+            if temp_angle_diff <= 180 :
+                r1 = rad_arc
+            else:
+                r1 = - rad_arc
+            dir_1 = 'G03'
+        else:
+            skip_1 = True   # set skip_1 flag
+            # initialize dir_1 direction.
+            if cw == True:
+                dir_1 = 'G02'
+            elif cw == False:
+                dir_1 = 'G03'
+
+    text_temp = text_tro_arc(x1, y1, x2, y2, x3, y3, x4, y4, x5, y5, r1, r2, r3, r4, r5, dir_1, skip_1, cw)     # generate first block og g code.
+    emit(text_temp)
+    skip_1 = False  # reset skip_1 flag
+
+    # initialize dir_1 direction.
+    if cw == True:
+        dir_1 = 'G02'
+    elif cw == False:
+        dir_1 = 'G03'
+
+    # generate g code for trochoidal loops except last loop in one block.
+    full = len(angles) - 1 if partial == True else len(angles)     # number of loops with full step.
+    if full > 1:
+        r1, r2, r3, r4, r5 = segment_radius(rad_slot, rad_arc, cw)
+        x1, y1, x2, y2, x3, y3, x4, y4 = tro_arc_loops(datum_x, datum_y, datum_angle, rad_slot, rad_arc, angles[1:full], inc_angles[1:full], cw)
+        if cw == True:
+            dir = 'G02'
+            inv_dir = 'G03'
+        elif cw == False:
+            dir = 'G03'
+            inv_dir = 'G02'
+        indent = '\n            '     # same lines as text_tro_arc()
+        r1, r2, r3, r4, r5 = [[r] * (full - 1) for r in (r1, r2, r3, r4, r5)]
+        emit_lines(emit, (f'{indent}{dir_1} X', ' Y', ' R', f'{indent}{indent}{dir} X', ' Y', ' R', f'{indent}G03 X', ' Y', ' R',
+                          f'{indent}{inv_dir} X', ' Y', ' R', f'{indent}G03 X', ' Y', ' R', indent),
+                   [x1, y1, r1, x2, y2, r2, x3, y3, r3, x4, y4, r4, x1, y1, r5], (4,) * 15)     # emit G-code block
+    # generate g code for last loop if present.
+    if partial == True:
+        angle = float(angles[-1])
+        inc_angle = float(inc_angles[-1])
+        x1, y1, x2, y2, x3, y3, x4, y4, x5, y5 = segment_position(datum_x, datum_y, datum_angle, rad_slot, rad_arc, angle, inc_angle, cw)
+        r1, r2, r3, r4, r5 = segment_radius(rad_slot, rad_arc, cw)
+
+        # calculate last slot end position
+        if last_slot == True:   # calculate x5, y5, r5 to end at midline with the slot path.
+            r5 = rad_arc/2
+            x5, y5 = relative_polar(datum_x, datum_y, datum_angle, rad_slot, angle)
+
+        text_temp = text_tro_arc(x1, y1, x2, y2, x3, y3, x4, y4, x5, y5, r1, r2, r3, r4, r5, dir_1, skip_1, cw)
+        emit(text_temp)
+
+        if last_slot == True:   # advance tool to end position on slot path midline.
+            text_temp = \
+                f'''
+                {dir_1} X{"%.4f" % end_x} Y{"%.4f" % end_y} R{"%.4f" % rad_slot}
+                '''
+            emit(text_temp)
+            cutter_x_final = end_x
+            cutter_y_final = end_y
+        else:       # advance tool to cutting position for next slot.
+            if cw == True:
+                rad_temp = rad_slot - rad_arc
+            if cw == False:
+                rad_temp = rad_slot + rad_arc
+            text_temp = f'''{dir_1} X{"%.4f" % x2} Y{"%.4f" % y2} R{"%.4f" % rad_temp}'''
+            emit(text_temp)
+            cutter_x_final = x2
+            cutter_y_final = y2
+
+    text_temp = \
+    f'''
+    (---trochoidal arc slot end---)
+    '''
+    # write footer for section.
+    emit(text_temp)
+
+    text = ''.join(blocks)    # G-code text. '' if blocks are sent to sink.
+    return (end_x_original, end_y_original, cutter_x_final, cutter_y_final, text)
+
+def surface(origin_x, origin_y, length_x, length_y, doc, dia, step, z_f, cut_f, safe_z, entry, name, debug = False, sink = None):
+
+    # ---description---
+    # calculates and prints to a txt file the tool path in G code to surface a rectangular part.
+    # assumes climb milling.
+    # assumes origin at bottom left corner.
+    # assumes z=0 at top surface.
+    # starts at x = length_x + 2 * diameter of cutter, y = 0  from bottom left corner.
+    # cuts in a clockwise direction from the outside to the center.
+    # return to origin after surfacing.
+    # start and ends at safe_z
+    # refer to PRT20210510003 Surfacing Calculator
+    # refer to ALG230526-001 Surface Algorithm
+    # text = surface(origin_x, origin_y, length_x, length_y, doc, dia, step, z_f, cut_f, safe_z, entry, name, debug)
+
+    # ---Variable List---
+    # origin_x = x of bottom left corner
+    # origin_y = y of bottom left corner
+    # length_x = x length of rectangle
+    # length_y = y length of rectangle
+    # doc = depth of cut (absolute convention. Negative in the downward Z direction.)
+    # dia = diameter of cutter
+    # step = step over per pass.
+    # z_f =  z feed
+    # cut_f = cutting feed
+    # safe_z = safe z
+    # name = name of file
+    # debug = False (default)
+    # sink = optional function. sink(text) receives each G-code block. None -> G-code text is returned.
+
+    # ---Return Variable List---
+    # text = G-code text
+
+    # ---Change History---
+    # rev: 01-01-03-01
+    # date: 18/Oct/2026
+    # Added optional sink. G-code blocks are sent to sink(text) as they are generated and text returns empty.
+    # without sink, blocks are collected in a list and joined once (text = text + ... removed).
+    # software test run on 18/Oct/2026
+    #
+    # rev: 01-01-01-09
+    # simplified last cut to a line to line cut followed by a straight center line cut.
+    # added starting point options on 4 different corners.
+    #
+    # rev: 01-01-01-08
+    # Bug fix.
+    # fixed off by one error on first top length.
+    # fixed "length_y" mislabelled as "length_x" on left and right length segments.
+    # reduced starting point offset from dia*2 to dia.
+    #
+    # rev: 01-01-01-05
+    # added error checks using abort function.
+    # software test run on 11/Mar/2023
+    #
+    # rev: 01-01-10-07
+    # changed from writing G-code directly to txt file to a separate text variable.
+    # software test run on 04/04/2022
+    #
+    # rev: 01-01-10-06
+    # changed doc from scalar to absolute convention.
+    # physical test run on TBD
+    #
+    # rev: 01-01-10-01
+    # Added variable list
+    # Added rounding to 4 decimal places for G-code coordinates, 3 for label coordinates, 1 for feeds
+    # physical test run on 09/Sep/2021
+
+    # check if safe_z is above surface.
+    if safe_z <= 0:
+        abort('safe_z', safe_z, 'safe_z below surface')
+
+    # check if step is larger than tool dia.
+    if step > dia:
+        abort('step',step,f'step is larger than tool dia.\nstep = {"%.3f" % step}\ntool dia = {"%.3f" % dia}')
+
+    start_block = \
+    f'''
+    (---surfacing start---)
+    (This program calculates the tool path to surface a rectangular part.)
+    (assumes climb milling.)
+    (assumes origin at bottom left corner.)
+    (assumes z=0 at top surface.)
+    (starts at x = 0, y = -(2 * diameter of cutter) from bottom left corner.)
+    (cuts in a clockwise direction from the outside to the center.)
+    (return to origin after surfacing.)
+    (---parameter---)
+    (origin: X{"%.3f" % origin_x} Y{"%.3f" % origin_y})
+    (length x: {"%.3f" % length_x})
+    (length y: {"%.3f" % length_y})
+    (depth of cut: {"%.3f" % doc})
+    (step: {"%.3f" % step})
+    (plunge feed: {"%.1f" % z_f})
+    (cutting feed: {"%.1f" % cut_f})
+    (safe Z: {"%.3f" % safe_z})
+    '''
+    blocks = []     # G-code blocks. joined once at the end.
+    emit = blocks.append if sink == None else sink     # send G-code blocks to sink or collect them.
+    emit(start_block)          # emit header block
+
+    # initialize starting point
+    if entry == 'bottom_right':
+        start_x = origin_x + length_x + dia
+        start_y = origin_y - dia/2 + step
+        length_y = length_y - step  # initialize length_y to compensate for off by one error.(OBOE)
+    elif entry == 'bottom_left':
+        start_x = origin_x - dia/2 + step
+        start_y = origin_y - dia
+        length_x = length_x - step  # initialize length_x to compensate for off by one error.(OBOE)
+    elif entry == 'top_left':
+        start_x = origin_x - dia
+        start_y = origin_y + length_y + dia/2 - step
+        length_y = length_y - step  # initialize length_y to compensate for off by one error.(OBOE)
+    elif entry == 'top_right':
+        start_x = origin_x + length_x + dia/2 - step
+        start_y = origin_y + length_y + dia
+        length_x = length_x - step  # initialize length_x to compensate for off by one error.(OBOE)
+
+    # starting G code block
+    text_temp = \
+    f'''
+    G0 Z{"%.4f" % safe_z}   (Go to safe height)
+    G0 X{"%.4f" % start_x} Y{"%.4f" % start_y}   (Rapid to start point)
+    F{"%.1f" % z_f}  (set to plunge feed)
+    G1 Z{"%.4f" % doc} (go to cut depth)
+    F{"%.1f" % cut_f}  (set to cutting feed)
+
+    G91 (incremental positioning)
+    '''
+    emit(text_temp)
+
+    if entry == 'bottom_right':
+        text_temp = \
+    f'''
+        G1 X{"%.4f" % (-dia)} (go to starting corner)
+    '''
+    elif entry == 'bottom_left':
+        text_temp = \
+    f'''
+        G1 Y{"%.4f" % (dia)} (go to starting corner)
+    '''
+    elif entry == 'top_left':
+        text_temp = \
+    f'''
+        G1 X{"%.4f" % (dia)} (go to starting corner)
+    '''
+    elif entry == 'top_right':
+        text_temp = \
+    f'''
+        G1 Y{"%.4f" % (-dia)} (go to starting corner)
+    '''
+    emit(text_temp)
+
+    last = False    # initialize last cut flag
+    first = True    # initialize first cut flag
+
+    while last == False:
+
+        # bottom length
+        if ((first == True) and (entry == 'bottom_right')) or (first == False):     # select segment based on starting point
+
+            length_x = length_x - step  # decrement length_x
+            if length_x <= 0:
+                text_temp = \
+    f'''   
+    G02 X{"%.4f" % (-dia / 2)} Y{"%.4f" % (dia / 2)} R{"%.4f" % (dia / 2)}
+    G1 Y{"%.4f" % (length_y - step + dia / 4)}
+    G02 X{"%.4f" % (dia / 4)} Y{"%.4f" % (dia / 4)} R{"%.4f" % (dia / 4)}      
+    G02 X{"%.4f" % (dia / 4)} Y{"%.4f" % (-dia / 4)} R{"%.4f" % (dia / 4)}     
+    G1 Y{"%.4f" % (-(length_y - step + dia / 4))}        
+    '''
+                emit(text_temp)
+                break
+            else:
+                text_temp = \
+    f'''
+    G1 X{"%.4f" % (-length_x)}
+    G02 X{"%.4f" % (-dia / 2)} Y{"%.4f" % (dia / 2)} R{"%.4f" % (dia / 2)}
+    '''
+                emit(text_temp)
+            first = False       # clear first flag
+
+        # left length
+        if ((first == True) and (entry == 'bottom_left')) or (first == False):     # select segment based on starting point
+            length_y = length_y - step  # decrement length_y
+            if length_y <= 0:
+                text_temp = \
+    f'''
+    G02 X{"%.4f" % (dia/2)} Y{"%.4f" % (dia/2)} R{"%.4f" % (dia/2)}
+    G1 X{"%.4f" % (length_x-step+dia/4)}
+    G02 X{"%.4f" % (dia/4)} Y{"%.4f" % (-dia/4)} R{"%.4f" % (dia/4)}
+    G02 X{"%.4f" % (-dia/4)} Y{"%.4f" % (-dia/4)} R{"%.4f" % (dia/4)}
+    G1 X{"%.4f" % (-(length_x-step+dia/4))}
+    '''
+                emit(text_temp)
+                break
+            else:
+                text_temp = \
+    f'''
+    G1 Y{"%.4f" % length_y}
+    G02 X{"%.4f" % (dia/2)} Y{"%.4f" % (dia/2)} R{"%.4f" % (dia/2)}
+    '''
+                emit(text_temp)
+            first = False       # clear first flag
+
+        # top length
+        if ((first == True) and (entry == 'top_left')) or (first == False):     # select segment based on starting point
+            length_x = length_x - step  # decrement length_x
+            if length_x <= 0:
+                text_temp = \
+    f'''
+    G02 X{"%.4f" % (dia/2)} Y{"%.4f" % (-dia/2)} R{"%.4f" % (dia/2)}
+    G1 Y{"%.4f" % (-(length_y-step+dia/4))}
+    G02 X{"%.4f" % (-dia/4)} Y{"%.4f" % (-dia/4)} R{"%.4f" % (dia/4)}
+    G02 X{"%.4f" % (-dia/4)} Y{"%.4f" % (dia/4)} R{"%.4f" % (dia/4)}
+    G1 Y{"%.4f" % (length_y-step+dia/4)}
+    '''
+                emit(text_temp)
+                break
+            else:
+                text_temp = \
+    f'''
+    G1 X{"%.4f" % length_x}
+    G02 X{"%.4f" % (dia/2)} Y{"%.4f" % (-dia/2)} R{"%.4f" % (dia/2)}
+    '''
+                emit(text_temp)
+            first = False       # clear first flag
+
+        # right length
+        if ((first == True) and (entry == 'top_right')) or (first == False):     # select segment based on starting point
+            length_y = length_y - step  # decrement length_y
+            if length_y <= 0:
+                text_temp = \
+    f'''
+    G02 X{"%.4f" % (-dia/2)} Y{"%.4f" % (-dia/2)} R{"%.4f" % (dia/2)}
+    G1 X{"%.4f" % (-(length_x-step+dia/4))}
+    G02 X{"%.4f" % (-dia/4)} Y{"%.4f" % (dia/4)} R{"%.4f" % (dia/4)}
+    G02 X{"%.4f" % (dia/4)} Y{"%.4f" % (dia/4)} R{"%.4f" % (dia/4)}
+    G1 X{"%.4f" % (length_x-step+dia/4)}
+    '''
+                emit(text_temp)
+                break
+            else:
+                text_temp = \
+    f'''
+    G1 Y{"%.4f" % (-length_y)}
+    G02 X{"%.4f" % (-dia/2)} Y{"%.4f" % (-dia/2)} R{"%.4f" % (dia/2)}
+    '''
+                emit(text_temp)
+            first = False       # clear first flag
+
+    text_temp = \
+    f'''
+    G90 (absolute positioning)
+    G0 Z{"%.4f" % safe_z}   (Go to safe height)
+    G0 X{"%.4f" % start_x} Y{"%.4f" % start_y}   (Rapid to start point)
+    '''
+    emit(text_temp)
+
+    text_temp = \
+    f'''
+    (---surfacing end---)
+    '''     # write footer for section.
+    emit(text_temp)
+    text = ''.join(blocks)    # G-code text. '' if blocks are sent to sink.
+    return (text)       # return compiled text variable.
+
+def spiral_drill(origin_x, origin_y, dia_hole, depth, step_depth, dia, z_f, cut_f, safe_z, name, debug = False, sink = None):
+
+    # ---description---
+    # calculates and prints to a txt file the tool path in G code of a spiral drilled hole.
+    # assumes climb milling.
+    # assumes origin at center of hole.
+    # assumes z=0 at top surface.
+    # starts at right edge of the hole (i.e. x = diameter of hole-dia of cutter, y = 0).
+    # cuts in a counter-clockwise direction from the outside to the center.
+    # starts and returns to safe_z
+    # return to origin after surfacing.
+    # refer to PRT20210512001 Spiral Drill
+    # text = spiral_drill(origin_x, origin_y, dia_hole, depth, step_depth, dia, z_f, cut_f, safe_z, name, debug)
+
+    # ---Variable List---
+    # origin_x = x of center of hole
+    # origin_y = y of center of hole
+    # dia_hole = hole diameter
+    # depth = depth of hole (absolute convention. Negative in the downward Z direction.)
+    # step_depth = step per spiral ramp. (scalar. Do NOT use negative sign.)
+    # dia = diameter of cutter
+    # z_f =  z feed
+    # cut_f = cutting feed
+    # safe_z = safe z
+    # name = name of file
+    # debug = False (default)
+    # sink = optional function. sink(text) receives each G-code block. None -> G-code text is returned.
+
+    # ---Return Variable List---
+    # text = G-code text
+
+    # ---Change History---
+    # rev: 01-01-03-01
+    # date: 18/Oct/2026
+    # Added optional sink. G-code blocks are sent to sink(text) as they are generated and text returns empty.
+    # without sink, blocks are collected in a list and joined once (text = text + ... removed).
+    # software test run on 18/Oct/2026
+    #
+    # rev: 01-01-01-05
+    # update error checks using abort function.
+    # added hole dia < tool dia check.
+    # software test run on 11/Mar/2023
+    #
+    # rev: 01-01-10-09
+    # added additional finishing cut.
+    # software test run on 14/04/2022
+    #
+    # rev: 01-01-10-07
+    # changed from writing G-code directly to txt file to a separate text variable.
+    # software test run on 04/04/2022
+    #
+    # rev: 01-01-10-06
+    # changed depth from scalar to absolute convention.
+    # physical test run on TBD
+    #
+    # rev: 01-01-10-01
+    # Added variable list
+    # Added rounding to 4 decimal places for G-code coordinates, 3 for label coordinates, 1 for feeds
+    # software test run on 07/Sep/2021
+    #
+    # rev: 01-01-09-01
+    # Changed variable name "step" to "step_depth"
+
+    blocks = []     # G-code blocks. joined once at the end.
+    emit = blocks.append if sink == None else sink     # send G-code blocks to sink or collect them.
+    emit('\n(---spiral drill start---)\n')  # write header for section.
+
+    # description
+    text_temp = \
+    f'''
+    (---description---)
+    (calculates and prints to a txt file the tool path in G code of a spiral drilled hole.)
+    (assumes climb milling.)
+    (assumes origin at center of hole.)
+    (assumes z=0 at top surface.)
+    (starts at right edge of the hole (i.e. x = diameter of hole-dia of cutter, y = 0).)
+    (cuts in a counter-clockwise direction from the outside to the center.)
+    (return to origin after surfacing.)
+    (refer to PRT20210512001 Spiral Drill)
+    '''
+    emit(text_temp)
+
+    # parameters
+    text_temp = \
+    f'''
+    (---parameter---)
+    (circle center: X{"%.3f" % origin_x} Y{"%.3f" % origin_y})
+    (diameter: {"%.3f" % dia_hole})
+    (depth: {"%.3f" % depth})
+    (step_depth: {"%.3f" % step_depth})
+    (diameter of cutter: {"%.3f" % dia})
+    (z feed: {"%.3f" % z_f})
+    (cutting feed: {"%.1f" % cut_f})
+    (safe Z: {"%.3f" % safe_z})
+    '''
+    emit(text_temp)
+
+    # initialize starting point
+    start_x = origin_x + dia_hole/2 - dia/2
+    start_y = origin_y
+
+    # check if safe_z is above surface.
+    if safe_z <= 0:
+        abort('safe_z', safe_z, 'safe_z below surface')
+
+    # check if hole dia is larger 2x tool dia.
+#    if dia_hole >= dia*2:
+#        abort('dia_hole',dia_hole,f'hole dia is larger 2x tool dia.\nhole dia = {"%.3f" % dia_hole}\ntool dia = {"%.3f" % dia}')
+
+    # check if hole dia is smaller than tool dia.
+    if dia_hole <= dia:
+        abort('dia_hole', dia_hole, f'hole dia is smaller than tool dia.\nhole dia = {"%.3f" % dia_hole}\ntool dia = {"%.3f" % dia}')
+
+    # starting G code block
+    text_temp = \
+    f'''
+    (---code---)
+    G0 Z{"%.4f" % safe_z}   (Go to safe height)
+    G0 X{"%.4f" % start_x} Y{"%.4f" % start_y}   (Rapid to start point)
+    F{"%.1f" % z_f}  (set to plunge feed)
+    G1 Z{"%.4f" % 0} (go to starting height)
+    F{"%.1f" % cut_f}  (set to cutting feed)
+    '''
+    emit(text_temp)
+
+    z = 0        # initialize current depth
+    depth = -depth      # convert scalar to absolute convention.
+
+    while depth > 0:
+        z = z + step_depth
+        depth = depth - step_depth
+
+        if depth > 0:
+            text_temp = \
+    f'''
+    G03 X{"%.4f" % start_x} Y{"%.4f" % start_y} I{"%.4f" % (origin_x - start_x)} J{"%.4f" % (origin_y - start_y)} Z{"%.4f" % (-z)}
+    '''
+            emit(text_temp)
+        else:
+            z = z + depth     # calculate remainder cut
+            text_temp = \
+    f'''
+    G03 X{"%.4f" % start_x} Y{"%.4f" % start_y} I{"%.4f" % (origin_x - start_x)} J{"%.4f" % (origin_y - start_y)} Z{"%.4f" % (-z)}
+    G03 X{"%.4f" % start_x} Y{"%.4f" % start_y} I{"%.4f" % (origin_x - start_x)} J{"%.4f" % (origin_y - start_y)}   (Finishing cut)
+    G03 X{"%.4f" % start_x} Y{"%.4f" % start_y} I{"%.4f" % (origin_x - start_x)} J{"%.4f" % (origin_y - start_y)}   (Finishing cut)
+    G0 Z{"%.4f" % safe_z}    (go to safe Z)
+    
+    (---spiral drill end---)
+    '''
+            emit(text_temp)
+
+            text = ''.join(blocks)    # G-code text. '' if blocks are sent to sink.
+            return (text)   # exit while loop at last cycle
+
+def peck_drill(hole_x, hole_y, dia_hole, depth, peck_depth, z_f, safe_z, retract_z, dwell, name, debug = False, sink = None):
+
+    # ---Description---
+    # calculates and prints to a txt file the tool path in G code of a peck drilled hole.
+    # assumes origin at center of hole.
+    # assumes z=0 at top surface.
+    # return to safe z after drilling.
+    # refer to ALG20210527001 Peck Drilling Algorithm
+    # text = peck_drill(hole_x, hole_y, dia_hole, depth, peck_depth, z_f, safe_z, retract_z, dwell, name, debug)
+
+    # ---Variable List---
+    # hole_x = x of center of hole
+    # hole_y = y of center of hole
+    # dia_hole = hole diameter
+    # depth = depth of hole (absolute convention. Negative in the downward Z direction.)
+    # peck_depth = step per peck. (scalar. Do NOT use negative sign.)
+    # z_f =  z feed
+    # safe_z = safe z
+    # retract_z = retract z after each peck.
+    # dwell = dwell time in ms at retract z.
+    # name = name of file
+    # debug = False (default)
+    # sink = optional function. sink(text) receives each G-code block. None -> G-code text is returned.
+
+    # ---Return Variable List---
+    # text = G-code text
+
+    # ---Change History---
+    # rev: 01-01-03-01
+    # date: 18/Oct/2026
+    # Added optional sink. G-code blocks are sent to sink(text) as they are generated and text returns empty.
+    # without sink, blocks are collected in a list and joined once (text = text + ... removed).
+    # software test run on 18/Oct/2026
+    #
+    # rev: 01-01-01-04
+    # Added abort function
+    # software test run on 08/Mar/2023
+    #
+    # rev: 01-01-10-07
+    # changed from writing G-code directly to txt file to a separate text variable.
+    # software test run on 04/04/2022
+    #
+    # rev: 01-01-10-06
+    # changed depth from scalar to absolute convention.
+    # physical test run on TBD
+    #
+    # rev: 01-01-10-01
+    # Added variable list
+    # Added rounding to 4 decimal places for G-code coordinates, 3 for label coordinates, 1 for feeds
+    # Changed last step if statement from < to <= to prevent double cutting in the event where the first cut is the last cut.
+    # Changed initial starting height before drilling from "peck height" to "retract height". possible bug correction.
+    # software test run on 07/Sep/2021
+    # physical test run on 09/Sep/2021
+    #
+    # rev: 01-01-09-09
+    # changed start height above surface from "1mm or less" to "1mm or peck depth, whichever is greater".
+    # reorganized code.
+    # added algorithm flow chart ALG20210527001 Rev01 Peck Drilling Algorithm
+    #
+    # rev: 01-01-09-01
+    # initial release
+
+    blocks = []     # G-code blocks. joined once at the end.
+    emit = blocks.append if sink == None else sink     # send G-code blocks to sink or collect them.
+    emit('\n(---peck drill start---)\n')  # write header for section.
+
+    # description
+    text_temp = \
+    f'''
+    (---description---)
+    (calculates and prints to a txt file the tool path in G code of a peck drilled hole.)
+    (assumes origin at center of hole.)
+    (assumes z=0 at top surface.)
+    (return to safe z after drilling.)
+    '''
+    emit(text_temp)
+
+    # parameters
+    text_temp = \
+    f'''
+    (---parameter---)
+    (Center of hole: X{"%.4f" % hole_x} Y{"%.4f" % hole_y})
+    (hole diameter: {"%.4f" % dia_hole})
+    (depth: {"%.4f" % depth})
+    (peck depth: {"%.4f" % peck_depth})
+    (drilling feed: {"%.1f" % z_f})
+    (safe Z: {"%.4f" % safe_z})
+    (retract z: {"%.4f" % retract_z})
+    (dwell: {dwell} ms)
+    '''
+    emit(text_temp)
+
+    # check if safe_z is above surface.
+    if safe_z <= 0:
+        abort('safe_z', safe_z, 'safe_z below surface')
+
+    text_temp = \
+    f'''
+    G0 Z{"%.4f" % safe_z}   (Go to safe height)
+    G0 X{"%.4f" % hole_x} Y{"%.4f" % hole_y}   (Rapid to start point)
+    '''
+    emit(text_temp)
+
+    if peck_depth > 1 :
+        text_temp = \
+    f'''
+    G0 Z{retract_z} (rapid to retract height: {"%.4f" % retract_z}mm above surface)
+    '''
+        emit(text_temp)
+    else:
+        text_temp = \
+    f'''
+    G0 Z{"%.4f" % 1} (rapid to 1mm above surface)
+    '''
+        emit(text_temp)
+
+    # Initialize variables
+    current_depth = 0
+    target_depth = -peck_depth
+    depth = -depth     # convert scalar to absolute convention.
+    final_depth = -depth
+    first = True
+    last = False
+
+    text_temp = \
+    f'''
+    F{"%.1f" % z_f} (set drilling feed)
+    '''
+    emit(text_temp)
+
+    while current_depth > final_depth:
+
+        if first == True:
+            first = False   # clear first flag
+        else:
+            predrill_depth = current_depth + 0.1 * peck_depth    # skip if first peck
+            text_temp = \
+    f'''
+    G0 Z{"%.4f" % predrill_depth}   (rapid to pre-drill depth)
+    '''
+            emit(text_temp)
+
+        if target_depth <= final_depth:
+
+            target_depth = final_depth
+            last = True
+
+        # drill to target depth
+        text_temp = \
+    f'''
+    G1 Z{"%.4f" % target_depth} (drill to peck depth)
+    '''
+        emit(text_temp)
+
+        if debug == True:
+            print(f'current depth: {current_depth}')
+            print(f'target depth: {target_depth}')
+            print('')
+
+        if last == False:
+
+            text_temp = \
+    f'''
+    G0 Z{"%.4f" % retract_z} (rapid to retract height)
+    G04 P{dwell}    (dwell ms)
+    '''
+            emit(text_temp)
+            current_depth = target_depth
+            target_depth = target_depth - peck_depth
+
+        else:
+
+            text_temp = \
+    f'''
+    G0 Z{"%.4f" % safe_z} (rapid to safe z)
+    (---peck drill end---)
+    '''
+            emit(text_temp)
+            text = ''.join(blocks)    # G-code text. '' if blocks are sent to sink.
+            return (text)       # exit while loop at last cycle
+
+def spiral_surface(origin_x, origin_y, start_dia, end_dia, doc, dia, step, z_f, cut_f, finish_f, finish_cuts, safe_z, name, debug = False, sink = None, tolerance = None):
+
+    # ---Description---
+    # calculates and prints to a txt file the tool path in G code of a spiral surface pocket.
+    # assumes origin at center of hole.
+    # assumes z=0 at top surface.
+    # start at safe_z
+    # Does NOT return to safe z after surfacing!!!
+    # text = spiral_surface(origin_x, origin_y, start_dia, end_dia, doc, dia, step, z_f, cut_f, finish_f, finish_cuts, safe_z, name, debug, sink, tolerance)
+
+    # ---Variable List---
+    # origin_x = x center of circular pocket
+    # origin_y = y center of circular pocket
+    # start_dia = diameter of entry hole assumes circular hole.
+    # end_dia = end diameter circular pocket
+    # doc = depth of cut (absolute convention)
+    # dia = diameter of cutter
+    # step = step of slice per spiral.
+    # z_f = z feed
+    # cut_f = cutting feed
+    # finish_f = finish feed
+    # finish_cuts = number of finish cuts
+    # safe_z = safe z
+    # name = name of file
+    # debug = False (default)
+    # sink = optional function. sink(text) receives each G-code block. None -> G-code text is returned.
+    # tolerance = optional largest distance of spiral segment arcs from spiral. None -> 24 segments per revolution. see spiral_segments()
+
+    # ---Return Variable List---
+    # text = G-code text
+
+    # ---Change History---
+    # rev: 01-01-03-01
+    # date: 18/Oct/2026
+    # Added optional sink. G-code blocks are sent to sink(text) as they are generated and text returns empty.
+    # without sink, blocks are collected in a list and joined once (text = text + ... removed).
+    # Added optional tolerance. number of segments per revolution from distance of segment arcs from spiral (spiral_segments).
+    # end points of all segments are calculated in one call by spiral_path() and sent in one block by emit_lines() (number columns go straight into move lists). G-code is identical with tolerance = None.
+    # software test run on 18/Oct/2026
+    #
+    # rev: 01-01-01-05
+    # update error checks using abort function.
+    # software test run on 11/Mar/2023
+    #
+    # rev: 01-01-10-07
+    # changed from writing G-code directly to txt file to a separate text variable.
+    # software test run on 04/04/2022
+    #
+    # rev: 01-01-10-03
+    # removed round() function
+    # Added selectable number of finish cuts and finishing feed rate.
+    #
+    # rev: 01-01-10-01
+    # fixed final OD to accommodate cutter diameter.
+    # Added rounding to 4 decimal places for G-code coordinates, 3 for label coordinates, 1 for feeds
+    # software test run on 07/Sep/2021
+    #
+    # ------------------------------
+    #
+    # rev: 01-01-09-02
+    # initial release
+
+    # initialize text variable.
+    blocks = []     # G-code blocks. joined once at the end.
+    emit = blocks.append if sink == None else sink     # send G-code blocks to sink or collect them.
+    text_temp = \
+    f'''
+    (---spiral surface start---)
+    (---description---)
+    (calculates and prints to a txt file the tool path in G code of a spiral surface pocket.)
+    (assumes origin at center of hole.)
+    (assumes z=0 at top surface.)
+    (return to safe z after surfacing.)
+    (---parameters---)
+    (origin: X{"%.4f" % origin_x} Y{"%.3f" % origin_y})
+    (pocket diameter: {"%.3f" % end_dia})
+    (depth of cut: {"%.3f" % doc})
+    (step: {"%.3f" % step})
+    (plunge feed: {"%.1f" % z_f})
+    (cutting feed: {"%.1f" % cut_f})
+    (safe Z: {"%.3f" % safe_z})
+    '''
+    emit(text_temp)
+
+    # check if safe_z is above surface.
+    if safe_z <= 0:
+        abort('safe_z', safe_z, 'safe_z below surface')
+
+    # check if start dia is larger than tool dia.
+    if end_dia < dia:
+        abort('end_dia', end_dia, f'end dia is smaller than tool dia.\nend dia = {"%.4f" % end_dia}\ntool dia = {"%.4f" % dia}')
+
+    # initialize variables
+    length = start_dia/2 - dia/2
+    end_length = end_dia/2 - dia/2
+
+    text_temp = \
+    f'''
+    G0 Z{"%.4f" % safe_z}   (Go to safe height)
+    G0 X{"%.4f" % (origin_x + length)} Y{"%.4f" % origin_y}   (Rapid to start point)
+    F{"%.1f" % z_f}      (set plunge feed)
+    G1 Z{"%.4f" % doc}  (go to depth of cut. Use absolute convention)
+    F{"%.1f" % cut_f}    (set cutting feed)
+    '''
+    emit(text_temp)
+
+    x, y, lengths, last = spiral_path(origin_x, origin_y, length, end_length, step, True, False, tolerance)   # end points of all segments. outward, ccw.
+    if len(lengths) > 0:
+        emit_lines(emit, ('\n    G3 X', ' Y', ' R', '\n    '), [x, y, lengths], (4, 4, 4))     # emit G-code block
+        if debug == True:                   #!!! Added debug statement.
+            for length in lengths.tolist():
+                print (f"length : {length}")
+
+    if last == True:
+        x = float(x[-1])
+        y = float(y[-1])
+        i = origin_x-x
+        j = origin_y-y
+        text_temp = \
+                f'''
+        G3 X{"%.4f" % x} Y{"%.4f" % y} I{"%.4f" % i} J{"%.4f" % j} F{"%.0f" % finish_f}
+        (finish cut)
+        '''
+        i = 1
+        while i <= finish_cuts:  # perform finish cuts
+            emit(text_temp)
+            i = i + 1
+        text_temp = \
+                f'''
+                (---spiral surface end---)
+                '''
+        emit(text_temp)
+    text = ''.join(blocks)    # G-code text. '' if blocks are sent to sink.
+    return (text)
+
+def corner_slice(start_x, start_y, end_x, end_y, start_rad, end_rad, doc, dia, step, z_f, cut_f, safe_z, name, mode = None, debug = False, sink = None):
+
+    # ---description---
+    # calculates and prints to a txt file the tool path in G code of a corner slice.
+    # start and end points are located at their respective center points.
+    # assumes z=0 at top surface.
+    # starts and returns to safe z before and after slicing.
+    # return mode: 1. straight, 2. concave, 3. convex
+    # refer to PRT20210515001 Corner Slice
+    # text = corner_slice(start_x, start_y, end_x, end_y, start_rad, end_rad, doc, dia, step, z_f, cut_f, safe_z,name, mode, debug)
+
+    # ---Variable List---
+    # start_x = x center of starting circle.
+    # start_y = y center of starting circle.
+    # end_x = x center of ending circle.
+    # end_y = y center of ending circle.
+    # start_rad = starting corner radius.
+    # end_rad = ending corner radius.
+    # doc = depth of cut (absolute convention)
+    # dia = diameter of cutter
+    # step = step over per slice.
+    # z_f = z feed
+    # cut_f = cutting feed
+    # safe_z = safe z
+    # name = name of file
+    # mode = tool path return mode : 1. straight, 2. concave, 3. convex
+    # debug = False (default)
+    # sink = optional function. sink(text) receives each G-code block. None -> G-code text is returned.
+
+    # ---Return Variable List---
+    # text = G-code text
+
+    # ---Change History---
+    # rev: 01-01-03-01
+    # date: 18/Oct/2026
+    # Added optional sink. G-code blocks are sent to sink(text) as they are generated and text returns empty.
+    # without sink, blocks are collected in a list and joined once (text = text + ... removed).
+    # software test run on 18/Oct/2026
+    #
+    # rev: 01-01-01-05
+    # Added abort function
+    # software test run on 11/Mar/2023
+    #
+    # rev: 01-01-10-07
+    # changed from writing G-code directly to txt file to a separate text variable.
+    # software test run on 04/04/2022
+    #
+    # rev: 01-01-10-01
+    # changed doc from scalar to absolute.
+    # round of G-code to 4 decimal places.
+    # changed from tool path radius to corner radius.
+    # Added rounding to 4 decimal places for G-code coordinates, 3 for label coordinates, 1 for feeds
+    # software test run on 07/Sep/2021
+    #
+    # rev: 01-01-09-05
+    # initial release
+
+    # write header for section.
+    start_block = \
+    f'''
+    (---corner slice start---)
+    (---description---)
+    (calculates and prints to a txt file the tool path in G code of a corner slice.)
+    (start and end points are located at their respective center points.)
+    (assumes z=0 at top surface.)
+    (return to safe z after surfacing.)
+    (refer to PRT20210515001 Corner Slice)
+    (---parameter---)
+    (start X{"%.3f" % start_x} Y{"%.3f" % start_y})
+    (end X{"%.3f" % end_x} Y{"%.3f" % end_y})
+    (start rad : {"%.3f" % start_rad})
+    (end rad : {"%.3f" % end_rad})
+    (depth of cut: {"%.3f" % doc})
+    (cutter dia : {"%.3f" % dia})
+    (step: {"%.3f" % step})
+    (plunge feed: {"%.1f" % z_f})
+    (cutting feed: {"%.1f" % cut_f})
+    (safe Z: {"%.3f" % safe_z})
+    '''
+    blocks = []     # G-code blocks. joined once at the end.
+    emit = blocks.append if sink == None else sink     # send G-code blocks to sink or collect them.
+    emit(start_block)
+
+    # check if safe_z is above surface.
+    if safe_z <= 0:
+        abort('safe_z', safe_z, 'safe_z below surface')
+
+    # check if end dia is larger than tool dia.
+    if end_rad*2 < dia:
+        abort('end_rad', end_rad, f'end dia is smaller than tool dia.\nend dia = {"%.4f" % (end_rad*2)}\ntool dia = {"%.4f" % dia}')
+
+    # check if mode is defined.
+    if mode != 1 and mode != 2 and mode != 3 :
+        abort('mode', mode, 'mode undefined')
+
+    # initialize variables
+    vec_x = end_x - start_x     # x vector length of slot
+    vec_y = end_y - start_y     # y vector length of slot
+    length = math.sqrt(vec_x ** 2 + vec_y ** 2)     # length of slot
+
+    # calculate arc angle and dia angle
+    start_rad = start_rad - dia/2   # calculate toolpath start radius
+    end_rad = end_rad - dia/2       # calculate toolpath end radius
+    adj = (start_rad-end_rad)
+    hyp = math.sqrt(length**2+adj**2)
+    angle_dia = math.asin((start_rad-end_rad)/hyp)*180/math.pi
+    angle_arc = math.asin((start_rad-end_rad)/length)*180/math.pi
+
+    # calculate datum position, angle and datum-edge length
+    hyp = start_rad/math.sin(angle_dia*math.pi/180)
+    datum_length = hyp*math.cos(angle_dia*math.pi/180)             # datum_length = length of center of start circle to apex/datum
+    angle = absolute_angle(start_x, start_y, end_x, end_y, debug)   # calculate start to end angle
+    datum_x = start_x + datum_length*math.cos(angle*math.pi/180)    # x coordinate of datum
+    datum_y = start_y + datum_length*math.sin(angle*math.pi/180)    # y coordinate of datum
+    datum_angle = angle + 180       # datum angle
+    datum_edge_length = datum_length - start_rad    # calculate length from datum to edge of start arc.
+
+    # calculate start position
+    datum_length_1 = datum_length
+    datum_edge_length_1 = datum_edge_length
+    length_1 = datum_length_1 * math.cos(angle_arc * math.pi / 180)
+    x1, y1 = relative_polar(datum_x, datum_y, datum_angle, length_1, angle_arc)
+
+    text_temp = \
+    f'''
+    G0 Z{"%.4f" % safe_z}   (Go to safe height)
+    G0 X{"%.4f" % x1} Y{"%.4f" % y1}   (Rapid to start point)
+    F{"%.1f" % z_f}      (set plunge feed)
+    G1 Z{"%.4f" % doc}  (go to depth of cut)
+    F{"%.1f" % cut_f}    (set cutting feed)
+    '''
+    emit(text_temp)
+
+    # calculate datum_length_2 and rad_2
+    rad_1 = start_rad
+    datum_edge_length_2 = datum_edge_length_1 - step
+    adj = datum_edge_length_2
+    opp = adj * math.tan(angle_dia*math.pi/180)
+    rad_2 = opp*adj/(adj-opp)
+    datum_length_2 = rad_2 + datum_edge_length_2
+
+    last = False
+    while rad_2 >= end_rad:
+
+        length_2 = datum_length_2 * math.cos(angle_arc*math.pi/180)
+        x2, y2 = relative_polar(datum_x, datum_y, datum_angle, length_2, angle_arc)
+
+        length_3 = length_2
+        x3, y3 = relative_polar(datum_x, datum_y, datum_angle, length_3, -angle_arc)
+
+        length_4 = datum_length_1 * math.cos(angle_arc*math.pi/180)
+        x4, y4 = relative_polar(datum_x, datum_y, datum_angle, length_4, -angle_arc)
+
+        length_1 = length_4
+        x1, y1 = relative_polar(datum_x, datum_y, datum_angle, length_1, angle_arc)
+
+        text_temp = \
+    f'''
+    G1 X{"%.4f" % x2} Y{"%.4f" % y2}
+    G3 X{"%.4f" % x3} Y{"%.4f" % y3} R{"%.4f" % rad_2}
+    G1 X{"%.4f" % x4} Y{"%.4f" % y4}
+    '''
+        emit(text_temp)
+
+        if mode == 1 :
+            text_temp = f'''G1 X{"%.4f" % x1} Y{"%.4f" % y1}    (straight line return)\n'''
+            emit(text_temp)
+        elif mode == 2 :
+            text_temp = f'''G2 X{"%.4f" % x1} Y{"%.4f" % y1} R{"%.4f" % rad_1} (concave return)\n'''
+            emit(text_temp)
+        elif mode == 3 :
+            text_temp = f'''G3 X{"%.4f" % x1} Y{"%.4f" % y1} R-{"%.4f" % rad_1}  (convex return)\n'''
+            emit(text_temp)
+
+        if last == True:
+            break       # exit loop
+
+        # increment datum_length_1
+        rad_1 = rad_2
+        datum_edge_length_1 = datum_edge_length_2
+        datum_length_1 = datum_edge_length_1 + rad_1
+
+        # increment datum_length_2
+        # complementary angles and basic algebra
+        datum_edge_length_2 = datum_edge_length_1 - step
+        adj_2 = datum_edge_length_2
+        opp_2 = adj_2 * math.tan(angle_dia * math.pi / 180)
+        rad_2 = opp_2 * adj_2 / (adj_2 - opp_2)
+        datum_length_2 = rad_2 + adj_2
+
+        if rad_2 < end_rad:
+            rad_2 = end_rad
+            datum_length_2 = rad_2 / math.tan(angle_dia * math.pi/180)
+            last = True
+
+    text_temp = \
+    f'''
+    (---corner slice end---)
+    '''
+    emit(text_temp)
+    text = ''.join(blocks)    # G-code text. '' if blocks are sent to sink.
+    return (text)
+
+def spiral_boss(origin_x, origin_y, start_dia, end_dia, doc, dia, step, z_f, cut_f, finish_f, finish_cuts, safe_z, name, z_bias_mode = False, z_backlash_bias = 0, debug = False, sink = None, tolerance = None):
+
+    # ---Description---
+    # calculates and prints to a txt file the tool path in G code of a spiral boss.
+    # assumes origin at center of boss.
+    # assumes z=0 at top surface.
+    # assumes existing clearance around material.
+    # tool enters vertically at the right size of boss.
+    # goes to safe z before cutting.
+    # does NOT return to safe z after cutting!!!
+    # text = spiral_boss(origin_x, origin_y, start_dia, end_dia, doc, dia, step, z_f, cut_f, finish_f, finish_cuts, safe_z, name, z_bias_mode = False, z_backlash_bias = 0, debug = False, sink = None, tolerance = None)
+
+    # ---Variable List---
+    # origin_x = x center of round boss
+    # origin_y = y center of round boss
+    # start_dia = diameter of starting diameter. Assumes round boss.
+    # end_dia = diameter of final boss.
+    # doc = depth of cut (absolute convention)
+    # dia = diameter of cutter
+    # step = step of slice per spiral.
+    # z_f = z feed
+    # cut_f = cutting feed
+    # finish_f = finish feed
+    # finish_cuts = number of finish cuts
+    # safe_z = safe z
+    # name = name of file
+    # z_bias_mode = Boolean. Incorporate z backlash biasing toward bottom of backlash. Default: False. !Caution! This will overshoot depth of cut by specified value.
+    # z_backlash_bias = Z value to overshoot backlash bias by. Default: 0
+    # debug = False (default)
+    # sink = optional function. sink(text) receives each G-code block. None -> G-code text is returned.
+    # tolerance = optional largest distance of spiral segment arcs from spiral. None -> 24 segments per revolution. see spiral_segments()
+
+    # ---Return Variable List---
+    # text = G-code text
+
+    # ---Change History---
+    # rev: 01-01-03-01
+    # date: 18/Oct/2026
+    # Added optional sink. G-code blocks are sent to sink(text) as they are generated and text returns empty.
+    # without sink, blocks are collected in a list and joined once (text = text + ... removed).
+    # Added optional tolerance. number of segments per revolution from distance of segment arcs from spiral (spiral_segments).
+    # end points of all segments are calculated in one call by spiral_path() and sent in one block by emit_lines() (number columns go straight into move lists). G-code is identical with tolerance = None.
+    # software test run on 18/Oct/2026
+    #
+    # rev: 01-01-01-05
+    # added comment on tool entry into cut.
+    # update error checks using abort function.
+    # software test run on 11/Mar/2023
+    #
+    # rev: 01-01-10-07
+    # changed from writing G-code directly to txt file to a separate text variable.
+    # software test run on 04/04/2022
+    #
+    # rev: 01-01-10-03
+    # Added z overshoot compensation
+    #
+    # rev: 01-01-10-02
+    # Added selectable number of finish cuts and finishing feed rate.
+    #
+    # Added rounding
+    # rev: 01-01-10-01
+    # initial release
+    # Added rounding to 4 decimal places for G-code coordinates, 3 for label coordinates, 1 for feeds
+    # software test run on 07/Sep/2021
+
+    title_block = \
+    f'''
+    (---spiral surface start---)
+    
+    (---description---)
+    (calculates and prints to a txt file the tool path in G code of a spiral boss.)
+    (assumes origin at center of hole.)
+    (assumes z=0 at top surface.)
+    (assumes existing clearance around material.)
+    (tool enters vertically at the right size of boss.)
+    (return to safe z after surfacing.)
+    
+    (---parameters---)
+    (origin: X{"%.3f" % origin_x} Y{"%.3f" % origin_y})
+    (boss start diameter: {"%.3f" % start_dia})
+    (boss end diameter: {"%.3f" % end_dia})
+    (depth of cut: {"%.3f" % doc})
+    (diameter of cutter: {"%.3f" % dia})
+    (step: {"%.3f" % step})
+    (plunge feed: {"%.1f" % z_f})
+    (cutting feed: {"%.1f" % cut_f})
+    (safe Z: {"%.3f" % safe_z})
+    (z_bias_mode = {z_bias_mode})
+    (z_backlash_bias = {"%.3f" % z_backlash_bias})
+    '''
+    blocks = []     # G-code blocks. joined once at the end.
+    emit = blocks.append if sink == None else sink     # send G-code blocks to sink or collect them.
+    emit(title_block)
+
+    # check if safe_z is above surface.
+    if safe_z <= 0:
+        abort('safe_z', safe_z, 'safe_z below surface')
+
+    # check if end dia is larger than start dia.
+    if start_dia < end_dia:
+        abort('start dia', start_dia, f'end dia is larger start dia\nstart dia = {"%.4f" % start_dia}\nend dia = {"%.4f" % end_dia}')
+
+    # initialize variables
+    length = start_dia/2 + dia/2
+    end_length = end_dia/2 + dia/2
+    x = origin_x + length
+    y = origin_y
+
+    text_temp = \
+    f'''
+    G0 Z{"%.4f" % safe_z}   (Go to safe height)
+    G0 X{"%.4f" % x} Y{"%.4f" % y}   (Rapid to start point)
+    F{"%.1f" % z_f}      (set plunge feed)
+    '''
+    emit(text_temp)
+
+    if z_bias_mode == True:
+        text_temp = \
+    f'''
+    G1 Z{"%.4f" % (doc+z_backlash_bias)}  (overshoot to z backlash bias)
+    '''
+        emit(text_temp)
+
+    text_temp = \
+    f'''
+    G1 Z{"%.4f" % doc}  (go to depth of cut. Use absolute convention)
+    F{"%.1f" % cut_f}    (set cutting feed)
+    '''
+    emit(text_temp)
+
+    x, y, lengths, last = spiral_path(origin_x, origin_y, length, end_length, step, False, True, tolerance)   # end points of all segments. inward, cw.
+    if len(lengths) > 0:
+        emit_lines(emit, ('\n    G2 X', ' Y', ' R', '\n    '), [x, y, lengths], (4, 4, 4))     # emit G-code block
+        if debug == True:                   #!!! Added debug statement.
+            for length in lengths.tolist():
+                print (f"length : {length}")
+
+    if last == True:
+        x = float(x[-1])
+        y = float(y[-1])
+        i = origin_x-x
+        j = origin_y-y
+        text_temp = \
+    f'''
+    G2 X{"%.4f" % x} Y{"%.4f" % y} I{"%.4f" % i} J{"%.4f" % j} F{"%.0f" % finish_f}
+    (finish cut)
+    '''
+        i = 1
+        while i <= finish_cuts:     # perform finish cuts
+            emit(text_temp)
+            i=i+1
+        text_temp = \
+    f'''
+    (---spiral surface end---)
+    '''
+        emit(text_temp)
+    text = ''.join(blocks)    # G-code text. '' if blocks are sent to sink.
+    return (text)
+
+def sheet_cache_keys(excel_file):
+    # ---Description---
+    # Generates a cache key for every sheet of the excel file.
+    # An xlsx file is a zip archive that stores each sheet in its own xml part. The key of a sheet is a hash of the sheet name,
+    # the sheet xml part, the date system of the workbook and only the shared strings and cell styles (with their number format) that the sheet uses.
+    # Editing one tab changes the key of that tab only, also when the edit adds text or styles to the shared workbook parts.
+    # Falls back to a hash of the whole excel file plus sheet name if the file cannot be read as an xlsx archive.
+    # keys = sheet_cache_keys(excel_file)
+
+    # ---Variable List---
+    # excel_file = excel file name including file extension.
+
+    # ---Return Variable List---
+    # keys = dictionary of cache keys in workbook order. key is sheet name.
+
+    # ---Change History---
+    # rev: 01-01-03-01
+    # date: 18/Oct/2026
+    # initial release
+    # software test run on 18/Oct/2026
+
+    import pandas as pd  # deferred import. see import_time_check().
+
+    ns_main = '{http://schemas.openxmlformats.org/spreadsheetml/2006/main}'  # spreadsheet xml namespace
+    ns_rel = '{http://schemas.openxmlformats.org/officeDocument/2006/relationships}'  # relationship id namespace
+    ns_pkg = '{http://schemas.openxmlformats.org/package/2006/relationships}'  # package relationship namespace
+    keys = {}  # initialize keys
+
+    try:
+        with zipfile.ZipFile(excel_file) as archive:
+            parts = archive.namelist()  # list of xml parts in the xlsx archive
+            strings = []  # xml of each shared string. cells refer to them by index.
+            if 'xl/sharedStrings.xml' in parts:
+                strings = [ET.tostring(item) for item in ET.fromstring(archive.read('xl/sharedStrings.xml'))]
+            styles = []  # xml of each cell style and its custom number format. cells refer to them by index.
+            if 'xl/styles.xml' in parts:
+                root = ET.fromstring(archive.read('xl/styles.xml'))
+                formats = {item.get('numFmtId'): ET.tostring(item) for item in root.iter(ns_main + 'numFmt')}  # custom number formats
+                xfs = root.find(ns_main + 'cellXfs')
+                if xfs is not None:
+                    styles = [ET.tostring(xf) + formats.get(xf.get('numFmtId'), b'') for xf in xfs]
+
+            rels = ET.fromstring(archive.read('xl/_rels/workbook.xml.rels'))  # map relationship id to sheet xml part
+            targets = {}
+            for rel in rels.iter(ns_pkg + 'Relationship'):
+                target = rel.get('Target').lstrip('/')
+                if target.startswith('xl/') == False:
+                    target = 'xl/' + target  # relative to xl folder
+                targets[rel.get('Id')] = target
+
+            book = ET.fromstring(archive.read('xl/workbook.xml'))  # sheet names in workbook order
+            properties = book.find(ns_main + 'workbookPr')
+            date_system = b'' if properties is None else str(properties.get('date1904')).encode('utf-8')  # 1900 or 1904 date system
+            for sheet in book.iter(ns_main + 'sheet'):
+                sheet_name = sheet.get('name')
+                data = archive.read(targets[sheet.get(ns_rel + 'id')])  # sheet xml part
+                used_strings = set()  # shared strings used by sheet
+                used_styles = {0}  # cell styles used by sheet. cells without style use style 0.
+                for cell in ET.fromstring(data).iter(ns_main + 'c'):
+                    if cell.get('s') != None:
+                        used_styles.add(int(cell.get('s')))
+                    value = cell.find(ns_main + 'v')
+                    if cell.get('t') == 's' and value is not None:
+                        used_strings.add(int(value.text))
+                digest = hashlib.sha256(sheet_name.encode('utf-8'))  # hash sheet name
+                digest.update(data)  # hash sheet xml part
+                digest.update(date_system)
+                for index in sorted(used_strings):
+                    digest.update(strings[index] if index < len(strings) else b'')  # hash shared strings used by sheet
+                for index in sorted(used_styles):
+                    digest.update(styles[index] if index < len(styles) else b'')  # hash cell styles used by sheet
+                keys[sheet_name] = digest.hexdigest()
+    except (zipfile.BadZipFile, KeyError, ValueError, ET.ParseError):
+        keys = {}  # not a readable xlsx archive
+
+    if keys == {}:
+        with open(excel_file, 'rb') as f:
+            file_bytes = f.read()  # whole excel file
+        for sheet_name in pd.ExcelFile(excel_file).sheet_names:
+            keys[sheet_name] = hashlib.sha256(file_bytes + sheet_name.encode('utf-8')).hexdigest()
+
+    return (keys)  # return values
+
+def sheet_cache_evict(cache_dir, cache_size):
+    # ---Description---
+    # Limits the size of the sheet cache folder.
+    # Deletes the least recently used cache files until the total size of the folder is within cache_size.
+    # A cache file is marked as used whenever it is loaded (file modified time is updated).
+    # sheet_cache_evict(cache_dir, cache_size)
+
+    # ---Variable List---
+    # cache_dir = sheet cache folder
+    # cache_size = maximum total size of cache folder in bytes
+
+    # ---Return Variable List---
+    # N/A
+
+    # ---Change History---
+    # rev: 01-01-03-01
+    # date: 18/Oct/2026
+    # initial release
+    # software test run on 18/Oct/2026
+
+    files = []  # initialize list of cache files
+    total = 0  # initialize total size
+    for entry in os.scandir(cache_dir):
+        if entry.is_file() and entry.name.endswith('.json'):
+            stat = entry.stat()
+            files.append((stat.st_mtime, stat.st_size, entry.path))
+            total = total + stat.st_size
+
+    files.sort()  # oldest first
+    counter = 0  # initialize counter
+    while total > cache_size and counter < len(files):
+        discard, size, path = files[counter]
+        os.remove(path)  # evict least recently used sheet
+        total = total - size
+        counter = counter + 1
+
+def sheet_cache_save(df, cache_file):
+    # ---Description---
+    # Stores a parsed sheet in the sheet cache as a json file. one list of cell values per column.
+    # cache files are plain data. loading a cache file does not run code, so the cache folder can be shared.
+    # number, text, boolean and blank cells are json values. dates and times are stored as tagged iso text. see sheet_cache_load()
+    # sheets with any other cell value are not cached (parsed from the excel file every run).
+    # stored = sheet_cache_save(df, cache_file)
+
+    # ---Variable List---
+    # df = parsed sheet
+    # cache_file = cache file name
+
+    # ---Return Variable List---
+    # stored = True -> sheet stored in cache. False -> sheet has a cell value that can not be stored.
+
+    # ---Change History---
+    # rev: 01-01-03-01
+    # date: 18/Oct/2026
+    # initial release
+    # software test run on 18/Oct/2026
+
+    import numpy as np  # deferred import. see import_time_check().
+    import pandas as pd  # deferred import. see import_time_check().
+
+    def cell(value):
+        if value is None or isinstance(value, (bool, str)):
+            return (value)
+        if isinstance(value, (int, np.integer)) and not isinstance(value, np.bool_):
+            return (int(value))
+        if isinstance(value, (float, np.floating)):
+            return (float(value))
+        if isinstance(value, pd.Timestamp):
+            return ({'timestamp': value.isoformat()})
+        if isinstance(value, datetime):
+            return ({'datetime': value.isoformat()})
+        if isinstance(value, datetime_time):
+            return ({'time': value.isoformat()})
+        raise ValueError(f'cell value can not be cached: {value!r}')
+
+    try:
+        columns = [cell(column) for column in df.columns]
+        dtypes = []  # dtype of each column
+        data = []  # cell values of each column
+        for index in range(len(df.columns)):
+            series = df.iloc[:, index]
+            dtype = str(series.dtype)
+            if dtype == 'object':
+                values = [cell(value) for value in series]
+            elif dtype in ['int64', 'float64', 'bool']:
+                values = series.tolist()
+            elif dtype == 'datetime64[ns]':
+                values = [None if pd.isna(value) else value.isoformat() for value in series]
+            else:
+                raise ValueError(f'column can not be cached: {dtype}')
+            dtypes.append(dtype)
+            data.append(values)
+    except ValueError:
+        return (False)  # sheet is not cached
+
+    with open(cache_file + '.tmp', 'w', encoding='utf-8') as f:
+        json.dump({'columns': columns, 'dtypes': dtypes, 'data': data}, f)
+    os.replace(cache_file + '.tmp', cache_file)  # complete cache file or none
+    return (True)
+
+def sheet_cache_load(cache_file):
+    # ---Description---
+    # Loads a parsed sheet stored by sheet_cache_save(). columns, dtypes and cell value types are the same as the parsed sheet.
+    # df = sheet_cache_load(cache_file)
+
+    # ---Variable List---
+    # cache_file = cache file name
+
+    # ---Return Variable List---
+    # df = parsed sheet
+
+    # ---Change History---
+    # rev: 01-01-03-01
+    # date: 18/Oct/2026
+    # initial release
+    # software test run on 18/Oct/2026
+
+    import pandas as pd  # deferred import. see import_time_check().
+
+    def cell(value):
+        if isinstance(value, dict):
+            if 'timestamp' in value:
+                return (pd.Timestamp(value['timestamp']))
+            if 'datetime' in value:
+                return (datetime.fromisoformat(value['datetime']))
+            return (datetime_time.fromisoformat(value['time']))
+        return (value)
+
+    with open(cache_file, 'r', encoding='utf-8') as f:
+        document = json.load(f)
+    columns = {}  # cell values of each column. key is column number.
+    for index, (dtype, values) in enumerate(zip(document['dtypes'], document['data'])):
+        if dtype == 'object':
+            columns[index] = pd.Series([cell(value) for value in values], dtype=object)
+        elif dtype == 'datetime64[ns]':
+            columns[index] = pd.Series(pd.to_datetime(values), dtype=dtype)
+        else:
+            columns[index] = pd.Series(values, dtype=dtype)
+    df = pd.DataFrame(columns)
+    df.columns = pd.Index([cell(column) for column in document['columns']])
+    return (df)
+
+def job_format(excel_file):
+    # ---Description---
+    # Identifies the format of the job description from its file name.
+    # folder -> csv (one csv file per sheet). .json -> json. .toml -> toml. any other file -> xlsx (excel file).
+    # file_format = job_format(excel_file)
+
+    # ---Variable List---
+    # excel_file = excel file name including file extension, json or toml file name, or folder of csv files.
+
+    # ---Return Variable List---
+    # file_format = xlsx, csv, json or toml
+
+    # ---Change History---
+    # rev: 01-01-03-01
+    # date: 18/Oct/2026
+    # initial release
+    # software test run on 18/Oct/2026
+
+    extension = os.path.splitext(excel_file)[1].lower()  # file extension
+    if os.path.isdir(excel_file):
+        file_format = 'csv'
+    elif extension == '.json':
+        file_format = 'json'
+    elif extension == '.toml':
+        file_format = 'toml'
+    else:
+        file_format = 'xlsx'
+    return (file_format)  # return values
+
+def text_cell(text):
+    # ---Description---
+    # Converts the text of a csv cell to the value an excel cell would hold.
+    # blank -> ''. TRUE/FALSE -> boolean. numbers -> int if whole number, float if not. numbers with leading zeros and any other text are returned as text.
+    # value = text_cell(text)
+
+    # ---Variable List---
+    # text = cell text
+
+    # ---Return Variable List---
+    # value = cell value
+
+    # ---Change History---
+    # rev: 01-01-03-01
+    # date: 18/Oct/2026
+    # initial release
+    # software test run on 18/Oct/2026
+
+    if text == '':
+        return ('')  # blank cell
+    if text in ['TRUE', 'True', 'true']:
+        return (True)
+    if text in ['FALSE', 'False', 'false']:
+        return (False)
+    digits = text.strip().lstrip('+-')
+    if len(digits) > 1 and digits[0] == '0' and digits[1].isdigit():
+        return (text)  # leading zero. text cell, e.g. revision '01'.
+    try:
+        value = float(text)
+    except ValueError:
+        return (text)  # text cell
+    if math.isfinite(value) == False:
+        return (text)  # nan and inf are text in excel
+    if value.is_integer():
+        value = int(value)  # whole numbers are read as int. same as excel.
+    return (value)  # return values
+
+def csv_sheet(csv_file):
+    # ---Description---
+    # Reads a csv file into a data frame with the same cell values and column names as a sheet parsed from the excel file.
+    # Each distinct cell text is converted once with text_cell(). Trailing blank rows are dropped.
+    # df = csv_sheet(csv_file)
+
+    # ---Variable List---
+    # csv_file = csv file name including file extension.
+
+    # ---Return Variable List---
+    # df = data frame of sheet
+
+    # ---Change History---
+    # rev: 01-01-03-01
+    # date: 18/Oct/2026
+    # initial release
+    # software test run on 18/Oct/2026
+
+    import pandas as pd  # deferred import. see import_time_check().
+
+    df_text = pd.read_csv(csv_file, dtype=str, keep_default_na=False, na_filter=False)  # import csv file as text. no na_filter/ blank cell filter.
+    blank = (df_text == '').all(axis=1).to_numpy()  # blank rows
+    rows = len(blank)  # total number of rows
+    while rows > 0 and blank[rows - 1] == True:
+        rows = rows - 1  # drop trailing blank row
+    df_text = df_text.iloc[:rows]
+
+    data = {}  # initialize columns
+    for column in df_text.columns:
+        lookup = {text: text_cell(text) for text in df_text[column].unique()}  # value of each distinct cell text
+        data[column] = [lookup[text] for text in df_text[column].tolist()]
+    df = pd.DataFrame(data, columns=df_text.columns)  # column types are inferred from values. same as excel.
+    return (df)  # return values
+
+def document_sheets(excel_file, file_format):
+    # ---Description---
+    # Reads a json or toml job description into data frames. One data frame per sheet.
+    # The document holds one list of rows per sheet. A row holds the cells of the row by column name, e.g.
+    # json: {"main": [{"#": 0, "operation": "rapid", ...}, ...], "parameters": [{"parameter": "prefix", "value": "..."}, ...], ...}
+    # toml: [[main]] tables. sheet names with spaces are quoted, e.g. [["line 01"]].
+    # Missing and null cells are blank (''). whole numbers are read as int. same as excel.
+    # sheets = document_sheets(excel_file, file_format)
+
+    # ---Variable List---
+    # excel_file = json or toml file name including file extension.
+    # file_format = json or toml
+
+    # ---Return Variable List---
+    # sheets = data frames. key is sheet name.
+
+    # ---Change History---
+    # rev: 01-01-03-01
+    # date: 18/Oct/2026
+    # initial release
+    # software test run on 18/Oct/2026
+
+    import pandas as pd  # deferred import. see import_time_check().
+
+    if file_format == 'json':
+        with open(excel_file, 'r', encoding='utf-8') as f:
+            document = json.load(f)
+    else:
+        import tomllib  # python 3.11 or later
+        with open(excel_file, 'rb') as f:
+            document = tomllib.load(f)
+
+    sheets = {}  # initialize sheets
+    for sheet_name, rows in document.items():
+        columns = []  # column names in order of first appearance
+        for row in rows:
+            columns = columns + [column for column in row if column not in columns]
+
+        data = {column: [] for column in columns}  # initialize columns
+        for row in rows:
+            for column in columns:
+                value = row.get(column)
+                if value is None:
+                    value = ''  # missing or null cell -> blank
+                elif isinstance(value, float) and value.is_integer():
+                    value = int(value)  # whole numbers are read as int. same as excel.
+                data[column].append(value)
+        sheets[sheet_name] = pd.DataFrame(data, columns=columns)
+    return (sheets)  # return values
+
+def workbook_session(excel_file, cache_flag=True, cache_dir='sheet cache', cache_size=100 * 1024 * 1024, stream_flag=False, workbook_previous=None):
+    # ---Description---
+    # Opens the excel file once and parses all sheets into data frames in a single pass.
+    # The job can also be read from a folder of csv files (one csv file per sheet, named after the sheet) or from a json or toml file.
+    # see job_format(). Column names and cell values are the same as an excel sheet.
+    # Returns a workbook session holding the parsed sheets and the time taken to parse them.
+    # Operations request their sheet from the session through workbook_sheet(). The excel file is not reopened.
+    # Parsed excel sheets are cached on disk, one json file per sheet, keyed by sheet_cache_keys(). see sheet_cache_save(). csv, json and toml jobs are not cached.
+    # Only sheets that changed since they were cached are parsed. The remaining sheets are loaded from the cache.
+    # If stream_flag is set, sheets used only by drill and spiral_drill operations on the main sheet are not parsed.
+    # These sheets are streamed row by row with sheet_stream() when the operation runs. excel and csv only.
+    # Every sheet has a content key. If a previous workbook session is passed in (watch mode), sheets with an unchanged key are kept in memory.
+    # workbook = workbook_session(excel_file, cache_flag, cache_dir, cache_size, stream_flag, workbook_previous)
+
+    # ---Variable List---
+    # excel_file = excel file name including file extension, json or toml file name, or folder of csv files.
+    # cache_flag = True -> use sheet cache, False -> bypass cache and parse all sheets.
+    # cache_dir = sheet cache folder
+    # cache_size = maximum total size of cache folder in bytes
+    # stream_flag = True -> stream drill and spiral_drill sheets. False -> parse all sheets.
+    # workbook_previous = previous workbook session of the same job. None -> no previous session.
+
+    # ---Return Variable List---
+    # workbook = workbook session (dictionary)
+    #   workbook['excel_file'] = excel file name
+    #   workbook['format'] = xlsx, csv, json or toml. see job_format()
+    #   workbook['sheets'] = parsed data frames. key is sheet name.
+    #   workbook['parse_time'] = time taken to open and parse the excel file in seconds.
+    #   workbook['parsed'] = list of sheets parsed from the excel file.
+    #   workbook['cached'] = list of sheets loaded from the sheet cache.
+    #   workbook['kept'] = list of unchanged sheets kept in memory from the previous workbook session.
+    #   workbook['keys'] = content key of each sheet. key changes when the sheet is edited.
+    #   workbook['streamed'] = list of sheets not parsed. streamed by sheet_stream().
+    #   workbook['typed'] = typed data frames converted by sheet_records(). key is (sheet, schema_name).
+    #   workbook['records'] = row records converted by sheet_records(). key is (sheet, schema_name).
+
+    # ---Change History---
+    # rev: 01-01-03-01
+    # date: 18/Oct/2026
+    # initial release
+    # software test run on 18/Oct/2026
+
+    import pandas as pd  # deferred import. see import_time_check().
+
+    start_time = time.perf_counter()  # start parse timer
+    excel = None  # excel file is opened only if a sheet has to be parsed.
+    file_format = job_format(excel_file)  # xlsx, csv, json or toml
+    if file_format != 'xlsx':
+        cache_flag = False  # only excel files are cached.
+
+    if file_format == 'csv':
+        keys = {}  # initialize content keys. one sheet per csv file.
+        for temp in sorted(os.listdir(excel_file)):
+            if temp.lower().endswith('.csv'):
+                with open(os.path.join(excel_file, temp), 'rb') as f:
+                    keys[os.path.splitext(temp)[0]] = hashlib.sha256(f.read()).hexdigest()  # hash of csv file
+    elif file_format != 'xlsx':
+        document = document_sheets(excel_file, file_format)  # json or toml document
+        keys = {}  # initialize content keys
+        for sheet_name, df in document.items():
+            digest = hashlib.sha256(str(list(df.columns)).encode('utf-8'))  # hash column names
+            digest.update(pd.util.hash_pandas_object(df.astype(str), index=False).to_numpy().tobytes())  # hash cells
+            keys[sheet_name] = digest.hexdigest()
+    else:
+        if cache_flag == True:
+            os.makedirs(cache_dir, exist_ok=True)  # create cache folder
+        keys = sheet_cache_keys(excel_file)  # cache key of each sheet
+
+    order = list(keys)  # sheet names in workbook order
+    if stream_flag == True and file_format in ['xlsx', 'csv'] and 'main' in order:
+        order.remove('main')
+        order.insert(0, 'main')  # main sheet is read first to find the sheets to stream.
+
+    sheets = {}  # initialize parsed sheets
+    cached = []  # initialize list of sheets loaded from cache
+    kept = []  # initialize list of sheets kept from previous workbook session
+    streamed = []  # initialize list of streamed sheets
+    for sheet_name in order:
+        if sheet_name in streamed:
+            continue  # sheet is streamed when the operation runs. not parsed.
+
+        cache_file = None  # initialize
+        if cache_flag == True:
+            cache_file = os.path.join(cache_dir, keys[sheet_name] + '.json')
+
+        if workbook_previous != None and sheet_name in workbook_previous['sheets'] and workbook_previous['keys'].get(sheet_name) == keys[sheet_name]:
+            sheets[sheet_name] = workbook_previous['sheets'][sheet_name]  # unchanged sheet. kept in memory.
+            kept.append(sheet_name)
+        elif cache_file != None and os.path.isfile(cache_file):
+            sheets[sheet_name] = sheet_cache_load(cache_file)  # load parsed sheet from cache
+            os.utime(cache_file)  # mark cache file as recently used
+            cached.append(sheet_name)
+        elif file_format == 'csv':
+            sheets[sheet_name] = csv_sheet(os.path.join(excel_file, sheet_name + '.csv'))  # import csv file into dataframe.
+        elif file_format != 'xlsx':
+            sheets[sheet_name] = document[sheet_name]  # sheet of json or toml document.
+        else:
+            if excel is None:
+                excel = pd.ExcelFile(excel_file)  # open excel file once
+            sheets[sheet_name] = excel.parse(sheet_name, na_filter=False)  # import sheet into dataframe. no na_filter/ blank cell filter.
+            if cache_file != None:
+                sheet_cache_save(sheets[sheet_name], cache_file)  # store parsed sheet in cache
+
+        if sheet_name == 'main' and stream_flag == True and file_format in ['xlsx', 'csv']:
+            operation_temp = sheets['main']['operation'].astype(str)
+            sheet_temp = sheets['main']['sheet_name'].astype(str)
+            drill_sheets = set(sheet_temp[operation_temp.isin(['drill', 'spiral_drill'])])  # sheets of drill operations
+            other_sheets = set(sheet_temp[~operation_temp.isin(['drill', 'spiral_drill'])])  # sheets of all other operations
+            streamed = [temp for temp in keys if temp in drill_sheets and temp not in other_sheets]
+
+    if excel is not None:
+        excel.close()  # close excel file
+    if cache_flag == True:
+        sheet_cache_evict(cache_dir, cache_size)  # limit size of cache
+
+    sheets = {sheet_name: sheets[sheet_name] for sheet_name in keys if sheet_name in sheets}  # restore workbook order
+    parse_time = time.perf_counter() - start_time  # total parse time
+    parsed = [sheet_name for sheet_name in sheets if sheet_name not in cached and sheet_name not in kept]  # sheets parsed from excel file
+
+    workbook = {'excel_file': excel_file, 'format': file_format, 'sheets': sheets, 'parse_time': parse_time, 'parsed': parsed, 'cached': cached, 'kept': kept, 'streamed': streamed,
+                'keys': keys, 'typed': {}, 'records': {}}  # create workbook session
+    if workbook_previous != None:
+        for key in workbook_previous['records']:
+            if key[0] in kept:
+                workbook['typed'][key] = workbook_previous['typed'][key]  # converted sheets of unchanged sheets
+                workbook['records'][key] = workbook_previous['records'][key]
+    print(f'workbook parsed: {excel_file} ({file_format}, {len(parsed)} sheets parsed, {len(cached)} sheets from cache, {len(kept)} sheets kept, {len(streamed)} sheets streamed in {"%.3f" % parse_time} s)')  # report parse time
+    return (workbook)  # return values
+
+def workbook_sheet(workbook, sheet):
+    # ---Description---
+    # Hands out a parsed sheet from the workbook session.
+    # Returns a copy so the caller can re-index or write to it without altering the parsed sheet held by the session.
+    # df = workbook_sheet(workbook, sheet)
+
+    # ---Variable List---
+    # workbook = workbook session. see workbook_session()
+    # sheet = excel sheet name
+
+    # ---Return Variable List---
+    # df = data frame of sheet
+
+    # ---Change History---
+    # rev: 01-01-03-01
+    # date: 18/Oct/2026
+    # initial release
+    # software test run on 18/Oct/2026
+
+    if sheet not in workbook['sheets']:
+        raise ValueError(f"Worksheet named '{sheet}' not found")  # same error as reading a missing sheet from the excel file.
+
+    df = workbook['sheets'][sheet].copy()  # copy of parsed sheet.
+    return (df)  # return values
+
+def job_modified_time(excel_file):
+    # ---Description---
+    # Returns the time the job was last saved. For a folder of csv files, the time of the last saved csv file.
+    # job_time = job_modified_time(excel_file)
+
+    # ---Variable List---
+    # excel_file = excel file name including file extension, json or toml file name, or folder of csv files.
+
+    # ---Return Variable List---
+    # job_time = modified time of job in seconds. None if the job can not be read (e.g. while being saved).
+
+    # ---Change History---
+    # rev: 01-01-03-01
+    # date: 18/Oct/2026
+    # initial release
+    # software test run on 18/Oct/2026
+
+    try:
+        if os.path.isdir(excel_file):
+            job_time = max([os.path.getmtime(entry.path) for entry in os.scandir(excel_file) if entry.name.lower().endswith('.csv')], default=0)
+        else:
+            job_time = os.path.getmtime(excel_file)
+    except OSError:
+        job_time = None  # file is being replaced
+    return (job_time)  # return values
+
+def watch_job(excel_file, job_time, watch_interval):
+    # ---Description---
+    # Watch mode. Waits until the job is saved again.
+    # Polls the modified time of the job every watch_interval seconds. Waits one more interval after a change so the save is complete.
+    # job_time = watch_job(excel_file, job_time, watch_interval)
+
+    # ---Variable List---
+    # excel_file = excel file name including file extension, json or toml file name, or folder of csv files.
+    # job_time = modified time of job when last read. see job_modified_time()
+    # watch_interval = time between checks in seconds.
+
+    # ---Return Variable List---
+    # job_time = modified time of saved job.
+
+    # ---Change History---
+    # rev: 01-01-03-01
+    # date: 18/Oct/2026
+    # initial release
+    # software test run on 18/Oct/2026
+
+    print(f'watching {excel_file}. save the job to regenerate G-code. ctrl+c to stop.')
+    while True:
+        time.sleep(watch_interval)
+        job_time_new = job_modified_time(excel_file)
+        if job_time_new != None and job_time_new != job_time:
+            time.sleep(watch_interval)  # wait for save to complete
+            if job_modified_time(excel_file) == job_time_new:
+                return (job_time_new)  # return values
+
+def import_time_check(import_budget=0.5):
+    # ---Description---
+    # Cold start check. Imports this script in a new python interpreter and measures the import time.
+    # pandas, numpy, openpyxl and tabulate are imported by the functions that use them, not when the script is imported.
+    # Check fails if the import takes longer than import_budget or if any of these modules are imported.
+    # import_time, heavy_modules, passed = import_time_check(import_budget)
+
+    # ---Variable List---
+    # import_budget = maximum import time in seconds.
+
+    # ---Return Variable List---
+    # import_time = import time of this script in seconds. python start up not included.
+    # heavy_modules = list of heavy modules imported with this script. [] -> none.
+    # passed = True -> import time within budget and no heavy modules imported.
+
+    # ---Change History---
+    # rev: 01-01-03-01
+    # date: 18/Oct/2026
+    # initial release
+    # software test run on 18/Oct/2026
+
+    script = os.path.abspath(__file__)  # this script
+    code = 'import importlib.util, sys, time\n' \
+           't = time.perf_counter()\n' \
+           f'spec = importlib.util.spec_from_file_location("generator", {script!r})\n' \
+           'spec.loader.exec_module(importlib.util.module_from_spec(spec))\n' \
+           'print(time.perf_counter() - t)\n' \
+           'print(",".join(m for m in ["pandas", "numpy", "openpyxl", "tabulate"] if m in sys.modules))\n'
+    result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True)  # import in new interpreter
+    lines = result.stdout.split('\n')
+    import_time = float(lines[0])
+    heavy_modules = [m for m in lines[1].split(',') if m != '']
+    passed = import_time <= import_budget and heavy_modules == []
+    print(f'import time: {"%.3f" % import_time} s (budget {"%.3f" % import_budget} s). '
+          f'heavy modules imported: {", ".join(heavy_modules) if heavy_modules != [] else "none"}. '
+          f'{"passed" if passed == True else "!!FAILED!!"}')
+    return (import_time, heavy_modules, passed)  # return values
+
+def sheet_schema(schema_name):
+    # ---Description---
+    # Declared schema of each sheet type.
+    # Returns the type of every column read by the data frame functions. For key/value sheets, returns the type of every key.
+    # float -> float64 column. bool -> nullable boolean column. category -> text column of repeated values (names, flags, modes).
+    # '#' column is handed out as 'number' in row records.
+    # schema = sheet_schema(schema_name)
+
+    # ---Variable List---
+    # schema_name = sheet type. main, line, trochoidal, peck drill, spiral drill, spiral boss, spiral surface, surface, corner slice.
+    #               key/value sheet types: parameters, static (static variables of line and trochoidal sheets).
+
+    # ---Return Variable List---
+    # schema = dictionary of column (or key) and type.
+
+    # ---Change History---
+    # rev: 01-01-03-01
+    # date: 18/Oct/2026
+    # initial release
+    # software test run on 18/Oct/2026
+
+    spiral = {'#': 'float', 'last_row_flag': 'bool', 'origin_x': 'float', 'origin_y': 'float', 'start_dia': 'float', 'end_dia': 'float', 'doc': 'float', 'step': 'float',
+              'cut_f': 'float', 'finish_f': 'float', 'finish_cuts': 'float', 'safe_z': 'float'}  # spiral boss and spiral surface share the same columns.
+
+    schemas = {
+        'main': {'#': 'float', 'last_row_flag': 'bool', 'x': 'float', 'y': 'float', 'z': 'float', 'operation': 'category', 'sheet_name': 'category',
+                 'start_safe_z': 'bool', 'return_safe_z': 'bool', 'repeat_row': 'float'},
+        'line': {'#': 'float', 'last_row_flag': 'bool', 'x': 'float', 'y': 'float', 'z': 'float', 'segment': 'category', 'rad': 'float', 'cw': 'bool', 'less_180': 'bool'},
+        'trochoidal': {'#': 'float', 'last_row_flag': 'bool', 'x': 'float', 'y': 'float', 'segment': 'category', 'rad': 'float', 'cw': 'bool', 'less_180': 'bool'},
+        'peck drill': {'#': 'float', 'last_row_flag': 'bool', 'x': 'float', 'y': 'float', 'dia_hole': 'float', 'depth': 'float', 'peck_depth': 'float', 'z_f': 'float',
+                       'safe_z': 'float', 'retract_z': 'float', 'dwell': 'float'},
+        'spiral drill': {'#': 'float', 'last_row_flag': 'bool', 'origin_x': 'float', 'origin_y': 'float', 'dia_hole': 'float', 'depth': 'float', 'step_depth': 'float',
+                         'cut_f': 'float', 'safe_z': 'float'},
+        'spiral boss': spiral,
+        'spiral surface': spiral,
+        'surface': {'#': 'float', 'last_row_flag': 'bool', 'origin_x': 'float', 'origin_y': 'float', 'length_x': 'float', 'length_y': 'float', 'doc': 'float', 'step': 'float',
+                    'cut_f': 'float', 'safe_z': 'float', 'entry': 'category'},
+        'corner slice': {'#': 'float', 'last_row_flag': 'bool', 'start_x': 'float', 'start_y': 'float', 'end_x': 'float', 'end_y': 'float', 'start_rad': 'float', 'end_rad': 'float',
+                         'doc': 'float', 'step': 'float', 'cut_f': 'float', 'mode': 'float', 'safe_z': 'float'},
+        'parameters': {'prefix': 'category', 'file name': 'category', 'clear z': 'float', 'initial x': 'float', 'initial y': 'float', 'start z': 'float',
+                       'terminal x': 'float', 'terminal y': 'float', 'cutting feed': 'float', 'plunge feed': 'float', 'finishing feed': 'float',
+                       'spindle speed (rpm)': 'float', 'cutter diameter': 'float', 'measured diameter': 'float', 'length of cut ': 'float', '# of flutes': 'float',
+                       'surface speed': 'category', 'chipload': 'category', 'cutter material': 'category', 'coating': 'category', 'x origin': 'category',
+                       'y origin': 'category', 'z origin': 'category', 'part material': 'category', 'compiler': 'category', 'description': 'category',
+                       'template file name': 'category', 'parameter file name': 'category', 'parameter file revision': 'category', 'written by': 'category',
+                       'written on': 'category'},  # surface speed and chipload accept both text and numbers.
+        'static': {'operation_name': 'category', 'offset': 'float', 'feed': 'float', 'safe_z': 'float', 'z_f': 'float', 'mode': 'float', 'step': 'float', 'wos': 'float',
+                   'doc': 'float'},
+    }
+    return (schemas[schema_name])  # return values
+
+def typed_column(raw, var_type):
+    # ---Description---
+    # Converts a whole data frame column to its declared type in one pass.
+    # Numbers are converted as a block. Every other distinct cell text is formatted once with format_variable() and reused for repeated cells.
+    # Values handed out are identical to format_data_frame_variable() on each cell.
+    # typed, values = typed_column(raw, var_type)
+
+    # ---Variable List---
+    # raw = data frame column (series) as read from the excel file
+    # var_type = declared type. float, bool or category.
+
+    # ---Return Variable List---
+    # typed = typed column. float64, nullable boolean or category. cells that do not match the declared type are null.
+    # values = list of formatted values (float, bool, None or text) for row records.
+
+    # ---Change History---
+    # rev: 01-01-03-01
+    # date: 18/Oct/2026
+    # initial release
+    # software test run on 18/Oct/2026
+
+    import pandas as pd  # deferred import. see import_time_check().
+    import numpy as np  # deferred import. see import_time_check().
+
+    text = raw.astype(object).astype(str)  # cell text. same str() conversion of each cell as format_data_frame_variable.
+    if var_type == 'float' and pd.api.types.is_numeric_dtype(raw.dtype) and pd.api.types.is_bool_dtype(raw.dtype) == False:
+        numeric = np.ones(len(raw), dtype=bool)  # column of numbers only
+    elif var_type == 'float':
+        numeric = raw.map(type).isin([float, int]).to_numpy()  # excel numbers. booleans are not counted as numbers.
+    else:
+        numeric = np.zeros(len(raw), dtype=bool)  # text, boolean and category columns are formatted by cell text.
+
+    lookup = {}  # formatted value of each distinct cell text
+    for var_raw in text[~numeric].unique():
+        lookup[var_raw] = format_variable(var_raw)
+
+    numbers = []  # initialize numbers
+    if numeric.any() == True:
+        numbers = raw[numeric].astype(float).tolist()  # convert numbers as a block
+    values = [None] * len(raw)  # initialize values
+    number_counter = 0  # initialize counter
+    for counter, var_raw in enumerate(text.tolist()):
+        if numeric[counter] == True:
+            values[counter] = numbers[number_counter]
+            number_counter = number_counter + 1
+        else:
+            values[counter] = lookup[var_raw]
+
+    if var_type == 'float':
+        typed = pd.Series([value if isinstance(value, float) else np.nan for value in values], index=raw.index, dtype='float64')
+    elif var_type == 'bool':
+        typed = pd.Series([value if isinstance(value, bool) else pd.NA for value in values], index=raw.index, dtype='boolean')
+    else:
+        typed = text.astype('category')
+
+    return (typed, values)  # return values
+
+def sheet_records(workbook, sheet, schema_name):
+    # ---Description---
+    # Converts a sheet of the workbook session to its declared schema once and hands out the rows as lightweight records.
+    # see schema_records(). Converted sheets are kept in the workbook session for reuse.
+    # records = sheet_records(workbook, sheet, schema_name)
+
+    # ---Variable List---
+    # workbook = workbook session. see workbook_session()
+    # sheet = excel sheet name
+    # schema_name = sheet type. see sheet_schema()
+
+    # ---Return Variable List---
+    # records = list of row records. list index is the row counter.
+
+    # ---Change History---
+    # rev: 01-01-03-01
+    # date: 18/Oct/2026
+    # initial release
+    # software test run on 18/Oct/2026
+
+    key = (sheet, schema_name)  # converted sheets are kept by sheet and schema
+    if key not in workbook['records']:
+        if sheet not in workbook['sheets']:
+            raise ValueError(f"Worksheet named '{sheet}' not found")  # same error as reading a missing sheet from the excel file.
+
+        df = workbook['sheets'][sheet]  # parsed sheet. read only.
+        workbook['typed'][key], workbook['records'][key] = schema_records(df, schema_name)
+
+    return (workbook['records'][key])  # return values
+
+def schema_records(df, schema_name):
+    # ---Description---
+    # Converts a data frame to its declared schema and returns the rows as lightweight records.
+    # Every column is converted as a whole with typed_column().
+    # A record is a named tuple. Columns are read as attributes, e.g. row.x, row.last_row_flag. '#' column is read as row.number.
+    # typed, records = schema_records(df, schema_name)
+
+    # ---Variable List---
+    # df = data frame as read from the excel file
+    # schema_name = sheet type. see sheet_schema()
+
+    # ---Return Variable List---
+    # typed = typed data frame
+    # records = list of row records. list index is the row counter.
+
+    # ---Change History---
+    # rev: 01-01-03-01
+    # date: 18/Oct/2026
+    # initial release
+    # software test run on 18/Oct/2026
+
+    import pandas as pd  # deferred import. see import_time_check().
+
+    schema = sheet_schema(schema_name)
+    typed = {}  # initialize typed columns
+    columns = []  # initialize formatted columns
+    for var_name, var_type in schema.items():
+        typed[var_name], values = typed_column(df[var_name], var_type)
+        columns.append(values)
+
+    fields = ['number' if var_name == '#' else var_name for var_name in schema]  # '#' is not a valid attribute name
+    record = collections.namedtuple(schema_name.replace(' ', '_') + '_row', fields)  # row record type
+    records = [record._make(values) for values in zip(*columns)]
+    return (pd.DataFrame(typed, index=df.index), records)  # return values
+
+def sheet_stream(workbook, sheet, schema_name, chunk_rows=1000):
+    # ---Description---
+    # Streams a sheet from the excel file in read-only mode without loading the whole sheet. csv files are streamed the same way.
+    # Rows are collected into chunks of chunk_rows, converted to the declared schema with schema_records() and handed out one chunk at a time.
+    # Memory use is set by chunk_rows, not by the number of rows on the sheet.
+    # Cells are read the same way as a parsed sheet. blank cells -> '', trailing blank rows are dropped.
+    # for df, records, last_chunk_flag in sheet_stream(workbook, sheet, schema_name, chunk_rows):
+
+    # ---Variable List---
+    # workbook = workbook session. see workbook_session()
+    # sheet = excel sheet name
+    # schema_name = sheet type. see sheet_schema()
+    # chunk_rows = number of rows per chunk
+
+    # ---Return Variable List---
+    # df = data frame of chunk. index restarts at 0 for every chunk.
+    # records = typed row records of chunk
+    # last_chunk_flag = True if chunk holds the last row of the sheet.
+
+    # ---Change History---
+    # rev: 01-01-03-01
+    # date: 18/Oct/2026
+    # initial release
+    # software test run on 18/Oct/2026
+
+    import pandas as pd  # deferred import. see import_time_check().
+    import openpyxl  # deferred import. see import_time_check().
+
+    def chunk_records(chunk):
+        # convert a list of rows into a data frame and typed row records.
+        df = pd.DataFrame(chunk, columns=columns)
+        typed, records = schema_records(df, schema_name)
+        return (df, records)
+
+    if workbook['format'] == 'csv':
+        book = open(os.path.join(workbook['excel_file'], sheet + '.csv'), 'r', newline='', encoding='utf-8')  # open csv file
+        reader = csv.reader(book)
+        header = next(reader, [])  # column names. kept as text.
+        rows = ([text_cell(text) for text in values] for values in reader)  # row iterator. rows are read from file on demand.
+    else:
+        book = openpyxl.load_workbook(workbook['excel_file'], read_only=True, data_only=True)  # open excel file in read-only mode
+        rows = book[sheet].iter_rows(values_only=True)  # row iterator. rows are read from file on demand.
+        header = next(rows, ())  # column names
+    try:
+        columns = []  # initialize column names. same naming as a parsed sheet.
+        for counter, column in enumerate(header):
+            if column is None or column == '':
+                column = f'Unnamed: {counter}'  # blank column name
+            base = column
+            duplicate = 1
+            while column in columns:
+                column = f'{base}.{duplicate}'  # repeated column name
+                duplicate = duplicate + 1
+            columns.append(column)
+
+        chunk = []  # initialize rows of current chunk
+        blank = []  # initialize blank rows. kept only if followed by a non-blank row.
+        pending = None  # completed chunk waiting for the next row, to know if it is the last chunk.
+        for values in rows:
+            values = list(values[:len(columns)]) + [None] * (len(columns) - len(values))  # fit row to columns
+            values = ['' if value is None else int(value) if isinstance(value, float) and value.is_integer() else value for value in values]  # blank cell -> ''. same as parsed sheet.
+            if all(value == '' for value in values):
+                blank.append(values)  # blank row
+                continue
+
+            if pending is not None:
+                yield pending + (False,)  # a row follows. not the last chunk.
+                pending = None
+            chunk = chunk + blank + [values]
+            blank = []
+            if len(chunk) >= chunk_rows:
+                pending = chunk_records(chunk)  # hold completed chunk
+                chunk = []
+
+        if chunk != []:
+            if pending is not None:
+                yield pending + (False,)
+            yield chunk_records(chunk) + (True,)  # last chunk
+        elif pending is not None:
+            yield pending + (True,)  # last chunk
+    finally:
+        book.close()  # close excel or csv file
+
+def sheet_static(workbook, sheet, schema_name):
+    # ---Description---
+    # Converts a key/value sheet (or key/value block of a sheet) to its declared schema once.
+    # parameters -> 'parameter' and 'value' columns. static -> 'static_variable' and 'static_value' columns.
+    # Only keys found on the sheet are returned.
+    # values = sheet_static(workbook, sheet, schema_name)
+
+    # ---Variable List---
+    # workbook = workbook session. see workbook_session()
+    # sheet = excel sheet name
+    # schema_name = parameters or static. see sheet_schema()
+
+    # ---Return Variable List---
+    # values = dictionary of key and formatted value.
+
+    # ---Change History---
+    # rev: 01-01-03-01
+    # date: 18/Oct/2026
+    # initial release
+    # software test run on 18/Oct/2026
+
+    import pandas as pd  # deferred import. see import_time_check().
+
+    key = (sheet, schema_name)  # converted sheets are kept by sheet and schema
+    if key not in workbook['records']:
+        if sheet not in workbook['sheets']:
+            raise ValueError(f"Worksheet named '{sheet}' not found")  # same error as reading a missing sheet from the excel file.
+
+        df = workbook['sheets'][sheet]  # parsed sheet. read only.
+        if schema_name == 'parameters':
+            key_column, value_column = 'parameter', 'value'
+        else:
+            key_column, value_column = 'static_variable', 'static_value'
+
+        raw = pd.Series(df[value_column].tolist(), index=df[key_column].astype(str).tolist())  # value column indexed by key
+        raw = raw[~raw.index.duplicated()]  # first occurrence of each key
+        values = {}  # initialize values
+        typed = {}  # initialize typed values
+        for var_type in ['float', 'bool', 'category']:
+            keys = [var_name for var_name, temp_type in sheet_schema(schema_name).items() if temp_type == var_type and var_name in raw.index]
+            if keys != []:
+                typed_temp, values_temp = typed_column(raw[keys], var_type)
+                values.update(zip(keys, values_temp))
+                typed[var_type] = typed_temp
+
+        workbook['typed'][key] = typed
+        workbook['records'][key] = values
+
+    return (workbook['records'][key])  # return values
+
+def validate_job(workbook, dia):
+    # ---Description---
+    # Pre-flight validation of the whole job before any G-code is written.
+    # Checks every sheet used by the main sheet at once with vectorized checks on the typed columns (see sheet_records()).
+    # Same checks as the aborts raised during generation: safe_z above surface, step <= tool dia, hole/end dia against tool dia,
+    # start dia >= end dia, modes, surface entry, width of trochoidal slot > tool dia, main sheet operations, sheet names and repeat_row targets.
+    # Only rows up to the first last_row_flag of each sheet are checked. rows after it are not run.
+    # All errors are returned together. see validation_report().
+    # errors = validate_job(workbook, dia)
+
+    # ---Variable List---
+    # workbook = workbook session. see workbook_session()
+    # dia = diameter of cutter (measured diameter)
+
+    # ---Return Variable List---
+    # errors = list of errors. each error is a dictionary of sheet, row, column, value and message. empty list if job is valid.
+
+    # ---Change History---
+    # rev: 01-01-03-01
+    # date: 18/Oct/2026
+    # initial release
+    # software test run on 18/Oct/2026
+
+    import pandas as pd  # deferred import. see import_time_check().
+    import numpy as np  # deferred import. see import_time_check().
+
+    errors = []  # initialize errors
+
+    def check(sheet, df, failed, column, message, offset=0):
+        # add an error for every row where failed is set.
+        failed = np.asarray(pd.Series(failed).fillna(False), dtype=bool)
+        for counter in np.flatnonzero(failed):
+            errors.append({'sheet': sheet, 'row': int(counter) + offset, 'column': column, 'value': df[column].iloc[counter], 'message': message})
+
+    def active_rows(typed, ended=False):
+        # rows up to and including the first last_row_flag. rows after it are not run.
+        flag = typed['last_row_flag'].fillna(False).to_numpy(dtype=bool)
+        after = np.cumsum(flag) - flag > 0  # rows after the first last_row_flag
+        if ended == True:
+            after[:] = True  # last_row_flag found on an earlier chunk
+        return (~after, ended or bool(flag.any()))
+
+    def missing_columns(sheet, df, schema_name):
+        # columns of the schema not found on the sheet.
+        missing = [var_name for var_name in sheet_schema(schema_name) if var_name not in df.columns]
+        for var_name in missing:
+            errors.append({'sheet': sheet, 'row': None, 'column': var_name, 'value': None, 'message': 'column not found'})
+        return (missing != [])
+
+    # ---main sheet---
+    sheet = 'main'
+    if sheet not in workbook['sheets']:
+        errors.append({'sheet': sheet, 'row': None, 'column': None, 'value': None, 'message': 'sheet not found'})
+        return (errors)  # return values
+    df = workbook['sheets'][sheet]
+    if missing_columns(sheet, df, 'main') == True:
+        return (errors)  # return values
+    sheet_records(workbook, sheet, 'main')
+    typed = workbook['typed'][(sheet, 'main')]
+    active, discard = active_rows(typed)
+    rows = len(df)  # total number of rows in main sheet
+
+    operations = {'line': 'line', 'trochoidal': 'trochoidal', 'drill': 'peck drill', 'surface': 'surface', 'spiral_drill': 'spiral drill',
+                  'spiral_surface': 'spiral surface', 'corner_slice': 'corner slice', 'spiral_boss': 'spiral boss'}  # sheet operations and schema of their sheets
+    operation = typed['operation'].astype(str)
+    check(sheet, df, active & ~operation.isin(list(operations) + ['clear_z', 'rapid', 'shift', 'clear_shift', 'repeat']), 'operation', 'invalid operation')
+
+    sheet_operation = active & operation.isin(list(operations))
+    sheet_name = typed['sheet_name'].astype(str)
+    known = list(workbook['sheets']) + list(workbook['streamed'])  # sheets of the job
+    check(sheet, df, sheet_operation & ~sheet_name.isin(known), 'sheet_name', 'sheet not found')
+
+    toolpath = active & operation.isin(['line', 'trochoidal'])
+    check(sheet, df, toolpath & typed['start_safe_z'].isna(), 'start_safe_z', 'not a boolean')
+    check(sheet, df, toolpath & typed['return_safe_z'].isna(), 'return_safe_z', 'not a boolean')
+
+    for var_name, moves in [('x', ['rapid', 'shift']), ('y', ['rapid', 'shift']), ('z', ['rapid'])]:
+        blank = typed[var_name].isna() & ~df[var_name].astype(str).isin(['None', 'none'])  # not a number and not None
+        check(sheet, df, active & operation.isin(moves) & blank, var_name, 'not float or None')
+
+    repeat = active & (operation == 'repeat')
+    repeat_row = typed['repeat_row']
+    in_range = (repeat_row % 1 == 0) & (repeat_row >= 1) & (repeat_row < rows)  # whole number of an existing row. row 0 can not be repeated.
+    check(sheet, df, repeat & ~in_range, 'repeat_row', f'repeat_row out of range. rows 1 to {rows - 1}')
+    target = repeat_row.where(in_range, 0).fillna(0).astype(int).to_numpy()
+    check(sheet, df, repeat & in_range & (operation.to_numpy()[target] == 'repeat'), 'repeat_row', 'repeat_row targets a repeat row')
+
+    # ---operation sheets---
+    jobs = pd.DataFrame({'sheet': sheet_name, 'schema': operation.map(operations)})[sheet_operation & sheet_name.isin(known)].drop_duplicates()
+    for sheet, schema_name in zip(jobs['sheet'], jobs['schema']):
+        if schema_name in ['line', 'trochoidal']:
+            if 'static_variable' not in workbook['sheets'][sheet].columns or 'static_value' not in workbook['sheets'][sheet].columns:
+                errors.append({'sheet': sheet, 'row': None, 'column': 'static_variable', 'value': None, 'message': 'static variables not found'})
+                continue
+            static = sheet_static(workbook, sheet, 'static')
+            if static.get('mode') not in [1, 2, 3]:
+                errors.append({'sheet': sheet, 'row': None, 'column': 'mode', 'value': static.get('mode'), 'message': 'mode undefined'})
+            if schema_name == 'trochoidal':
+                if isinstance(static.get('doc'), float) == False:
+                    errors.append({'sheet': sheet, 'row': None, 'column': 'doc', 'value': static.get('doc'), 'message': 'not a number'})
+                if isinstance(static.get('wos'), float) == False or static.get('wos') <= dia:
+                    errors.append({'sheet': sheet, 'row': None, 'column': 'wos', 'value': static.get('wos'), 'message': f'width of slot is smaller tool dia. tool dia = {"%.3f" % dia}'})
+            continue
+
+        if sheet in workbook['streamed']:
+            chunks = (df for df, discard, discard in sheet_stream(workbook, sheet, schema_name))  # streamed sheet. checked one chunk at a time.
+        else:
+            chunks = [workbook['sheets'][sheet]]
+
+        offset = 0  # row number of first row of chunk
+        ended = False  # last_row_flag found
+        try:
+            for df in chunks:
+                if offset == 0 and missing_columns(sheet, df, schema_name) == True:
+                    break
+                if sheet in workbook['streamed']:
+                    typed = schema_records(df, schema_name)[0]  # typed chunk
+                else:
+                    sheet_records(workbook, sheet, schema_name)
+                    typed = workbook['typed'][(sheet, schema_name)]  # typed sheet
+
+                active, ended = active_rows(typed, ended)
+                for var_name, var_type in sheet_schema(schema_name).items():
+                    if var_type == 'float' and var_name not in ['#', 'mode']:
+                        check(sheet, df, active & typed[var_name].isna(), var_name, 'not a number', offset)
+                check(sheet, df, active & (typed['safe_z'] <= 0), 'safe_z', 'safe_z below surface', offset)
+
+                if schema_name == 'surface':
+                    check(sheet, df, active & (typed['step'] > dia), 'step', f'step is larger than tool dia. tool dia = {"%.3f" % dia}', offset)
+                    check(sheet, df, active & ~typed['entry'].astype(str).isin(['bottom_right', 'bottom_left', 'top_left', 'top_right']), 'entry', 'entry undefined', offset)
+                elif schema_name == 'spiral drill':
+                    check(sheet, df, active & (typed['dia_hole'] <= dia), 'dia_hole', f'hole dia is smaller than tool dia. tool dia = {"%.3f" % dia}', offset)
+                elif schema_name == 'spiral surface':
+                    check(sheet, df, active & (typed['end_dia'] < dia), 'end_dia', f'end dia is smaller than tool dia. tool dia = {"%.4f" % dia}', offset)
+                elif schema_name == 'spiral boss':
+                    check(sheet, df, active & (typed['start_dia'] < typed['end_dia']), 'start_dia', 'end dia is larger start dia', offset)
+                elif schema_name == 'corner slice':
+                    check(sheet, df, active & (typed['end_rad'] * 2 < dia), 'end_rad', f'end dia is smaller than tool dia. tool dia = {"%.4f" % dia}', offset)
+                    check(sheet, df, active & ~typed['mode'].isin([1, 2, 3]), 'mode', 'mode undefined', offset)
+                offset = offset + len(df)
+        except KeyError as error:
+            errors.append({'sheet': sheet, 'row': None, 'column': error.args[0], 'value': None, 'message': 'column not found'})  # column of streamed sheet not found
+
+    return (errors)  # return values
+
+def validation_report(errors):
+    # ---Description---
+    # Tabulates the errors found by validate_job() into a single report.
+    # text = validation_report(errors)
+
+    # ---Variable List---
+    # errors = list of errors. see validate_job()
+
+    # ---Return Variable List---
+    # text = report text
+
+    # ---Change History---
+    # rev: 01-01-03-01
+    # date: 18/Oct/2026
+    # initial release
+    # software test run on 18/Oct/2026
+
+    import pandas as pd  # deferred import. see import_time_check().
+
+    df_temp = pd.DataFrame(errors, columns=['sheet', 'row', 'column', 'value', 'message']).astype(object)
+    df_temp = df_temp.where(df_temp.notna(), '---')  # blank cells
+    df_temp = df_temp.to_markdown(index=False, tablefmt='pipe', colalign=['center'] * len(df_temp.columns))  # tabulate errors
+    text = f'!!SCRIPT ABORTED!!\njob validation failed. {len(errors)} errors found. no G-code written.\n\n' + str(df_temp) + '\n'
+    return (text)  # return values
+
+def format_variable(var_raw):
+    # ---Description---
+    # Formats the text of a single cell to the explicit variable type.
+    # 'None' -> None. 'True'/'False' -> boolean. numerical text -> float. any other text is returned as text.
+    # var_format = format_variable(var_raw)
+
+    # ---Variable List---
+    # var_raw = cell text
+
+    # ---Return Variable List---
+    # var_format = formatted variable
+
+    # ---Change History---
+    # rev: 01-01-03-01
+    # date: 18/Oct/2026
+    # initial release. moved from format_data_frame_variable.
+    # software test run on 18/Oct/2026
+
+    def is_valid_float(element: str) -> bool:
+        # ---Description---
+        # Checks if contents of string is a numerical float .
+        # Returns True if string is a numerical float, False if not.
+        # is_valid_float(element)
+
+        # ---Variable List---
+        # element = string
+
+        # ---Return Variable List---
+        # N/A
+
+        try:
+            float(element)
+            return True
+        except ValueError:
+            return False
+
+    if var_raw == 'None' or var_raw == 'none':
+        var_format = None  # None detected.
+    elif var_raw == 'False' or var_raw == 'false':
+        var_format = False  # explicit boolean declaration.
+    elif var_raw == 'True' or var_raw == 'true':
+        var_format = True  # explicit boolean declaration.
+    elif is_valid_float(var_raw) == True:  # check for numerical value
+        var_format = float(var_raw)
+    else:
+        var_format = var_raw  # import as string.
+
+    return (var_format)  # return formatted value.
+
+def format_data_frame_variable(df, var_name, row, debug=False):
+    # ---Description---
+    # Formats the variable from the data frame to the explicit variable type.
+    # returns formatted variable.
+    # var_format = format_data_frame_variable(df, var_name, counter, debug)
+
+    # ---Variable List---
+    # df = data frame
+    # var_raw = unformatted variable
+    # counter = counter/row indicator
+
+    # ---Return Variable List---
+    # var_format = formatted variable
+
+    # ---Change History---
+    # rev: 01-01-03-01
+    # date: 18/Oct/2026
+    # text formatting moved to format_variable(). shared with typed_column().
+    # software test run on 18/Oct/2026
+    #
+    # rev: 01-01-10-10
+    # added detection for small caps.
+    # software test run on 13/Aug/2022
+    #
+    # rev: 01-01-10-09
+    # initial release
+    # software test run on 14/Apr/2022
+
+#    var_raw =df.loc[row, var_name] # alternative way to import variable from dataframe
+    var_raw = df[var_name][row]  # import variable from dataframe
+    var_raw = str(var_raw)  # convert imported variable to string.
+
+    if debug == True:  # debug code
+        print(f'row = {row}')
+        print(f'var_name = {var_name}')
+        print(f'var_raw = {var_raw}')
+        print(f'var_raw type = {type(var_raw)}')
+
+    var_format = format_variable(var_raw)  # format text to explicit variable type.
+
+    if debug == True:  # debug code
+        print(f'var_format = {var_format}')
+        print(f'var_format type = {type(var_format)}\n')
+
+    return (var_format)  # return formatted value.
+
+def debug_print_table(df_temp, operation_temp, sheet_temp, rows_temp):
+    # ---Description---
+    # imports a dataframe and tabulates the dataframe to text format.
+    # assumes the format of a typical excel operation tab.
+    # removes the notes column.
+    # intended to display excel tab as read from the excel file.
+    # text_debug_temp = debug_print_table(df_temp, operation_temp, sheet_temp, rows_temp)
+
+    # ---Variable List---
+    # df_temp = data frame
+    # operation_temp = operation name
+    # sheet_temp = sheet name
+    # rows_temp = number of rows
+
+    # ---Return Variable List---
+    # text_debug_temp = tabulated table
+
+    # ---Change History---
+    # rev: 01-01-10-12
+    # initial release
+    # software test run on 18/Jul/2023
+
+    text_debug_temp = f'\n===========================\n'\
+                      f'operation: {operation_temp}\n'\
+                      f'tab: {sheet_temp} \n'\
+                      f'===========================\n\n'
+
+    df_temp = df_temp[df_temp.columns.drop(['notes'])]  # remove notes column
+    df_temp = df_temp.to_markdown(index=False, tablefmt='pipe', colalign=['center'] * len(df_temp.columns))  # tabulate dataframe
+    text_debug_temp = text_debug_temp + str(df_temp)
+    return (text_debug_temp)  # return values
+
+def debug_single_row_df(df_temp):
+    # ---Description---
+    # imports a dataframe and creates a single row data frame with the basic formatted columns.
+    # single_df_temp = debug_single_row_df(df_temp)
+
+    # ---Variable List---
+    # df_temp = data frame
+
+    # ---Return Variable List---
+    # single_df_temp = single row data frame
+
+    # ---Change History---
+    # rev: 01-01-10-12
+    # initial release
+    # software test run on 18/Jul/2023
+
+    single_df_temp = df_temp.loc[:, :'comments']  # create temp dataframe up to 'comments' columns
+    single_df_temp = single_df_temp.where(single_df_temp == '', '')  # write blanks into all cells
+
+    single_df_temp['adjusted_x'] = ''  # create additional column
+    single_df_temp['adjusted_y'] = ''  # create additional column
+    single_df_temp['shift_x'] = ''  # create additional column
+    single_df_temp['shift_y'] = ''  # create additional column
+    single_df_temp['repeat_flag'] = ''  # create additional column
+    single_df_temp = single_df_temp.drop(single_df_temp.index[1:])  # remove all rows except for the first row.
+    single_df_temp.iloc[[0],:] = '---'  # initialize cells by writing '---' into all cells
+
+    return (single_df_temp)  # return values
+
+def toolpath_data_frame_archive(name, excel_file, sheet, start_safe_z, return_safe_z, operation, dia, debug = False):
+    # ---Description---
+    # !!! OBSOLETE !!!
+    # Imports a 2D dataframe from an excel file, calculates the toolpath adjusted for offset and tool diameter and prints to a txt file the linear or trochoidal tool path in G code.
+    # returns last position of cutter and end position of arc.
+    # refer to "ALG20220329001 Toolpath Data Frame Algorithm"
+    # start and end points are located along the midline of slot for trochoidal slots.
+    # positions cutter to start point and cutting depth.
+    # cut at one depth of cut only for trochoidal pathway.
+    # cut at variable depths for linear pathway.
+    # calculates offset from edge of part profile.
+    # first_x_adjusted, first_y_adjusted, end_x, end_y, cutter_x, cutter_y, text = toolpath_data_frame(name, excel_file, sheet, start_safe_z, return_safe_z, operation, dia, debug)
+
+    # ---Variable List---
+    # name = name of file
+    # excel file = excel file name including file extension.
+    # sheet = active excel sheet
+    # start_safe_z = start_safe_z flag
+    # return_safe_z = return_safe_z flag
+    # operation = line or trochoidal pathway.
+    # dia = diameter of cutter
+
+    # ---Return Variable List---
+    # end_x_final = x coordinate of end of slot unadjusted
+    # end_y_final = y coordinate of end of slot unadjusted
+    # cutter_x_final = x coordinate of cutter position
+    # cutter_y_final = y coordinate of cutter position
+
+    # ---Change History---
+    # rev: 01-01-02-01
+    # date: 18/Aug/2023
+    # archive function. replaced with new version to be used with profile function.
+    #
+    # rev: 01-01-10-12
+    # updated debug text to print tabulated tables and rows.
+    # software test run on 18/Jul/2023
+    #
+    # rev: 01-01-01-11
+    # date: 29/May/2023
+    # description:
+    # Bug fix.toolpath_data_frame. Fixed row# 0 arc_seg able to read and print "None" on Debug txt file.
+    #
+    # rev: 01-01-01-06
+    # date: 12/Mar/2023
+    # description:
+    # Added shift x y.
+    # changed debug x, y to use end_x, end_y instead of start_x, start_y
+    # minor code house cleaning
+    # software test run on 12/Mar/2023
+    #
+    # rev: 01-01-01-04
+    # date: 08/Mar/2023
+    # description:
+    # Added debug file statements
+    # software test run on 08/Mar/2023
+    #
+    # rev: 01-01-10-12
+    # Added feed rate to move cutter to start point.
+    #
+    # rev: 01-01-10-10
+    # changed code to compliment separating line and trochoidal toolpath excel tab/ dataframe.
+    # Added static_variables function to read static variables from dataframe.
+    # Updated extract row function to support line/trochoidal separation.
+    #
+    # rev: 01-01-10-09
+    # Moved format_data_frame_variable function from inside function to outside.
+    # Added optional safe_z starting and ending rapid tool movement.
+    #
+    # rev: 01-01-10-08
+    # Shifted variables to excel sheet.
+    #
+    # rev: 01-01-10-07
+    # initial release
+    # software test run on 31/Mar/2022
+
+    import pandas as pd  # deferred import. see import_time_check().
+
+    def static_variables(df, tro, debug=False):
+        # ---Description---
+        # Extract and format static variables.
+        # returns formatted variables.
+        # operation_name, offset, feed, safe_z, z_f, mode, step, wos, doc = static_variables(df, tro, debug=False)
+
+        # ---Variable List---
+        # df = dataframe
+        # tro = trochoidal toolpath flag.
+
+        # ---Return Variable List---
+        # operation_name = name of operation.
+        # offset = cutting offset
+        # feed = feedrate
+        # safe_z = safe z height
+        # z_f = z plunge feed
+        # mode = 1 -> right side of travel, 2 -> left side of travel, 3 -> on line of travel.
+        # step = trochoidal step
+        # wos = width of trochoidal slot
+        # doc = depth of cut (for trochoidal only)
+
+        df.set_index('static_variable', inplace=True)  # replace index default column with static_variable column
+
+        operation_name = format_data_frame_variable(df, 'static_value', 'operation_name', debug)  # import name of operation.
+        offset = format_data_frame_variable(df, 'static_value', 'offset', debug)  # import offset.
+        feed = format_data_frame_variable(df, 'static_value', 'feed', debug)  # import feed.
+        safe_z = format_data_frame_variable(df, 'static_value', 'safe_z', debug)  # import safe z height.
+        z_f = format_data_frame_variable(df, 'static_value', 'z_f', debug)  # import plunge feed.
+        mode = format_data_frame_variable(df, 'static_value', 'mode', debug)  # import mode.
+        step = None     # null
+        wos = None      # null
+        doc = None      # null
+
+        if tro == True:
+            step = format_data_frame_variable(df, 'static_value', 'step', debug)  # import trochoidal step.
+            wos = format_data_frame_variable(df, 'static_value', 'wos', debug)  # import width of trochoidal slot.
+            doc = format_data_frame_variable(df, 'static_value', 'doc', debug)  # import depth of cut (for trochoidal only)
+
+            if isinstance(doc, float) == False:  # check if doc is a number, if not issue error.
+                abort('doc', doc)
+
+        return (operation_name, offset, feed, safe_z, z_f, mode, step, wos, doc)  # return values
+
+    def extract_row(counter, debug=False):
+        # ---Description---
+        # Extract and format variables of a single row from the data frame to the explicit variable type.
+        # returns formatted row of variables.
+        # last_row_flag, x, y, z, arc_seg, rad, cw, less_180 = extract_row(counter)
+
+        # ---Variable List---
+        # counter = row counter
+
+        # ---Return Variable List---
+        last_row_flag = format_data_frame_variable(df, 'last_row_flag', counter, debug)  # import last_row_flag value.
+        x = format_data_frame_variable(df, 'x', counter, debug)  # import x value.
+        y = format_data_frame_variable(df, 'y', counter, debug)  # import y value.
+        x, y = shift(x, y, shift_x, shift_y)   # add shift to x, y value.
+
+        if tro == False:
+            z = format_data_frame_variable(df, 'z', counter, debug)  # import z value if line toolpath.
+        elif tro == True:
+            z = None         # null z value if trochoidal toolpath.
+
+        segment = format_data_frame_variable(df, 'segment', counter, debug)  # import segment value.
+        rad = format_data_frame_variable(df, 'rad', counter, debug)  # import radius.
+        cw = format_data_frame_variable(df, 'cw', counter, debug)  # import clockwise flag.
+        less_180 = format_data_frame_variable(df, 'less_180', counter, debug)  # import less_180 flag.
+
+        # set or clear arc_seg flag.
+        if segment == 'linear':
+            arc_seg = False
+        elif segment == 'arc':
+            arc_seg = True
+        else:
+            arc_seg = None
+
+        return (last_row_flag, x, y, z, arc_seg, rad, cw, less_180)  # return values
+
+    def debug_print_row(df_temp, counter, tro):
+        # ---Description---
+        # Tabulates single, current row to text format.
+        # text_debug_temp = debug_print_row(df_temp, counter, tro)
+
+        # ---Variable List---
+        # df_temp = data frame
+        # counter = row counter
+        # tro = trochoidal flag
+
+        # ---Return Variable List---
+        # text_debug_temp = tabulated row
+
+        df_temp.iloc[[0],:] = '---'   # initialize cells by writing '---' into all cells
+
+        df_temp.at[0, '#'] = counter  # write counter to # column
+        df_temp.at[0, 'last_row_flag'] = last_row_flag
+        df_temp.at[0, 'x'] = df.at[counter, 'x']
+        df_temp.at[0, 'y'] = df.at[counter, 'y']
+        if tro == False:
+            df_temp.at[0, 'z'] = df.at[counter, 'z']
+        df_temp.at[0, 'segment'] = segment_debug
+        df_temp.at[0, 'rad'] = rad
+        df_temp.at[0, 'cw'] = cw
+        df_temp.at[0, 'less_180'] = less_180
+        df_temp.at[0, 'comments'] = df.at[counter, 'comments']
+        if counter == 0:
+            temp_x = start_x
+            temp_y = start_y
+        else:
+            temp_x = end_x
+            temp_y = end_y
+        df_temp.at[0, 'adjusted_x'] = temp_x
+        df_temp.at[0, 'adjusted_y'] = temp_y
+        df_temp.at[0, 'shift_x'] = shift_x
+        df_temp.at[0, 'shift_y'] = shift_y
+        df_temp.at[0, 'repeat_flag'] = repeat_flag
+
+        df_temp = df_temp.to_markdown(index=False, tablefmt='pipe', colalign=['center'] * len(df_temp.columns))     # tabulate df in txt format
+        text_debug_temp = str(df_temp)       # convert to text str
+        return (text_debug_temp)  # return values
+
+    if operation == 'line':                 # initialize tro flag.
+        tro = False                         # line toolpath.
+    elif operation == 'trochoidal':
+        tro = True                          # trochoidal toolpath.
+    else:
+        abort('operation', operation)        # invalid operation value detected.
+
+    df = pd.read_excel(excel_file, sheet_name = sheet, na_filter=False)      # import excel file into dataframe.
+    operation_name, offset, feed, safe_z, z_f, mode, step, wos, doc = static_variables(df, tro, debug=False)  # assign static parameters.
+    df = pd.read_excel(excel_file, sheet_name = sheet, na_filter=False)      # reimport excel file into dataframe. !!! workaround for restoring index.!!!
+
+    if debug == True:       # debug
+        print(f'{df}\n')
+
+    rows = df.shape[0]      # total number of rows in dataframe.
+    last_row = rows - 1     # initialize number of last row
+    counter = 0             # initialize counter
+    row_df = debug_single_row_df(df)    # initialize single row data frame.
+
+    text_debug = debug_print_table(df, operation, sheet, rows)    # print dataframe as read from excel file
+    text_debug = indent(text_debug, 8)  # indent spacing
+    text_debug = text_debug + '\n\n'  # spacing
+    write_to_file(name_debug, text_debug)  # write to debug file
+
+    # print static variables to debug file
+    df_temp = df[['static_variable', 'static_value']]  # drop all columns except 'static_variable'and 'static_value'
+    df_temp['static_variable_index'] = df_temp.loc[:, 'static_variable']    # create static_variable_index column. duplicate of static_variable column
+    df_temp.set_index('static_variable_index', inplace=True)  # replace index default column with static_variable_index column
+    df_temp = df_temp.assign(static_value='---')    # initialize cells by writing '---' into all cells in static_value column
+
+    df_temp.at['offset', 'static_value'] = offset  # write offset
+    df_temp.at['feed', 'static_value'] = feed  # feed
+    df_temp.at['safe_z', 'static_value'] = safe_z  # write safe_z
+    df_temp.at['z_f', 'static_value'] = z_f  # write z_f
+    df_temp.at['mode', 'static_value'] = mode  # write mode
+
+    if tro == True:
+        df_temp.at['step', 'static_value'] = step  # write step
+        df_temp.at['wos', 'static_value'] = wos  # write wos
+        df_temp.at['doc', 'static_value'] = doc  # write doc
+
+    df_temp = df_temp.to_markdown(index=False, tablefmt='pipe', colalign=['center'] * len(df_temp.columns))  # tabulate dataframe
+    text_debug = str(df_temp)
+    text_debug = indent(text_debug, 8)  # indent spacing
+    text_debug = text_debug + '\n\n'  # spacing
+    write_to_file(name_debug, text_debug)  # write to debug file
+
+    # initialize parameters
+    last_row_flag, start_x, start_y, start_z, arc_seg, rad, cw, less_180 = extract_row(counter)  # extract row 0 values.
+
+    skip_debug = False  # initialize
+    if arc_seg == False:
+        segment_debug = 'linear'
+    elif arc_seg == True:
+        segment_debug = 'arc'
+    elif arc_seg == None:
+        segment_debug = 'None'
+
+        text_debug = debug_print_row(row_df, counter, tro)  # tabulate single row
+        text_debug = indent(text_debug, 8)  # indent table
+        text_debug = text_debug + '\n\n'  # spacing
+        write_to_file(name_debug, text_debug)  # write to debug file
+
+    counter = counter + 1                                           # increment counter
+    last_row_flag, end_x, end_y, end_z, arc_seg, rad, cw, less_180 = extract_row(counter)  # extract row 1 values.
+
+    start_block = \
+    f'''
+    (---toolpath_data_frame start---)
+    (---description---)
+    (Imports a 2D dataframe from an excel file, calculates the toolpath adjusted for offset and tool diameter and prints to a txt file the single or trochoidal tool path in G code.)
+    (returns last position of cutter and end position of toolpath.)
+    (refer to "ALG20220329001 Toolpath Data Frame Algorithm")
+    (start and end points are located at the center points of toolpath.)
+    (does not set cutting feed.)
+    (---parameter---)            
+    (cutter diameter: {"%.3f" % dia})        
+    (offset: {"%.3f" % offset})
+    (excel_file: {excel_file})
+    (sheet: {sheet})
+    '''
+
+    text = start_block
+
+    first_slot = True           # initialize trochodial first slot
+    last_slot = False           # initialize trochodial last slot
+    end_x_adjusted_pre = None   # Initialize
+    end_y_adjusted_pre = None   # Initialize
+    rad_adjusted = None         # Initialize
+
+    if tro == True:             # initialize effective width of slot. Trochodial = wos, single line = tool diameter.
+        effective_wos = wos
+        first_z = doc           # initialize z height of starting point.
+    else:
+        effective_wos = dia
+        first_z = start_z       # initialize z height of starting point.
+
+    while counter <= last_row:      # recursive loop
+
+        if skip_debug == False:  # skip if True.
+
+            if arc_seg == False:
+                segment_debug = 'linear'
+            elif arc_seg == True:
+                segment_debug = 'arc'
+            elif arc_seg == None:
+                segment_debug = 'None'
+
+            text_debug = debug_print_row(row_df, counter, tro) + '\n\n'  # tabulate single row
+            text_debug = indent(text_debug, 8)
+            write_to_file(name_debug, text_debug)  # write to debug file
+
+        elif skip_debug == True:
+            skip_debug = False      # reset flag.
+
+        if counter == last_row or last_row_flag == True:
+            last_slot = True        # set last_slot = True for trochodial toolpath.
+
+        if arc_seg == False:        # straight line segment
+            start_x_adjusted, start_y_adjusted, end_x_adjusted, end_y_adjusted = linear_offset_adjustment(effective_wos, offset, start_x, start_y,end_x, end_y, mode)     # adjust line for offset and tool diameter.
+        elif arc_seg == True:       # arc line segment
+            start_x_adjusted, start_y_adjusted, end_x_adjusted, end_y_adjusted, rad_adjusted = arc_offset_adjustment(effective_wos, offset, start_x, start_y, end_x, end_y, rad, cw, less_180, mode)     # adjust arc for offset and tool diameter.
+
+        if counter == 1:
+            cutter_x = start_x_adjusted             # initialize cutter position at first adjusted position.
+            cutter_y = start_y_adjusted             # initialize cutter position at first adjusted position.
+            first_x_adjusted = start_x_adjusted     # first point of the segment.
+            first_y_adjusted = start_y_adjusted     # first point of the segment.
+#            start_cutter = ''       # initialize
+            if start_safe_z == True:
+                start_cutter = \
+            f'''G0 Z{"%.4f" % safe_z}				(Rapid to safe height)
+            G0 X{"%.4f" % first_x_adjusted} Y{"%.4f" % first_y_adjusted}                 (Rapid to start point)
+            '''
+            else:
+                start_cutter = \
+            f'''G1 X{"%.4f" % first_x_adjusted} Y{"%.4f" % first_y_adjusted} F{feed}                 (move at cut_f to start point)
+            '''
+
+            if isinstance(first_z, float) == True:  # check if start_z is a number, if not skip.
+                start_cutter = start_cutter + \
+            f'''
+            G1 Z{"%.4f" % first_z}	F{"%.4f" % z_f}			(Plunge to cutting height)
+            '''
+            start_cutter = start_cutter + \
+            f'''
+            F{feed}     (set cutting feed)
+            '''
+            text = text + start_cutter
+
+        if debug == True:
+            print(f'row/counter = {counter}')
+            print(f'end_x_adjusted_pre = {end_x_adjusted_pre}')
+            print(f'start_x_adjusted = {start_x_adjusted}')
+            print(f'end_y_adjusted_pre = {end_y_adjusted_pre}')
+            print(f'start_y_adjusted = {start_y_adjusted}')
+            print(f'end_x_adjusted = {end_x_adjusted}')
+            print(f'end_y_adjusted = {end_y_adjusted}')
+            print(f'rad_adjusted = {rad_adjusted}')
+            print(f'arc_seg = {arc_seg}')
+            print(f'cw = {cw}')
+            print(f'less_180 = {less_180}')
+            print(f'tro = {tro}')
+            print(f'start_x = {start_x}')
+            print(f'start_y = {start_y}')
+            print(f'start_z = {start_z}')
+            print(f'end_x = {end_x}')
+            print(f'end_y = {end_y}')
+            print(f'end_z = {end_z}')
+            print(f'mode = {mode}')
+            print(f'operation = {operation}\n')
+
+        if ((start_x_adjusted != end_x_adjusted_pre) or (start_y_adjusted != end_y_adjusted_pre)) and counter != 1:            # detect acute/non-tangent transition point excluding 1st segment.
+
+            if debug == True:
+                print('non-tangent transition detected')
+                print(f'row/counter = {counter}')
+                print(f'end_x_adjusted_pre = {end_x_adjusted_pre}')
+                print(f'start_x_adjusted = {start_x_adjusted}')
+                print(f'end_y_adjusted_pre = {end_y_adjusted_pre}')
+                print(f'start_y_adjusted = {start_y_adjusted}\n')
+
+            counter = counter - 1   # decrement counter.
+
+            skip_debug = True   # readjustment of non-tangent transition. skip debug statement.
+
+            # intialize parameters for transition arc.
+            last_slot = False       # clear last_slot if set.
+            last_row_flag = False   # clear last_row_flag if set.
+            end_x_adjusted = start_x_adjusted   # intialize x end point of transition arc with start point of next toolpath segment.
+            end_y_adjusted = start_y_adjusted   # intialize y end point of transition arc with start point of next toolpath segment.
+            start_x_adjusted = end_x_adjusted_pre   # intialize x start point of transition arc with end point of previous toolpath segment.
+            start_y_adjusted = end_y_adjusted_pre   # intialize y start point of transition arc with end point of previous toolpath segment.
+            rad_adjusted = effective_wos/2 + offset # # intialize rad of transition arc to tangentially transition between the start and end point of previous and next toolpath segment respectively.
+            rad_adjusted = round(rad_adjusted, 5)  # round to 5 decimal places.
+            less_180 = True     # arc will never be more than 180deg.
+            arc_seg = True
+            end_x = start_x     # reset start x value
+            end_y = start_y     # reset start y value
+            end_z = None        # reset start z value. no height change during transition arc.
+
+            if mode == 1:       # !!!! CAUTION!!!! Assumes transition arc on the external/boss profile cuts. Does not check for overlapping internal/pocket correction. !!!!!
+                cw = False
+            elif mode == 2:
+                cw = True
+
+        if tro == False:    # linear toolpath segment
+            if arc_seg == False:
+                cutter_x, cutter_y, cutter_z, text_temp = line(end_x_adjusted, end_y_adjusted, name, feed, end_z)  # print G-code for adjusted line segment.
+            else:
+                cutter_x, cutter_y, cutter_z, text_temp = arc(end_x_adjusted, end_y_adjusted, name, rad_adjusted, cw, less_180, feed, end_z)  # print G-code for adjusted arc segment.
+        elif tro == True:       # trochoidal toolpath segment
+            if arc_seg == False:
+                discard, discard, cutter_x, cutter_y, text_temp = tro_slot(start_x_adjusted, start_y_adjusted, end_x_adjusted, end_y_adjusted, step, wos, dia, name, cutter_x, cutter_y, first_slot, last_slot)   # print G-code for adjusted trichodial line segment.
+            else:
+                discard, discard, cutter_x, cutter_y, text_temp = tro_arc(start_x_adjusted, start_y_adjusted, end_x_adjusted, end_y_adjusted, step, wos, dia, rad_adjusted, cw, less_180, name, cutter_x, cutter_y, first_slot, last_slot)     # print G-code for adjusted trichodial arc segment.
+            first_slot = False      # clear first slot flag
+
+        text = text + text_temp      # store G-code into a text variable before printing to a text file.
+
+        break_flag, text_temp = last_row_detect(df, sheet, last_row_flag, last_row, counter, 8)  # detect last row
+        if counter == last_row or break_flag == True:       # detect last row row or last row flag
+            if return_safe_z == True:
+                end_cutter = \
+                f'''
+                G0 Z{"%.4f" % safe_z}				(Rapid to safe height)
+                '''
+                text = text + end_cutter
+
+            text = text + text_temp
+
+            return (first_x_adjusted, first_y_adjusted, end_x, end_y, cutter_x, cutter_y, text)       # last point. exit function.
+
+        counter = counter + 1                   # increment counter
+        end_x_adjusted_pre = end_x_adjusted     # update previous x value
+        end_y_adjusted_pre = end_y_adjusted     # update previous y value
+        start_x = end_x                         # update start x value
+        start_y = end_y                         # update start y value
+
+        last_row_flag, end_x, end_y, end_z, arc_seg, rad, cw, less_180 = extract_row(counter)
+
+def toolpath_data_frame(name, workbook, sheet, start_safe_z, return_safe_z, operation, dia, debug = False, sink = None):
+    # ---Description---
+    # Imports a 2D dataframe from an excel file, calculates the toolpath adjusted for offset and tool diameter and prints to a txt file the linear or trochoidal tool path in G code.
+    # returns last position of cutter and end position of arc.
+    # refer to "ALG20220329001 Toolpath Data Frame Algorithm"
+    # start and end points are located along the midline of slot for trochoidal slots.
+    # positions cutter to start point and cutting depth.
+    # cut at one depth of cut only for trochoidal pathway.
+    # cut at variable depths for linear pathway.
+    # calculates offset from edge of part profile.
+    # first_x_adjusted, first_y_adjusted, end_x, end_y, cutter_x, cutter_y, text = toolpath_data_frame(name, workbook, sheet, start_safe_z, return_safe_z, operation, dia, debug, sink)
+
+    # ---Variable List---
+    # name = name of file
+    # workbook = workbook session. see workbook_session()
+    # sheet = active excel sheet
+    # start_safe_z = start_safe_z flag
+    # return_safe_z = return_safe_z flag
+    # operation = line or trochoidal pathway.
+    # dia = diameter of cutter
+    # sink = optional function. sink(text) receives each G-code block. None -> G-code text is returned.
+
+    # ---Return Variable List---
+    # end_x_final = x coordinate of end of slot unadjusted
+    # end_y_final = y coordinate of end of slot unadjusted
+    # cutter_x_final = x coordinate of cutter position
+    # cutter_y_final = y coordinate of cutter position
+
+    # ---Change History---
+    # rev: 01-01-03-01
+    # date: 18/Oct/2026
+    # sheet is read once from the workbook session. removed reimport workaround for restoring index.
+    # static variables are read from typed static values (sheet_static). typed row records are passed to profile_generator.
+    # Added optional sink. G-code blocks, including trochoidal slots and arcs, are sent to sink as they are generated. text returns empty.
+    # debug tables are rendered and written at full debug level only. see debug_level.
+    # software test run on 18/Oct/2026
+    #
+    # rev: 01-01-02-01
+    # date: 18/Aug/2023
+    # major change. designed to be used with profile_generator function.
+    #
+    # rev: 01-01-10-12
+    # updated debug text to print tabulated tables and rows.
+    # software test run on 18/Jul/2023
+    #
+    # rev: 01-01-01-11
+    # date: 29/May/2023
+    # description:
+    # Bug fix.toolpath_data_frame. Fixed row# 0 arc_seg able to read and print "None" on Debug txt file.
+    #
+    # rev: 01-01-01-06
+    # date: 12/Mar/2023
+    # description:
+    # Added shift x y.
+    # changed debug x, y to use end_x, end_y instead of start_x, start_y
+    # minor code house cleaning
+    # software test run on 12/Mar/2023
+    #
+    # rev: 01-01-01-04
+    # date: 08/Mar/2023
+    # description:
+    # Added debug file statements
+    # software test run on 08/Mar/2023
+    #
+    # rev: 01-01-10-12
+    # Added feed rate to move cutter to start point.
+    #
+    # rev: 01-01-10-10
+    # changed code to compliment separating line and trochoidal toolpath excel tab/ dataframe.
+    # Added static_variables function to read static variables from dataframe.
+    # Updated extract row function to support line/trochoidal separation.
+    #
+    # rev: 01-01-10-09
+    # Moved format_data_frame_variable function from inside function to outside.
+    # Added optional safe_z starting and ending rapid tool movement.
+    #
+    # rev: 01-01-10-08
+    # Shifted variables to excel sheet.
+    #
+    # rev: 01-01-10-07
+    # initial release
+    # software test run on 31/Mar/2022
+
+    def static_variables(static, tro):
+        # ---Description---
+        # Extract and format static variables.
+        # returns formatted variables.
+        # operation_name, offset, feed, safe_z, z_f, mode, step, wos, doc = static_variables(static, tro)
+
+        # ---Variable List---
+        # static = typed static variables. see sheet_static()
+        # tro = trochoidal toolpath flag.
+
+        # ---Return Variable List---
+        # operation_name = name of operation.
+        # offset = cutting offset
+        # feed = feedrate
+        # safe_z = safe z height
+        # z_f = z plunge feed
+        # mode = 1 -> right side of travel, 2 -> left side of travel, 3 -> on line of travel.
+        # step = trochoidal step
+        # wos = width of trochoidal slot
+        # doc = depth of cut (for trochoidal only)
+
+        operation_name = static['operation_name']  # import name of operation.
+        offset = static['offset']  # import offset.
+        feed = static['feed']  # import feed.
+        safe_z = static['safe_z']  # import safe z height.
+        z_f = static['z_f']  # import plunge feed.
+        mode = static['mode']  # import mode.
+        step = None     # null
+        wos = None      # null
+        doc = None      # null
+
+        if tro == True:
+            step = static['step']  # import trochoidal step.
+            wos = static['wos']  # import width of trochoidal slot.
+            doc = static['doc']  # import depth of cut (for trochoidal only)
+
+            if isinstance(doc, float) == False:  # check if doc is a number, if not issue error.
+                abort('doc', doc)
+
+        return (operation_name, offset, feed, safe_z, z_f, mode, step, wos, doc)  # return values
+
+    def debug_print_row(df_temp, counter):
+        # ---Description---
+        # Tabulates single, current row to text format.
+        # text_debug_temp = debug_print_row(df_temp, counter)
+
+        # ---Variable List---
+        # df_temp = data frame
+        # counter = row counter
+        # tro = trochoidal flag
+
+        # ---Return Variable List---
+        # text_debug_temp = tabulated row
+
+        df_temp.iloc[[0],:] = '---'   # initialize cells by writing '---' into all cells
+
+        df_temp.at[0, '#'] = counter  # write counter to # column
+        df_temp.at[0, 'last_row_flag'] = last_row_flag
+        df_temp.at[0, 'skip_flag'] = skip_flag
+        df_temp.at[0, 'abort_flag'] = abort_flag
+        df_temp.at[0, 'output_start_x'] = start_x
+        df_temp.at[0, 'output_start_y'] = start_y
+        df_temp.at[0, 'output_start_z'] = start_z
+        df_temp.at[0, 'output_end_x'] = end_x
+        df_temp.at[0, 'output_end_y'] = end_y
+        df_temp.at[0, 'output_end_z'] = end_z
+        df_temp.at[0, 'output_segment'] = segment
+        df_temp.at[0, 'output_rad'] = rad
+        df_temp.at[0, 'output_cw'] = cw
+        df_temp.at[0, 'output_less_180'] = less_180
+        df_temp.at[0, 'shift_x'] = shift_x
+        df_temp.at[0, 'shift_y'] = shift_y
+        df_temp.at[0, 'repeat_flag'] = repeat_flag
+
+        df_temp = df_temp.to_markdown(index=False, tablefmt='pipe', colalign=['center'] * len(df_temp.columns))     # tabulate df in txt format
+        text_debug_temp = str(df_temp)       # convert to text str
+        return (text_debug_temp)  # return values
+
+    # -----------------------------------------------------------------------
+    # 1693393585 Initialize tro flag
+    # -----------------------------------------------------------------------
+    if operation == 'line':                 # initialize tro flag.
+        tro = False                         # line toolpath.
+    elif operation == 'trochoidal':
+        tro = True                          # trochoidal toolpath.
+    else:
+        abort('operation', operation)        # invalid operation value detected.
+
+    # -----------------------------------------------------------------------
+    # 1693393611 Import data frame and assign static variables
+    # -----------------------------------------------------------------------
+    df = workbook_sheet(workbook, sheet)      # import sheet from workbook session into dataframe.
+    static = sheet_static(workbook, sheet, 'static')  # typed static variables.
+    operation_name, offset, feed, safe_z, z_f, mode, step, wos, doc = static_variables(static, tro)  # assign static parameters.
+
+    if debug == True:       # debug
+        print(f'{df}\n')
+
+    # -----------------------------------------------------------------------
+    # 1693393915 Write static variables to debug file
+    # -----------------------------------------------------------------------
+
+    rows = df.shape[0]      # total number of rows in dataframe.
+
+    if debug_level == 'full':     # full debug level only.
+        text_debug = debug_print_table(df, operation, sheet, rows)    # print dataframe as read from excel file
+        text_debug = indent(text_debug, 8)  # indent spacing
+        text_debug = text_debug + '\n\n'  # spacing
+        write_to_file(name_debug, text_debug)  # write to debug file
+
+    if debug_level == 'full':     # full debug level only.
+        # print static variables to debug file
+        df_temp = df[['static_variable', 'static_value']]  # drop all columns except 'static_variable'and 'static_value'
+#    df_temp['static_variable_index'] = df_temp.loc[:, 'static_variable']    # create static_variable_index column. duplicate of static_variable column. warning "A value is trying to be set on a copy of a slice from a DataFrame. Try using .loc[row_indexer,col_indexer] = value instead"
+#    df_temp.set_index('static_variable_index', inplace=True)  # replace index default column with static_variable_index column. warning "A value is trying to be set on a copy of a slice from a DataFrame. Try using .loc[row_indexer,col_indexer] = value instead"
+        df_temp.insert(0, 'static_variable_index', None, True)  # insert new column at index 0 (first colun of data frame)
+        df_temp = df_temp.sort_index().reset_index(drop=True)  # sort rows according to index values and reset to running integers. done to avoid warning "A value is trying to be set on a copy of a slice from a DataFrame. Try using .loc[row_indexer,col_indexer] = value instead"
+        df_temp['static_variable_index'] = df_temp['static_variable']   # copy values of 'static_variable' column to 'static_variable_index' column
+        df_temp.set_index('static_variable', inplace=True)  # replace index default column with 'static_variable_index' column
+        df_temp = df_temp.assign(static_value='---')    # initialize cells by writing '---' into all cells in 'static_value' column
+
+        df_temp.at['offset', 'static_value'] = offset  # write offset
+        df_temp.at['feed', 'static_value'] = feed  # feed
+        df_temp.at['safe_z', 'static_value'] = safe_z  # write safe_z
+        df_temp.at['z_f', 'static_value'] = z_f  # write z_f
+        df_temp.at['mode', 'static_value'] = mode  # write mode
+
+        if tro == True:
+            df_temp.at['step', 'static_value'] = step  # write step
+            df_temp.at['wos', 'static_value'] = wos  # write wos
+            df_temp.at['doc', 'static_value'] = doc  # write doc
+
+        df_temp = df_temp.to_markdown(index=False, tablefmt='pipe', colalign=['center'] * len(df_temp.columns))  # tabulate dataframe
+        text_debug = str(df_temp)
+        text_debug = indent(text_debug, 8)      # indent spacing
+        text_debug = text_debug + '\n\n'        # spacing
+        write_to_file(name_debug, text_debug)   # write to debug file
+
+    # -----------------------------------------------------------------------
+    # 1693393736 Initialize variable: effective_wos
+    # -----------------------------------------------------------------------
+
+    if tro == True:             # initialize effective width of slot/cutter. Trochodial = wos, single line = tool diameter.
+        effective_wos = wos     # Trochodial = wos
+    else:
+        effective_wos = dia     # single line = tool diameter
+
+    # -----------------------------------------------------------------------
+    # 1693393750 Generate profile dataframe with profile_generator
+    # -----------------------------------------------------------------------
+
+    records = sheet_records(workbook, sheet, operation)  # typed row records of sheet. line or trochoidal.
+    df_profile, debug_df_profile, detect_abort_flag = profile_generator(df, records, tro, effective_wos)       # process data frame to generate profile data frame
+
+    # -----------------------------------------------------------------------
+    # 1693393773 Initialize variables
+    # -----------------------------------------------------------------------
+
+    profile_counter = 0     # initialize counter for profile df
+    profile_rows = len(df_profile)  # number of rows in df_line
+    end = profile_rows - 1          # initialize end counter
+
+    row_df = debug_single_row_df(debug_df_profile)  # initialize single row data frame.
+
+    '''    last_row_flag = df_profile.loc[profile_counter, 'last_row_flag']  # get last_row_flag from df_profile dataframe
+    skip_flag = df_profile.loc[profile_counter, 'skip_flag']  # get skip_flag from df_profile dataframe
+    abort_flag = df_profile.loc[profile_counter, 'abort_flag']  # get abort_flag from df_profile dataframe
+    start_x = df_profile.loc[profile_counter, 'output_start_x']  # get output_start_x type from df_profile dataframe
+    start_y = df_profile.loc[profile_counter, 'output_start_y']  # get output_start_y value from df_profile dataframe
+    end_x = df_profile.loc[profile_counter, 'output_end_x']  # get output_end_x value from df_profile dataframe
+    end_y = df_profile.loc[profile_counter, 'output_end_y']  # get output_end_y value from df_profile dataframe
+    segment = df_profile.loc[profile_counter, 'output_segment']  # get output_segment value from df_profile dataframe
+    rad = df_profile.loc[profile_counter, 'output_rad']  # get rad value from df_profile dataframe
+    cw = df_profile.loc[profile_counter, 'output_cw']  # get cw value from df_profile dataframe
+    less_180 = df_profile.loc[profile_counter, 'output_less_180']  # get less_180 value from df_profile dataframe
+
+    start_z = df_profile.loc[profile_counter, 'output_start_z']  # get output_start_z value from df_profile dataframe
+    if start_z == '---':    # if value = '---' convert to None
+        start_z = None
+    end_z = df_profile.loc[profile_counter, 'output_end_z']  # get output_end_z value from df_profile dataframe
+    if end_z == '---':    # if value = '---' convert to None
+        end_z = None'''
+
+    start_block = \
+    f'''
+    (---toolpath_data_frame start---)
+    (---description---)
+    (Imports a 2D dataframe from an excel file, calculates the toolpath adjusted for offset and tool diameter and prints to a txt file the single or trochoidal tool path in G code.)
+    (returns last position of cutter and end position of toolpath.)
+    (refer to "ALG20220329001 Toolpath Data Frame Algorithm")
+    (start and end points are located at the center points of toolpath.)
+    (does not set cutting feed.)
+    (---parameter---)            
+    (cutter diameter: {"%.3f" % dia})        
+    (offset: {"%.3f" % offset})
+    (excel_file: {workbook['excel_file']})
+    (sheet: {sheet})
+    '''
+
+    blocks = []     # G-code blocks. joined once at the end.
+    emit = blocks.append if sink == None else sink     # send G-code blocks to sink or collect them.
+    emit(start_block)           # write header
+    first_slot = True           # initialize trochodial first slot
+    last_slot = False           # initialize trochodial last slot
+
+    start_z = df_profile.loc[0, 'output_start_z']  # get first (row 0)output_start_z value from df_profile dataframe
+    if start_z == '---':  # if value = '---' convert to None
+        start_z = None
+
+    if tro == True:             # initialize effective width of slot. Trochodial = wos, single line = tool diameter.
+        first_z = doc           # initialize z height of starting point.
+    else:
+        first_z = start_z       # initialize z height of starting point.
+
+    # -----------------------------------------------------------------------
+    # 1693393845 Iterative loop to generate G-code from profile data frame row by row
+    # -----------------------------------------------------------------------
+    while profile_counter <= end:      # recursive loop
+
+        # -----------------------------------------------------------------------
+        # 1693394015 Extract variables from row
+        # -----------------------------------------------------------------------
+
+        last_row_flag = df_profile.loc[profile_counter, 'last_row_flag']  # get last_row_flag from df_profile dataframe
+        skip_flag = df_profile.loc[profile_counter, 'skip_flag']  # get skip_flag from df_profile dataframe
+        abort_flag = df_profile.loc[profile_counter, 'abort_flag']  # get abort_flag from df_profile dataframe
+        start_x = df_profile.loc[profile_counter, 'output_start_x']  # get output_start_x type from df_profile dataframe
+        start_y = df_profile.loc[profile_counter, 'output_start_y']  # get output_start_y value from df_profile dataframe
+        end_x = df_profile.loc[profile_counter, 'output_end_x']  # get output_end_x value from df_profile dataframe
+        end_y = df_profile.loc[profile_counter, 'output_end_y']  # get output_end_y value from df_profile dataframe
+        segment = df_profile.loc[profile_counter, 'output_segment']  # get output_segment value from df_profile dataframe
+        rad = df_profile.loc[profile_counter, 'output_rad']  # get rad value from df_profile dataframe
+        cw = df_profile.loc[profile_counter, 'output_cw']  # get cw value from df_profile dataframe
+        less_180 = df_profile.loc[profile_counter, 'output_less_180']  # get less_180 value from df_profile dataframe
+        transition_arc_flag = df_profile.loc[profile_counter, 'transition_arc_flag']  # get transition_arc_flag value from df_profile dataframe
+
+        start_z = df_profile.loc[profile_counter, 'output_start_z']  # get output_start_z value from df_profile dataframe
+        if start_z == '---':  # if value = '---' convert to None
+            start_z = None
+
+        end_z = df_profile.loc[profile_counter, 'output_end_z']  # get output_end_z value from df_profile dataframe
+        if end_z == '---':  # if value = '---' convert to None
+            end_z = None
+
+        if transition_arc_flag == True:     # do not change z height during transition arc.
+            start_z = None
+            end_z = None
+
+        # -----------------------------------------------------------------------
+        # 1693394021 Write single row to debug file
+        # -----------------------------------------------------------------------
+
+        if debug_level == 'full':     # full debug level only.
+            text_debug = debug_print_row(row_df, profile_counter) + '\n\n'  # tabulate single row
+            text_debug = indent(text_debug, 8)
+            write_to_file(name_debug, text_debug)  # write to debug file
+
+        # -----------------------------------------------------------------------
+        # 1693394035 skip_flag?
+        # -----------------------------------------------------------------------
+
+        if skip_flag == True:       # skip segment. segment inversion.
+            profile_counter = profile_counter + 1  # increment profile counter.
+            continue  # skip loop iteration.
+
+        if profile_counter == end or last_row_flag == True:
+            last_slot = True        # set last_slot = True for trochodial toolpath.
+
+        # -----------------------------------------------------------------------
+        # 1693394146 first segment?
+        # -----------------------------------------------------------------------
+
+        if profile_counter == 0:            # first segment
+            cutter_x = start_x              # initialize cutter position at first adjusted position.
+            cutter_y = start_y              # initialize cutter position at first adjusted position.
+            first_x_adjusted = start_x      # first point of the segment.
+            first_y_adjusted = start_y      # first point of the segment.
+
+            # -----------------------------------------------------------------------
+            # 1693394212 Start safe_z?
+            # -----------------------------------------------------------------------
+
+            if start_safe_z == True:
+
+                # -----------------------------------------------------------------------
+                # 1693394237
+                # start at safe z.
+                # Generate G-code to move cutter to:
+                # Safe z height.
+                # Rapid to start x, y of slot/line.
+                # Plunge to cutting z height.
+                # -----------------------------------------------------------------------
+
+                start_cutter = \
+            f'''G0 Z{"%.4f" % safe_z}				(Rapid to safe height)
+            G0 X{"%.4f" % first_x_adjusted} Y{"%.4f" % first_y_adjusted}                 (Rapid to start point)
+            '''
+            else:
+
+                # -----------------------------------------------------------------------
+                # 1693394251
+                # Do not start at safe z.
+                # Generate G-code to move cutter to:
+                # Move to start x, y of slot/line at cut_f speed
+                # Plunge to cutting z height.
+                # -----------------------------------------------------------------------
+
+                start_cutter = \
+            f'''G1 X{"%.4f" % first_x_adjusted} Y{"%.4f" % first_y_adjusted} F{feed}                 (move at cut_f to start point)
+            '''
+
+            if isinstance(first_z, float) == True:  # check if start_z is a number, if not skip.
+                start_cutter = start_cutter + \
+            f'''
+            G1 Z{"%.4f" % first_z}	F{"%.4f" % z_f}			(Plunge to cutting height)
+            '''
+
+            # -----------------------------------------------------------------------
+            # 1693641683 Set cut_f
+            # -----------------------------------------------------------------------
+
+            start_cutter = start_cutter + \
+            f'''
+            F{feed}     (set cutting feed)
+            '''
+            emit(start_cutter)
+
+            # -----------------------------------------------------------------------
+            # 1693394306 Trichodial?
+            # -----------------------------------------------------------------------
+
+        if tro == False:    # linear toolpath segment
+
+            # -----------------------------------------------------------------------
+            # 1693394426 Generate G-Code for straight line.
+            # -----------------------------------------------------------------------
+
+            if segment == 'linear':
+                cutter_x, cutter_y, cutter_z, text_temp = line(end_x, end_y, name, feed, end_z)  # print G-code for adjusted line segment.
+
+            # -----------------------------------------------------------------------
+            # 1693394433 Generate G-Code for arc.
+            # -----------------------------------------------------------------------
+
+            elif segment == 'arc':
+                cutter_x, cutter_y, cutter_z, text_temp = arc(end_x, end_y, name, rad, cw, less_180, feed, end_z)  # print G-code for adjusted arc segment.
+
+        elif tro == True:       # trochoidal toolpath segment
+
+            # -----------------------------------------------------------------------
+            # 1693394459 Generate G-Code for trichodial straight slot.
+            # -----------------------------------------------------------------------
+
+            if segment == 'linear':
+                discard, discard, cutter_x, cutter_y, text_temp = tro_slot(start_x, start_y, end_x, end_y, step, wos, dia, name, cutter_x, cutter_y, first_slot, last_slot, sink=emit)   # print G-code for adjusted trichodial line segment.
+
+            # -----------------------------------------------------------------------
+            # 1693394449 Generate G-Code for trichodial arc.
+            # -----------------------------------------------------------------------
+
+            elif segment == 'arc':
+                discard, discard, cutter_x, cutter_y, text_temp = tro_arc(start_x, start_y, end_x, end_y, step, wos, dia, rad, cw, less_180, name, cutter_x, cutter_y, first_slot, last_slot, sink=emit)     # print G-code for adjusted trichodial arc segment.
+
+            # -----------------------------------------------------------------------
+            # 1693394484 trichodial first slot = False
+            # -----------------------------------------------------------------------
+
+            first_slot = False      # clear first slot flag
+
+        # -----------------------------------------------------------------------
+        # 1693394473 Write to text bank
+        # -----------------------------------------------------------------------
+
+        if text_temp != '':
+            emit(text_temp)      # G-code of line or arc. trochoidal blocks are sent to emit as they are generated.
+
+        # -----------------------------------------------------------------------
+        # 1693394582 Last segment or break_flag = True?
+        # -----------------------------------------------------------------------
+
+        if profile_counter == end or last_row_flag == True:       # detect last row row or last row flag
+
+            # -----------------------------------------------------------------------
+            # 1693394623 Go to safe_z?
+            # -----------------------------------------------------------------------
+
+            if return_safe_z == True:
+
+                # -----------------------------------------------------------------------
+                # 1693394636 Go to safe z
+                # -----------------------------------------------------------------------
+
+                end_cutter = \
+                f'''
+                G0 Z{"%.4f" % safe_z}				(Rapid to safe height)
+                '''
+                emit(end_cutter)
+
+            # -----------------------------------------------------------------------
+            # 1693394998 End
+            # -----------------------------------------------------------------------
+            text = ''.join(blocks)    # G-code text. '' if blocks are sent to sink.
+            return (first_x_adjusted, first_y_adjusted, end_x, end_y, cutter_x, cutter_y, text)       # last point. exit function.
+
+        # -----------------------------------------------------------------------
+        # 1693394594 Increment counter
+        # -----------------------------------------------------------------------
+
+        profile_counter = profile_counter + 1   # increment counter
+
+def parameters_data_frame(workbook, sheet):
+    # ---Description---
+    # Imports a 2D dataframe from an excel file, formats the text file name, parameters, start and end G-code blocks.
+    # file headers are returned and written by the main program after the output files are opened.
+    # start_block, end_block, name, name_debug, clear_z, start_z, cut_f, finish_f, z_f, dia, header, header_debug = parameters_data_frame(workbook, sheet)
+
+    # ---Variable List---
+    # workbook = workbook session. see workbook_session()
+    # sheet = excel sheet name
+
+    # ---Return Variable List---
+    # start_block = G-code start block
+    # end_block = G-code end block
+    # name = name of text file
+    # clear_z = safe z that clears entire part. Conservative z height.
+    # start_z = z height at top of part.
+    # cut_f = cutting feed rate
+    # finish_f = finish feed rate
+    # z_f = plunge feed rate
+    # dia = adjusted cutter tolerance
+    # header = G-code file header
+    # header_debug = debug file header
+
+    # ---Change History---
+    # rev: 01-01-03-01
+    # date: 18/Oct/2026
+    # sheet is read from the workbook session instead of reopening the excel file.
+    # parameters are read from typed parameter values (sheet_static) instead of formatting every cell with format_data_frame_variable.
+    # file headers are returned (header, header_debug) instead of written to the G-code and debug files. see open_output()
+    # software test run on 18/Oct/2026
+    #
+    # rev: 01-01-02-02
+    # date: 22/Apr/2024
+    # minor change.
+    # def parameters_data_frame. removed "%.0f" %  from surface_speed and chipload variables. enable variable to accept both string and number variables.
+    # adjusted minor spacing.
+    # tested on 22/Apr/2024.
+    #
+    # rev: 01-01-10-12
+    # added header borders
+    # software test run on 19/Jul/2023
+    #
+    # rev: 01-01-01-05
+    # Added int modifier for rev number.
+    # Added written by and written on to parameters function.
+    # software test run on 11/Mar/2023
+    #
+    # rev: 01-01-01-04
+    # Added debug file name generator
+    # Added debug statements
+    # software test run on 12/0/Mar/2023
+    #
+    # rev: 01-01-10-10
+    # Added template file name into parameter description
+    # Added parameter file name into parameter description
+    # Added parameter revision number into parameter description
+    #direct input of measured cutter diameter.
+    # calculate cutter tolerence.
+    # added valid doc value detection. must be a numerical float.
+    # software test run on 13/Aug/2022
+    #
+    # rev: 01-01-10-09
+    # initial release
+    # software test run on 14/Apr/2022
+
+    # ---------File Name Variables------------
+
+    df = workbook_sheet(workbook, sheet)  # import sheet from workbook session into dataframe.
+    df.set_index('parameter', inplace=True)  # replace index default column with parameter column
+    parameters = sheet_static(workbook, sheet, 'parameters')  # typed parameter values.
+    doc_number = datetime.now().strftime("%Y%m%d-%H%M%S")  # get date time stamp (YYYYMMDD-HHMMSS) for file name.
+    prefix = parameters['prefix']
+    file_name = parameters['file name']
+    rev = str(df['value']['revision'])
+    name = prefix + doc_number + f' Rev{rev} ' + file_name  # file name
+    name_debug = name + ' Debug' # debug file name
+
+    # ---------General Variables------------
+
+    clear_z = parameters['clear z']  # safe z that clears entire part. Conservative z height.
+    initial_x = parameters['initial x']  # initial x at start of program.
+    initial_y = parameters['initial y']  # initial y at start of program.
+    start_z = parameters['start z']  # z height at top of part.
+    terminal_x = parameters['terminal x']  # terminal x at end of program.
+    terminal_y = parameters['terminal y']  # terminal y at end of program.
+    cut_f = parameters['cutting feed']  # cutting feed rate
+    z_f = parameters['plunge feed']  # plunge feed rate
+    finish_f = parameters['finishing feed']  # finish feed rate
+    rpm = parameters['spindle speed (rpm)']  # spindle speed
+    cutter_dia = parameters['cutter diameter']  # diameter of cutter as specified.
+    dia = parameters['measured diameter']  # measured actual cutter diameter.
+    tol = dia - cutter_dia      # cutter tolerance (for reference)
+    loc = parameters['length of cut ']  # length of flutes on cutter.
+    flute = parameters['# of flutes']  # number of flutes
+    surface_speed = parameters['surface speed']  # Surface Speed (m/min)
+    chipload = parameters['chipload']  # Chipload (mm/tooth)
+    cutter_material = parameters['cutter material']  # material of cutter. e.g. HSS, carbide, cobalt
+    coating = parameters['coating']  # coating of cutter.  e.g. None, AT, TiN
+    x_origin = parameters['x origin']  # x origin e.g. center of part, left edge
+    y_origin = parameters['y origin']  # y origin. e.g. center of part, bottom edge
+    z_origin = parameters['z origin']  # z origin e.g. top surface of part, top surface of vise
+    part_material = parameters['part material']  # material of part. e.g. Delrin, ABS, SS304, CoCr
+    compiler = parameters['compiler']  # compiler version
+    description = parameters['description']  # G-code description
+    template_file_name = parameters['template file name']  # parameter template excel file name and revision
+    parameter_file_name = parameters['parameter file name']  # parameter excel file name
+    parameter_file_rev = parameters['parameter file revision']  # parameter excel file revision
+    written_by = parameters['written by']  # author name
+    written_on = parameters['written on']  # date
+
+    header_debug = f'==========================================================================================\n' \
+                   f'python script: {os.path.basename(__file__)}\n' \
+                   f'file: {parameter_file_name}\n' \
+                   f'rev: {int(parameter_file_rev)}\n' \
+                   f'template: {template_file_name}\n'\
+                   f'==========================================================================================\n\n'
+
+    info = \
+        f'''
+    (==========================)    
+    (file_name: {name})
+    (==========================)  
+
+    (---Description---)
+    ({description})
+
+    (TOOL/MILL, dia: {"%.3f" % cutter_dia}, LOC:{"%.3f" % loc}, {flute} Flute, {cutter_material}, {coating})
+    (--X origin: {x_origin}--)
+    (--Y origin: {y_origin}--)
+    (--Z origin: {z_origin}--)
+    (Part material: {part_material})
+    (G-code is generated using Python script "{os.path.basename(__file__)}")
+    (Parameter File: {parameter_file_name})
+    (Revision: {int(parameter_file_rev)})
+    (Parameter File Template: {template_file_name})
+    (Written by: {written_by})
+    (Written on: {written_on})
+
+    (---Compiler---)
+    ({compiler})
+
+    (---Change History---)
+    (NA)    
+
+    (---Bug List---)
+    (NA)
+    '''
+
+    var = \
+        f'''
+    (===General variables===)
+    (clear z                   = {"%.3f" % clear_z})
+    (initial x                 = {"%.3f" % initial_x})
+    (initial y                 = {"%.3f" % initial_y})
+    (start z                   = {"%.3f" % start_z})
+    (terminal x                = {"%.3f" % terminal_x})
+    (terminal y                = {"%.3f" % terminal_y})
+    (cut feed (default)        = {"%.1f" % cut_f})
+    (plunge feed (default)     = {"%.1f" % z_f})
+    (finish feed (default)     = {"%.1f" % finish_f})
+    (spindle speed (default)   = {"%.0f" % rpm})
+    (diameter of cutter        = {"%.3f" % cutter_dia})
+    (tolerance of cutter       = {"%.3f" % tol})
+    (effective diameter        = {"%.3f" % dia})
+    (surface Speed (reference) = {surface_speed} m/min)
+    (chipload (reference)      = {chipload} mm/tooth)
+    '''
+
+    start_block = \
+        f'''
+    (start block)
+    G90			   (Absolute XYZ)
+    G21G64G17	   (mm, Best Speed Path, XY Plane)
+    M3 S{rpm}      (Spindle Speed)
+    G0 Z{"%.4f" % clear_z}   (Go to safe height)
+    G0 X{"%.4f" % initial_x} Y{"%.4f" % initial_y}   (Rapid to start point)
+
+    (===Main Start===)
+    '''
+
+    header = info + var  # G-code file header. written by the main program.
+
+    end_block = \
+        f'''
+    (===Main End===)
+
+    (end block)
+    G0 Z{"%.4f" % clear_z}				(Rapid to safe height)
+    G0 X{"%.4f" % terminal_x} Y{"%.4f" % terminal_y}        (Rapid to end point)
+    M5						    (Spindle Stop)
+    M30					        (End & Rewind)
+    '''
+
+    return (start_block, end_block, name, name_debug, clear_z, start_z, cut_f, finish_f, z_f, dia, header, header_debug)
+
+def peck_drill_data_frame(name, workbook, sheet):
+    # ---Description---
+    # Imports a 2D dataframe from an excel file, calculates the toolpath for peck drilling multiple holes in G code.
+    # starts at safe z.
+    # returns to safe z.
+    # sheets listed in workbook['streamed'] are read in chunks with sheet_stream(). G-code is written one chunk at a time.
+
+    # ---Variable List---
+    # name = name of file
+    # workbook = workbook session. see workbook_session()
+    # sheet = excel sheet name
+
+    # ---Return Variable List---
+    # N/A
+
+    # ---Change History---
+    # rev: 01-01-03-01
+    # date: 18/Oct/2026
+    # sheet is read from the workbook session instead of reopening the excel file.
+    # columns are read from typed row records (sheet_records) instead of formatting every cell with format_data_frame_variable.
+    # Added streaming mode. streamed sheets are read in chunks with sheet_stream() and G-code is written one chunk at a time.
+    # G-code of each operation is written to the G-code file as it is generated (file_sink). G-code text of the sheet is not collected.
+    # debug tables are rendered and written at full debug level only. see debug_level.
+    # software test run on 18/Oct/2026
+    #
+    # rev: 01-01-10-12
+    # updated debug text to print tabulated tables and rows.
+    # software test run on 18/Jul/2023
+    #
+    # rev: 01-01-01-06
+    # date: 12/Mar/2023
+    # description:
+    # Added shift x y.
+    # software test run on 12/Mar/2023
+    #
+    # rev: 01-01-01-04
+    # date: 08/Mar/2023
+    # description:
+    # Added debug file statements
+    # software test run on 08/Mar/2023
+    #
+    # rev: 01-01-01-03
+    # date: 23/Feb/2023
+    # description:
+    # Fixed bug on repeat g-code generation in peck drill data frame
+    # software test run on 23/Feb/2023
+    #
+    # rev: 01-01-01-02
+    # Added last row detect
+    # software test run on TBD
+    #
+    # rev: 01-01-10-09
+    # initial release
+    # software test run on 14/Apr/2022
+
+    def debug_print_row(df_temp, counter):
+        # ---Description---
+        # Tabulates single, current row to text format.
+        # text_debug_temp = debug_print_row(df_temp, counter)
+
+        # ---Variable List---
+        # df_temp = data frame
+        # counter = row counter
+
+        # ---Return Variable List---
+        # text_debug_temp = tabulated row
+
+        df_temp.iloc[[0],:] = '---'  # initialize cells by writing '---' into all cells
+        df_temp.at[0, '#'] = row_offset + counter  # write row counter to # column
+        df_temp.at[0, 'last_row_flag'] = last_row_flag
+        df_temp.at[0, 'x'] = df.at[counter, 'x']
+        df_temp.at[0, 'y'] = df.at[counter, 'y']
+        df_temp.at[0, 'dia_hole'] = dia_hole
+        df_temp.at[0, 'depth'] = depth
+        df_temp.at[0, 'peck_depth'] = peck_depth
+        df_temp.at[0, 'z_f'] = z_f
+        df_temp.at[0, 'safe_z'] = safe_z
+        df_temp.at[0, 'retract_z'] = retract_z
+        df_temp.at[0, 'dwell'] = dwell
+        df_temp.at[0, 'comments'] = df.at[counter, 'comments']
+
+        df_temp.at[0, 'adjusted_x'] = hole_x
+        df_temp.at[0, 'adjusted_y'] = hole_y
+        df_temp.at[0, 'shift_x'] = shift_x
+        df_temp.at[0, 'shift_y'] = shift_y
+        df_temp.at[0, 'repeat_flag'] = repeat_flag
+
+        df_temp = df_temp.to_markdown(index=False, tablefmt='pipe', colalign=['center'] * len(df_temp.columns))     # tabulate df in txt format
+        text_debug_temp = str(df_temp)       # convert to text str
+        return (text_debug_temp)  # return values
+
+    if sheet in workbook['streamed']:
+        chunks = sheet_stream(workbook, sheet, 'peck drill')  # stream rows of sheet in chunks. sheet is not held in memory.
+        text_debug = f'\n===========================\n' \
+                     f'operation: {operation}\n' \
+                     f'tab: {sheet} \n' \
+                     f'streamed. table not printed.\n' \
+                     f'===========================\n'
+    else:
+        df = workbook_sheet(workbook, sheet)  # import sheet from workbook session into dataframe.
+        chunks = [(df, sheet_records(workbook, sheet, 'peck drill'), True)]  # whole sheet as a single chunk.
+        if debug_level == 'full':     # full debug level only.
+            text_debug = debug_print_table(df, operation, sheet, df.shape[0])
+
+    if debug_level == 'full':     # full debug level only.
+        text_debug = indent(text_debug, 8) # indent
+        text_debug = text_debug + '\n\n'  # spacing
+        write_to_file(name_debug, text_debug)  # write to debug file
+
+    row_offset = 0          # initialize row counter of first row in chunk
+    break_flag = False      # initialize
+    for df, records, last_chunk_flag in chunks:
+        rows = df.shape[0]      # total number of rows in chunk.
+        if last_chunk_flag == True:
+            last_row = rows - 1     # last row of sheet is in this chunk
+        else:
+            last_row = rows         # last row of sheet is in a later chunk
+        if row_offset == 0:
+            row_df = debug_single_row_df(df)    # initialize single row data frame.
+        counter = 0             # initialize counter
+        sink = file_sink(name)     # G-code blocks are written to the G-code file as they are generated.
+
+        while counter <= last_row and counter < rows:
+
+            # import parameters from excel file.
+            row = records[counter]  # typed row record.
+            last_row_flag = row.last_row_flag
+            hole_x = row.x
+            hole_y = row.y
+            hole_x, hole_y = shift(hole_x, hole_y, shift_x, shift_y)   # add shift to x, y value.
+            dia_hole = row.dia_hole
+            depth = row.depth
+            peck_depth = row.peck_depth
+            z_f = row.z_f
+            safe_z = row.safe_z
+            retract_z = row.retract_z
+            dwell = row.dwell
+
+            if debug_level == 'full':     # full debug level only.
+                text_debug = debug_print_row(row_df, counter) + '\n\n'   # populate debug row.
+                text_debug = indent(text_debug, 8)
+                write_to_file(name_debug, text_debug)  # write to debug file
+
+            # generate G-code
+            peck_drill(hole_x, hole_y, dia_hole, depth, peck_depth, z_f, safe_z, retract_z, dwell, name, sink=sink)
+
+            break_flag, text_temp = last_row_detect(df, sheet, last_row_flag, last_row, counter, 8)  # detect last row
+            if break_flag == True:  # break if last row
+                sink(text_temp)
+                break
+
+            counter = counter + 1  # increment counter.
+
+        if break_flag == True:
+            break
+        row_offset = row_offset + rows  # row counter of first row in next chunk
+
+def surface_data_frame(name, workbook, sheet):
+    # ---Description---
+    # Imports a 2D dataframe from an excel file, calculates the toolpath for surfacing a rectangular work piece in G code.
+    # starts at safe z.
+    # returns to safe z.
+
+    # ---Variable List---
+    # name = name of file
+    # workbook = workbook session. see workbook_session()
+    # sheet = excel sheet name
+
+    # ---Return Variable List---
+    # N/A
+
+    # ---Change History---
+    # rev: 01-01-03-01
+    # date: 18/Oct/2026
+    # sheet is read from the workbook session instead of reopening the excel file.
+    # columns are read from typed row records (sheet_records) instead of formatting every cell with format_data_frame_variable.
+    # G-code of each operation is written to the G-code file as it is generated (file_sink). G-code text of the sheet is not collected.
+    # debug tables are rendered and written at full debug level only. see debug_level.
+    # software test run on 18/Oct/2026
+    #
+    # rev: 01-01-10-12
+    # updated debug text to print tabulated tables and rows.
+    # software test run on 18/Jul/2023
+    #
+    # rev: 01-01-01-09
+    # date: 26/May/2023
+    # description:
+    # Added entry parameter
+    #
+    # rev: 01-01-01-06
+    # date: 12/Mar/2023
+    # description:
+    # Added shift x y.
+    # software test run on 12/Mar/2023
+    #
+    # rev: 01-01-01-05
+    # Added error text file statements to surface dataframe function.
+    # software test run on 11/Mar/2023
+    #
+    # rev: 01-01-10-10
+    # added cut_f parameter import from excel file.
+    # software test run on 13/Aug/2022
+    #
+    # rev: 01-01-10-09
+    # initial release
+    # software test run on 14/Apr/2022
+
+    def debug_print_row(df_temp, counter):
+        # ---Description---
+        # Tabulates single, current row to text format.
+        # text_debug_temp = debug_print_row(df_temp, counter)
+
+        # ---Variable List---
+        # df_temp = data frame
+        # counter = row counter
+
+        # ---Return Variable List---
+        # text_debug_temp = tabulated row
+
+        df_temp.iloc[[0],:] = '---'  # initialize cells by writing '---' into all cells
+        df_temp.at[0, '#'] = counter  # write counter to # column
+        df_temp.at[0, 'last_row_flag'] = last_row_flag
+        df_temp.at[0, 'origin_x'] = df.at[counter, 'origin_x']
+        df_temp.at[0, 'origin_y'] = df.at[counter, 'origin_y']
+        df_temp.at[0, 'length_x'] = length_x
+        df_temp.at[0, 'length_y'] = length_y
+        df_temp.at[0, 'doc'] = doc
+        df_temp.at[0, 'step'] = step
+        df_temp.at[0, 'cut_f'] = cut_f
+        df_temp.at[0, 'safe_z'] = safe_z
+        df_temp.at[0, 'entry'] = entry
+        df_temp.at[0, 'comments'] = df.at[counter, 'comments']
+
+        df_temp.at[0, 'adjusted_x'] = origin_x
+        df_temp.at[0, 'adjusted_y'] = origin_y
+        df_temp.at[0, 'shift_x'] = shift_x
+        df_temp.at[0, 'shift_y'] = shift_y
+        df_temp.at[0, 'repeat_flag'] = repeat_flag
+
+        df_temp = df_temp.to_markdown(index=False, tablefmt='pipe', colalign=['center'] * len(df_temp.columns))     # tabulate df in txt format
+        text_debug_temp = str(df_temp)       # convert to text str
+        return (text_debug_temp)  # return values
+
+    df = workbook_sheet(workbook, sheet)  # import sheet from workbook session into dataframe.
+    records = sheet_records(workbook, sheet, 'surface')  # typed row records of sheet.
+    rows = df.shape[0]      # total number of rows in dataframe.
+    last_row = rows - 1     # initialize number of last row
+    counter = 0             # initialize counter
+    sink = file_sink(name)     # G-code blocks are written to the G-code file as they are generated.
+    row_df = debug_single_row_df(df)    # initialize single row data frame.
+
+    if debug_level == 'full':     # full debug level only.
+        text_debug = debug_print_table(df, operation, sheet, rows)
+        text_debug = indent(text_debug, 8) # indent
+        text_debug = text_debug + '\n\n'  # spacing
+        write_to_file(name_debug, text_debug)  # write to debug file
+
+    while counter <= last_row:
+
+        # import parameters from excel file.
+        row = records[counter]  # typed row record.
+        last_row_flag = row.last_row_flag
+        origin_x = row.origin_x
+        origin_y = row.origin_y
+        origin_x, origin_y = shift(origin_x, origin_y, shift_x, shift_y)   # add shift to x, y value.
+        length_x = row.length_x
+        length_y = row.length_y
+        doc = row.doc
+        step = row.step
+        cut_f = row.cut_f
+        safe_z = row.safe_z
+        entry = row.entry
+
+        if debug_level == 'full':     # full debug level only.
+            text_debug = debug_print_row(row_df, counter)   # populate debug row.
+            text_debug = text_debug + '\n\n'
+            text_debug = indent(text_debug, 8)
+            write_to_file(name_debug, text_debug)  # write to debug file
+
+        # generate G-code
+        surface(origin_x, origin_y, length_x, length_y, doc, dia, step, z_f, cut_f, safe_z, entry, name, sink=sink)
+
+        break_flag, text_temp = last_row_detect(df, sheet, last_row_flag, last_row, counter, 8)  # detect last row
+        if break_flag == True:  # break if last row
+            sink(text_temp)
+            break
+
+        counter = counter + 1  # increment counter.
+
+
+def spiral_drill_data_frame(name, workbook, sheet):
+    # ---Description---
+    # Imports a 2D dataframe from an excel file, calculates the toolpath for spiral drilling multiple holes in G code.
+    # starts at safe z.
+    # returns to safe z.
+    # sheets listed in workbook['streamed'] are read in chunks with sheet_stream(). G-code is written one chunk at a time.
+
+    # ---Variable List---
+    # name = name of file
+    # workbook = workbook session. see workbook_session()
+    # sheet = excel sheet name
+
+    # ---Return Variable List---
+    # N/A
+
+    # ---Change History---
+    # rev: 01-01-03-01
+    # date: 18/Oct/2026
+    # sheet is read from the workbook session instead of reopening the excel file.
+    # columns are read from typed row records (sheet_records) instead of formatting every cell with format_data_frame_variable.
+    # Added streaming mode. streamed sheets are read in chunks with sheet_stream() and G-code is written one chunk at a time.
+    # G-code of each operation is written to the G-code file as it is generated (file_sink). G-code text of the sheet is not collected.
+    # debug tables are rendered and written at full debug level only. see debug_level.
+    # software test run on 18/Oct/2026
+    #
+    # rev: 01-01-10-12
+    # updated debug text to print tabulated tables and rows.
+    # software test run on 18/Jul/2023
+    #
+    # rev: 01-01-01-06
+    # date: 12/Mar/2023
+    # description:
+    # Added shift x y.
+    # software test run on 12/Mar/2023
+    #
+    # rev: 01-01-01-05
+    # Added error text file statements to spiral drill function.
+    # software test run on 11/Mar/2023
+    #
+    # rev: 01-01-10-09
+    # initial release
+    # software test run on 14/Apr/2022
+
+    def debug_print_row(df_temp, counter):
+        # ---Description---
+        # Tabulates single, current row to text format.
+        # text_debug_temp = debug_print_row(df_temp, counter)
+
+        # ---Variable List---
+        # df_temp = data frame
+        # counter = row counter
+
+        # ---Return Variable List---
+        # text_debug_temp = tabulated row
+
+        df_temp.iloc[[0],:] = '---'  # initialize cells by writing '---' into all cells
+        df_temp.at[0, '#'] = row_offset + counter  # write row counter to # column
+        df_temp.at[0, 'last_row_flag'] = last_row_flag
+        df_temp.at[0, 'origin_x'] = df.at[counter, 'origin_x']
+        df_temp.at[0, 'origin_y'] = df.at[counter, 'origin_y']
+        df_temp.at[0, 'dia_hole'] = dia_hole
+        df_temp.at[0, 'depth'] = depth
+        df_temp.at[0, 'step_depth'] = step_depth
+        df_temp.at[0, 'cut_f'] = cut_f
+        df_temp.at[0, 'safe_z'] = safe_z
+        df_temp.at[0, 'comments'] = df.at[counter, 'comments']
+
+        df_temp.at[0, 'adjusted_x'] = origin_x
+        df_temp.at[0, 'adjusted_y'] = origin_y
+        df_temp.at[0, 'shift_x'] = shift_x
+        df_temp.at[0, 'shift_y'] = shift_y
+        df_temp.at[0, 'repeat_flag'] = repeat_flag
+
+        df_temp = df_temp.to_markdown(index=False, tablefmt='pipe',
+                                      colalign=['center'] * len(df_temp.columns))  # tabulate df in txt format
+        text_debug_temp = str(df_temp)  # convert to text str
+        return (text_debug_temp)  # return values
+
+    if sheet in workbook['streamed']:
+        chunks = sheet_stream(workbook, sheet, 'spiral drill')  # stream rows of sheet in chunks. sheet is not held in memory.
+        text_debug = f'\n===========================\n' \
+                     f'operation: {operation}\n' \
+                     f'tab: {sheet} \n' \
+                     f'streamed. table not printed.\n' \
+                     f'===========================\n'
+    else:
+        df = workbook_sheet(workbook, sheet)  # import sheet from workbook session into dataframe.
+        chunks = [(df, sheet_records(workbook, sheet, 'spiral drill'), True)]  # whole sheet as a single chunk.
+        if debug_level == 'full':     # full debug level only.
+            text_debug = debug_print_table(df, operation, sheet, df.shape[0])
+
+    if debug_level == 'full':     # full debug level only.
+        text_debug = indent(text_debug, 8) # indent
+        text_debug = text_debug + '\n\n'  # spacing
+        write_to_file(name_debug, text_debug)  # write to debug file
+
+    row_offset = 0          # initialize row counter of first row in chunk
+    break_flag = False      # initialize
+    for df, records, last_chunk_flag in chunks:
+        rows = df.shape[0]      # total number of rows in chunk.
+        if last_chunk_flag == True:
+            last_row = rows - 1     # last row of sheet is in this chunk
+        else:
+            last_row = rows         # last row of sheet is in a later chunk
+        if row_offset == 0:
+            row_df = debug_single_row_df(df)    # initialize single row data frame.
+        counter = 0             # initialize counter
+        sink = file_sink(name)     # G-code blocks are written to the G-code file as they are generated.
+
+        while counter <= last_row and counter < rows:
+
+            # import parameters from excel file.
+            row = records[counter]  # typed row record.
+            last_row_flag = row.last_row_flag
+            origin_x = row.origin_x
+            origin_y = row.origin_y
+            origin_x, origin_y = shift(origin_x, origin_y, shift_x, shift_y)   # add shift to x, y value.
+            dia_hole = row.dia_hole
+            depth = row.depth
+            step_depth = row.step_depth
+            cut_f = row.cut_f
+            safe_z = row.safe_z
+
+            if debug_level == 'full':     # full debug level only.
+                text_debug = debug_print_row(row_df, counter)   # populate debug row.
+                text_debug = text_debug + '\n\n'
+                text_debug = indent(text_debug, 8)
+                write_to_file(name_debug, text_debug)  # write to debug file
+
+            # generate G-code
+            spiral_drill(origin_x, origin_y, dia_hole, depth, step_depth, dia, z_f, cut_f, safe_z, name, sink=sink)
+
+            break_flag, text_temp = last_row_detect(df, sheet, last_row_flag, last_row, counter, 8)  # detect last row
+            if break_flag == True:  # break if last row
+                sink(text_temp)
+                break
+
+            counter = counter + 1  # increment counter.
+
+        if break_flag == True:
+            break
+        row_offset = row_offset + rows  # row counter of first row in next chunk
+
+def spiral_surface_data_frame(name, workbook, sheet):
+    # ---Description---
+    # Imports a 2D dataframe from an excel file, calculates the toolpath for a spiral surfacing a part in G code.
+    # starts at safe z.
+    # returns to safe z.
+
+    # ---Variable List---
+    # name = name of file
+    # workbook = workbook session. see workbook_session()
+    # sheet = excel sheet name
+
+    # ---Return Variable List---
+    # N/A
+
+    # ---Change History---
+    # rev: 01-01-03-01
+    # date: 18/Oct/2026
+    # sheet is read from the workbook session instead of reopening the excel file.
+    # columns are read from typed row records (sheet_records) instead of formatting every cell with format_data_frame_variable.
+    # G-code of each operation is written to the G-code file as it is generated (file_sink). G-code text of the sheet is not collected.
+    # debug tables are rendered and written at full debug level only. see debug_level.
+    # software test run on 18/Oct/2026
+    #
+    # rev: 01-01-10-12
+    # updated debug text to print tabulated tables and rows.
+    # software test run on 18/Jul/2023
+    #
+    # rev: 01-01-01-06
+    # date: 12/Mar/2023
+    # description:
+    # Added shift x y.
+    # software test run on 12/Mar/2023
+    #
+    # rev: 01-01-01-05
+    # Added error text file statements to spiral surface dataframe function.
+    # software test run on 11/Mar/2023
+    #
+    # rev: 01-01-10-09
+    # initial release
+    # software test run on 14/Apr/2022
+
+    def debug_print_row(df_temp, counter):
+        # ---Description---
+        # Tabulates single, current row to text format.
+        # text_debug_temp = debug_print_row(df_temp, counter)
+
+        # ---Variable List---
+        # df_temp = data frame
+        # counter = row counter
+
+        # ---Return Variable List---
+        # text_debug_temp = tabulated row
+
+        df_temp.iloc[[0],:] = '---'  # initialize cells by writing '---' into all cells
+        df_temp.at[0, '#'] = counter  # write counter to # column
+        df_temp.at[0, 'last_row_flag'] = last_row_flag
+        df_temp.at[0, 'origin_x'] = df.at[counter, 'origin_x']
+        df_temp.at[0, 'origin_y'] = df.at[counter, 'origin_y']
+        df_temp.at[0, 'start_dia'] = start_dia
+        df_temp.at[0, 'end_dia'] = end_dia
+        df_temp.at[0, 'doc'] = doc
+        df_temp.at[0, 'step'] = step
+        df_temp.at[0, 'cut_f'] = cut_f
+        df_temp.at[0, 'finish_f'] = finish_f
+        df_temp.at[0, 'finish_cuts'] = finish_cuts
+        df_temp.at[0, 'safe_z'] = safe_z
+        df_temp.at[0, 'comments'] = df.at[counter, 'comments']
+
+        df_temp.at[0, 'adjusted_x'] = origin_x
+        df_temp.at[0, 'adjusted_y'] = origin_y
+        df_temp.at[0, 'shift_x'] = shift_x
+        df_temp.at[0, 'shift_y'] = shift_y
+        df_temp.at[0, 'repeat_flag'] = repeat_flag
+
+        df_temp = df_temp.to_markdown(index=False, tablefmt='pipe',
+                                      colalign=['center'] * len(df_temp.columns))  # tabulate df in txt format
+        text_debug_temp = str(df_temp)  # convert to text str
+        return (text_debug_temp)  # return values
+
+    df = workbook_sheet(workbook, sheet)  # import sheet from workbook session into dataframe.
+    records = sheet_records(workbook, sheet, 'spiral surface')  # typed row records of sheet.
+    rows = df.shape[0]      # total number of rows in dataframe.
+    last_row = rows - 1     # initialize number of last row
+    counter = 0             # initialize counter
+    sink = file_sink(name)     # G-code blocks are written to the G-code file as they are generated.
+    row_df = debug_single_row_df(df)    # initialize single row data frame.
+
+    if debug_level == 'full':     # full debug level only.
+        text_debug = debug_print_table(df, operation, sheet, rows)
+        text_debug = indent(text_debug, 8) # indent
+        text_debug = text_debug + '\n\n'  # spacing
+        write_to_file(name_debug, text_debug)  # write to debug file
+
+    while counter <= last_row:
+
+        # import parameters from excel file.
+        row = records[counter]  # typed row record.
+        last_row_flag = row.last_row_flag
+        origin_x = row.origin_x
+        origin_y = row.origin_y
+        origin_x, origin_y = shift(origin_x, origin_y, shift_x, shift_y)   # add shift to x, y value.
+        start_dia = row.start_dia
+        end_dia = row.end_dia
+        doc = row.doc
+        step = row.step
+        cut_f = row.cut_f
+        finish_f = row.finish_f
+        finish_cuts = row.finish_cuts
+        safe_z = row.safe_z
+
+        if debug_level == 'full':     # full debug level only.
+            text_debug = debug_print_row(row_df, counter)   # populate debug row.
+            text_debug = text_debug + '\n\n'
+            text_debug = indent(text_debug, 8)
+            write_to_file(name_debug, text_debug)  # write to debug file
+
+        # generate G-code
+        spiral_surface(origin_x, origin_y, start_dia, end_dia, doc, dia, step, z_f, cut_f, finish_f, finish_cuts, safe_z, name, sink=sink, tolerance=spiral_tolerance)
+
+        break_flag, text_temp = last_row_detect(df, sheet, last_row_flag, last_row, counter, 8)  # detect last row
+        if break_flag == True:  # break if last row
+            sink(text_temp)
+            break
+
+        counter = counter + 1  # increment counter.
+
+
+def corner_slice_data_frame(name, workbook, sheet):
+    # ---Description---
+    # Imports a 2D dataframe from an excel file, calculates the toolpath for corner slicing part in G code.
+    # starts at safe z.
+    # returns to safe z.
+
+    # ---Variable List---
+    # name = name of file
+    # workbook = workbook session. see workbook_session()
+    # sheet = excel sheet name
+
+    # ---Return Variable List---
+    # N/A
+
+    # ---Change History---
+    # rev: 01-01-03-01
+    # date: 18/Oct/2026
+    # sheet is read from the workbook session instead of reopening the excel file.
+    # columns are read from typed row records (sheet_records) instead of formatting every cell with format_data_frame_variable.
+    # G-code of each operation is written to the G-code file as it is generated (file_sink). G-code text of the sheet is not collected.
+    # debug tables are rendered and written at full debug level only. see debug_level.
+    # software test run on 18/Oct/2026
+    #
+    # rev: 01-01-10-12
+    # updated debug text to print tabulated tables and rows.
+    # software test run on 18/Jul/2023
+    #
+    # rev: 01-01-01-06
+    # date: 12/Mar/2023
+    # description:
+    # Added shift x y.
+    # software test run on 12/Mar/2023
+    #
+    # rev: 01-01-01-05
+    # Added error text file statements to spiral surface dataframe function.
+    # software test run on 11/Mar/2023
+    #
+    # rev: 01-01-10-09
+    # initial release
+    # software test run on 14/Apr/2022
+
+    def debug_print_row(df_temp, counter):
+        # ---Description---
+        # Tabulates single, current row to text format.
+        # text_debug_temp = debug_print_row(df_temp, counter)
+
+        # ---Variable List---
+        # df_temp = data frame
+        # counter = row counter
+
+        # ---Return Variable List---
+        # text_debug_temp = tabulated row
+
+        df_temp.iloc[[0],:] = '---'  # initialize cells by writing '---' into all cells
+        df_temp.at[0, '#'] = counter  # write counter to # column
+        df_temp.at[0, 'last_row_flag'] = last_row_flag
+        df_temp.at[0, 'start_x'] = df.at[counter, 'start_x']
+        df_temp.at[0, 'start_y'] = df.at[counter, 'start_y']
+        df_temp.at[0, 'end_x'] = df.at[counter, 'end_x']
+        df_temp.at[0, 'end_y'] = df.at[counter, 'end_y']
+        df_temp.at[0, 'start_rad'] = start_rad
+        df_temp.at[0, 'end_rad'] = end_rad
+        df_temp.at[0, 'doc'] = doc
+        df_temp.at[0, 'step'] = step
+        df_temp.at[0, 'cut_f'] = cut_f
+        df_temp.at[0, 'mode'] = mode
+        df_temp.at[0, 'safe_z'] = safe_z
+        df_temp.at[0, 'comments'] = df.at[counter, 'comments']
+
+        df_temp.at[0, 'adjusted_start_x'] = start_x
+        df_temp.at[0, 'adjusted_start_y'] = start_y
+        df_temp.at[0, 'shift_x'] = shift_x
+        df_temp.at[0, 'shift_y'] = shift_y
+        df_temp.at[0, 'repeat_flag'] = repeat_flag
+        df_temp.at[0, 'adjusted_end_x'] = end_x
+        df_temp.at[0, 'adjusted_end_y'] = end_y
+        df_temp = df_temp.to_markdown(index=False, tablefmt='pipe', colalign=['center'] * len(df_temp.columns))  # tabulate df in txt format
+        text_debug_temp = str(df_temp)  # convert to text str
+        return (text_debug_temp)  # return values
+
+    df = workbook_sheet(workbook, sheet)  # import sheet from workbook session into dataframe.
+    records = sheet_records(workbook, sheet, 'corner slice')  # typed row records of sheet.
+    rows = df.shape[0]      # total number of rows in dataframe.
+    last_row = rows - 1     # initialize number of last row
+    counter = 0             # initialize counter
+    sink = file_sink(name)     # G-code blocks are written to the G-code file as they are generated.
+    row_df = debug_single_row_df(df)    # initialize single row data frame.
+    row_df.insert(loc= len(row_df.columns)-3, column='adjusted_end_x', value='---')    # insert new column 'adjusted_end_x' 3rd from end into single row data frame.
+    row_df.insert(loc= len(row_df.columns)-3, column='adjusted_end_y', value='---')    # insert new column 'adjusted_end_y' 3rd from end into single row data frame.
+    row_df.rename(columns={"adjusted_x": "adjusted_start_x", "adjusted_y": "adjusted_start_y"}, inplace=True)   # rename adjusted start columns
+
+    if debug_level == 'full':     # full debug level only.
+        text_debug = debug_print_table(df, operation, sheet, rows)
+        text_debug = indent(text_debug, 8)  # indent
+        text_debug = text_debug + '\n\n'  # spacing
+        write_to_file(name_debug, text_debug)  # write to debug file
+
+
+    while counter <= last_row:
+
+        # import parameters from excel file.
+        row = records[counter]  # typed row record.
+        last_row_flag = row.last_row_flag
+        start_x = row.start_x
+        start_y = row.start_y
+        start_x, start_y = shift(start_x, start_y, shift_x, shift_y)   # add shift to x, y value.
+        end_x = row.end_x
+        end_y = row.end_y
+        end_x, end_y = shift(end_x, end_y, shift_x, shift_y)   # add shift to x, y value.
+        start_rad = row.start_rad
+        end_rad = row.end_rad
+        doc = row.doc
+        step = row.step
+        cut_f = row.cut_f
+        mode = row.mode
+        safe_z = row.safe_z
+
+        if debug_level == 'full':     # full debug level only.
+            text_debug = debug_print_row(row_df , counter)   # populate debug row.
+            text_debug = text_debug + '\n\n'
+            text_debug = indent(text_debug, 8)
+            write_to_file(name_debug, text_debug)  # write to debug file
+
+        # generate G-code
+        corner_slice(start_x, start_y, end_x, end_y, start_rad, end_rad, doc, dia, step, z_f, cut_f, safe_z, name, mode, sink=sink)
+
+        break_flag, text_temp = last_row_detect(df, sheet, last_row_flag, last_row, counter, 8)  # detect last row
+        if break_flag == True:  # break if last row
+            sink(text_temp)
+            break
+
+        counter = counter + 1  # increment counter.
+
+
+def spiral_boss_data_frame(name, workbook, sheet):
+    # ---Description---
+    # Imports a 2D dataframe from an excel file, calculates the toolpath for cutting a spiral boss in G code.
+    # starts at safe z.
+    # returns to safe z.
+
+    # ---Variable List---
+    # name = name of file
+    # workbook = workbook session. see workbook_session()
+    # sheet = excel sheet name
+
+    # ---Return Variable List---
+    # N/A
+
+    # ---Change History---
+    # rev: 01-01-03-01
+    # date: 18/Oct/2026
+    # sheet is read from the workbook session instead of reopening the excel file.
+    # columns are read from typed row records (sheet_records) instead of formatting every cell with format_data_frame_variable.
+    # G-code of each operation is written to the G-code file as it is generated (file_sink). G-code text of the sheet is not collected.
+    # debug tables are rendered and written at full debug level only. see debug_level.
+    # software test run on 18/Oct/2026
+    #
+    # rev: 01-01-01-06
+    # date: 12/Mar/2023
+    # description:
+    # Added shift x y.
+    # software test run on 12/Mar/2023
+    #
+    # rev: 01-01-01-05
+    # Added error text file statements to spiral boss function.
+    # software test run on 11/Mar/2023
+    #
+    # rev: 01-01-10-09
+    # initial release
+    # software test run on 14/Apr/2022
+
+    def debug_print_row(df_temp, counter):
+        # ---Description---
+        # Tabulates single, current row to text format.
+        # text_debug_temp = debug_print_row(df_temp, counter)
+
+        # ---Variable List---
+        # df_temp = data frame
+        # counter = row counter
+
+        # ---Return Variable List---
+        # text_debug_temp = tabulated row
+
+        df_temp.iloc[[0],:] = '---'  # initialize cells by writing '---' into all cells
+        df_temp.at[0, '#'] = counter  # write counter to # column
+        df_temp.at[0, 'last_row_flag'] = last_row_flag
+        df_temp.at[0, 'origin_x'] = df.at[counter, 'origin_x']
+        df_temp.at[0, 'origin_y'] = df.at[counter, 'origin_y']
+        df_temp.at[0, 'start_dia'] = start_dia
+        df_temp.at[0, 'end_dia'] = end_dia
+        df_temp.at[0, 'doc'] = doc
+        df_temp.at[0, 'step'] = step
+        df_temp.at[0, 'cut_f'] = cut_f
+        df_temp.at[0, 'finish_f'] = finish_f
+        df_temp.at[0, 'finish_cuts'] = finish_cuts
+        df_temp.at[0, 'safe_z'] = safe_z
+        df_temp.at[0, 'comments'] = df.at[counter, 'comments']
+
+        df_temp.at[0, 'adjusted_x'] = origin_x
+        df_temp.at[0, 'adjusted_y'] = origin_y
+        df_temp.at[0, 'shift_x'] = shift_x
+        df_temp.at[0, 'shift_y'] = shift_y
+        df_temp.at[0, 'repeat_flag'] = repeat_flag
+
+        df_temp = df_temp.to_markdown(index=False, tablefmt='pipe', colalign=['center'] * len(df_temp.columns))  # tabulate df in txt format
+        text_debug_temp = str(df_temp)  # convert to text str
+        return (text_debug_temp)  # return values
+
+    df = workbook_sheet(workbook, sheet)  # import sheet from workbook session into dataframe.
+    records = sheet_records(workbook, sheet, 'spiral boss')  # typed row records of sheet.
+    rows = df.shape[0]      # total number of rows in dataframe.
+    last_row = rows - 1     # initialize number of last row
+    counter = 0             # initialize counter
+    sink = file_sink(name)     # G-code blocks are written to the G-code file as they are generated.
+    row_df = debug_single_row_df(df)    # initialize single row data frame.
+
+    if debug_level == 'full':     # full debug level only.
+        text_debug = debug_print_table(df, operation, sheet, rows)
+        text_debug = indent(text_debug, 8) # indent
+        text_debug = text_debug + '\n\n'  # spacing
+        write_to_file(name_debug, text_debug)  # write to debug file
+
+    while counter <= last_row:
+
+        # import parameters from excel file.
+        row = records[counter]  # typed row record.
+        last_row_flag = row.last_row_flag
+        origin_x = row.origin_x
+        origin_y = row.origin_y
+        origin_x, origin_y = shift(origin_x, origin_y, shift_x, shift_y)   # add shift to x, y value.
+        start_dia = row.start_dia
+        end_dia = row.end_dia
+        doc = row.doc
+        step = row.step
+        cut_f = row.cut_f
+        finish_f = row.finish_f
+        finish_cuts = row.finish_cuts
+        safe_z = row.safe_z
+
+        if debug_level == 'full':     # full debug level only.
+            text_debug = debug_print_row(row_df, counter)   # populate debug row.
+            text_debug = text_debug + '\n\n'
+            text_debug = indent(text_debug, 8)
+            write_to_file(name_debug, text_debug)  # write to debug file
+
+        # generate G-code
+        spiral_boss(origin_x, origin_y, start_dia, end_dia, doc, dia, step, z_f, cut_f, finish_f, finish_cuts, safe_z, name, sink=sink, tolerance=spiral_tolerance)
+
+        break_flag, text_temp = last_row_detect(df, sheet, last_row_flag, last_row, counter, 8)  # detect last row
+        if break_flag == True:  # break if last row
+            sink(text_temp)
+            break
+
+        counter = counter + 1  # increment counter.
+
+
+def rapid(name, row):
+    # ---Description---
+    # Imports a 2D dataframe from an excel file, calculates the toolpath for a rapid movement in G code.
+    # x, y, z = rapid(name, row)
+
+    # ---Variable List---
+    # name = name of file
+    # row = typed row record of main tab. see sheet_records()
+
+    # ---Return Variable List---
+    # x = x position
+    # y = y position
+    # z = z position
+
+    # ---Change History---
+    # rev: 01-01-03-01
+    # date: 18/Oct/2026
+    # reads typed row record of main tab. replaced df_main, counter with row.
+    # software test run on 18/Oct/2026
+    #
+    # rev: 01-01-10-12
+    # return x, y, z
+    # software test run on 18/Jul/2023
+    #
+    # rev: 01-01-01-06
+    # date: 12/Mar/2023
+    # description:
+    # Added 'None' as a valid variable.
+    # detect of x,y,z are all None then do not print g-code G0
+    # software test run on 12/Mar/2023
+    #
+    # rev: 01-01-01-04
+    # date: 08/Mar/2023
+    # description:
+    # Added debug file statements
+    # found and fixed variable type check bug
+    # software test run on 08/Mar/2023
+    #
+    # rev: 01-01-10-10
+    # initial release
+    # software test run on 11/Aug/2022
+
+    operation_debug = row.operation
+#    text_debug = f'\n{operation_debug}\n'
+#    text_debug = indent(text_debug, 8)
+#    write_to_file(name_debug, text_debug)  # write to debug file
+
+    x = row.x
+    y = row.y
+    z = row.z
+    x, y = shift(x, y, shift_x, shift_y)  # add shift to x,y value.
+
+    if x == None and y == None and z ==None:
+        text = ''   #
+    else:
+        text = f'G0 '  # G0 rapid command
+
+    if isinstance(x, float) == True:  # check if x is a number, if not skip.
+        text = text + f' X{"%.4f" % x}'  # append x position
+        text_debug = f'x: {x}, '
+        text_debug = indent(text_debug, 8)
+#        write_to_file(name_debug, text_debug)  # write to debug file
+    elif x == None: # check if x is 'None', if not skip.
+        text_debug = f'x: {x}, '
+        text_debug = indent(text_debug, 8)
+#        write_to_file(name_debug, text_debug)  # write to debug file
+    else:
+        abort('x', x, 'not float or None')
+
+    if isinstance(y, float) == True:  # check if y is a number, if not skip.
+        text = text + f' Y{"%.4f" % y}'  # append y position
+        text_debug = f'y:{y}, '
+#        write_to_file(name_debug, text_debug)  # write to debug file
+    elif y == None:  # check if y is 'None', if not skip.
+        text_debug = f'y: {y}, '
+#        write_to_file(name_debug, text_debug)  # write to debug file
+    else:
+        abort('y', y, 'not float or None')
+
+    if isinstance(z, float) == True:  # check if z is a number, if not skip.
+        text = text + f' Z{"%.4f" % z}'  # append z position
+        text_debug = f'z:{z}'
+#        write_to_file(name_debug, text_debug)  # write to debug file
+    elif z == None: # check if z is 'None', if not skip.
+        text_debug = f'z: {z}'
+#        write_to_file(name_debug, text_debug)  # write to debug file
+    else:
+        abort('z', z, 'not float or None')
+
+    text = text + '         (Rapid)\n'
+    write_to_file(name, text)       # write g-code
+    return (x, y, z)
+
+def last_row_detect(df_temp, sheet_temp, last_row_flag, last_row, counter, indent_spacing = 0):
+    # ---Description---
+    # Detects the last row of dataframe.
+    # additionally detects unintentional termination of a dataframe.
+    # returns break_flag, comments in G-code, and prints to debug window.
+    # break_flag, text = last_row_detect(df_temp, sheet_temp, last_row_flag, last_row, counter, indent_spacing)
+
+    # ---Variable List---
+    # df_temp = active data frame
+    # sheet_temp = active sheet
+    # last_row_flag = last row flag
+    # last_row = total number of rows in the dataframe
+    # counter = row counter
+    # indent_spacing = indent spacing for debug file statements
+
+    # ---Return Variable List---
+    # break_flag = flag signalling the detection of the last row.
+    # text = returns type of termination
+
+    # ---Change History---
+    # rev: 01-01-03-01
+    # date: 18/Oct/2026
+    # debug text is written at full debug level only. see debug_level.
+    # software test run on 18/Oct/2026
+    #
+    # rev: 01-01-10-12
+    # clean up code
+    # software test run on 19/Jul/2023
+    #
+    # rev: 01-01-01-04
+    # date: 08/Mar/2023
+    # description:
+    # Added debug file statements
+    # Added debug file indent spacing variable.
+    # software test run on 08/Mar/2023
+    #
+    # rev: 01-01-10-11
+    # fixed data frame bug.
+    # added active dataframe and active sheet as pass in variables.
+    # software test run on 15/Aug/2022
+    #
+    # rev: 01-01-10-10
+    # initial release
+    # software test run on 11/Aug/2022
+
+    break_flag = False      # initialize. clear break flag
+    text = ''               # initialize.
+    text_debug = ''         # initialize.
+    if last_row_flag == True:                                                           # detect last row to terminate program.
+        if counter < last_row:
+            row = format_data_frame_variable(df_temp, '#', counter)
+            print(f'''early termination of row\nsheet: {sheet_temp}\nrow #: {"%.0f" % row}\n''')   # premature program termination
+            text = f'''\n(early termination of row)\n(sheet: {sheet_temp})\n(row #: {"%.0f" % row})\n'''  # to G-code text file
+            text_debug = 'early termination of row'
+        else:
+            print(f'''last row processed\nnormal termination of program\nsheet: {sheet_temp}\n''')    # normal expected program termination
+            text = f'''\n(last row processed)\n(normal termination of program)\n(sheet: {sheet_temp})\n'''  # to G-code text file
+            text_debug = 'last row processed. normal termination of program.'
+        break_flag = True       # set break flag
+
+    if counter == last_row and break_flag == False:
+        print(f'''last row detected and processed\nlast_row_flag not detected!\nunexpected termination of program\nsheet: {sheet_temp}\n''')  # unexpected program termination. last_row_flag not detected
+        text = f'''\n(last row detected and processed)\n(last_row_flag not detected!)\n(unexpected termination of program)\n(sheet: {sheet_temp})\n'''  # to G-code text file
+        text_debug = 'last row detected and processed. last_row_flag not detected!'
+        break_flag = True       # set break flag
+
+    if debug_level == 'full':     # full debug level only.
+        text_debug = indent(text_debug, indent_spacing) + '\n'      # indent text.
+        write_to_file(name_debug, text_debug)           # write to debug file.
+
+    return (break_flag, text)
+
+def indent(text, amount, ch=' '):
+    # ---Description---
+    # Pads a text variable with defined blank spaces.
+    # text = indent(text, amount)
+
+    # ---Variable List---
+    # text = import text string
+    # amount = number of blank spaces to pad
+
+    # ---Return Variable List---
+    # text = import text with padded blank spaces in front
+
+    # ---Change History---
+    # rev: 01-01-01-04
+    # Initial release
+    # software test run on 08/Mar/2023
+
+    return textwrap.indent(text, amount * ch)
+
+def abort(variable_name, variable, error_message = None):
+    # ---Description---
+    # Aborts the program and print an error message on the debug window, G-code text file and debug text file.
+    # abort(variable_name, variable, error_message)
+
+    # ---Variable List---
+    # variable_name = name of variable
+    # variable = value of variable
+    # error_message = optional error message
+
+    # ---Return Variable List---
+    # N/A
+
+    # ---Change History---
+    # rev: 01-01-03-01
+    # date: 18/Oct/2026
+    # output files are flushed and closed before quit. see close_outputs()
+    # DNC sending is stopped.
+    # error message is not written to the debug file at debug level off.
+    # software test run on 18/Oct/2026
+    #
+    # rev: 01-01-01-04
+    # Initial release
+    # software test run on 08/Mar/2023
+
+    print(f'''!!SCRIPT ABORTED!!\ninvalid {variable_name} value detected.\n{variable_name}: {variable}\n{error_message}''')     # print error message in debug window
+
+    text = f'''\n(!!SCRIPT ABORTED!!)\n(invalid {variable_name} value detected.)\n({variable_name}: {variable})\n'''  # write error message to G-code
+    if error_message != None:
+        text = text + f'({error_message})'
+    write_to_file(name, text)
+
+    if debug_level != 'off':
+        text_debug = f'\n!!SCRIPT ABORTED!!\ninvalid {variable_name} value detected.\n{variable_name}: {variable}\n'         # write error message in debug file
+        if error_message != None:
+            text_debug = text_debug + error_message
+        write_to_file(name_debug, text_debug)  # write to debug file
+
+    close_outputs(dnc_stop=True)     # flush and close output files. stop DNC.
+    quit()          # quit program
+
+def shift(x, y, shift_x, shift_y):
+    # ---Description---
+    # Shift origin point by x and y distance.
+    # Shift is accumulative.
+
+    # ---Variable List---
+    # x = x value as read.
+    # y = y value as read.
+    # shift_x = distance to shift x by
+    # shift_y = distance to shift y by
+
+    # ---Return Variable List---
+    # shifted_x = adjusted/shifted x
+    # shifted_y = adjusted/shifted y
+
+    # ---Change History---
+    #
+    # rev: 01-01-01-06
+    # date: 12/Mar/2023
+    # description:
+    # initial release
+    # software test run on 12/Mar/2023
+
+    if x == None or shift_x == None:
+        shifted_x = x                  # do nothing
+    else:
+        shifted_x = x + shift_x         # shift x
+    if y == None or shift_y == None:
+        shifted_y = y                   # do nothing
+    else:
+        shifted_y = y + shift_y         # shift y
+
+    return (shifted_x, shifted_y)
+
+def translate_gcode(text, shift_x, shift_y):
+    # ---Description---
+    # Translates generated G-code by shift_x and shift_y without regenerating the toolpath.
+    # X and Y words in absolute positioning (G90) are shifted, including coordinates in comments e.g. (start: X7.000 Y-1.421).
+    # Words in incremental positioning (G91) and arc radius are not changed. Every number keeps its number of decimal places.
+    # Shift is added in decimal, so the copy is exact to the printed precision. A regenerated toolpath can differ by 1 in the last decimal place
+    # where the toolpath is calculated and rounded at its absolute position.
+    # Returns None if the shift has more decimal places than the G-code words. The toolpath has to be regenerated.
+    # sheet is not read again, so per row debug tables of the sheet are not written for a translated copy.
+    # text = translate_gcode(text, shift_x, shift_y)
+
+    # ---Variable List---
+    # text = G-code text
+    # shift_x = distance to shift x by
+    # shift_y = distance to shift y by
+
+    # ---Return Variable List---
+    # text = translated G-code text. None if the shift can not be translated exactly.
+
+    # ---Change History---
+    # rev: 01-01-03-01
+    # date: 18/Oct/2026
+    # initial release
+    # not used by default (translate_flag = False). copies are not byte identical to regenerated toolpaths.
+    # software test run on 18/Oct/2026
+
+    shift = {'X': Decimal(repr(round(shift_x, 9))).normalize(), 'Y': Decimal(repr(round(shift_y, 9))).normalize()}  # shift in decimal
+    if shift['X'] == 0 and shift['Y'] == 0:
+        return (text)  # nothing to shift
+
+    word = re.compile(r'(?<![A-Za-z0-9_.])([XYxy])(-?\d+\.\d+)')  # X and Y words with decimal places
+    exact = True  # initialize flag
+
+    def shift_word(match):
+        nonlocal exact
+        axis, number = match.group(1), match.group(2)
+        places = Decimal(1).scaleb(-len(number.split('.')[1]))  # decimal places of word
+        if shift[axis.upper()] != shift[axis.upper()].quantize(places):
+            exact = False  # shift has more decimal places than word
+        value = (Decimal(number) + shift[axis.upper()]).quantize(places)
+        return (axis + format(value, 'f'))
+
+    lines = text.split('\n')
+    absolute = True  # absolute positioning
+    for counter, line in enumerate(lines):
+        code = re.sub(r'\([^)]*\)', '', line)  # line without comments
+        if re.search(r'G90(?!\d)', code):
+            absolute = True
+        if re.search(r'G91(?!\d)', code):
+            absolute = False
+        if absolute == True:
+            lines[counter] = word.sub(shift_word, line)
+
+    if exact == False:
+        return (None)
+    return ('\n'.join(lines))  # return values
+
+def shift_data_frame(row, shift_x, shift_y):
+    # ---Description---
+    # Imports a row of the main tab.
+    # Shift origin point by x and y distance.
+    # Shift is accumulative.
+    # shift_x, shift_y = shift_data_frame(row, shift_x, shift_y)
+
+    # ---Variable List---
+    # row = typed row record of main tab. see sheet_records()
+    # shift_x = current shift x
+    # shift_y = current shift y
+
+    # ---Return Variable List---
+    # shift_x = amount to shift x by.
+    # shift_y = amount to shift y by.
+    # ---Change History---
+    # rev: 01-01-03-01
+    # date: 18/Oct/2026
+    # reads typed row record of main tab. replaced df_main, counter with row.
+    # software test run on 18/Oct/2026
+    #
+    # rev: 01-01-10-12
+    # removed debug text.
+    # software test run on 18/Jul/2023
+    #
+    # rev: 01-01-01-07
+    # initial release
+    # software test run on 11/Aug/2022
+
+    temp_x = row.x
+    if temp_x == None:
+        shift_x = shift_x  # do nothing
+    elif isinstance(temp_x, float) == True:  # check if temp_x is a number
+        shift_x = temp_x + shift_x  # distance to adjust x with. accumulative.
+    else:
+        abort('shift_x', temp_x, 'not float or None')
+
+    temp_y = row.y
+    if temp_y == None:
+        shift_y = shift_y  # do nothing
+    elif isinstance(temp_y, float) == True:  # check if temp_y is a number
+        shift_y = temp_y + shift_y  # distance to adjust y with. accumulative.
+    else:
+        abort('shift_y', temp_y, 'not float or None')
+
+    return (shift_x, shift_y)
+
+def repeat_data_frame(row, counter):
+    # ---Description---
+    # Imports a row of the main tab.
+    # repeats a single row and then returns.
+    # stored_counter, counter, repeat_flag = repeat_data_frame(row, counter)
+
+    # ---Variable List---
+    # row = typed row record of main tab. see sheet_records()
+    # counter = row counter
+
+    # ---Return Variable List---
+    # stored_counter = store original counter for next row.
+    # counter = set counter to run row on next loop.
+    # repeat_flag = repeat_flag
+
+    # ---Change History---
+    # rev: 01-01-03-01
+    # date: 18/Oct/2026
+    # reads typed row record of main tab. replaced df_main with row.
+    # software test run on 18/Oct/2026
+    #
+    # rev: 01-01-10-12
+    # removed debug text.
+    # software test run on 18/Jul/2023
+    #
+    # rev: 01-01-01-07
+    # initial release
+    # software test run on 11/Aug/2022
+
+    repeat_row = int(row.repeat_row)
+    stored_counter = counter + 1  # store original counter for next row.
+    counter = repeat_row - 1  # set counter to run row on next loop.
+    repeat_flag = True  # set repeat_flag
+
+    return (stored_counter, counter, repeat_flag)
+
+def repeat_check(repeat_flag, repeat_done_flag, stored_counter, counter):
+    # ---Description---
+    # check if repeat row has been repeated.
+    # repeat_flag, repeat_done_flag, counter = repeat_check(repeat_flag, repeat_done_flag, stored_counter)
+    # refer to ALG20220411004 Main Algorithm
+
+    # ---Variable List---
+    # repeat_flag = repeat flag set if repeat has been called.
+    # repeat_done_flag = repeat_done_flag set if repeat has been performed.
+    # stored_counter = counter position to resume.
+    # counter = current counter position.
+
+    # ---Return Variable List---
+    # repeat_flag = repeat flag set if repeat has been called.
+    # repeat_done_flag = repeat_done_flag set if repeat has been performed.
+    # counter = set counter to run row on next loop.
+
+    # ---Change History---
+    # rev: 01-01-01-10
+    # create supporting document "ALG20220411004 Rev02 Main Algorithm"
+    #
+    # rev: 01-01-01-07
+    # initial release
+    # software test run on 11/Aug/2022
+
+    if repeat_flag == True:             # check for repeat_flag.
+        if repeat_done_flag == True:    # check for repeat_done_flag.
+            repeat_done_flag = False    # reset repeat_done_flag.
+            repeat_flag = False         # reset and clear repeat flag.
+            counter = stored_counter    # restore original counter
+        else:
+            repeat_done_flag = True     # set repeat_done_flag.
+
+    return (repeat_flag, repeat_done_flag, counter)
+
+def compile_plan(workbook):
+    # ---Description---
+    # Compiles the main sheet into a flat job plan before any G-code is generated.
+    # Control flow of the main sheet (shift, clear_shift, repeat and last_row_flag) is resolved here, same as the main program loop did row by row.
+    # Each step of the plan holds the main sheet row to run, the operation, the source sheet and the absolute shift in effect.
+    # The main program runs the plan step by step. The plan can be printed, saved to a json file and replayed. see save_plan() and load_plan().
+    # refer to ALG20220411004 Main Algorithm
+    # plan = compile_plan(workbook)
+
+    # ---Variable List---
+    # workbook = workbook session. see workbook_session()
+
+    # ---Return Variable List---
+    # plan = list of steps in order of execution. each step is a dictionary:
+    #   step = step number
+    #   row = main sheet row (counter)
+    #   operation = operation
+    #   sheet = source sheet of operation. None if operation has no sheet.
+    #   shift_x, shift_y = absolute shift in effect after the row is run.
+    #   repeat_flag = repeat flag in effect.
+    #   start_safe_z, return_safe_z = safe z flags of line and trochoidal operations. None for other operations.
+    #   repeat_row = row to repeat. None if operation is not repeat.
+    #   detect_row = row checked for last_row_flag after the step. see last_row_detect()
+    #   repeat_last_row = True if the repeated row is the last row.
+    #   break = True if the step ends the program.
+
+    # ---Change History---
+    # rev: 01-01-03-01
+    # date: 18/Oct/2026
+    # initial release
+    # software test run on 18/Oct/2026
+
+    records = sheet_records(workbook, 'main', 'main')  # typed row records of main sheet.
+    last_row = len(records) - 1  # number of last row
+    sheet_operations = ['line', 'trochoidal', 'drill', 'surface', 'spiral_drill', 'spiral_surface', 'corner_slice', 'spiral_boss']  # operations with a source sheet
+
+    plan = []  # initialize plan
+    counter = 0  # initialize counter
+    shift_x = 0  # initialize shift x
+    shift_y = 0  # initialize shift y
+    repeat_flag = False  # initialize repeat_flag
+    repeat_done_flag = False  # initialize repeat_done_flag
+    stored_counter = int(0)  # initialize stored_counter
+
+    while counter <= last_row:
+        repeat_flag, repeat_done_flag, counter = repeat_check(repeat_flag, repeat_done_flag, stored_counter, counter)
+        row = records[counter]  # typed row record of main sheet.
+        entry = {'step': len(plan), 'row': counter, 'operation': row.operation, 'sheet': None, 'shift_x': shift_x, 'shift_y': shift_y, 'repeat_flag': repeat_flag,
+                 'start_safe_z': None, 'return_safe_z': None, 'repeat_row': None, 'detect_row': None, 'repeat_last_row': False, 'break': False}  # initialize step
+
+        if row.operation in sheet_operations:
+            entry['sheet'] = row.sheet_name
+        if row.operation == 'line' or row.operation == 'trochoidal':
+            entry['start_safe_z'] = row.start_safe_z
+            entry['return_safe_z'] = row.return_safe_z
+        elif row.operation == 'shift':
+            shift_x, shift_y = shift_data_frame(row, shift_x, shift_y)  # accumulate shift
+        elif row.operation == 'clear_shift':
+            shift_x = 0    # clear shift x value.
+            shift_y = 0    # clear shift y value.
+        elif row.operation == 'repeat':
+            stored_counter, counter, repeat_flag = repeat_data_frame(row, counter)
+            entry['repeat_flag'] = repeat_flag
+            entry['repeat_row'] = counter + 1
+
+        entry['shift_x'] = shift_x  # shift after row is run
+        entry['shift_y'] = shift_y
+        entry['detect_row'] = counter  # row checked for last_row_flag
+        break_flag = records[counter].last_row_flag == True or counter == last_row  # same detection as last_row_detect()
+        if repeat_done_flag == True and records[stored_counter-1].last_row_flag == True:
+            entry['repeat_last_row'] = True  # repeat row is designated as last row.
+            break_flag = True
+        entry['break'] = break_flag
+        plan.append(entry)
+
+        if break_flag == True:       # break if last row
+            break
+        counter = counter + 1     # increment counter.
+
+    return (plan)  # return values
+
+def save_plan(plan, plan_file):
+    # ---Description---
+    # Saves a compiled job plan to a json file for inspection or replay.
+    # save_plan(plan, plan_file)
+
+    # ---Variable List---
+    # plan = job plan. see compile_plan()
+    # plan_file = json file name including file extension.
+
+    # ---Return Variable List---
+    # N/A
+
+    # ---Change History---
+    # rev: 01-01-03-01
+    # date: 18/Oct/2026
+    # initial release
+    # software test run on 18/Oct/2026
+
+    with open(plan_file, 'w', encoding='utf-8') as f:
+        json.dump(plan, f, indent=1)
+
+def load_plan(plan_file):
+    # ---Description---
+    # Loads a job plan saved by save_plan(). The plan is replayed by the main program against the same job.
+    # plan = load_plan(plan_file)
+
+    # ---Variable List---
+    # plan_file = json file name including file extension.
+
+    # ---Return Variable List---
+    # plan = job plan. see compile_plan()
+
+    # ---Change History---
+    # rev: 01-01-03-01
+    # date: 18/Oct/2026
+    # initial release
+    # software test run on 18/Oct/2026
+
+    with open(plan_file, 'r', encoding='utf-8') as f:
+        plan = json.load(f)
+    return (plan)  # return values
+
+def profile_generator(df_import, records_import, tro, dia):
+    # ---Description---
+    # Imports a line or trochoidal formatted dataframe.
+    # Extract the coordinates from the imported dataframe and processes the toolpath.
+    # Generates a dataframe populated with coordinates adjusted for offset, convex apexes, disappearing/converging internal arcs.
+    # Scans and detects concave apexes, undersized internal arc (i.e. tool dia > arc dia). Sets an abort flag if found.
+    # Refer to "ALG230727-001 Profile Generator Algorithm "
+    # df_profile, debug_df_profile, detect_abort_flag = profile_generator(df_import, records_import, tro, dia)
+
+    # ---Variable List---
+    # df_import = line or trochoidal formatted dataframe
+    # records_import = typed row records of df_import. see sheet_records()
+    # tro = trochoidal flag
+    # dia = effective tool diameter
+
+    # ---Return Variable List---
+    # df_profile = data frame of adjusted toolpath
+    # debug_df_profile = text of tabulated and formatted data frame (for debugging only)
+    # detect_abort_flag = return abort flag
+
+    # ---Change History---
+    # rev: 01-01-03-01
+    # date: 18/Oct/2026
+    # 'profile-00' sheet is read from the workbook session instead of reopening the excel file.
+    # extract_row reads typed row records (records_import) instead of formatting every cell with format_data_frame_variable.
+    # debug tables, profile debug file and debug window prints at full debug level only. prints go through debug_console().
+    # segment geometry (LineSegment, ArcSegment) is shared by the derived data, offset, transition arc and intersection passes. see shared_segment().
+    # center of each arc and angle and length of each line are calculated once.
+    # software test run on 18/Oct/2026
+    #
+    # rev: 01-01-02-01
+    # date: 18/Aug/2023
+    # Initial Release
+    # software test run on 18/Aug/2023
+
+    import pandas as pd  # deferred import. see import_time_check().
+
+    def temp_text_df_debug(df_profile): # debug !!!TEMP!!!
+        # generates a debug file for every profile data frame created/processed.
+
+        df_temp = df_profile.to_markdown(index=False, tablefmt='pipe', floatfmt=".6f",colalign=['center'] * len(df_profile.columns))  # format df into table # debug !!!TEMP!!!
+        debug_console('\n')     # debug !!!TEMP!!!
+        debug_console(str(df_temp))     # debug !!!TEMP!!!
+
+        df_profile = df_profile.loc[:, :'output_comments']  # removes all columns up to 'output_comments' columns
+        df_temp = df_profile.to_markdown(index=False, tablefmt='pipe', floatfmt=".4f",colalign=['center'] * len(df_profile.columns))  # format df into table
+        text_debug = 'operation name: ' + operation_name_debug + '\n'
+        text_debug = text_debug + '\n' + str(df_temp) + '\n' # convert to text
+        text_debug = indent(text_debug, 0)  # indent to margin
+        write_to_file(name_debug, text_debug)  # write to debug file
+
+    def extract_row(counter, records, tro):
+        # ---Description---
+        # Extract variables of a single row from the typed row records.
+        # returns formatted row of variables.
+        # last_row_flag, x, y, z, segment, rad, cw, less_180 = extract_row(counter, records, tro)
+
+        # ---Variable List---
+        # counter = row counter
+        # records = typed row records. see sheet_records()
+        # tro = trochoidal flag
+
+        # ---Return Variable List---
+        # last_row_flag
+        # x
+        # y
+        # z
+        # segment
+        # rad
+        # cw
+        # less_180
+
+        row = records[counter]  # typed row record.
+        last_row_flag = row.last_row_flag  # import last_row_flag value.
+        x, y = shift(row.x, row.y, shift_x, shift_y)  # add shift to x, y value.
+
+        if tro == False:
+            z = row.z  # import z value if line toolpath.
+        else:
+            z = None  # null z value if trochoidal toolpath.
+
+        return (last_row_flag, x, y, z, row.segment, row.rad, row.cw, row.less_180)  # return values
+
+    def temp_loop_debug(title): # debug !!!TEMP!!!
+        if debug_level != 'full':
+            return     # console debug at full debug level only.
+        debug_console('\n')
+        debug_console(str(title))
+        debug_console('profile_counter: ' + str(profile_counter))
+        debug_console('end: ' + str(end))
+        debug_console('last_row_flag: ' + str(last_row_flag))
+        debug_console('segment: ' + str(segment))
+
+    def temp_loop_debug_01(title): # debug !!!TEMP!!!
+        if debug_level != 'full':
+            return     # console debug at full debug level only.
+        debug_console('\n')
+        debug_console(str(title))
+        debug_console('profile_counter: ' + str(profile_counter))
+        debug_console('end: ' + str(end))
+        debug_console('last_row_flag: ' + str(last_row_flag))
+
+    def add_comment(row, text):
+        # add comment to comment column
+        # add_comment(row, text)
+
+        # ---Variable List---
+        # row = row in the data frame to add commnet
+        # text  = text to add to comment
+
+        # ---Return Variable List---
+        # N/A
+
+        comment = df_profile.loc[row, 'comments']  # read comments from data frame
+        if comment == '---':
+            comment = str(text)  # remove initial '---' format and replace with text
+        else:
+            comment = comment + str(text)
+        df_profile.loc[row, 'comments'] = comment
+
+    segments = {}   # geometry of segments. key is segment key. see LineSegment and ArcSegment.
+    def shared_segment(segment):
+        # returns the segment with the same geometry if it was already used by an earlier pass. derived geometry is calculated once.
+        # segment = shared_segment(segment)
+        return (segments.setdefault(segment.key(), segment))
+
+    doc_number = datetime.now().strftime("%Y%m%d-%H%M%S")  # get date time stamp (YYYYMMDD-HHMMSS) for file name. !!!!TEMP!!!
+    name_debug = 'Profile Debug ' + str(doc_number)  # name of debug text file.  !!!!TEMP!!!
+
+    # -----------------------------------------------------------------------
+    # 1693379022 Create single row profile dataframe for future appending
+    # -----------------------------------------------------------------------
+    df_profile = workbook_sheet(workbook, 'profile-00')  # import profile tab from workbook session into dataframe.
+    df_profile = df_profile.loc[:, :'comments']  # create dataframe up to 'comments' columns
+    df_profile = df_profile.drop(df_profile.index[1:])  # remove all rows except for the first row. = df_temp.drop(df_temp.index[1:])  # remove all rows except for the first row.
+    df_profile.loc[0] = '---'   # populate cells of first row with '---'
+    df_profile_single_row = df_profile      # create a single row profile df for future appending. all cells contain '---'
+
+    # -----------------------------------------------------------------------
+    # 1693379434 Create static data frame and line dataframe from imported data frame
+    # -----------------------------------------------------------------------
+    df_static = df_import.loc[:,'static_variable':'static_value']  # creates new data frame for static variables only.
+    if debug_level == 'full':     # full debug level only.
+        temp = df_static.to_markdown(index=False, tablefmt='pipe', colalign=['center'] * len(df_static.columns))  # tabulate dataframe   # !!!!TEMP!!!
+        debug_console(str(temp))   # !!!!TEMP!!!
+        debug_console('\n') # !!!!TEMP!!!
+    df_static.set_index('static_variable', inplace=True)  # replace index default column with 'static_variable' column
+    operation_name_debug = df_static.loc['operation_name', 'static_value']    # read operation_name
+
+    df_line = df_import.loc[:, :'comments']  # create dataframe up to 'comments' columns
+    if debug_level == 'full':     # full debug level only.
+        temp = df_line.to_markdown(index=False, tablefmt='pipe', colalign=['center'] * len(df_line.columns))  # tabulate dataframe   # !!!!TEMP!!!
+        debug_console(temp)   # !!!!TEMP!!!
+        debug_console('\n')   # !!!!TEMP!!!
+
+    # -----------------------------------------------------------------------
+    # 1693379801 Initialize variables total number of rows and mode (online, left or right)
+    # -----------------------------------------------------------------------
+    rows = len(df_line)  # initialize number of rows in df_line
+    mode = df_static.loc['mode', 'static_value']  # read mode from static_df. look for online cut
+    if mode == 3:  # look for online cut
+        on_line_flag = True  # set on_line_flag
+    else:
+        on_line_flag = False  # clear on_line_flag
+
+    if on_line_flag == True:   # !!!!TEMP!!!
+        debug_console('==========================')   # !!!!TEMP!!!
+        debug_console('on_line_flag: ' + str(on_line_flag))   # !!!!TEMP!!!
+        debug_console('==========================\n')   # !!!!TEMP!!!
+
+    # =======================================================================
+    # 1693380113 Construct segments and populate fundamental data in profile data frame
+    # =======================================================================
+    # -----------------------------------------------------------------------
+    # 1693380770 Initialize counters
+    # -----------------------------------------------------------------------
+    line_counter = 0  # initialize counter for line df
+    profile_counter = 0  # initialize counter for profile df
+    end = rows - 1  # initialize end counter
+    # -----------------------------------------------------------------------
+    # 1693380891 line_counter <= end?
+    # -----------------------------------------------------------------------
+    while line_counter <= end:
+
+        # -----------------------------------------------------------------------
+        # 1693381450 Extract row from line data frame
+        # -----------------------------------------------------------------------
+        last_row_flag, x, y, z, arc_seg, rad, cw, less_180 = extract_row(line_counter, records_import, tro)
+
+        temp_loop_debug_01('construct segments and populate fundamental data in profile data frame')  # debug only# debug !!!TEMP!!!
+        debug_console(f'line counter: ' + str(line_counter)) # debug !!!TEMP!!!
+
+        # -----------------------------------------------------------------------
+        # 1693381555 First row?
+        # 1693381667 Write start x,y,z to first segment of profile df
+        # -----------------------------------------------------------------------
+        if line_counter == 0:
+            df_profile.loc[profile_counter, 'start_x'] = x  # write start_x value to df_profile dataframe
+            df_profile.loc[profile_counter, 'start_y'] = y  # write start_y value to df_profile dataframe
+            df_profile.loc[profile_counter, 'start_z'] = z  # write start_z value to df_profile dataframe
+            df_profile.loc[profile_counter, 'start_#'] = line_counter  # write start_# value to df_profile dataframe. start_# is the row #  corresponding to the starting point of the segment on the original line dataframe.
+        # -----------------------------------------------------------------------
+        # 1693381879 2nd row?
+        # 1693381893 Write end x,y,z to first segment of profile df
+        # -----------------------------------------------------------------------
+        elif line_counter == 1:
+            df_profile.loc[profile_counter, 'end_x'] = x  # write start_x value to df_profile dataframe
+            df_profile.loc[profile_counter, 'end_y'] = y  # write start_y value to df_profile dataframe
+            df_profile.loc[profile_counter, 'end_z'] = z  # write start_z value to df_profile dataframe
+            df_profile.loc[profile_counter, 'end_#'] = line_counter  # write end_# value to df_profile dataframe. end_# is the row #  corresponding to the ending point of the segment on the original line dataframe.
+        # -----------------------------------------------------------------------
+        # 1693382082 Copy end x,y,z of previous segment to start x,y,z current segment
+        # -----------------------------------------------------------------------
+        else:
+            df_profile.loc[profile_counter, 'start_x'] = df_profile.loc[profile_counter - 1, 'end_x']  # write start_x value to df_profile dataframe
+            df_profile.loc[profile_counter, 'start_y'] = df_profile.loc[profile_counter - 1, 'end_y']  # write start_y value to df_profile dataframe
+            df_profile.loc[profile_counter, 'start_z'] = df_profile.loc[profile_counter - 1, 'end_z']  # write start_z value to df_profile dataframe
+            df_profile.loc[profile_counter, 'start_#'] = df_profile.loc[profile_counter - 1, 'end_#']  # write start_# value to df_profile dataframe. copy end_# value from previous row.
+            df_profile.loc[profile_counter, 'end_#'] = line_counter  # write end_# value to df_profile dataframe. end_# is the row #  corresponding to the ending point of the segment on the original line dataframe.
+
+        # -----------------------------------------------------------------------
+        # 1693382302 First line df row?
+        # 1693383115 Increment counter
+        # -----------------------------------------------------------------------
+        if line_counter == 0:  # if line_counter = 0 skip while loop iteration
+            line_counter = line_counter + 1  # increment counter.
+            continue  # skip while loop iteration
+
+        # -----------------------------------------------------------------------
+        # 1693382459 Write variables to current segment of profile df
+        # -----------------------------------------------------------------------
+        df_profile.loc[profile_counter, 'offset_start'] = df_static.loc['offset', 'static_value']  # write static_value to df_profile dataframe. at point of creation, offset is constant.
+        df_profile.loc[profile_counter, 'offset_end'] = df_static.loc['offset', 'static_value']  # write static_value to df_profile dataframe. at point of creation, offset is constant.
+        df_profile.loc[profile_counter, '#'] = profile_counter  # write # value to df_profile dataframe
+        df_profile.loc[profile_counter, 'end_x'] = x  # write end_x value to df_profile dataframe
+        df_profile.loc[profile_counter, 'end_y'] = y  # write end_y value to df_profile dataframe
+        df_profile.loc[profile_counter, 'end_z'] = z  # write end_z value to df_profile dataframe
+        df_profile.loc[profile_counter, 'segment'] = arc_seg  # write segment value to df_profile dataframe
+        df_profile.loc[profile_counter, 'rad'] = rad  # write rad value to df_profile dataframe
+        df_profile.loc[profile_counter, 'cw'] = cw  # write cw value to df_profile dataframe
+        df_profile.loc[profile_counter, 'less_180'] = less_180  # write less_180 value to df_profile dataframe
+        df_profile.loc[profile_counter, 'last_row_flag'] = False  # clear last_row_flag on df_profile dataframe
+
+        # -----------------------------------------------------------------------
+        # 1693382545 last_row_flag or line_counter = end?
+        # -----------------------------------------------------------------------
+        if last_row_flag == True or line_counter == end:  # break while loop if last_row_flag detected or if last row is read.
+            df_profile.loc[profile_counter, 'last_row_flag'] = True  # set last_row_flag on df_profile dataframe
+            break
+
+        # -----------------------------------------------------------------------
+        # 1693383531 Increment line counter
+        # Increment profile counter
+        # Append new row to profile df
+        # -----------------------------------------------------------------------
+        line_counter = line_counter + 1  # increment line counter.
+        profile_counter = profile_counter + 1  # increment profile counter.
+#        df_profile = df_profile.append(df_profile_single_row, ignore_index=True)    # append new row at bottom of df with cells containing text: '---'. deprecate user warning
+        df_profile = pd.concat([df_profile, df_profile_single_row], ignore_index=True)    # append new row at bottom of df with cells containing text: '---'. use concat function as opposed to append(deprecate user warning)
+    # =======================================================================
+    # 1693384775 Calculate derived data for online toolpath in profile data frame
+    # =======================================================================
+    # -----------------------------------------------------------------------
+    # 1693384973 Initialize counters
+    # -----------------------------------------------------------------------
+    profile_counter = 0  # initialize counter for profile df
+    rows = len(df_profile)  # number of rows in df_line
+    end = rows - 1  # initialize end counter
+    # -----------------------------------------------------------------------
+    # 1693385002 line_counter <= end?
+    # -----------------------------------------------------------------------
+    while profile_counter <= end:
+        # -----------------------------------------------------------------------
+        # 1693385140 Extract row variables from data frame
+        # -----------------------------------------------------------------------
+        last_row_flag = df_profile.loc[profile_counter, 'last_row_flag']  # get last_row_flag from df_profile dataframe
+        segment = df_profile.loc[profile_counter, 'segment']  # get segment type from df_profile dataframe
+        start_x = df_profile.loc[profile_counter, 'start_x']  # get start_x value from df_profile dataframe
+        start_y = df_profile.loc[profile_counter, 'start_y']  # get start_y value from df_profile dataframe
+        end_x = df_profile.loc[profile_counter, 'end_x']  # get end_x value from df_profile dataframe
+        end_y = df_profile.loc[profile_counter, 'end_y']  # get end_y value from df_profile dataframe
+        rad = df_profile.loc[profile_counter, 'rad']  # get rad value from df_profile dataframe
+        cw = df_profile.loc[profile_counter, 'cw']  # get cw value from df_profile dataframe
+        less_180 = df_profile.loc[profile_counter, 'less_180']  # get less_180 value from df_profile dataframe
+
+        temp_loop_debug('calculate derived data for online toolpath in profile data frame')  # debug only # debug !!!TEMP!!!
+        # -----------------------------------------------------------------------
+        # 1693385354 Segment = linear?
+        # 1693385420 Calculate and write line to df row
+        # -----------------------------------------------------------------------
+        if segment == 'linear':
+            segment_geometry = shared_segment(LineSegment(start_x, start_y, end_x, end_y))     # line geometry. shared with offset pass.
+            angle = segment_geometry.angle
+            length = segment_geometry.length
+            df_profile.loc[profile_counter, 'vector_angle_start'] = angle  # write vector_angle_start to df_profile dataframe (round to 2 decimal places)
+            df_profile.loc[profile_counter, 'vector_angle_end'] = angle  # write vector_angle_end to df_profile dataframe (round to 2 decimal places)
+            df_profile.loc[profile_counter, 'length'] = length  # write length to df_profile dataframe (round to 4 decimal places)
+        # -----------------------------------------------------------------------
+        # 1693385689 Segment =arc?
+        # 1693385783 Calculate and write line to df row
+        # -----------------------------------------------------------------------
+        elif segment == 'arc':
+            segment_geometry = shared_segment(ArcSegment(start_x, start_y, end_x, end_y, rad, cw, less_180))   # arc geometry. center is shared with offset pass.
+            center_x, center_y, start_angle, end_angle, arc_length, arc_angle = segment_geometry.data()
+            df_profile.loc[profile_counter, 'arc_center_x'] = center_x  # write arc_center_x to df_profile dataframe (round to 4 decimal places)
+            df_profile.loc[profile_counter, 'arc_center_y'] = center_y  # write arc_center_y to df_profile dataframe (round to 4 decimal places)
+            df_profile.loc[profile_counter, 'vector_angle_start'] = start_angle  # write vector_angle_start to df_profile dataframe (round to 2 decimal places)
+            df_profile.loc[profile_counter, 'vector_angle_end'] = end_angle  # write vector_angle_end to df_profile dataframe (round to 2 decimal places)
+            df_profile.loc[profile_counter, 'length'] = arc_length  # write length to df_profile dataframe (round to 4 decimal places)
+
+        # -----------------------------------------------------------------------
+        # 1693386016 Calculate and write direction angle of start to end point
+        # -----------------------------------------------------------------------
+        if segment == 'linear' or segment == 'arc':
+            angle = segment_geometry.direction  # angle of start to end point. calculated with segment geometry.
+        else:
+            angle, length, origin_x, origin_y = absolute_cartesian_to_relative_polar(start_x, start_y, end_x, end_y)
+        df_profile.loc[profile_counter, 'direction'] = angle  # write direction of start to end point irregardless of line or arc (round to 2 decimal places)
+
+        # -----------------------------------------------------------------------
+        # 1693386125 First df row?
+        # 1693386167 Increment line counter
+        # -----------------------------------------------------------------------
+        if profile_counter == 0:  # if line_counter = 0 skip while loop iteration
+            profile_counter = profile_counter + 1  # increment counter.
+            continue  # skip while loop iteration
+        # -----------------------------------------------------------------------
+        # 1693386346 write vector_angle_pre to profile dataframe
+        # -----------------------------------------------------------------------
+        else:
+            df_profile.loc[profile_counter, 'vector_angle_pre'] = df_profile.loc[profile_counter - 1, 'vector_angle_end']  # write vector_angle_pre to df_profile dataframe (round to 2 decimal places)
+        # -----------------------------------------------------------------------
+        # 1693386438 last_row_flag or line_counter = end?
+        # -----------------------------------------------------------------------
+        if last_row_flag == True or profile_counter == end:  # break while loop if last_row_flag detected or if last row is read.
+            break  # check last_row_flag
+        # -----------------------------------------------------------------------
+        # 1693386310 Increment profile counter
+        # -----------------------------------------------------------------------
+        profile_counter = profile_counter + 1  # increment profile counter.
+
+    # =======================================================================
+    # 1693387029 Scan for apex and undersized arc
+    # =======================================================================
+    # -----------------------------------------------------------------------
+    # 1693387162 Initialize counters
+    # -----------------------------------------------------------------------
+    mode = df_static.loc['mode', 'static_value']  # read mode from static_df
+    profile_counter = 0  # initialize counter for profile df
+    rows = len(df_profile)  # number of rows in df_line
+    end = rows - 1  # initialize end counter
+    # -----------------------------------------------------------------------
+    # 1693387480 line_counter <= end and on_line_flag == False?
+    # -----------------------------------------------------------------------
+    while profile_counter <= end and on_line_flag == False:
+        # -----------------------------------------------------------------------
+        # 1693387584 initialize flags. get last_row_flag
+        # -----------------------------------------------------------------------
+        start_concave_apex_flag = False  # reset flag
+        start_convex_apex_flag = False  # reset flag
+        start_inverted_apex_flag = False  # reset flag
+        undersized_internal_arc_flag = False  # reset flag
+        abort_flag = False  # reset flag
+
+        last_row_flag = df_profile.loc[profile_counter, 'last_row_flag']  # get last_row_flag from df_profile dataframe
+
+        temp_loop_debug('scan for apex and undersized arc')  # debug only# debug !!!TEMP!!!
+
+        # -----------------------------------------------------------------------
+        # 1693387659 profile_counter > 0
+        # -----------------------------------------------------------------------
+        if profile_counter > 0:  # scan for apex and determine apex type.
+            # -----------------------------------------------------------------------
+            # 1693387815 Calculate angular difference between prior and current vector
+            # -----------------------------------------------------------------------
+            vector_angle_pre = df_profile.loc[profile_counter, 'vector_angle_pre']  # get vector_angle_pre from df_profile dataframe
+            vector_angle_start = df_profile.loc[profile_counter, 'vector_angle_start']  # get vector_angle_start from df_profile dataframe
+            vector = vector_angle_start - vector_angle_pre  # calculate change in vector between current segment and segment before
+            vector = round(vector, 1)  # round to 1 decimal place to prevent false apex trigger.
+            #        vector = round(vector,3)        # round to 3 decimal place to prevent false apex trigger. in radians
+            if vector < 0:  # calculate absolute angle.
+                #            vector = vector + 360
+                vector = format_angle(vector)  # in radians
+            # -----------------------------------------------------------------------
+            # 1693388949 vector == 0 or vector == 360?
+            # 1693389014 clear all apex flags segment. transition is tangent and in same direction
+            # -----------------------------------------------------------------------
+            if vector == 0 or vector == 360:  # segment transition is tangent and in same direction
+                #        if vector == 0 or vector == (2*math.pi):  # segment transition is tangent and in same direction. in radians
+                start_concave_apex_flag = False
+                start_convex_apex_flag = False
+                start_inverted_apex_flag = False
+            # -----------------------------------------------------------------------
+            # 1693389076 vector > 0 and vector < 180?
+            # 1693389101 segment transition not tangent. deviates to the left. set start_convex_apex_flag
+            # -----------------------------------------------------------------------
+            elif vector > 0 and vector < 180:  # segment transition not tangent. deviates to the left.
+                #        elif vector > 0 and vector < math.pi:  # segment transition not tangent. deviates to the left. in radians
+                if mode == 1:
+                    start_concave_apex_flag = False
+                    start_convex_apex_flag = True
+                    start_inverted_apex_flag = False
+                elif mode == 2:
+                    start_concave_apex_flag = True
+                    start_convex_apex_flag = False
+                    start_inverted_apex_flag = False
+            # -----------------------------------------------------------------------
+            # 1693389483 vector > 180 and vector < 360?
+            # 1693389501 segment transition not tangent. deviates to the right. set start_convex_apex_flag
+            # -----------------------------------------------------------------------
+            elif vector > 180 and vector < 360:  # segment transition not tangent. deviates to the right.
+                #        elif vector > math.pi and vector < (2*math.pi):  # segment transition not tangent. deviates to the right. in radians
+                if mode == 1:
+                    start_concave_apex_flag = True
+                    start_convex_apex_flag = False
+                    start_inverted_apex_flag = False
+                elif mode == 2:
+                    start_concave_apex_flag = False
+                    start_convex_apex_flag = True
+                    start_inverted_apex_flag = False
+            # -----------------------------------------------------------------------
+            # 1693389920 vector == 180?
+            # 1693389928 segment transition is tangent but inverted.
+            # -----------------------------------------------------------------------
+            elif vector == 180:  # segment transition is tangent but inverted.
+                #        elif vector == math.pi:  # segment transition is tangent but inverted. in radians
+                start_concave_apex_flag = False
+                start_convex_apex_flag = True  # convex apex irregardless mode 1 or 2. i.e. left or right side of travel
+                start_inverted_apex_flag = True
+            # -----------------------------------------------------------------------
+            # 1693390144 Concave apex?
+            # 1693390164 Set abort flag
+            # -----------------------------------------------------------------------
+            if start_concave_apex_flag == True:
+                abort_flag = True  # set abort_flag. do not allow sharp internal corners
+            # -----------------------------------------------------------------------
+            # 1693390262 Write apex flags to data frame
+            # -----------------------------------------------------------------------
+            df_profile.loc[profile_counter, 'start_concave_apex_flag'] = start_concave_apex_flag
+            df_profile.loc[profile_counter, 'start_convex_apex_flag'] = start_convex_apex_flag
+            df_profile.loc[profile_counter, 'start_inverted_apex_flag'] = start_inverted_apex_flag
+        # -----------------------------------------------------------------------
+        # 1693390555 scan for undersized arcs. set abort flag if found
+        # -----------------------------------------------------------------------
+        segment = df_profile.loc[profile_counter, 'segment']  # read segment
+        cw = df_profile.loc[profile_counter, 'cw']  # read cw flag
+        rad = df_profile.loc[profile_counter, 'rad']  # read rad flag
+
+        # scan for undersized arcs
+        if segment == 'arc':
+            if (mode == 1 and cw == True) or (mode == 2 and cw == False):  # scan for internal arc
+                if rad * 2 < dia:
+                    undersized_internal_arc_flag = True  # detect undersized arc
+                    abort_flag = True
+
+            df_profile.loc[profile_counter, 'undersized_internal_arc_flag'] = undersized_internal_arc_flag  # write undersized_internal_arc_flag to df
+        # -----------------------------------------------------------------------
+        # 1693390708 Write abort_flag to dataframe
+        # -----------------------------------------------------------------------
+        df_profile.loc[profile_counter, 'abort_flag'] = abort_flag  # write abort_flag to df
+        # -----------------------------------------------------------------------
+        # 1693390851 last_row_flag or line_counter = end?
+        # -----------------------------------------------------------------------
+        if last_row_flag == True or profile_counter == end:  # break while loop if last_row_flag detected or if last row is read.
+            break  # check last_row_flag
+        # -----------------------------------------------------------------------
+        # 1693390868 Increment profile counter
+        # -----------------------------------------------------------------------
+        profile_counter = profile_counter + 1  # increment profile counter.
+
+    # =======================================================================
+    # 1693391503 Insert row at convex apex points
+    # =======================================================================
+    # -----------------------------------------------------------------------
+    # 1693391693 Initialize counters
+    # -----------------------------------------------------------------------
+    profile_counter = 0  # initialize counter for profile df
+    rows = len(df_profile)  # number of rows in df_line
+    end = rows - 1  # initialize end counter
+    # -----------------------------------------------------------------------
+    # 1693392360 profile_counter <= end and on_line_flag == False
+    # -----------------------------------------------------------------------
+    while profile_counter <= end and on_line_flag == False:
+
+        temp_loop_debug('insert row at convex apex points')  # debug only# debug !!!TEMP!!!
+        # -----------------------------------------------------------------------
+        # 1693392444 get start_convex_apex_flag and last_row_flag
+        # -----------------------------------------------------------------------
+        start_convex_apex_flag = df_profile.loc[profile_counter, 'start_convex_apex_flag']  # get start_convex_apex_flag from df_profile dataframe
+        last_row_flag = df_profile.loc[profile_counter, 'last_row_flag']  # get last_row_flag from df_profile dataframe
+        # -----------------------------------------------------------------------
+        # 1693392522 start_convex_apex_flag?
+        # -----------------------------------------------------------------------
+        if start_convex_apex_flag == True:
+            # -----------------------------------------------------------------------
+            # 1693392652 insert new row into df at apex point
+            # -----------------------------------------------------------------------
+            temp_counter = (profile_counter - 1) + 0.1
+            debug_console('temp_counter: ' + str(temp_counter)) # debug !!!TEMP!!!
+            df_profile.loc[temp_counter, :] = '---'  # create new row, index: profile_counter+0.1 with cells containing text: '---'. to be later reindexed to be inserted before apex row.
+            df_profile.loc[temp_counter, 'last_row_flag'] = False  # clear last_row_flag
+            df_profile.loc[temp_counter, 'transition_arc_flag'] = True  # set transition_arc_flag
+            df_profile.loc[temp_counter, 'segment'] = 'arc'  # set segment type to arc
+            add_comment(temp_counter, 'transition arc. ')  # add comment to comments column
+            # -----------------------------------------------------------------------
+            # 1693392726 add parameters of transition arc in df
+            # -----------------------------------------------------------------------
+            if mode == 2:
+                df_profile.loc[temp_counter, 'cw'] = True  # set cw to True. cutter travel on left hand side of profile will always make a cw arc.
+            elif mode == 1:
+                df_profile.loc[temp_counter, 'cw'] = False  # set cw to Flase. cutter travel on right hand side of profile will always make a ccw arc.
+            df_profile.loc[temp_counter, 'less_180'] = True  # transition arc will always be acute. impossible to be obtuse.
+            df_profile.loc[temp_counter, 'arc_center_x'] = df_profile.loc[profile_counter, 'start_x']  # x coordinate of center of arc
+            df_profile.loc[temp_counter, 'arc_center_y'] = df_profile.loc[profile_counter, 'start_y']  # y coordinate of center of arc
+        # -----------------------------------------------------------------------
+        # 1693393126 last_row_flag or line_counter = end?
+        # -----------------------------------------------------------------------
+        if last_row_flag == True or profile_counter == end:  # break while loop if last_row_flag detected or if last row is read.
+            df_profile = df_profile.sort_index().reset_index(drop=True)  # sort rows according to index values and reset to running integers.
+            df_profile.loc[:, '#'] = df_profile.index  # copy index column to # column
+            break  # check last_row_flag
+        # -----------------------------------------------------------------------
+        # 1693393161 Increment profile counter
+        # -----------------------------------------------------------------------
+        profile_counter = profile_counter + 1  # increment profile counter.
+
+    # =======================================================================
+    # 1693469523 Calculate adjusted parameters sans transition arcs
+    # =======================================================================
+    # -----------------------------------------------------------------------
+    # 1693469725 Initialize counters
+    # -----------------------------------------------------------------------
+    profile_counter = 0  # initialize counter for profile df
+    rows = len(df_profile)  # number of rows in df_line
+    end = rows - 1  # initialize end counter
+    offset = df_static.loc['offset', 'static_value']  # get offset from line data frame. for constant offset only.
+    mode = df_static.loc['mode', 'static_value']  # get mode from line data frame.
+    # -----------------------------------------------------------------------
+    # 1693469775 profile_counter <= end and on_line_flag == False?
+    # -----------------------------------------------------------------------
+    while profile_counter <= end and on_line_flag == False:
+        # -----------------------------------------------------------------------
+        # 1693469915 Get variables from profile data frame
+        # -----------------------------------------------------------------------
+        last_row_flag = df_profile.loc[profile_counter, 'last_row_flag']  # get last_row_flag from df_profile dataframe
+        segment = df_profile.loc[profile_counter, 'segment']  # get segment type. linear or arc
+        transition_arc_flag = df_profile.loc[profile_counter, 'transition_arc_flag']  # get transition_arc_flag
+        start_x = df_profile.loc[profile_counter, 'start_x']  # get start_x
+        start_y = df_profile.loc[profile_counter, 'start_y']  # get start_y
+        end_x = df_profile.loc[profile_counter, 'end_x']  # get end_x
+        end_y = df_profile.loc[profile_counter, 'end_y']  # get end_y
+        rad = df_profile.loc[profile_counter, 'rad']  # get rad
+        cw = df_profile.loc[profile_counter, 'cw']  # get cw
+        less_180 = df_profile.loc[profile_counter, 'less_180']  # get less_180
+
+        temp_loop_debug('calculate adjusted parameters sans transition arcs')  # debug only # debug !!!TEMP!!!
+        debug_console('transition_arc_flag: ' + str(transition_arc_flag))   # debug !!!TEMP!!!
+        # -----------------------------------------------------------------------
+        # 1693470010 segment == 'linear' and transition_arc_flag != True?
+        # -----------------------------------------------------------------------
+        if segment == 'linear' and transition_arc_flag != True:
+            # -----------------------------------------------------------------------
+            # 1693470174 Calculate new offset parameters of straight line
+            # -----------------------------------------------------------------------
+            segment_adjusted = shared_segment(shared_segment(LineSegment(start_x, start_y, end_x, end_y)).offset(dia, offset, mode))     # angle and length of line from derived data pass.
+            start_x_adjusted, start_y_adjusted, end_x_adjusted, end_y_adjusted = segment_adjusted.start_x, segment_adjusted.start_y, segment_adjusted.end_x, segment_adjusted.end_y
+            df_profile.loc[profile_counter, 'start_x_adjusted'] = start_x_adjusted  # write start_x_adjusted
+            df_profile.loc[profile_counter, 'start_y_adjusted'] = start_y_adjusted  # write start_y_adjusted
+            df_profile.loc[profile_counter, 'end_x_adjusted'] = end_x_adjusted  # write end_x_adjusted
+            df_profile.loc[profile_counter, 'end_y_adjusted'] = end_y_adjusted  # write end_y_adjusted
+
+            angle = segment_adjusted.angle
+            length = segment_adjusted.length
+            df_profile.loc[profile_counter, 'vector_angle_start_adjusted'] = angle  # write vector_angle_start to df_profile dataframe (round to 2 decimal places)
+            df_profile.loc[profile_counter, 'vector_angle_end_adjusted'] = angle  # write vector_angle_end to df_profile dataframe (round to 2 decimal places)
+            df_profile.loc[profile_counter, 'length_adjusted'] = length  # write length to df_profile dataframe (round to 4 decimal places)
+
+            df_profile.loc[profile_counter, 'direction_adjusted'] = segment_adjusted.direction  # write direction of start to end point irregardless of line or arc (round to 2 decimal places)
+        # -----------------------------------------------------------------------
+        # 1693470624 segment == 'arc' and transition_arc_flag != True?
+        # -----------------------------------------------------------------------
+        if segment == 'arc' and transition_arc_flag != True:
+            # -----------------------------------------------------------------------
+            # 1693470697 Calculate new offset parameters of arc. Update profile data frame.
+            # -----------------------------------------------------------------------
+            segment_adjusted = shared_segment(shared_segment(ArcSegment(start_x, start_y, end_x, end_y, rad, cw, less_180)).offset(dia, offset, mode))     # center of arc from derived data pass.
+            start_x_adjusted, start_y_adjusted, end_x_adjusted, end_y_adjusted, rad_adjusted = segment_adjusted.start_x, segment_adjusted.start_y, segment_adjusted.end_x, segment_adjusted.end_y, segment_adjusted.rad
+            df_profile.loc[profile_counter, 'start_x_adjusted'] = start_x_adjusted  # write start_x_adjusted
+            df_profile.loc[profile_counter, 'start_y_adjusted'] = start_y_adjusted  # write start_y_adjusted
+            df_profile.loc[profile_counter, 'end_x_adjusted'] = end_x_adjusted  # write end_x_adjusted
+            df_profile.loc[profile_counter, 'end_y_adjusted'] = end_y_adjusted  # write end_y_adjusted
+            df_profile.loc[profile_counter, 'rad_adjusted'] = rad_adjusted  # write rad_adjusted
+
+            debug_console('start_x_adjusted: ' + str(start_x_adjusted)) # debug !!!TEMP!!!
+            debug_console('start_y_adjusted: ' + str(start_y_adjusted)) # debug !!!TEMP!!!
+            debug_console('end_x_adjusted: ' + str(end_x_adjusted)) # debug !!!TEMP!!!
+            debug_console('end_y_adjusted: ' + str(end_y_adjusted)) # debug !!!TEMP!!!
+            debug_console('rad_adjusted: ' + str(rad_adjusted)) # debug !!!TEMP!!!
+            # -----------------------------------------------------------------------
+            # 1693471197 rad_adjusted == 0? Detect if concave arc has offset into a point.
+            # 1693471265 Set skip_flag. Increment counter
+            # -----------------------------------------------------------------------
+            if round(rad_adjusted, 5) == 0:  # detect if concave arc has offset into a point.
+                arc_point_flag = True   # set arc_point_flag
+                df_profile.loc[profile_counter, 'arc_point_flag'] = arc_point_flag  # write arc_point_flag to df_profile dataframe
+                df_profile.loc[profile_counter, 'skip_flag'] = True  # set skip_flag
+                comment_temp = 'concave offset point'  # comment
+                add_comment(profile_counter, comment_temp)  # update comments
+                profile_counter = profile_counter + 1  # increment profile counter.
+                continue  # skip loop iteration.
+            # -----------------------------------------------------------------------
+            # 1693471477 Calculate new arc data. Update profile data frame.
+            # -----------------------------------------------------------------------
+            center_x, center_y, start_angle, end_angle, arc_length, arc_angle = segment_adjusted.data()
+            df_profile.loc[profile_counter, 'vector_angle_start_adjusted'] = start_angle  # write vector_angle_start to df_profile dataframe (round to 2 decimal places)
+            df_profile.loc[profile_counter, 'vector_angle_end_adjusted'] = end_angle  # write vector_angle_end to df_profile dataframe (round to 2 decimal places)
+            df_profile.loc[profile_counter, 'length_adjusted'] = arc_length  # write length to df_profile dataframe (round to 4 decimal places)
+
+            df_profile.loc[profile_counter, 'direction_adjusted'] = segment_adjusted.direction  # write direction of start to end point irregardless of line or arc (round to 2 decimal places)
+        # -----------------------------------------------------------------------
+        # 1693472153 last_row_flag or line_counter = end?
+        # -----------------------------------------------------------------------
+        if last_row_flag == True or profile_counter == end:  # break while loop if last_row_flag detected or if last row is read.
+            break  # check last_row_flag
+        # -----------------------------------------------------------------------
+        # 1693472160 Increment profile counter
+        # -----------------------------------------------------------------------
+        profile_counter = profile_counter + 1  # increment profile counter.
+
+    # =======================================================================
+    # 1693472474 Calculate adjusted parameters for transition arcs
+    # =======================================================================
+    # -----------------------------------------------------------------------
+    # 1693472629 Initialize counters
+    # -----------------------------------------------------------------------
+    profile_counter = 0  # initialize counter for profile df
+    rows = len(df_profile)  # number of rows in df_line
+    end = rows - 1  # initialize end counter
+    # -----------------------------------------------------------------------
+    # 1693472655 profile_counter <= end and on_line_flag == False?
+    # -----------------------------------------------------------------------
+    while profile_counter <= end and on_line_flag == False:
+        # -----------------------------------------------------------------------
+        # 1693473056 Get relevant variables from profile data frame
+        # -----------------------------------------------------------------------
+        last_row_flag = df_profile.loc[profile_counter, 'last_row_flag']  # get last_row_flag from df_profile dataframe
+        transition_arc_flag = df_profile.loc[profile_counter, 'transition_arc_flag']  # get transition_arc_flag
+        cw = df_profile.loc[profile_counter, 'cw']  # get cw
+        less_180 = df_profile.loc[profile_counter, 'less_180']  # get less_180
+
+        temp_loop_debug('calculate adjusted parameters for transition arcs')  # debugging statement # debug !!!TEMP!!!
+        # -----------------------------------------------------------------------
+        # 1693473214 transition_arc_flag == True?
+        # -----------------------------------------------------------------------
+        if transition_arc_flag == True:
+            # -----------------------------------------------------------------------
+            # 1693473232 Calculate and write relevant variables to the profile data frame.
+            # -----------------------------------------------------------------------
+            df_profile.loc[profile_counter, 'offset_start'] = offset  # write offset_start for transition arc
+            df_profile.loc[profile_counter, 'offset_end'] = offset  # write offset_end for transition arc
+
+            start_x_adjusted = df_profile.loc[(profile_counter - 1), 'end_x_adjusted']  # read end point of prior segment as start point of transition arc segment
+            start_y_adjusted = df_profile.loc[(profile_counter - 1), 'end_y_adjusted']  # read end point of prior segment as start point of transition arc segment
+            end_x_adjusted = df_profile.loc[(profile_counter + 1), 'start_x_adjusted']  # read start point of next segment as end point of transition arc segment
+            end_y_adjusted = df_profile.loc[(profile_counter + 1), 'start_y_adjusted']  # read start point of next segment as end point of transition arc segment
+            rad_adjusted = offset + dia / 2  # calculate rad of adjusted transition arc
+
+            df_profile.loc[profile_counter, 'start_x_adjusted'] = start_x_adjusted  # write start_x_adjusted for transition arc
+            df_profile.loc[profile_counter, 'start_y_adjusted'] = start_y_adjusted  # write start_y_adjusted for transition arc
+            df_profile.loc[profile_counter, 'end_x_adjusted'] = end_x_adjusted  # write end_x_adjusted for transition arc
+            df_profile.loc[profile_counter, 'end_y_adjusted'] = end_y_adjusted  # write end_y_adjusted for transition arc
+            df_profile.loc[profile_counter, 'rad_adjusted'] = rad_adjusted  # write rad_adjusted
+
+            segment_adjusted = shared_segment(ArcSegment(start_x_adjusted, start_y_adjusted, end_x_adjusted, end_y_adjusted, rad_adjusted, cw, less_180))     # transition arc
+            center_x, center_y, start_angle, end_angle, arc_length, arc_angle = segment_adjusted.data()
+            df_profile.loc[profile_counter, 'vector_angle_start_adjusted'] = start_angle  # write vector_angle_start to df_profile dataframe (round to 2 decimal places)
+            df_profile.loc[profile_counter, 'vector_angle_end_adjusted'] = end_angle  # write vector_angle_end to df_profile dataframe (round to 2 decimal places)
+            df_profile.loc[profile_counter, 'length_adjusted'] = arc_length  # write length to df_profile dataframe (round to 4 decimal places)
+
+            df_profile.loc[profile_counter, 'direction_adjusted'] = segment_adjusted.direction  # write direction of start to end point irregardless of line or arc (round to 2 decimal places)
+        # -----------------------------------------------------------------------
+        # 1693473511 last_row_flag or line_counter = end?
+        # -----------------------------------------------------------------------
+        if last_row_flag == True or profile_counter == end:  # break while loop if last_row_flag detected or if last row is read.
+            break  # check last_row_flag
+        # -----------------------------------------------------------------------
+        # 1693473520 Increment profile counter
+        # -----------------------------------------------------------------------
+        profile_counter = profile_counter + 1  # increment profile counter.
+
+    # =======================================================================
+    # 1693473686 Calculate vector_angle_pre_adjusted
+    # =======================================================================
+    # -----------------------------------------------------------------------
+    #  1693473800 Initialize counters
+    # -----------------------------------------------------------------------
+    profile_counter = 0  # initialize counter for profile df
+    rows = len(df_profile)  # number of rows in df_line
+    end = rows - 1  # initialize end counter
+    # -----------------------------------------------------------------------
+    # 1693473830 profile_counter <= end and on_line_flag == False?
+    # -----------------------------------------------------------------------
+    while profile_counter <= end and on_line_flag == False:
+
+        temp_loop_debug('calculate vector_angle_pre_adjusted')  # debugging statement # debug !!!TEMP!!!
+
+        last_row_flag = df_profile.loc[profile_counter, 'last_row_flag']  # get last_row_flag from df_profile dataframe
+        # -----------------------------------------------------------------------
+        # 1693474114 First line df row?
+        # -----------------------------------------------------------------------
+        if profile_counter == 0:  # if line_counter = 0 skip while loop iteration
+            # -----------------------------------------------------------------------
+            # 1693474120 Increment line counter
+            # -----------------------------------------------------------------------
+            profile_counter = profile_counter + 1  # increment counter.
+            continue  # skip while loop iteration
+        # -----------------------------------------------------------------------
+        # 1693474288 Calculate and write vector_angle_pre_adjusted to profile data frame.
+        # -----------------------------------------------------------------------
+        vector_angle_pre_adjusted = df_profile.loc[profile_counter - 1, 'vector_angle_end_adjusted']
+        df_profile.loc[profile_counter, 'vector_angle_pre_adjusted'] = vector_angle_pre_adjusted  # write vector_angle_pre_adjusted
+        # -----------------------------------------------------------------------
+        # 1693474405 last_row_flag or line_counter = end?
+        # -----------------------------------------------------------------------
+        if last_row_flag == True or profile_counter == end:  # break while loop if last_row_flag detected or if last row is read.
+            break  # check last_row_flag
+        # -----------------------------------------------------------------------
+        # 1693474397 Increment profile counter
+        # -----------------------------------------------------------------------
+        profile_counter = profile_counter + 1  # increment profile counter.
+
+    # =======================================================================
+    # 1693475580 Determine segment inversion
+    # =======================================================================
+    # -----------------------------------------------------------------------
+    # 1693475682 Initialize counters
+    # -----------------------------------------------------------------------
+    profile_counter = 0  # initialize counter for profile df
+    rows = len(df_profile)  # number of rows in df_line
+    end = rows - 1  # initialize end counter
+    # -----------------------------------------------------------------------
+    # 1693475709 profile_counter <= end and on_line_flag == False?
+    # -----------------------------------------------------------------------
+    while profile_counter <= end and on_line_flag == False:
+        # -----------------------------------------------------------------------
+        # 1693475804 Get relevant variables from profile data frame
+        # -----------------------------------------------------------------------
+        last_row_flag = df_profile.loc[profile_counter, 'last_row_flag']  # get last_row_flag from df_profile dataframe
+        transition_arc_flag = df_profile.loc[profile_counter, 'transition_arc_flag']  # get transition_arc_flag from df_profile dataframe
+        arc_point_flag = df_profile.loc[profile_counter, 'arc_point_flag']  # get arc_point_flag from df_profile dataframe
+
+        temp_loop_debug('determine segment inversion')  # debugging statement # debug !!!TEMP!!!
+        debug_console(transition_arc_flag) # debug !!!TEMP!!!
+        # -----------------------------------------------------------------------
+        # 1693475844 transition_arc_flag != True and arc_point_flag != True?
+        # -----------------------------------------------------------------------
+        if transition_arc_flag != True and arc_point_flag != True:  # omit transition arcs and point arcs
+            # -----------------------------------------------------------------------
+            # 1693476189 Calculate change in segment direction before and after offset.
+            # -----------------------------------------------------------------------
+            direction = df_profile.loc[profile_counter, 'direction']  # get segment direction
+            direction_adjusted = df_profile.loc[profile_counter, 'direction_adjusted']  # get adjusted segment direction
+            direction_difference = direction_adjusted - direction  # calculate direction difference
+            direction_difference = round(direction_difference, 1)  # round to 1 decimal place to prevent false inversion trigger
+            #        direction_difference = round(direction_difference,3)  # round to 3 decimal place to prevent false inversion trigger. in radians.
+
+            debug_console('direction_difference: ' + str(direction_difference)) # debug !!!TEMP!!!
+            # -----------------------------------------------------------------------
+            # 1693476403
+            # Determine segment inversion.
+            # Set or Clear appropriate flags.
+            # Write inversion_flag to profile data frame.
+            # -----------------------------------------------------------------------
+            if direction_difference == 0 or direction_difference == 360:  # no inversion found. start and end points of segment are in the same direction before and after adjustment.
+                #        if direction_difference == 0 or direction_difference == round(2*math.pi, 3):  # no inversion found. start and end points of segment are in the same direction before and after adjustment. in radians.
+                df_profile.loc[profile_counter, 'inversion_flag'] = False  # clear inversion flag
+            else:  # inversion found. start and end points of segment are not in the same direction before and after adjustment.
+                df_profile.loc[profile_counter, 'skip_flag'] = True  # set skip_flag
+                df_profile.loc[profile_counter, 'inversion_flag'] = True  # determine segment inversion if any change in start-end direction is found. does not have to be 180deg apart.
+                df_profile.loc[profile_counter - 1, 'intersect_end_flag'] = True  # set prior segment intersect end flag
+                df_profile.loc[profile_counter + 1, 'intersect_start_flag'] = True  # set subsequent segment intersect start flag
+                add_comment(profile_counter, 'segment inversion. ')  # update comments
+
+            inversion_flag = df_profile.loc[profile_counter, 'inversion_flag']  # Write inversion_flag to profile data frame.
+            debug_console('inversion_flag: ' + str(inversion_flag)) # debug !!!TEMP!!!
+
+        #    df_profile.loc[profile_counter, 'inversion_flag'] = False  # bypass inversion check. !!!!debug only!!!
+        # -----------------------------------------------------------------------
+        # 1693476512 last_row_flag or line_counter = end?
+        # -----------------------------------------------------------------------
+        if last_row_flag == True or profile_counter == end:  # break while loop if last_row_flag detected or if last row is read.
+            break  # check last_row_flag
+        # -----------------------------------------------------------------------
+        # 1693476507 Increment profile counter
+        # -----------------------------------------------------------------------
+        profile_counter = profile_counter + 1  # increment profile counter.
+
+    # =======================================================================
+    # 1693476771  Determine intersection point
+    # =======================================================================
+    # -----------------------------------------------------------------------
+    # 1693476884 Initialize counters
+    # -----------------------------------------------------------------------
+    profile_counter = 0  # initialize counter for profile df
+    rows = len(df_profile)  # number of rows in df_line
+    end = rows - 1  # initialize end counter
+    # -----------------------------------------------------------------------
+    # 1693476898 profile_counter <= end and on_line_flag == False?
+    # -----------------------------------------------------------------------
+    while profile_counter <= end and on_line_flag == False:
+        # -----------------------------------------------------------------------
+        # 1693477161
+        # Initialize variables.
+        # Get last_row_flag and inversion_flag from profile data frame
+        # -----------------------------------------------------------------------
+        intersect_x = None  # intialize
+        intersect_y = None  # intialize
+        inversion_type = None  # initialize
+        segment_swap_flag = False  # initialize
+        rel_intersect_x = None  # initialize
+        rel_intersect_y = None  # initialize
+        abort_flag = False    # initialize
+
+        last_row_flag = df_profile.loc[profile_counter, 'last_row_flag']  # get last_row_flag from df_profile dataframe
+        inversion_flag = df_profile.loc[profile_counter, 'inversion_flag']  # get inversion_flag from df_profile dataframe
+
+        temp_loop_debug('determine intersection point')  # debugging statement # debug !!!TEMP!!!
+        # -----------------------------------------------------------------------
+        # 1693477263 inversion_flag == True?
+        # -----------------------------------------------------------------------
+        if inversion_flag == True:  # scan for inverted segment
+            # -----------------------------------------------------------------------
+            # 1693477417 Get relevant variables of prior and later segment from profile data frame
+            # -----------------------------------------------------------------------
+            prior_segment_type = df_profile.loc[profile_counter - 1, 'segment']  # get prior segment type from df_profile dataframe
+            later_segment_type = df_profile.loc[profile_counter + 1, 'segment']  # get segment type from df_profile dataframe
+
+            prior_segment_x1 = df_profile.loc[profile_counter - 1, 'start_x_adjusted']  # read start_x_adjusted on prior segment
+            prior_segment_y1 = df_profile.loc[profile_counter - 1, 'start_y_adjusted']  # read start_y_adjusted on prior segment
+            prior_segment_x2 = df_profile.loc[profile_counter - 1, 'end_x_adjusted']  # read end_x_adjusted on prior segment
+            prior_segment_y2 = df_profile.loc[profile_counter - 1, 'end_y_adjusted']  # read end_y_adjusted on prior segment
+            if prior_segment_type == 'arc':
+                prior_segment_r = df_profile.loc[profile_counter - 1, 'rad_adjusted']  # read rad_adjusted on prior segment
+                prior_segment_arc_center_x = df_profile.loc[profile_counter - 1, 'arc_center_x']  # read arc_center_x on prior segment
+                prior_segment_arc_center_y = df_profile.loc[profile_counter - 1, 'arc_center_y']  # read arc_center_y on prior segment
+            #            prior_segment_m = (prior_segment_y2 - prior_segment_y1) / (prior_segment_x2 - prior_segment_x1)   # calculate gradient of prior segment
+            #            prior_segment_c = prior_segment_y2 - prior_segment_x2 * prior_segment_m     # calculate y intercept of prior segment
+            else:
+                prior_segment_r = None  # assign None/null
+                prior_segment_arc_center_x = None  # assign None/null
+                prior_segment_arc_center_y = None  # assign None/null
+
+            later_segment_x1 = df_profile.loc[profile_counter + 1, 'start_x_adjusted']  # read start_x_adjusted on later segment
+            later_segment_y1 = df_profile.loc[profile_counter + 1, 'start_y_adjusted']  # read start_y_adjusted on later segment
+            later_segment_x2 = df_profile.loc[profile_counter + 1, 'end_x_adjusted']  # read end_x_adjusted on later segment
+            later_segment_y2 = df_profile.loc[profile_counter + 1, 'end_y_adjusted']  # read end_y_adjusted on later segment
+            if later_segment_type == 'arc':
+                later_segment_r = df_profile.loc[profile_counter + 1, 'rad_adjusted']  # read rad_adjusted on later segment
+                later_segment_arc_center_x = df_profile.loc[profile_counter + 1, 'arc_center_x']  # read arc_center_x on later segment
+                later_segment_arc_center_y = df_profile.loc[profile_counter + 1, 'arc_center_y']  # read arc_center_y on later segment
+            #            later_segment_m = (later_segment_y2 - later_segment_y1) / (later_segment_x2 - later_segment_x1)   # calculate gradient of later segment
+            #            later_segment_c = later_segment_y2 - later_segment_x2 * later_segment_m     # calculate y intercept of later segment
+            else:
+                later_segment_r = None  # assign None/null
+                later_segment_arc_center_x = None  # assign None/null
+                later_segment_arc_center_y = None  # assign None/null
+
+            debug_console('line-arc ' + 'prior_segment_type: ' + str(prior_segment_type))  # ok # debug !!!TEMP!!!
+            debug_console('line-arc ' + 'later_segment_type: ' + str(later_segment_type))  # ok # debug !!!TEMP!!!
+
+            # -----------------------------------------------------------------------
+            # 1693559409 Line - Line Intersect?
+            # -----------------------------------------------------------------------
+            if prior_segment_type == 'linear' and later_segment_type == 'linear':
+                # -----------------------------------------------------------------------
+                # 1693565362 Calculate Intersection point using prior segment as reference axis.
+                # Refer to "DRW230721-001 Intersecting Segments"
+                # -----------------------------------------------------------------------
+                parallel_flag = False  # initialize flag
+                origin_x = prior_segment_x1  # use prior segment start point as the origin.
+                origin_y = prior_segment_y1  # use prior segment start point as the origin.
+                axis_angle = shared_segment(LineSegment(prior_segment_x1, prior_segment_y1, prior_segment_x2, prior_segment_y2)).angle  # find absolute angle of prior segment. Use segment as reference axis. calculated in offset pass.
+                temp_x1, temp_y1 = shift_origin(origin_x, origin_y, later_segment_x1, later_segment_y1)  # apply shift in origin
+                rel_x1, rel_y1 = rotate_axis(axis_angle, temp_x1, temp_y1)  # apply axis rotation
+                temp_x2, temp_y2 = shift_origin(origin_x, origin_y, later_segment_x2, later_segment_y2)  # apply shift in origin
+                rel_x2, rel_y2 = rotate_axis(axis_angle, temp_x2, temp_y2)  # apply axis rotation
+
+                rel_angle = absolute_angle(rel_x1, rel_y1, rel_x2, rel_y2)  # find angle of later segment relative to prior segment (reference axis).
+
+                # -----------------------------------------------------------------------
+                # 1693565879 Identify possible line-line cases
+                # Refer to "DRW230721-001 Intersecting Segments"
+                # -----------------------------------------------------------------------
+                if round(rel_angle, 1) == 0:  # later segment is parallel/ 0 deg relative to the prior segment in the same direction.
+                    #            if round(rel_angle,3) == 0:  # later segment is parallel/ 0 deg relative to the prior segment in the same direction. in radians.
+                    inversion_type = 'line-line similar parallel'  # !!!!Currently unaddressed!!!!
+                    parallel_flag = True  # set parallel flag
+                    if round(rel_y1, 4) == 0:  # both segments are colinear
+                        inversion_type = 'line-line similar colinear'  # !!!!Currently unaddressed!!!!
+                elif round(rel_angle, 1) == 180:  # later segment is parallel/ 180 deg relative to the prior segment in the opposing direction.
+                    #            elif round(rel_angle,3) == round(math.pi,3):  # later segment is parallel/ 180 deg relative to the prior segment in the opposing direction. in radians.
+                    inversion_type = 'line-line opposing parallel'  # !!!!Currently unaddressed!!!!
+                    parallel_flag = True  # set parallel flag
+                    if round(rel_y1, 4) == 0:  # both segments are colinear
+                        inversion_type = 'line-line opposing colinear'  # should be detected and addressed at "1693471197 Detect if concave arc has offset into a point."
+                elif round(rel_angle, 1) == 90 or round(rel_angle, 1) == 270:
+                    #            elif round(rel_angle, 3) == round((0.5*math.pi),3) or round(rel_angle, 3) == round((1.5*math.pi),3):
+                    rel_intersect_x = temp_x1  # later segment is normal/90deg or 270deg relative to the prior segment.
+                    inversion_type = 'line-line orthogonal intersection'
+                else:
+                    rel_m = math.tan(rel_angle / 180 * math.pi)  # calculate gradient of relative segment for y=mx+c
+                    #                rel_m = math.tan(rel_angle)  # calculate gradient of relative segment for y=mx+c in radians.
+                    rel_c = rel_y2 - rel_x2 * rel_m  # calculate y intercept of relative segment for y=mx+c
+                    rel_intersect_x = -rel_c / rel_m  # calculate x intercept. x = -c/m
+                    inversion_type = 'line-line intersecting'
+
+                # -----------------------------------------------------------------------
+                # 1693566061
+                # Calculate absolute intersect point.
+                # Write intersect point and inversion type to profile data frame.
+                # Refer to "DRW230721-001 Intersecting Segments"
+                # -----------------------------------------------------------------------
+                debug_console('line-line ' + 'inversion_type: ' + str(inversion_type))  # debug # debug !!!TEMP!!!
+                df_profile.loc[profile_counter, 'inversion_type'] = inversion_type  # write inversion_type to data frame
+
+                temp_x1, temp_y1 = rotate_axis(-axis_angle, rel_intersect_x, 0)  # undo axis rotation
+                intersect_x, intersect_y = shift_origin(-origin_x, -origin_y, temp_x1, temp_y1)  # undo origin shift
+
+            # -----------------------------------------------------------------------
+            # 1693579080 Arc - Arc Intersect?
+            # -----------------------------------------------------------------------
+            elif prior_segment_type == 'arc' and later_segment_type == 'arc':
+                # -----------------------------------------------------------------------
+                # 1693581943 Identify possible Arc-Arc cases.
+                # Refer to "DRW230721-001 Intersecting Segments"
+                # -----------------------------------------------------------------------
+                discard, length, discard, discard = line_data(prior_segment_arc_center_x, prior_segment_arc_center_y, later_segment_arc_center_x, later_segment_arc_center_y)
+                debug_console('arc-arc ' + 'length-01: ' + str(length))  # debug # debug !!!TEMP!!!
+                debug_console('arc-arc ' + 'prior_segment_r-01: ' + str(prior_segment_r))  # debug # debug !!!TEMP!!!
+                debug_console('arc-arc ' + 'later_segment_r-01: ' + str(later_segment_r))  # debug # debug !!!TEMP!!!
+
+                # identify possible arc-arc cases
+                if round(length, 4) == round((prior_segment_r + later_segment_r), 4):  # arc circles are external tangents. should be detected and addressed at "1693471197 Detect if concave arc has offset into a point."
+                    inversion_type = 'arc-arc external tangents'
+                elif round(length, 4) == round(abs(prior_segment_r - later_segment_r), 4):  # arc circles are internal tangents. should be detected and addressed at "1693471197 Detect if concave arc has offset into a point."
+                    inversion_type = 'arc-arc internal tangents'
+                elif round(length, 4) > round((prior_segment_r + later_segment_r), 4):  # arc circles are external non-intersecting. Should not happen for 1st order adjacent segments.
+                    inversion_type = 'arc-arc external non-intersecting'
+                    abort_flag = True   # set abort flag.
+                    df_profile.loc[profile_counter, 'abort_flag'] = abort_flag  # write abort_flag to df
+                elif round(length, 4) < round(abs(prior_segment_r - later_segment_r), 4):  # arc circles are internal non-intersecting. Should not happen for 1st order adjacent segments.
+                    inversion_type = 'arc-arc internal non-intersecting'
+                    abort_flag = True   # set abort flag.
+                    df_profile.loc[profile_counter, 'abort_flag'] = abort_flag  # write abort_flag to df
+                elif round(length, 4) == 0:  # arc circles are concentric. !!!! Possible case !!!! code does not account for scenario.
+                    inversion_type = 'arc-arc concentric'
+                    abort_flag = True   # set abort flag.
+                    df_profile.loc[profile_counter, 'abort_flag'] = abort_flag  # write abort_flag to df
+                elif round(length, 4) < round((prior_segment_r + later_segment_r), 4):  # arc circles are intersecting at 2 distinct points
+                    inversion_type = 'arc-arc distinct intersection'
+
+                debug_console('arc-arc ' + 'inversion_type-01: ' + str(inversion_type))  # debug # debug !!!TEMP!!!
+                df_profile.loc[profile_counter, 'inversion_type'] = inversion_type  # write inversion_type to data frame
+
+                # -----------------------------------------------------------------------
+                # 1693582745
+                # Calculate relative intersection point using prior arc center to later arc center as a reference axis
+                # Refer to "DRW230721-001 Intersecting Segments"
+                # Assuming that arcs have distinct intersection
+                # -----------------------------------------------------------------------
+                axis_angle, length_b, discard, discard = line_data(prior_segment_arc_center_x, prior_segment_arc_center_y, later_segment_arc_center_x, later_segment_arc_center_y)  # get parameters using arc to arc center line for reference axis
+                length_c = prior_segment_r
+                length_a = later_segment_r
+
+                debug_console('arc-arc ' + 'prior_segment_arc_center_x-01: ' + str(prior_segment_arc_center_x))  # ok # debug !!!TEMP!!!
+                debug_console('arc-arc ' + 'prior_segment_arc_center_y-01: ' + str(prior_segment_arc_center_y))  # ok # debug !!!TEMP!!!
+                debug_console('arc-arc ' + 'later_segment_arc_center_x-01: ' + str(later_segment_arc_center_x))  # ok # debug !!!TEMP!!!
+                debug_console('arc-arc ' + 'later_segment_arc_center_y-01: ' + str(later_segment_arc_center_y))  # ok # debug !!!TEMP!!!
+
+                debug_console('arc-arc ' + 'length_a-01: ' + str(length_a))  # ok # debug !!!TEMP!!!
+                debug_console('arc-arc ' + 'length_b-01: ' + str(length_b))  # ok # debug !!!TEMP!!!
+                debug_console('arc-arc ' + 'length_c-01: ' + str(length_c))  # ok # debug !!!TEMP!!!
+                debug_console('arc-arc ' + 'axis_angle-01: ' + str(axis_angle))  # ok # debug !!!TEMP!!!
+
+                # Use prior arc center to later arc center as a reference axis
+                # Cosine Rule
+                # a^2 = b^2 + c^2 − 2bc cos A
+                # A = cos^-1 [(b^2 + c^2 + a^2)/(2bc)]
+                # Use cosine rule to calculate angle A given lengths a, b, c
+                # Calculate d to find the intersect points
+                # refer to "DRW230721-001 Intersecting Segments"
+                angle_a = math.degrees(math.acos((length_b ** 2 + length_c ** 2 - length_a ** 2) / (2 * length_b * length_c)))  # calculating angle at corner a using cosine rule
+                rel_y = prior_segment_r * (math.sin((angle_a / 180) * math.pi))  # calculating the y/perpendicular distance of an intersect point from reference axis or prior arc center to later arc center
+                rel_x = prior_segment_r * (math.cos((angle_a / 180) * math.pi))  # calculating the x/parallel distance of an intersect point from reference axis or prior arc center to later arc center
+                #            angle_a = math.acos((length_b**2 + length_c**2 - length_a**2)/(2*length_b*length_c))    # calculating angle at corner a using cosine rule in radians.
+                #            rel_y = prior_segment_r * math.sin(angle_a)     # calculating the y/perpendicular distance of an intersect point from reference axis or prior arc center to later arc center in radians.
+                #            rel_x = prior_segment_r * math.cos(angle_a)     # calculating the x/parallel distance of an intersect point from reference axis or prior arc center to later arc center in radians.
+                debug_console('arc-arc ' + 'rel_y-01: ' + str(rel_y))  # ok # debug !!!TEMP!!!
+                debug_console('arc-arc ' + 'angle_a-01: ' + str(angle_a))  # ok # debug !!!TEMP!!!
+
+                # -----------------------------------------------------------------------
+                # 1693583006
+                # Determine which side the intersect point lies on relative to the reference axis
+                # Refer to "DRW230721-001 Intersecting Segments"
+                # i.e. which of the 2 possible interesection points is to be used?
+                # Assumption: the connection points of the original arcs stay on the same side of the reference axis before and after segment inversion.
+                # Find the relative position of the prior_segment end point with respect to the reference axis.
+                # Determine if the point is on the left or right of the axis. i.e. left/y=positive, right/y=negative.
+                # Select the appropriate point.
+                # -----------------------------------------------------------------------
+                shifted_x, shifted_y = shift_origin(prior_segment_arc_center_x, prior_segment_arc_center_y, prior_segment_x2, prior_segment_y2)  # using prior_segment end point, shift origin to prior_segment_arc_center
+                rel_prior_segment_x2, rel_prior_segment_y2 = rotate_axis(axis_angle, shifted_x, shifted_y)  # rotate axis to find the relative coordinates of the prior_segment end point with respect to the reference axis (prior arc center to later arc center)
+
+                if rel_prior_segment_y2 > 0:  # on left/positive side of reference axis
+                    rel_y = rel_y   # adjust direction to be on the same side
+                elif rel_prior_segment_y2 < 0:  # on right/negative side of reference axis
+                    rel_y = -rel_y  # adjust direction to be on the same side
+                debug_console('arc-arc ' + 'rel_y-02: ' + str(rel_y))  # ok # debug !!!TEMP!!!
+
+                # -----------------------------------------------------------------------
+                # 1693584489
+                # Calculate absolute intersect point.
+                # Write intersect point and inversion type to profile data frame.
+                # Refer to "DRW230721-001 Intersecting Segments"
+                # -----------------------------------------------------------------------
+                temp_x1, temp_y1 = rotate_axis(-axis_angle, rel_x, rel_y)  # undo axis rotation
+                intersect_x, intersect_y = shift_origin(-prior_segment_arc_center_x, -prior_segment_arc_center_y, temp_x1, temp_y1)  # undo origin shift
+
+            # -----------------------------------------------------------------------
+            # 1693584702 Line - Arc Intersect?
+            # -----------------------------------------------------------------------
+            elif (prior_segment_type == 'linear' and later_segment_type == 'arc') or (prior_segment_type == 'arc' and later_segment_type == 'linear'):
+                debug_console('line-arc ' + 'prior_segment_type: ' + str(prior_segment_type))  # ok # debug !!!TEMP!!!
+                debug_console('line-arc ' + 'later_segment_type: ' + str(later_segment_type))  # ok # debug !!!TEMP!!!
+                # -----------------------------------------------------------------------
+                # 1693584830 intersect is Arc-Line?
+                # -----------------------------------------------------------------------
+                if prior_segment_type == 'arc' and later_segment_type == 'linear':  # reverse relationship from arc-line to line-arc to normalize processing
+                    # -----------------------------------------------------------------------
+                    # 1693584893 Reverse relationship from arc-line to line-arc to normalize processing
+                    # -----------------------------------------------------------------------
+                    segment_swap_flag = True  # set segment_swap_flag
+                    temp_px1 = prior_segment_x1  # assign temp variable
+                    temp_py1 = prior_segment_y1  # assign temp variable
+                    temp_px2 = prior_segment_x2  # assign temp variable
+                    temp_py2 = prior_segment_y2  # assign temp variable
+
+                    temp_lx1 = later_segment_x1  # assign temp variable
+                    temp_ly1 = later_segment_y1  # assign temp variable
+                    temp_lx2 = later_segment_x2  # assign temp variable
+                    temp_ly2 = later_segment_y2  # assign temp variable
+
+                    temp_pr = prior_segment_r  # assign temp variable
+                    temp_pacx = prior_segment_arc_center_x  # assign temp variable
+                    temp_pacy = prior_segment_arc_center_y  # assign temp variable
+
+                    #                temp_lr = later_segment_r     # assign temp variable
+                    #                temp_lacx = lacx = later_segment_arc_center_x     # assign temp variable
+                    #                temp_lacy = later_segment_arc_center_y     # assign temp variable
+
+                    #                prior_segment_x1 = temp_lx1     # exchange prior and later variables
+                    #                prior_segment_y1 = temp_ly1     # exchange prior and later variables
+                    #                prior_segment_x2 = temp_lx2     # exchange prior and later variables
+                    #                prior_segment_y2 = temp_ly2     # exchange prior and later variables
+
+                    #                later_segment_x1 = temp_px1     # exchange prior and later variables
+                    #                later_segment_y1 = temp_py1     # exchange prior and later variables
+                    #                later_segment_x2 = temp_px2     # exchange prior and later variables
+                    #                later_segment_y2 = temp_py2     # exchange prior and later variables
+
+                    prior_segment_x1 = temp_lx2  # exchange prior and later variables
+                    prior_segment_y1 = temp_ly2  # exchange prior and later variables
+                    prior_segment_x2 = temp_lx1  # exchange prior and later variables
+                    prior_segment_y2 = temp_ly1  # exchange prior and later variables
+
+                    later_segment_x1 = temp_px2  # exchange prior and later variables
+                    later_segment_y1 = temp_py2  # exchange prior and later variables
+                    later_segment_x2 = temp_px1  # exchange prior and later variables
+                    later_segment_y2 = temp_py1  # exchange prior and later variables
+
+                    later_segment_r = temp_pr  # exchange prior and later variables
+                    later_segment_arc_center_x = temp_pacx  # exchange prior and later variables
+                    later_segment_arc_center_y = temp_pacy  # exchange prior and later variables
+
+                # -----------------------------------------------------------------------
+                # 1693586720
+                # Use prior_segment start point as origin and prior_segment as reference axis
+                # Find the relative position of the arc center.
+                # refer to "DRW230721-001 Intersecting Segments"
+                # -----------------------------------------------------------------------
+                axis_angle, length, discard, discard = shared_segment(LineSegment(prior_segment_x1, prior_segment_y1, prior_segment_x2, prior_segment_y2)).data()  # get parameters using prior line segment for reference axis. refer to "DRW230721-001 Intersecting Segments"
+                temp_x, temp_y = shift_origin(prior_segment_x1, prior_segment_y1, later_segment_arc_center_x, later_segment_arc_center_y)  # apply origin shift to prior_segment_x1, prior_segment_y1 as origin
+                rel_arc_x, rel_arc_y = rotate_axis(axis_angle, temp_x, temp_y)  # apply axis rotation. rel_arc_y is the perpendicular distance between the line and center of arc.
+
+                debug_console('\n' + 'rel_arc_y: ' + str(rel_arc_y))  # ok # debug !!!TEMP!!!
+
+                # -----------------------------------------------------------------------
+                # 1693634405
+                # Determine the line-arc cases by evaluating b(rel_arc_y) agains the arc radius.
+                # refer to "DRW230721-001 Intersecting Segments"
+                # -----------------------------------------------------------------------
+                if round(abs(rel_arc_y), 4) == round(later_segment_r, 4):  # detect tangential intersect. should be detected and addressed at "1693471197 Detect if concave arc has offset into a point."
+                    inversion_type = 'line-arc tangential'
+                    if segment_swap_flag == True:
+                        inversion_type = 'arc-line tangential'
+                if round(abs(rel_arc_y), 4) > round(later_segment_r, 4):  # detect non-contact intersect. Should not encounter scenario.
+                    inversion_type = 'line-arc non-contact'
+                    if segment_swap_flag == True:
+                        inversion_type = 'arc-line non-contact'
+                if round(abs(rel_arc_y), 4) < round(later_segment_r, 4):  # detect separate and distinct intersect
+                    inversion_type = 'line-arc distinct intersect'
+                    if segment_swap_flag == True:
+                        inversion_type = 'arc-line distinct intersect'
+
+                df_profile.loc[profile_counter, 'inversion_type'] = inversion_type  # write inversion_type to data frame
+                debug_console('\n' + 'inversion_type: ' + str(inversion_type))  # ok # debug !!!TEMP!!!
+
+                # -----------------------------------------------------------------------
+                # 1693634827
+                # Use Pythagoras rule to calculate the intersect point
+                # r^2 = a^2 + b^2
+                # Use Pythagoras rule to calculate a (half_cord) given lengths b (rel_arc_y), r (later_segment_r)
+                # Calculate d (rel_intersect_x) given c (rel_arc_x) to find the intersect point.
+                # -----------------------------------------------------------------------
+                half_cord = math.sqrt(later_segment_r ** 2 - rel_arc_y ** 2)
+                rel_intersect_x = rel_arc_x - half_cord
+                debug_console('\n' + 'rel_intersect_x: ' + str(rel_intersect_x))  # ok # debug !!!TEMP!!!
+
+                # -----------------------------------------------------------------------
+                # 1693634860
+                # Determine which side the intersect point lies on relative to the orthogonal axis i.e. right angle line from arc center to reference axis.
+                # i.e. which of the 2 possible intersection points is to be used?
+                # Assumption: the connection points of the original line-arc stays on the same side of the reference axis before and after segment inversion.
+                # Determine if the length of the line which stays constant is longer or shorter than rel_arc_x. i.e. shorter=near point, longer=far point.
+                # Select the appropriate point.
+                # refer to "DRW230721-001 Intersecting Segments"
+                # -----------------------------------------------------------------------
+                if length < rel_arc_x:  # near point
+                    rel_intersect_x = rel_intersect_x
+                elif length > rel_arc_x:  # far point
+                    rel_intersect_x = rel_intersect_x + half_cord * 2
+
+                debug_console('\n' + 'rel_intersect_x-adj: ' + str(rel_intersect_x))  # ok # debug !!!TEMP!!!
+                debug_console('\n' + 'rel_intersect_x (near): ' + str(rel_intersect_x))  # ok # debug !!!TEMP!!!
+                debug_console('\n' + 'rel_intersect_x (far): ' + str(rel_intersect_x + half_cord * 2))  # ok # debug !!!TEMP!!!
+                rel_intersect_x_far = rel_intersect_x + half_cord * 2 # debug !!!TEMP!!!
+
+                # -----------------------------------------------------------------------
+                # 1693635785
+                # Calculate absolute intersect point.
+                # Write intersect point and inversion type to profile data frame.
+                # -----------------------------------------------------------------------
+                temp_x1, temp_y1 = rotate_axis(-axis_angle, rel_intersect_x, 0)  # undo axis rotation
+                intersect_x, intersect_y = shift_origin(-prior_segment_x1, -prior_segment_y1, temp_x1, temp_y1)  # undo origin shift
+
+                temp_x1_far, temp_y1_far = rotate_axis(-axis_angle, rel_intersect_x_far, 0)  # undo axis rotation # debug !!!TEMP!!!
+                intersect_x_far, intersect_y_far = shift_origin(-prior_segment_x1, -prior_segment_y1, temp_x1_far, temp_y1_far)  # undo origin shift # debug !!!TEMP!!!
+                debug_console('\n' + 'intersect_x (far): ' + str(intersect_x_far))  # ok # debug !!!TEMP!!!
+                debug_console('intersect_y (far): ' + str(intersect_y_far))  # ok # debug !!!TEMP!!!
+
+            debug_console('\n' + 'intersect_x: ' + str(intersect_x))  # ok # debug !!!TEMP!!!
+            debug_console('intersect_y: ' + str(intersect_y))  # ok # debug !!!TEMP!!!
+            debug_console('\n' + 'intersect_x (near): ' + str(intersect_x))  # ok # debug !!!TEMP!!!
+            debug_console('intersect_y (near): ' + str(intersect_y))  # ok # debug !!!TEMP!!!
+
+            df_profile.loc[profile_counter - 1, 'end_x_intersect'] = intersect_x  # write intersect x to prior segment
+            df_profile.loc[profile_counter - 1, 'end_y_intersect'] = intersect_y  # write intersect y to prior segment
+            df_profile.loc[profile_counter + 1, 'start_x_intersect'] = intersect_x  # write intersect x to later segment
+            df_profile.loc[profile_counter + 1, 'start_y_intersect'] = intersect_y  # write intersect y to later segment
+            # -----------------------------------------------------------------------
+            # 1693636324 last_row_flag or line_counter = end?
+            # -----------------------------------------------------------------------
+        if last_row_flag == True or profile_counter == end:  # break while loop if last_row_flag detected or if last row is read.
+            break  # check last_row_flag
+
+        # -----------------------------------------------------------------------
+        # 1693636360 Increment profile counter
+        # -----------------------------------------------------------------------
+        profile_counter = profile_counter + 1  # increment profile counter.
+
+    # =======================================================================
+    # 1693636800 Populate output columns
+    # =======================================================================
+    profile_counter = 0  # initialize counter for profile df
+    rows = len(df_profile)  # number of rows in df_line
+    end = rows - 1  # initialize end counter
+
+    while profile_counter <= end:
+
+        last_row_flag = df_profile.loc[profile_counter, 'last_row_flag']  # get last_row_flag from df_profile dataframe
+        skip_flag = df_profile.loc[profile_counter, 'skip_flag']  # get skip_flag from df_profile dataframe
+        transition_arc_flag = df_profile.loc[profile_counter, 'transition_arc_flag']  # get transition_arc_flag from df_profile dataframe
+        temp_loop_debug('populate output columns')  # debugging statement
+
+        if skip_flag == True:  # if skip_flag = True skip while loop iteration
+            output_comments = df_profile.loc[profile_counter, 'comments']  # get comments from df_profile dataframe
+            df_profile.loc[profile_counter, 'output_comments'] = output_comments  # write output_comments from df_profile dataframe
+            profile_counter = profile_counter + 1  # increment profile counter.
+            continue  # skip while loop iteration
+
+        if on_line_flag == True:
+            output_start_x = df_profile.loc[profile_counter, 'start_x']  # get start_x from df_profile dataframe
+            output_start_y = df_profile.loc[profile_counter, 'start_y']  # get start_y from df_profile dataframe
+            output_end_x = df_profile.loc[profile_counter, 'end_x']  # get end_x from df_profile dataframe
+            output_end_y = df_profile.loc[profile_counter, 'end_y']  # get end_y from df_profile dataframe
+            output_segment = df_profile.loc[profile_counter, 'segment']  # get segment from df_profile dataframe
+            output_rad = df_profile.loc[profile_counter, 'rad']  # get rad from df_profile dataframe
+            output_cw = df_profile.loc[profile_counter, 'cw']  # get cw from df_profile dataframe
+            output_less_180 = df_profile.loc[profile_counter, 'less_180']  # get less_180 from df_profile dataframe
+
+        if on_line_flag == False:
+
+            inversion_type = df_profile.loc[profile_counter, 'inversion_type']  # get inversion_type from df_profile dataframe
+            debug_console('inversion_type: ' + str(inversion_type)) # debug !!!TEMP!!!
+            intersect_start_flag = df_profile.loc[profile_counter, 'intersect_start_flag']  # get intersect_start_flag from df_profile dataframe
+            intersect_end_flag = df_profile.loc[profile_counter, 'intersect_end_flag']  # get intersect_end_flag from df_profile dataframe
+            #        intersect_start_flag = False      # !!debug !!! # debug !!!TEMP!!!
+            #        intersect_end_flag = False      # !!debug !!! # debug !!!TEMP!!!
+
+            if intersect_start_flag == True:
+                add_comment(profile_counter, 'start intersect. ')
+                output_start_x = df_profile.loc[profile_counter, 'start_x_intersect']  # get start_x_intersect from df_profile dataframe
+                output_start_y = df_profile.loc[profile_counter, 'start_y_intersect']  # get start_y_intersect from df_profile dataframe
+            else:
+                output_start_x = df_profile.loc[profile_counter, 'start_x_adjusted']  # get start_x from df_profile dataframe
+                output_start_y = df_profile.loc[profile_counter, 'start_y_adjusted']  # get start_y from df_profile dataframe
+
+            if intersect_end_flag == True:
+                add_comment(profile_counter, 'end intersect. ')
+                output_end_x = df_profile.loc[profile_counter, 'end_x_intersect']  # get end_x_intersect from df_profile dataframe
+                output_end_y = df_profile.loc[profile_counter, 'end_y_intersect']  # get end_y_intersect from df_profile dataframe
+            else:
+                output_end_x = df_profile.loc[profile_counter, 'end_x_adjusted']  # get end_x from df_profile dataframe
+                output_end_y = df_profile.loc[profile_counter, 'end_y_adjusted']  # get end_y from df_profile dataframe
+
+            output_segment = df_profile.loc[profile_counter, 'segment']  # get segment from df_profile dataframe
+
+            if output_segment == 'arc':
+                output_rad = df_profile.loc[profile_counter, 'rad_adjusted']  # get rad from df_profile dataframe
+                output_cw = df_profile.loc[profile_counter, 'cw']  # get cw from df_profile dataframe
+                output_less_180 = df_profile.loc[profile_counter, 'less_180']  # get less_180 from df_profile dataframe
+
+        #    temp_text_df_debug(df_profile)  # debug only!!!!!!!!  # debug !!!TEMP!!!
+
+        #    df_profile.loc[profile_counter, 'output_start_x'] = round(output_start_x, 6)    # write start_x from df_profile dataframe
+        df_profile.loc[profile_counter, 'output_start_x'] = round(output_start_x, 4)  # write start_x from df_profile dataframe
+        df_profile.loc[profile_counter, 'output_start_y'] = round(output_start_y, 4)  # write output_start_y from df_profile dataframe
+        df_profile.loc[profile_counter, 'output_end_x'] = round(output_end_x, 4)  # write output_end_x from df_profile dataframe
+        df_profile.loc[profile_counter, 'output_end_y'] = round(output_end_y, 4)  # write output_end_y from df_profile dataframe
+        df_profile.loc[profile_counter, 'output_segment'] = output_segment  # write output_segment from df_profile datafram
+
+        if output_segment == 'arc':
+            df_profile.loc[profile_counter, 'output_rad'] = round(output_rad, 4)  # write output_rad from df_profile dataframe
+            df_profile.loc[profile_counter, 'output_cw'] = output_cw  # write output_cw from df_profile dataframe
+            df_profile.loc[profile_counter, 'output_less_180'] = output_less_180  # write output_less_180 from df_profile dataframe
+
+        if tro == False and transition_arc_flag != True:    # process start and end z for non transition line segments. !!! Does NOT account for disappearing internal arc segments !!!
+            output_start_z = df_profile.loc[profile_counter, 'start_z']     # get start_z from df_profile dataframe
+            output_end_z =  df_profile.loc[profile_counter, 'end_z']       # get end_z from df_profile dataframe
+#            df_profile.loc[profile_counter, 'output_start_z'] = round(output_start_z, 4)  # write output_start_y from df_profile dataframe
+#            df_profile.loc[profile_counter, 'output_end_z'] = round(output_end_z, 4)  # write output_end_y from df_profile dataframe
+
+            if output_start_z == None:
+                output_start_z = '---'
+                df_profile.loc[profile_counter, 'output_start_z'] = output_start_z  # write output_start_y from df_profile dataframe
+            else:
+                df_profile.loc[profile_counter, 'output_start_z'] = round(output_start_z, 4)  # write output_start_y from df_profile dataframe
+            if output_end_z == None:
+                output_end_z = '---'
+                df_profile.loc[profile_counter, 'output_end_z'] = output_end_z  # write output_start_y from df_profile dataframe
+            else:
+                df_profile.loc[profile_counter, 'output_end_z'] = round(output_end_z, 4)  # write output_start_y from df_profile dataframe
+
+        output_comments = df_profile.loc[profile_counter, 'comments']  # get comments from df_profile dataframe
+        df_profile.loc[profile_counter, 'output_comments'] = output_comments  # write output_comments from df_profile dataframe
+
+        if last_row_flag == True or profile_counter == end:  # break while loop if last_row_flag detected or if last row is read.
+            break  # check last_row_flag
+
+        profile_counter = profile_counter + 1  # increment profile counter.
+
+    # =======================================================================
+    # 1693637708 Detect abort_flag
+    # =======================================================================
+    profile_counter = 0  # initialize counter for profile df
+    rows = len(df_profile)  # number of rows in df_line
+    end = rows - 1  # initialize end counter
+    detect_abort_flag = False  # initialize detect_abort_flag
+
+    while profile_counter <= end:
+
+        last_row_flag = df_profile.loc[profile_counter, 'last_row_flag']  # get last_row_flag from df_profile dataframe
+        abort_flag = df_profile.loc[profile_counter, 'abort_flag']  # get abort_flag from df_profile dataframe
+        temp_loop_debug('detect abort_flag')  # debugging statement # debug !!!TEMP!!!
+
+        if abort_flag == True:      # check for abort_flag = True
+            detect_abort_flag = True       # set detect_abort_flag
+            break   # exit loop
+
+        if last_row_flag == True or profile_counter == end:  # break while loop if last_row_flag detected or if last row is read.
+            break   # exit loop
+
+        profile_counter = profile_counter + 1  # increment profile counter.
+
+#    debug_df_profile = df_profile.to_markdown(index=False, tablefmt='pipe', colalign=['center'] * len(df_profile.columns))  # tabulate main df !!!!TEMP!!! # debug !!!TEMP!!!
+    debug_df_profile = df_profile.loc[:, :'output_comments']  # create dataframe up to 'comments' columns !!!!TEMP!!! # debug !!!TEMP!!!
+    debug_df_profile.loc[:, 'comments'] = '---'  # create new column labeled "comments" with cells containing text: '---'. # debug !!!TEMP!!!
+    if debug_level == 'full':     # full debug level only.
+        temp_text_df_debug(df_profile)  # !!!!TEMP!!! # debug !!!TEMP!!!
+    return (df_profile, debug_df_profile, detect_abort_flag)
+
+def debug_df_row(df_temp, counter):
+    # ---Description---
+    # populate single, current data frame row.
+    # df_temp = debug_df_row(df_temp, counter)
+
+    # ---Variable List---
+    # df_temp = data frame
+    # counter = row counter
+
+    # ---Return Variable List---
+    # df_temp = tabulated row
+
+    df_temp.iloc[[0],:] = '---'  # initialize cells by writing '---' into all cells
+    df_temp.at[0, '#'] = counter  # write counter to # column
+    df_temp.at[0, 'last_row_flag'] = last_row_flag_debug
+    df_temp.at[0, 'operation'] = operation
+    df_temp.at[0, 'sheet_name'] = sheet_debug
+    df_temp.at[0, 'comments'] = df_main.at[counter, 'comments']
+
+    df_temp.at[0, 'adjusted_x'] = '---'     # initialize cells by writing '---'
+    df_temp.at[0, 'adjusted_y'] = '---'     # initialize cells by writing '---'
+    df_temp.at[0, 'shift_x'] = shift_x
+    df_temp.at[0, 'shift_y'] = shift_y
+    df_temp.at[0, 'repeat_flag'] = repeat_flag
+
+    return (df_temp)  # return values
+
+def debug_print_row(df_temp):
+    # ---Description---
+    # Tabulates single, current row to text format.
+    # text_debug_temp = debug_print_row(df_temp)
+
+    # ---Variable List---
+    # df_temp = data frame
+
+    # ---Return Variable List---
+    # text_debug_temp = tabulated row
+
+    df_temp = df_temp.to_markdown(index=False, tablefmt='pipe', colalign=['center'] * len(df_temp.columns))  # tabulate df in txt format
+    text_debug_temp = str(df_temp)  # convert to text str
+    return (text_debug_temp)  # return values
+
+def debug_console(*text):
+    # ---Description---
+    # Prints debug text in the debug window at full debug level. see debug_level.
+    # debug_console(text)
+
+    # ---Variable List---
+    # text = text to print
+
+    # ---Return Variable List---
+    # N/A
+
+    # ---Change History---
+    # rev: 01-01-03-01
+    # date: 18/Oct/2026
+    # initial release
+    # software test run on 18/Oct/2026
+
+    if debug_level == 'full':
+        print(*text)
+
+def debug_summary(step_summary, job_time):
+    # ---Description---
+    # Tabulates per operation totals of the steps of the main program for the debug file. summary and full debug level.
+    # text_debug_temp = debug_summary(step_summary, job_time)
+
+    # ---Variable List---
+    # step_summary = list of steps. dictionary of operation, source ('generated' or 'reused'), lines, bytes and time of each step.
+    # job_time = time of whole job in seconds.
+
+    # ---Return Variable List---
+    # text_debug_temp = tabulated totals
+
+    # ---Change History---
+    # rev: 01-01-03-01
+    # date: 18/Oct/2026
+    # initial release
+    # software test run on 18/Oct/2026
+
+    import pandas as pd  # deferred import. see import_time_check().
+
+    text_debug_temp = f'\n===========================\n' \
+                      f'summary\n' \
+                      f'===========================\n\n'
+    if step_summary == []:
+        return (text_debug_temp + 'no steps.\n')
+    df_temp = pd.DataFrame(step_summary)
+    df_temp['generated'] = df_temp['source'] == 'generated'
+    df_temp['reused'] = df_temp['source'] == 'reused'
+    df_temp = df_temp.groupby('operation', sort=False).agg(steps=('source', 'size'), generated=('generated', 'sum'), reused=('reused', 'sum'),
+                                                          lines=('lines', 'sum'), bytes=('bytes', 'sum'), time=('time', 'sum')).reset_index()
+    df_temp['time'] = df_temp['time'].map(lambda value: "%.3f" % value)  # seconds
+    df_temp = df_temp.rename(columns={'time': 'time (s)'})
+    df_temp = df_temp.to_markdown(index=False, tablefmt='pipe', colalign=['center'] * len(df_temp.columns))  # tabulate totals
+    text_debug_temp = text_debug_temp + str(df_temp) + '\n\n' \
+        f'steps: {len(step_summary)}\n' \
+        f'G-code lines: {sum(step["lines"] for step in step_summary)}\n' \
+        f'G-code bytes: {sum(step["bytes"] for step in step_summary)}\n' \
+        f'job time: {"%.3f" % job_time} s\n'
+    return (text_debug_temp)  # return values
+
+# ---------Import Parameters------------
+
+excel_file = 'LOG20220414001 G-code Parameters.xlsx'       # !!!! identify name of excel file to import data from. !!!!
+                                    # !!!! job can also be a folder of csv files (one per sheet) or a .json / .toml file. see job_format(). !!!!
+cache_flag = True                   # !!!! True -> load unchanged sheets from sheet cache. False -> bypass cache and parse all sheets. !!!!
+cache_dir = 'sheet cache'           # sheet cache folder.
+cache_size = 100 * 1024 * 1024      # maximum size of sheet cache folder in bytes. least recently used sheets are deleted first.
+stream_flag = False                 # !!!! True -> stream peck drill and spiral drill sheets row by row. for sheets with a large number of holes. !!!!
+validate_flag = True                # !!!! True -> validate the whole job before writing G-code. False -> skip validation. !!!!
+plan_file = None                    # !!!! json file name to save compiled plan of main sheet. None -> plan not saved. !!!!
+replay_file = None                  # !!!! json file name of saved plan to replay instead of compiling main sheet. None -> compile main sheet. !!!!
+translate_flag = False              # !!!! True -> repeated operations on the same sheet are translated copies of the first toolpath (last decimal place can differ, no per row debug tables). False -> regenerate every toolpath. !!!!
+watch_flag = False                  # !!!! True -> keep running and regenerate G-code when the job is saved. only toolpaths of changed sheets are regenerated. !!!!
+watch_interval = 1.0                # time between checks for a saved job in seconds.
+import_check_flag = False           # !!!! True -> check cold start import time of this script before running. see import_time_check(). !!!!
+import_budget = 0.5                 # maximum import time of this script in seconds.
+benchmark_flag = False              # !!!! True -> run G-code format benchmark (format_benchmark) and geometry benchmark (geometry_benchmark) and quit. !!!!
+moves_flag = False                  # !!!! True -> G-code is collected as a move list (numpy structured array) and rendered to the G-code file in one pass at the end of the job. !!!!
+npz_flag = False                    # !!!! True -> toolpath is also saved as a numpy archive (name.npz) of moves, operations and job parameters. see npz_close() and load_toolpath(). !!!!
+npz_compress = False                # True -> compressed numpy archive. False -> arrays can be memory mapped by load_toolpath().
+output_buffer = 1024 * 1024         # !!!! write buffer of G-code and debug files in bytes. 0 -> open, write and close file on every write. !!!!
+output_compression = None           # !!!! None -> text files. 'gzip' -> .txt.gz files. 'zstd' -> .txt.zst files (zstandard package). compressed as written. !!!!
+split_bytes = None                  # !!!! maximum size of G-code file in bytes. G-code is split into numbered files (name Part001 ...) at safe points. None -> no size limit. see split_output(). !!!!
+split_blocks = None                 # !!!! maximum number of blocks (non blank lines) of G-code file. None -> no block limit. !!!!
+dnc_address = None                  # !!!! drip-feed (DNC) G-code to machine while it is generated. 'host:port' -> socket. device path -> serial port or pty. 'stand-in' -> stand-in machine for testing (name DNC.txt). None -> no DNC. !!!!
+dnc_flow = 'count'                  # DNC flow control. 'count' -> character counting against dnc_rx_buffer. 'ack' -> each block waits for ok.
+dnc_rx_buffer = 128                 # receive buffer of machine in bytes.
+spiral_tolerance = None             # !!!! largest distance of spiral surface and spiral boss segment arcs from the spiral. segments per revolution are picked from it. None -> 24 segments per revolution. see spiral_segments(). !!!!
+debug_level = 'full'                # !!!! 'full' -> debug file with tables of every sheet and row. 'summary' -> debug file with per operation totals only. 'off' -> no debug file. tables are only rendered at full. !!!!
+debug_queue = 1000                  # !!!! debug file is written by a background thread through a queue of this many writes. 0 -> debug file is written by the main program. !!!!
+
+if __name__ == '__main__':   # main program runs only when the script is run. functions can be imported without pandas.
+    if import_check_flag == True:
+        import_time_check(import_budget)    # check cold start import time.
+    if benchmark_flag == True:
+        format_benchmark()  # G-code format throughput.
+        geometry_benchmark()    # array coordinate functions against one point at a time.
+        quit()
+    import pandas as pd     # data frames are needed from here on.
+    workbook = None     # initialize workbook session
+    step_cache = {}     # initialize G-code of each step of the last run. watch mode.
+    output_name = None  # initialize G-code file name of first run. watch mode.
+    while True:
+        job_time = job_modified_time(excel_file)     # time job was saved
+        workbook = workbook_session(excel_file, cache_flag, cache_dir, cache_size, stream_flag, workbook)     # open excel file once and parse all sheets. unchanged sheets are kept in watch mode.
+        sheet = 'parameters'                # identify name of excel sheet to import data from.
+
+        if validate_flag == True:
+            errors = validate_job(workbook, sheet_static(workbook, sheet, 'parameters')['measured diameter'])   # check all sheets with measured cutter diameter before any file is written.
+            if errors != []:
+                print(validation_report(errors))    # print all errors in debug window
+                if watch_flag == False:
+                    quit()          # quit program
+                job_time = watch_job(excel_file, job_time, watch_interval)   # wait for job to be corrected and saved.
+                continue
+
+        start_block, end_block, name, name_debug, clear_z, start_z, cut_f, finish_f, z_f, dia, header, header_debug = parameters_data_frame(workbook, sheet)        # generate G-code parameters.
+        if split_bytes != None or split_blocks != None:
+            split_output(name, start_block, end_block, start_z, split_bytes, split_blocks, output_buffer, output_compression)    # G-code file is split into chunk files as it is written.
+        elif output_buffer > 0 or output_compression != None:
+            open_output(name, output_buffer, output_compression)     # open G-code file once for the whole job.
+        if (output_buffer > 0 or output_compression != None) and debug_level != 'off':
+            open_output(name_debug, output_buffer, output_compression)   # open debug file once for the whole job. debug file is never split.
+        if debug_queue > 0 and debug_level != 'off':
+            writer_open(name_debug, debug_queue)    # debug file is written by a background thread.
+        write_to_file(name, header)     # file header. written after the file is opened. see open_output()
+        if debug_level != 'off':
+            write_to_file(name_debug, header_debug)    # debug file header
+        if moves_flag == True:
+            output_moves[name] = move_list()    # G-code is collected as a move list.
+        if npz_flag == True:
+            npz_metadata = {'excel_file': excel_file, 'name': name, 'clear_z': clear_z, 'start_z': start_z, 'cut_f': cut_f, 'finish_f': finish_f,
+                            'z_f': z_f, 'dia': dia, 'start_block': start_block, 'end_block': end_block,
+                            'parameters': sheet_static(workbook, sheet, 'parameters')}
+            npz_open(name, npz_metadata, output_moves.get(name), npz_compress)     # binary toolpath export. shares move list of moves_flag.
+        if dnc_address != None:
+            dnc_open(name, dnc_address, dnc_flow, dnc_rx_buffer)   # drip-feed G-code to machine while it is generated.
+
+        # print parameters table into debug file.
+        job_start_time = time.perf_counter()     # start time of G-code generation. debug summary.
+        text_debug = f'workbook: {excel_file}\n' \
+                     f'sheets parsed: {len(workbook["parsed"])}\n' \
+                     f'sheets from cache: {len(workbook["cached"])}\n' \
+                     f'sheets kept: {len(workbook["kept"])}\n' \
+                     f'sheets streamed: {len(workbook["streamed"])}\n' \
+                     f'parse time: {"%.3f" % workbook["parse_time"]} s\n\n'
+        if debug_level == 'full':     # full debug level only.
+            df_temp = workbook_sheet(workbook, sheet)  # import sheet from workbook session into dataframe.
+            df_temp = df_temp.to_markdown(index=False, tablefmt='pipe', colalign=['center'] * len(df_temp.columns))
+            text_debug = text_debug + str(df_temp)
+        if debug_level != 'off':
+            text_debug = indent(text_debug,0)
+            write_to_file(name_debug, text_debug)  # write to debug file
+
+        write_to_file(name, start_block)    # write G-code start block
+
+        if debug_level == 'full':     # full debug level only.
+            text_debug = '\n\nwrite g-code start_block\n'
+            write_to_file(name_debug, text_debug)    # write to debug file
+        # ===========================================================================
+        # ================================ G-code start =============================
+        # ===========================================================================
+
+        sheet = 'main'
+        df_main = workbook_sheet(workbook, sheet)  # import main sheet from workbook session into dataframe. no na_filter/ blank cell filter.
+        main_records = sheet_records(workbook, sheet, 'main')  # typed row records of main sheet.
+        rows = df_main.shape[0]  # total number of rows in dataframe.
+        last_row = rows - 1  # initialize number of last row
+        shift_x = 0  # initialize shift x
+        shift_y = 0  # initialize shift y
+        repeat_flag = False  # initialize repeat_flag
+        last_row_flag = False   # initialize last_row_flag
+        toolpath_cache = {}     # initialize generated toolpaths. key is operation, sheet and safe z flags.
+        step_cache_new = {}     # initialize G-code of each step of this run. kept for watch mode.
+        if replay_file != None:
+            plan = load_plan(replay_file)  # replay saved plan.
+        else:
+            plan = compile_plan(workbook)  # resolve shift, repeat and last row of main sheet into a flat plan.
+        if plan_file != None:
+            save_plan(plan, plan_file)  # save plan for inspection or replay.
+        row_df = debug_single_row_df(df_main)  # initialize single row data frame.
+        step_summary = []   # initialize operation, lines, bytes and time of each step. debug summary.
+
+        if debug_level == 'full':     # full debug level only.
+            text_debug = f'\n===========================\n'\
+                         f'tab: {sheet}\n' \
+                         f'total rows: {rows}\n'\
+                         f'===========================\n\n'
+            df_temp = df_main[df_main.columns.drop(['notes'])]      # create main df. exclude notes column
+            df_temp = df_temp.to_markdown(index=False, tablefmt='pipe', colalign=['center']*len(df_temp.columns))   # tabulate main df
+            text_debug = text_debug + str(df_temp) + '\n\n'
+            df_temp = pd.DataFrame(plan).astype(object)     # create plan df.
+            df_temp = df_temp.where(df_temp.notna(), '---')     # blank cells
+            df_temp = df_temp.to_markdown(index=False, tablefmt='pipe', colalign=['center']*len(df_temp.columns))   # tabulate plan df
+            text_debug = text_debug + f'plan: {len(plan)} steps\n\n' + str(df_temp) + '\n\n'
+            text_debug = indent(text_debug, 0)
+            write_to_file(name_debug, text_debug)    # write to debug file
+
+        # run compiled plan.
+        for entry in plan:
+
+            counter = entry['row']      # main sheet row of step.
+            shift_x = entry['shift_x']  # absolute shift of step.
+            shift_y = entry['shift_y']  # absolute shift of step.
+            repeat_flag = entry['repeat_flag']
+            row = main_records[counter]     # typed row record of main sheet.
+            operation = row.operation       # import operation from excel file.
+            operation_valid_flag = False    # initialize flag
+
+            toolpath_key = (operation, entry['sheet'], entry['start_safe_z'], entry['return_safe_z'])  # same sheet and flags generate the same toolpath.
+            step_key = toolpath_key + (shift_x, shift_y, workbook['keys'].get(entry['sheet']), workbook['keys'].get('profile-00'), workbook['keys'].get('parameters'))  # same toolpath, shift and sheet contents generate the same G-code.
+            reuse_text = None   # initialize G-code written instead of generating toolpath.
+            if entry['sheet'] != None and step_key in step_cache:
+                reuse_text = step_cache[step_key]  # watch mode. sheets unchanged since last run.
+                text_debug_reuse = 'sheet unchanged since last run. toolpath not regenerated.\n'
+            elif translate_flag == True and toolpath_key in toolpath_cache:
+                text_cache, cache_step, cache_x, cache_y = toolpath_cache[toolpath_key]
+                reuse_text = translate_gcode(text_cache, shift_x - cache_x, shift_y - cache_y)  # None if shift can not be translated exactly.
+                text_debug_reuse = f'translated copy of step {cache_step}. toolpath not regenerated.\n' \
+                                   f'shift_x: {shift_x - cache_x}, shift_y: {shift_y - cache_y}\n'
+            output_capture[name] = []    # capture G-code of step
+            step_start_time = time.perf_counter()    # start time of step. debug summary.
+            if name in output_moves:
+                move_op(output_moves[name], f"step {entry['step']}: {operation} {entry['sheet']}")   # operation id of moves of step.
+            elif name in output_npz:
+                move_op(output_npz[name]['moves'], f"step {entry['step']}: {operation} {entry['sheet']}")   # operation id of moves of binary toolpath export.
+
+            last_row_flag_debug = row.last_row_flag       # import last_row flag from excel file for debug file.
+            sheet_debug = row.sheet_name       # import sheet_name from excel file for debug file.
+            if debug_level == 'full':     # full debug level only.
+                row_df = debug_df_row(row_df, counter)  # populate debug row.
+
+            if operation == 'line' or operation == 'trochoidal':
+                operation_valid_flag = True  # set flag
+                sheet = entry['sheet']
+                start_safe_z = entry['start_safe_z']     # pass start_safe_z to toolpath_data_frame. starts from safe z height if set.
+                if isinstance(start_safe_z, bool) == False:  # check if start_safe_z is a boolean, if not issue error.
+                    abort('start_safe_z', start_safe_z)  # abort. write error message.
+
+                return_safe_z = entry['return_safe_z']     # pass return_safe_z to toolpath_data_frame. returns to safe z height if set.
+                if isinstance(return_safe_z, bool) == False:  # check if return_safe_z is a boolean, if not issue error.
+                    abort('return_safe_z', return_safe_z)  # abort. write error message.
+
+                row_df.at[0, 'start_safe_z'] = start_safe_z   # for debug row
+                row_df.at[0, 'return_safe_z'] = return_safe_z   # for debug row
+                if debug_level == 'full':     # full debug level only.
+                    text_debug = debug_print_row(row_df) + '\n'  # populate debug row.
+                    text_debug = indent(text_debug, 0)  # indent text
+                    write_to_file(name_debug, text_debug)  # write to debug file
+
+                if reuse_text == None:
+                    toolpath_data_frame(name, workbook, sheet, start_safe_z, return_safe_z, operation, dia, debug = False, sink = file_sink(name))    # G-code is written as it is generated.
+
+            elif operation == 'drill':
+                operation_valid_flag = True  # set flag
+                sheet = entry['sheet']
+                if debug_level == 'full':     # full debug level only.
+                    text_debug = debug_print_row(row_df) + '\n'  # populate debug row.
+                    text_debug = indent(text_debug, 0)  # indent text
+                    write_to_file(name_debug, text_debug)  # write to debug file
+                if reuse_text == None:
+                    peck_drill_data_frame(name, workbook, sheet)
+
+            elif operation == 'surface':
+                operation_valid_flag = True  # set flag
+                sheet = entry['sheet']
+                if debug_level == 'full':     # full debug level only.
+                    text_debug = debug_print_row(row_df) + '\n'  # populate debug row.
+                    text_debug = indent(text_debug, 0)  # indent text
+                    write_to_file(name_debug, text_debug)  # write to debug file
+                if reuse_text == None:
+                    surface_data_frame(name, workbook, sheet)
+
+            elif operation == 'spiral_drill':
+                operation_valid_flag = True  # set flag
+                sheet = entry['sheet']
+                if debug_level == 'full':     # full debug level only.
+                    text_debug = debug_print_row(row_df) + '\n'  # populate debug row.
+                    text_debug = indent(text_debug, 0)  # indent text
+                    write_to_file(name_debug, text_debug)  # write to debug file
+                if reuse_text == None:
+                    spiral_drill_data_frame(name, workbook, sheet)
+
+            elif operation == 'spiral_surface':
+                operation_valid_flag = True  # set flag
+                sheet = entry['sheet']
+                if debug_level == 'full':     # full debug level only.
+                    text_debug = debug_print_row(row_df) + '\n'  # populate debug row.
+                    text_debug = indent(text_debug, 0)  # indent text
+                    write_to_file(name_debug, text_debug)  # write to debug file
+                if reuse_text == None:
+                    spiral_surface_data_frame(name, workbook, sheet)
+
+            elif operation == 'corner_slice':
+                operation_valid_flag = True  # set flag
+                sheet = entry['sheet']
+                if debug_level == 'full':     # full debug level only.
+                    text_debug = debug_print_row(row_df) + '\n'  # populate debug row.
+                    text_debug = indent(text_debug, 0)  # indent text
+                    write_to_file(name_debug, text_debug)  # write to debug file
+                if reuse_text == None:
+                    corner_slice_data_frame(name, workbook, sheet)
+
+            elif operation == 'spiral_boss':
+                operation_valid_flag = True  # set flag
+                sheet = entry['sheet']
+                if debug_level == 'full':     # full debug level only.
+                    text_debug = debug_print_row(row_df) + '\n'  # populate debug row.
+                    text_debug = indent(text_debug, 0)  # indent text
+                    write_to_file(name_debug, text_debug)  # write to debug file
+                if reuse_text == None:
+                    spiral_boss_data_frame(name, workbook, sheet)
+
+            elif operation == 'clear_z':
+                operation_valid_flag = True  # set flag
+                text = f'G0 Z{clear_z}          (Clear Z)\n'
+                write_to_file(name, text)
+
+                row_df.at[0, 'clear_z'] = clear_z   # create clear_z column. contains clear_z height value.
+                if debug_level == 'full':     # full debug level only.
+                    text_debug = debug_print_row(row_df) + '\n'  # populate debug row.
+                    text_debug = indent(text_debug, 0)  # indent text
+                    write_to_file(name_debug, text_debug)  # write to debug file
+
+            elif operation == 'rapid':
+                operation_valid_flag = True  # set flag
+                x, y, z = rapid(name, row)
+
+                row_df.at[0, 'x'] = df_main.at[counter, 'x']   # update x
+                row_df.at[0, 'y'] = df_main.at[counter, 'y']   # update y
+                row_df.at[0, 'z'] = df_main.at[counter, 'z']   # update z
+                row_df.at[0, 'adjusted_x'] = x  # update adjusted_x
+                row_df.at[0, 'adjusted_y'] = y  # update adjusted_y
+                if debug_level == 'full':     # full debug level only.
+                    text_debug = debug_print_row(row_df) + '\n'  # populate debug row.
+                    text_debug = indent(text_debug, 0)  # indent text
+                    write_to_file(name_debug, text_debug)  # write to debug file
+
+            elif operation == 'shift':
+                operation_valid_flag = True  # set flag
+
+                row_df.at[0, 'x'] = df_main.at[counter, 'x']   # update x
+                row_df.at[0, 'y'] = df_main.at[counter, 'y']   # update y
+                row_df.at[0, 'shift_x'] = shift_x   # update shift_x
+                row_df.at[0, 'shift_y'] = shift_y   # update shift_y
+                if debug_level == 'full':     # full debug level only.
+                    text_debug = debug_print_row(row_df) + '\n'  # populate debug row.
+                    text_debug = indent(text_debug, 0)  # indent text
+                    write_to_file(name_debug, text_debug)  # write to debug file
+
+            elif operation == 'clear_shift':
+                operation_valid_flag = True  # set flag
+
+                row_df.at[0, 'shift_x'] = shift_x   # update shift_x
+                row_df.at[0, 'shift_y'] = shift_y   # update shift_y
+                if debug_level == 'full':     # full debug level only.
+                    text_debug = debug_print_row(row_df) + '\n'  # populate debug row.
+                    text_debug = indent(text_debug, 0)  # indent text
+                    write_to_file(name_debug, text_debug)  # write to debug file
+
+            elif operation == 'repeat':
+                operation_valid_flag = True  # set flag
+
+                row_df.at[0, 'repeat_flag'] = repeat_flag   # update repeat flag
+                row_df.at[0, 'repeat_row'] = entry['repeat_row']  # update row to repeat
+                if debug_level == 'full':     # full debug level only.
+                    text_debug = debug_print_row(row_df) + '\n'  # populate debug row.
+                    text_debug = indent(text_debug, 0)  # indent text
+                    write_to_file(name_debug, text_debug)  # write to debug file
+
+            if operation_valid_flag == False:  # check for invalid operation.
+                abort('operation', operation)   # abort. write error message.
+
+            if reuse_text != None:
+                write_to_file(name, reuse_text)    # write unchanged or translated copy of toolpath
+                if debug_level == 'full':     # full debug level only.
+                    text_debug = indent(text_debug_reuse, 8)  # indent text
+                    write_to_file(name_debug, text_debug)  # write to debug file
+
+            toolpath_text = ''.join(output_capture.pop(name))  # G-code written for step
+            if debug_level != 'off':
+                step_summary.append({'operation': operation,
+                                     'source': 'generated' if reuse_text == None else 'reused',
+                                     'lines': toolpath_text.count('\n'),
+                                     'bytes': len(toolpath_text),
+                                     'time': time.perf_counter() - step_start_time})     # totals of step. debug summary.
+            if entry['sheet'] != None:
+                if reuse_text == None:
+                    reuse_text = toolpath_text   # generated toolpath
+                if translate_flag == True and toolpath_key not in toolpath_cache:
+                    toolpath_cache[toolpath_key] = (reuse_text, entry['step'], shift_x, shift_y)  # keep toolpath for translated copies
+                step_cache_new[step_key] = reuse_text  # keep toolpath for watch mode
+
+            last_row_flag = main_records[entry['detect_row']].last_row_flag       # import last_row flag from excel file.
+            sheet = 'main'
+            if debug_level == 'full':     # full debug level only.
+                write_to_file(name_debug, '\n')  # empty line for debug file readability.
+            break_flag, text = last_row_detect(df_main, sheet, last_row_flag, last_row, entry['detect_row'], 0)        # detect last row in main excel tab
+
+            if entry['repeat_last_row'] == True:     # repeat row is designated as last row.
+                break_flag = True      # set break_flag
+
+            if break_flag == True:       # break if last row
+                write_to_file(name, text)
+                break
+
+        # ===========================================================================
+        # ================================ G-code end ===============================
+        # ===========================================================================
+
+        write_to_file(name, end_block)      # write G-code end block
+        if debug_level == 'full':     # full debug level only.
+            text_debug = '\nwrite g-code end_block\n'
+            write_to_file(name_debug, text_debug)    # write to debug file
+        if debug_level != 'off':
+            write_to_file(name_debug, debug_summary(step_summary, time.perf_counter() - job_start_time))   # per operation totals
+        close_outputs()     # flush G-code and debug files and rename into place.
+        chunks = output_chunks.pop(name, None)     # chunk files of split G-code file
+        if chunks != None:
+            print(f'G-code file split into {len(chunks)} files: {os.path.basename(chunks[0])} ... {os.path.basename(chunks[-1])}')
+
+        if watch_flag == False:
+            break
+
+        # watch mode. regenerated G-code replaces the G-code file of the first run.
+        if output_name == None:
+            output_name = name          # G-code file of first run
+            output_name_debug = name_debug
+        else:
+            suffix = output_suffix[output_compression]     # .txt, .txt.gz or .txt.zst
+            if chunks == None:
+                os.replace(f'{name}{suffix}', f'{output_name}{suffix}')   # replace G-code file in one step
+            else:
+                for chunk in chunks:
+                    os.replace(f'{chunk}{suffix}', f'{output_name}{chunk[len(name):]}{suffix}')   # replace chunk files
+                index = len(chunks) + 1
+                while os.path.exists(f'{split_name(output_name, index)}{suffix}'):
+                    os.remove(f'{split_name(output_name, index)}{suffix}')  # chunk files of last run not written by this run
+                    index = index + 1
+            if npz_flag == True:
+                os.replace(f'{name}.npz', f'{output_name}.npz')    # replace binary toolpath
+            if debug_level != 'off':
+                os.replace(f'{name_debug}{suffix}', f'{output_name_debug}{suffix}')
+            print(f'G-code file updated: {output_name}{suffix}')
+        step_cache = step_cache_new     # steps of this run
+        job_time = watch_job(excel_file, job_time, watch_interval)   # wait for job to be saved.